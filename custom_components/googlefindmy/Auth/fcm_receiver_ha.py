@@ -25,6 +25,8 @@ Push-path debouncing
       coordinators (per-coordinator Google Home filtering is applied here).
 * The receiver remains thin: significance gating and cooldown application are the
   coordinator’s responsibility.
+* Every push gets a locate trace (see `tracing`): parse/decrypt spans, the debounce
+  wait, then gating, commit and publish in the coordinator that decrypted it.
 
 Runtime telemetry (for diagnostics)
 -----------------------------------
@@ -42,12 +44,25 @@ import json
 import logging
 import random
 import time
+from time import perf_counter
 from typing import Any, Callable, Optional
 
 from custom_components.googlefindmy.Auth.token_cache import (
     async_get_cached_value,
     async_set_cached_value,
 )
+from custom_components.googlefindmy.latency import STAGE_PARSE, pipeline_latency
+from custom_components.googlefindmy.loop_watchdog import loop_section, record_section
+from custom_components.googlefindmy.tracing import (
+    OUTCOME_FILTERED,
+    OUTCOME_NO_LOCATION,
+    OUTCOME_SUPERSEDED,
+    SPAN_DEBOUNCE,
+    TRACE_PUSH,
+    LocateTrace,
+    bind_trace,
+    trace_span,
+)
 
 # Integration-level tunables (safe fallbacks if missing)
 try:
@@ -122,6 +137,8 @@ class FcmReceiverHA:
         # ---------------- Debounce state (push path) ----------------
         # Latest pending payload per device; flushed after short debounce.
         self._pending: dict[str, dict] = {}
+        # Locate trace per pending payload and when it was queued (perf_counter)
+        self._pending_traces: dict[str, tuple[LocateTrace, float]] = {}
         # Flush tasks per device (cancel/recreate on new updates).
         self._flush_tasks: dict[str, asyncio.Task] = {}
         # Debounce window in milliseconds (small enough to feel real-time).
@@ -414,6 +431,7 @@ class FcmReceiverHA:
             notification: Unused; provided by the client.
             data_message: Unused; provided by the client.
         """
+        started = perf_counter()
         try:
             payload = (obj.get("data") or {}).get("com.google.android.apps.adm.FCM_PAYLOAD")
             if not payload:
@@ -464,6 +482,8 @@ class FcmReceiverHA:
         except Exception as err:  # noqa: BLE001
             # Final guard to avoid crashing the receiver callback
             _LOGGER.error("Error processing FCM notification: %s", err)
+        finally:
+            record_section("fcm_notification", started, perf_counter())
 
     # -------------------- Helpers --------------------
 
@@ -560,25 +580,32 @@ class FcmReceiverHA:
             location_data = None
             last_error = None
             successful_coordinator = None
+            # The trace joins the buffer of the entry that owns the device (known after decryption)
+            trace = LocateTrace(canonic_id, TRACE_PUSH)
 
             # Try each coordinator until one succeeds
-            for coordinator in tracking_coordinators:
-                try:
-                    location_data = await self._decode_background_location_async(hex_string, coordinator)
-                    if location_data:
-                        successful_coordinator = coordinator  # Track which coordinator decrypted successfully
-                        break  # Success!
-                except Exception as coord_err:
-                    last_error = coord_err
-                    # Log at debug level to avoid spam in multi-account setups
-                    _LOGGER.debug(
-                        "Decrypt attempt failed for %s (trying next coordinator if available): %s",
-                        canonic_id[:8],
-                        str(coord_err)[:100]
-                    )
-                    continue  # Try next coordinator
+            with bind_trace(trace):
+                for coordinator in tracking_coordinators:
+                    try:
+                        location_data = await self._decode_background_location_async(hex_string, coordinator)
+                        if location_data:
+                            successful_coordinator = coordinator  # Track which coordinator decrypted successfully
+                            break  # Success!
+                    except Exception as coord_err:
+                        last_error = coord_err
+                        # Log at debug level to avoid spam in multi-account setups
+                        _LOGGER.debug(
+                            "Decrypt attempt failed for %s (trying next coordinator if available): %s",
+                            canonic_id[:8],
+                            str(coord_err)[:100]
+                        )
+                        continue  # Try next coordinator
 
             if not location_data or not successful_coordinator:
+                if len(tracking_coordinators) == 1:
+                    # Single owner: keep the failed decode visible in its traces
+                    trace.finish(OUTCOME_NO_LOCATION)
+                    self._add_trace(tracking_coordinators[0], trace)
                 # Only log if we actually tried coordinators
                 if last_error and len(tracking_coordinators) > 1:
                     _LOGGER.debug(
@@ -601,11 +628,23 @@ class FcmReceiverHA:
             # Replace any older pending payload for this device with the newest one.
             # IMPORTANT: Store which coordinator successfully decrypted this, so _flush only updates that coordinator
             self._pending[canonic_id] = (successful_coordinator, payload)
+            self._add_trace(successful_coordinator, trace)
+            replaced = self._pending_traces.get(canonic_id)
+            if replaced is not None:
+                replaced[0].finish(OUTCOME_SUPERSEDED)
+            self._pending_traces[canonic_id] = (trace, perf_counter())
             self._schedule_flush(canonic_id)
 
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Error processing background update for %s: %s", canonic_id, err)
 
+    @staticmethod
+    def _add_trace(coordinator: Any, trace: LocateTrace) -> None:
+        """Add a push trace to the trace buffer of a coordinator (if it keeps one)."""
+        traces = getattr(coordinator, "locate_traces", None)
+        if traces is not None:
+            traces.add(trace)
+
     def _schedule_flush(self, device_id: str) -> None:
         """(Re)schedule a short debounce before fanning out updates to coordinators.
 
@@ -655,6 +694,11 @@ class FcmReceiverHA:
         pending_data = self._pending.pop(device_id, None)
         # Remove the stored task (it is this method's responsibility to clear it).
         self._flush_tasks.pop(device_id, None)
+        trace: Optional[LocateTrace] = None
+        pending_trace = self._pending_traces.pop(device_id, None)
+        if pending_trace is not None:
+            trace, queued = pending_trace
+            trace.span(SPAN_DEBOUNCE, queued, perf_counter())
 
         if not pending_data:
             return
@@ -691,6 +735,8 @@ class FcmReceiverHA:
 
                     if should_filter:
                         _LOGGER.debug("Filtered Google Home detection for %s (push path)", device_id[:8])
+                        if trace is not None:
+                            trace.finish(OUTCOME_FILTERED)
                         # Skip this coordinator only
                         continue
 
@@ -707,7 +753,9 @@ class FcmReceiverHA:
                 # Commit to coordinator cache via its public API
                 update_cache = getattr(coordinator, "update_device_cache", None)
                 if callable(update_cache):
-                    update_cache(device_id, coordinator_payload)
+                    # The coordinator records gating and commit on the bound trace
+                    with bind_trace(trace):
+                        update_cache(device_id, coordinator_payload)
                 else:
                     # Transitional fallback for older coordinators (to be removed once all callers updated)
                     try:
@@ -765,7 +813,16 @@ class FcmReceiverHA:
             from custom_components.googlefindmy.NovaApi import nova_request
 
             # Parse in current thread (lightweight)
-            device_update = parse_device_update_protobuf(hex_string)
+            parse_started = perf_counter()
+            with loop_section("fcm_parse"):
+                device_update = parse_device_update_protobuf(hex_string)
+            parse_s = perf_counter() - parse_started
+            trace_span(STAGE_PARSE, parse_s)
+
+            # Stage latencies are recorded on the coordinator that decrypts the update
+            latency = getattr(coordinator, "pipeline_latency", None)
+            if latency is not None:
+                latency.observe(STAGE_PARSE, parse_s)
 
             # Register cache provider for multi-account support
             if coordinator and hasattr(coordinator, '_cache'):
@@ -773,7 +830,8 @@ class FcmReceiverHA:
                 nova_request.register_cache_provider(lambda: cache)
                 try:
                     # Decrypt async (maintains cache context, offloads CPU work)
-                    locations = await async_decrypt_location_response_locations(device_update) or []
+                    with pipeline_latency(latency):
+                        locations = await async_decrypt_location_response_locations(device_update) or []
                     return locations[0] if locations else {}
                 finally:
                     nova_request.unregister_cache_provider()
@@ -10,12 +10,15 @@ import datetime
 import hashlib
 import logging
 import math
+from time import perf_counter
 from typing import Optional, List, Dict, Any
 
 from google.protobuf.message import DecodeError
 
 from custom_components.googlefindmy.FMDNCrypto.foreign_tracker_cryptor import decrypt
 from custom_components.googlefindmy.KeyBackup.cloud_key_decryptor import decrypt_eik, decrypt_aes_gcm
+from custom_components.googlefindmy.latency import STAGE_DECRYPT, STAGE_IDENTITY_KEY, observe_stage
+from custom_components.googlefindmy.tracing import trace_span
 from custom_components.googlefindmy.NovaApi.ExecuteAction.LocateTracker.decrypted_location import WrappedLocation
 from custom_components.googlefindmy.ProtoDecoders import DeviceUpdate_pb2
 from custom_components.googlefindmy.ProtoDecoders import Common_pb2
@@ -321,7 +324,11 @@ async def async_decrypt_location_response_locations(
         _LOGGER.error("Device registration metadata missing or invalid: %s", exc)
         raise
 
+    key_started = perf_counter()
     identity_key = await async_retrieve_identity_key(device_registration)
+    key_s = perf_counter() - key_started
+    observe_stage(STAGE_IDENTITY_KEY, key_s)
+    trace_span(STAGE_IDENTITY_KEY, key_s)
 
     try:
         locations_proto = (
@@ -370,6 +377,7 @@ async def async_decrypt_location_response_locations(
             encrypted_location: bytes = enc.encryptedLocation
             public_key_random: bytes = enc.publicKeyRandom
 
+            decrypt_started = perf_counter()
             if public_key_random == b"":  # Own report
                 decrypted_location = await _offload_decrypt_aes(identity_key, encrypted_location)
             else:
@@ -377,6 +385,9 @@ async def async_decrypt_location_response_locations(
                 decrypted_location = await _offload_decrypt_foreign(
                     identity_key, encrypted_location, public_key_random, time_offset
                 )
+            decrypt_s = perf_counter() - decrypt_started
+            observe_stage(STAGE_DECRYPT, decrypt_s)
+            trace_span(STAGE_DECRYPT, decrypt_s, "own" if public_key_random == b"" else "network")
 
             wrapped.append(
                 WrappedLocation(
@@ -8,6 +8,7 @@ import asyncio
 import time
 import logging
 import traceback
+from time import perf_counter
 from typing import Optional, Callable, Protocol, runtime_checkable
 
 import aiohttp
@@ -24,11 +25,30 @@ from custom_components.googlefindmy.NovaApi.nova_request import (
     NovaHTTPError,
 )
 from custom_components.googlefindmy.NovaApi.scopes import NOVA_ACTION_API_SCOPE
+from custom_components.googlefindmy.latency import (
+    STAGE_FCM_WAIT,
+    STAGE_NOVA_REQUEST,
+    STAGE_PARSE,
+    PipelineLatency,
+    current_pipeline_latency,
+    pipeline_latency,
+)
+from custom_components.googlefindmy.request_governor import RPC_LOCATE
+from custom_components.googlefindmy.tracing import (
+    SPAN_FCM_CALLBACK,
+    LocateTrace,
+    bind_trace,
+    current_trace,
+    traced,
+)
 from custom_components.googlefindmy.NovaApi.util import generate_random_uuid
 from custom_components.googlefindmy.example_data_provider import get_example_data
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default wait for the FCM location response (callers may pass a shorter adaptive bound).
+FCM_LOCATION_WAIT_S = 60.0
+
 
 # -----------------------------------------------------------------------------
 # FCM receiver provider (registered by integration setup; unloaded on teardown)
@@ -109,13 +129,15 @@ class _CallbackContext:
     Attributes:
         event: An asyncio.Event to signal that data has been received.
         data: The data payload received from the callback.
+        received: `perf_counter()` when the FCM callback was triggered.
     """
-    __slots__ = ("event", "data")
+    __slots__ = ("event", "data", "received")
 
     def __init__(self) -> None:
         """Initialize the callback context."""
         self.event: asyncio.Event = asyncio.Event()
         self.data: list | None = None
+        self.received: float | None = None
 
 
 def _make_location_callback(
@@ -125,6 +147,8 @@ def _make_location_callback(
     ctx: _CallbackContext,
     loop: asyncio.AbstractEventLoop,
     cache_provider: any = None,
+    latency: Optional[PipelineLatency] = None,
+    trace: Optional[LocateTrace] = None,
 ) -> Callable[[str, str], None]:
     """Factory that creates an FCM callback bound to a context object.
 
@@ -143,6 +167,11 @@ def _make_location_callback(
         ctx: The shared context object for signaling and data transfer.
         loop: The asyncio event loop of the main thread.
         cache_provider: The cache provider for this account (captured from context).
+        latency: The stage latency recorder of the requesting entry (captured from
+            context; the parse time measured in the worker thread is recorded on
+            the loop).
+        trace: The trace of the requesting locate (captured from context; the
+            callback and parse spans are recorded in the worker thread).
 
     Returns:
         A callback function suitable for the FCM receiver.
@@ -150,6 +179,9 @@ def _make_location_callback(
 
     def location_callback(response_canonic_id: str, hex_response: str) -> None:
         """Processes the location update received via FCM."""
+        ctx.received = perf_counter()
+        if trace is not None:
+            trace.event(SPAN_FCM_CALLBACK, at=ctx.received)
         try:
             _LOGGER.info("FCM callback triggered for %s, processing response...", name)
             _LOGGER.debug("FCM response length: %d chars", len(hex_response))
@@ -173,7 +205,11 @@ def _make_location_callback(
 
             # Parse the hex response in this worker thread
             try:
+                parse_started = perf_counter()
                 device_update = parse_device_update_protobuf(hex_response)
+                parse_s = perf_counter() - parse_started
+                if trace is not None:
+                    trace.span(STAGE_PARSE, parse_started, parse_started + parse_s)
             except Exception as parse_exc:
                 _LOGGER.error("Failed to parse device update for %s: %s", name, parse_exc)
                 ctx.data = []
@@ -197,7 +233,10 @@ def _make_location_callback(
                     nova_request.register_cache_provider(cache_provider)
 
                 try:
-                    location_data = await async_decrypt_location_response_locations(device_update)
+                    if latency is not None:
+                        latency.observe(STAGE_PARSE, parse_s)
+                    with pipeline_latency(latency), bind_trace(trace):
+                        location_data = await async_decrypt_location_response_locations(device_update)
                 except (StaleOwnerKeyError, DecryptionError, SpotApiEmptyResponseError) as err:
                     _LOGGER.error("Failed to process location data for %s: %s", name, err)
                     ctx.data = []
@@ -242,6 +281,7 @@ async def get_location_data_for_device(
     *,
     username: Optional[str] = None,
     cache: Optional[any] = None,
+    fcm_timeout_s: Optional[float] = None,
 ) -> list:
     """Get location data for a device (async, HA-compatible).
 
@@ -260,9 +300,16 @@ async def get_location_data_for_device(
         name: The human-readable name of the device for logging purposes.
         session: (Deprecated) An optional aiohttp.ClientSession. No longer used directly.
         username: The username for the request.
+        fcm_timeout_s: How long to wait for the FCM response (default 60 s); the
+            coordinator passes an adaptive value derived from observed latencies.
 
     Returns:
         A list of dictionaries containing location data, or an empty list on failure.
+
+    Raises:
+        NovaRateLimitError: The locate request was throttled.
+        NovaHTTPError: Server error, or the endpoint's circuit is open
+            (`NovaCircuitOpenError`).
     """
     _LOGGER.info("Requesting location data for %s...", name)
 
@@ -276,6 +323,10 @@ async def get_location_data_for_device(
     registered = False
     ctx = _CallbackContext()
     loop = asyncio.get_running_loop()
+    # Stage latencies of the requesting entry (bound by the coordinator)
+    latency = current_pipeline_latency()
+    # Trace of this locate (bound by the coordinator; None for untraced callers)
+    trace = current_trace()
 
     try:
         # Generate request UUID
@@ -301,7 +352,7 @@ async def get_location_data_for_device(
             _LOGGER.debug("Registering FCM location updates for %s...", name)
             callback = _make_location_callback(
                 name=name, canonic_device_id=canonic_device_id, ctx=ctx, loop=loop,
-                cache_provider=cache_provider
+                cache_provider=cache_provider, latency=latency, trace=trace,
             )
             fcm_token = await fcm_receiver.async_register_for_location_updates(
                 canonic_device_id, callback
@@ -322,17 +373,20 @@ async def get_location_data_for_device(
         # Send location request to Google API (async; HA session preferred if provided)
         _LOGGER.info("Sending location request to Google API for %s...", name)
         try:
-            _ = await async_nova_request(
-                NOVA_ACTION_API_SCOPE, hex_payload, username=username, cache=cache
-            )
+            request_started = perf_counter()
+            with traced(STAGE_NOVA_REQUEST):
+                _ = await async_nova_request(
+                    NOVA_ACTION_API_SCOPE, hex_payload, username=username, cache=cache,
+                    rpc_class=RPC_LOCATE,
+                )
+            if latency is not None:
+                latency.observe(STAGE_NOVA_REQUEST, perf_counter() - request_started)
         except asyncio.CancelledError:
             raise
-        except NovaRateLimitError as e:
-            _LOGGER.warning("Rate limited while requesting location for %s: %s", name, e)
-            return []
-        except NovaHTTPError as e:
-            _LOGGER.warning("Server error (%s) while requesting location for %s: %s", e.status, name, e)
-            return []
+        except (NovaRateLimitError, NovaHTTPError):
+            # Throttles, open circuits and server errors are not "no location": the
+            # poll loop backs off its spacing and counts the failure for the device.
+            raise
         except NovaAuthError as e:
             _LOGGER.error("Authentication error while requesting location for %s: %s", name, e)
             return []
@@ -347,13 +401,21 @@ async def get_location_data_for_device(
         _LOGGER.info("Location request accepted for %s; awaiting FCM data...", name)
 
         # Wait efficiently for FCM callback to signal completion
-        timeout = 60  # seconds
+        timeout = FCM_LOCATION_WAIT_S if fcm_timeout_s is None else max(1.0, float(fcm_timeout_s))
         _LOGGER.info("Waiting for location response for %s...", name)
+        wait_started = perf_counter()
         try:
             await asyncio.wait_for(ctx.event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
-            _LOGGER.warning("No location response received for %s (timeout: %ss)", name, timeout)
+            _LOGGER.warning("No location response received for %s (timeout: %.0fs)", name, timeout)
+            if trace is not None:
+                trace.span(STAGE_FCM_WAIT, wait_started, perf_counter(), "timeout")
             return []
+        if ctx.received is not None:
+            if latency is not None:
+                latency.observe(STAGE_FCM_WAIT, ctx.received - wait_started)
+            if trace is not None:
+                trace.span(STAGE_FCM_WAIT, wait_started, ctx.received)
 
         data = ctx.data or []
         if data and data[0].get("canonic_id") == canonic_device_id:
@@ -368,6 +430,8 @@ async def get_location_data_for_device(
     except asyncio.CancelledError:
         _LOGGER.info("Location request cancelled for %s", name)
         raise
+    except (NovaRateLimitError, NovaHTTPError):
+        raise
     except Exception as e:
         _LOGGER.error("Error requesting location for %s: %s", name, e)
         _LOGGER.debug("Traceback: %s", traceback.format_exc())
@@ -17,6 +17,9 @@ Features
   per-call pools (`register_hass()` / `unregister_hass()`).
 - Token TTL learning policy (sync/async variants) to proactively refresh ADM tokens.
 - Robust retry logic (401 -> refresh & retry; 5xx/429 -> exponential backoff).
+- Account-wide request budgets (async path): every attempt acquires a token from
+  the account's `RequestGovernor`; 429/RESOURCE_EXHAUSTED (and 503 with a
+  Retry-After) pause the account, bare 503s count towards the circuit breaker.
 - All auth/cache access in the async path uses the async token cache API.
 
 Notes
@@ -50,6 +53,15 @@ from custom_components.googlefindmy.Auth.token_cache import (
     async_set_cached_value,
 )
 from ..const import NOVA_API_USER_AGENT
+from ..request_governor import (
+    CircuitOpenError,
+    RequestBudgetExceeded,
+    get_circuit_breaker,
+    get_governor,
+    is_throttle_response,
+    parse_retry_after,
+    rpc_class_for_nova_scope,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -97,6 +109,16 @@ class NovaHTTPError(NovaError):
         self.status = status
         self.detail = detail
 
+class NovaCircuitOpenError(NovaHTTPError):
+    """Raised without a network round-trip while the endpoint's circuit is open."""
+    def __init__(self, detail: Optional[str] = None):
+        super().__init__(503, detail)
+
+
+def _is_outage_error(err: Exception) -> bool:
+    """Return True for failures that count towards the endpoint circuit breaker."""
+    return isinstance(err, NovaError) and not isinstance(err, (NovaAuthError, NovaRateLimitError))
+
 # ------------------------ Optional Home Assistant hooks ------------------------
 # These hooks allow the integration to supply a shared aiohttp ClientSession.
 _HASS_REF = None
@@ -649,6 +671,7 @@ async def async_nova_request(
     username: Optional[str] = None,
     session: Optional[aiohttp.ClientSession] = None,
     cache: Optional[any] = None,
+    rpc_class: Optional[str] = None,
 ) -> str:
     """
     Asynchronous Nova API request for Home Assistant.
@@ -664,18 +687,29 @@ async def async_nova_request(
         session: Optional aiohttp session to reuse.
         cache: Optional TokenCache instance for multi-account isolation. If provided,
                this cache will be used directly instead of the global cache resolution.
+        rpc_class: Request budget class ("list", "locate", "action"); derived from
+               the scope if omitted.
 
     Returns:
         Hex-encoded response body.
     Raises:
         ValueError: if the hex_payload is invalid or username is unavailable.
         NovaAuthError: on 4xx client errors.
-        NovaRateLimitError: on 429 errors after all retries.
+        NovaRateLimitError: on 429 errors after all retries, or when the account's
+            request budget/throttle pause does not allow the request in time.
         NovaHTTPError: on 5xx server errors after all retries.
+        NovaCircuitOpenError: (a NovaHTTPError) without any request while the
+            endpoint's circuit breaker is open after repeated failures.
         NovaError: on other unrecoverable errors like network issues after retries.
     """
     url = f"https://android.googleapis.com/nova/{api_scope}"
 
+    # Fail fast (before token work) while the endpoint is known to be down.
+    breaker = get_circuit_breaker(api_scope)
+    if breaker.retry_in() > 0:
+        breaker.rejected += 1
+        raise NovaCircuitOpenError(f"{api_scope} unavailable; retry in {breaker.retry_in():.0f}s")
+
     # Safe username retrieval - handle cache errors during multi-entry validation
     if username:
         user = username
@@ -748,65 +782,88 @@ async def async_nova_request(
             session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16, enable_cleanup_closed=True))
             ephemeral_session = True
 
+    governor = get_governor(user)
+    budget_class = rpc_class or rpc_class_for_nova_scope(api_scope)
+
     try:
-        refreshed_once = False
-        retries_used = 0
-        while True:
-            attempt = retries_used + 1
-            try:
-                timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=30)
-                async with session.post(url, headers=headers, data=payload, timeout=timeout, allow_redirects=False) as response:
-                    content = await response.read()
-                    status = response.status
-                    _LOGGER.debug("Nova API async request to %s: status=%d", api_scope, status)
-
-                    if status == 200:
-                        return content.hex()
+        with breaker.guard(_is_outage_error):
+            refreshed_once = False
+            retries_used = 0
+            while True:
+                attempt = retries_used + 1
+                try:
+                    await governor.acquire(budget_class)
+                except RequestBudgetExceeded as e:
+                    _LOGGER.info("Nova API async request to %s deferred: %s", api_scope, e)
+                    raise NovaRateLimitError(str(e)) from e
+                try:
+                    timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=30)
+                    async with session.post(url, headers=headers, data=payload, timeout=timeout, allow_redirects=False) as response:
+                        content = await response.read()
+                        status = response.status
+                        _LOGGER.debug("Nova API async request to %s: status=%d", api_scope, status)
+
+                        if status == 200:
+                            governor.note_success()
+                            return content.hex()
                     
-                    text_snippet = _redact(_beautify_text(content.decode(errors='ignore')))
+                        text_snippet = _redact(_beautify_text(content.decode(errors='ignore')))
+
+                        retry_after = response.headers.get("Retry-After")
+                        if is_throttle_response(status, body=text_snippet, retry_after=retry_after):
+                            # Server-side throttling: pause the whole account. The next attempt
+                            # waits in governor.acquire() (or fails fast if the pause is long).
+                            governor.note_throttled(parse_retry_after(retry_after))
+                            if retries_used < NOVA_MAX_RETRIES:
+                                retries_used += 1
+                                continue
+                            _LOGGER.error("Nova API async request to %s throttled after %d attempts (status %d).", api_scope, retries_used + 1, status)
+                            raise NovaRateLimitError(f"Nova API throttled (HTTP {status}) after {NOVA_MAX_RETRIES} attempts.")
                     
-                    if status == 401:
-                        lvl = logging.INFO if not refreshed_once else logging.WARNING
-                        _LOGGER.log(lvl, "Nova API async request to %s: 401 Unauthorized. Refreshing token.", api_scope)
-                        await policy.on_401()
-                        if not refreshed_once:
-                            refreshed_once = True
-                            continue # Free retry
-
-                        raise NovaAuthError(status, "Unauthorized after token refresh")
-
-                    if status in (408, 429) or 500 <= status < 600:
-                        if retries_used < NOVA_MAX_RETRIES:
-                            delay = _compute_delay(attempt, response.headers.get("Retry-After"))
-                            _LOGGER.info(
-                                "Nova API async request to %s failed with status %d. Retrying in %.2f seconds (attempt %d/%d)...",
-                                api_scope, status, delay, retries_used + 1, NOVA_MAX_RETRIES
-                            )
-                            retries_used += 1
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            _LOGGER.error("Nova API async request to %s failed after %d attempts with status %d.", api_scope, retries_used + 1, status)
-                            if status == 429:
-                                raise NovaRateLimitError(f"Nova API rate limited after {NOVA_MAX_RETRIES} attempts.")
-                            raise NovaHTTPError(status, f"Nova API failed after {NOVA_MAX_RETRIES} attempts.")
+                        if status == 401:
+                            lvl = logging.INFO if not refreshed_once else logging.WARNING
+                            _LOGGER.log(lvl, "Nova API async request to %s: 401 Unauthorized. Refreshing token.", api_scope)
+                            await policy.on_401()
+                            if not refreshed_once:
+                                refreshed_once = True
+                                continue # Free retry
+
+                            raise NovaAuthError(status, "Unauthorized after token refresh")
+
+                        if status in (408, 429) or 500 <= status < 600:
+                            if retries_used < NOVA_MAX_RETRIES:
+                                delay = _compute_delay(attempt, response.headers.get("Retry-After"))
+                                _LOGGER.info(
+                                    "Nova API async request to %s failed with status %d. Retrying in %.2f seconds (attempt %d/%d)...",
+                                    api_scope, status, delay, retries_used + 1, NOVA_MAX_RETRIES
+                                )
+                                retries_used += 1
+                                await asyncio.sleep(delay)
+                                continue
+                            else:
+                                _LOGGER.error("Nova API async request to %s failed after %d attempts with status %d.", api_scope, retries_used + 1, status)
+                                if status == 429:
+                                    raise NovaRateLimitError(f"Nova API rate limited after {NOVA_MAX_RETRIES} attempts.")
+                                raise NovaHTTPError(status, f"Nova API failed after {NOVA_MAX_RETRIES} attempts.")
                     
-                    raise NovaAuthError(status, text_snippet)
-
-            except asyncio.CancelledError:
-                raise
-            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
-                if retries_used < NOVA_MAX_RETRIES:
-                    delay = _compute_delay(attempt, None)
-                    _LOGGER.info("Nova API async request to %s failed with %s. Retrying in %.2f seconds (attempt %d/%d)...",
-                                 api_scope, type(e).__name__, delay, retries_used + 1, NOVA_MAX_RETRIES)
-                    retries_used += 1
-                    await asyncio.sleep(delay)
-                    continue
-                else:
-                    _LOGGER.error("Nova API async request to %s failed after %d attempts with %s.", api_scope, retries_used + 1, type(e).__name__)
-                    raise NovaError(f"Nova API request failed after retries: {e}") from e
-
+                        raise NovaAuthError(status, text_snippet)
+
+                except asyncio.CancelledError:
+                    raise
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    if retries_used < NOVA_MAX_RETRIES:
+                        delay = _compute_delay(attempt, None)
+                        _LOGGER.info("Nova API async request to %s failed with %s. Retrying in %.2f seconds (attempt %d/%d)...",
+                                     api_scope, type(e).__name__, delay, retries_used + 1, NOVA_MAX_RETRIES)
+                        retries_used += 1
+                        await asyncio.sleep(delay)
+                        continue
+                    else:
+                        _LOGGER.error("Nova API async request to %s failed after %d attempts with %s.", api_scope, retries_used + 1, type(e).__name__)
+                        raise NovaError(f"Nova API request failed after retries: {e}") from e
+    except CircuitOpenError as e:
+        # Another request is already probing the endpoint (half-open).
+        raise NovaCircuitOpenError(str(e)) from e
     finally:
         if ephemeral_session and session:
             await session.close()
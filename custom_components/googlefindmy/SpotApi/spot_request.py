@@ -16,6 +16,15 @@ from custom_components.googlefindmy.Auth.username_provider import (
     async_get_username,    # async-first (HA)
 )
 from custom_components.googlefindmy.SpotApi.grpc_parser import GrpcParser
+from custom_components.googlefindmy.request_governor import (
+    RPC_ACTION,
+    CircuitOpenError,
+    RequestBudgetExceeded,
+    get_circuit_breaker,
+    get_governor,
+    is_throttle_response,
+    parse_retry_after,
+)
 
 # Sync helpers for CLI/dev usage (never call inside the HA event loop)
 from custom_components.googlefindmy.Auth.spot_token_retrieval import get_spot_token  # sync API
@@ -33,6 +42,14 @@ from custom_components.googlefindmy.Auth.token_cache import (
 _LOGGER = logging.getLogger(__name__)
 
 
+class SpotTransportError(RuntimeError):
+    """SPOT request failed for outage reasons (timeout, transport error, HTTP 5xx).
+
+    These failures count towards the per-method circuit breaker; auth and
+    throttling errors remain plain RuntimeErrors.
+    """
+
+
 def _beautify_text(resp) -> str:
     """Best-effort body-to-text for diagnostics (HTML/JSON error pages)."""
     try:
@@ -294,7 +311,7 @@ def spot_request(api_scope: str, payload: bytes) -> bytes:
 
 # ------------------------------ ASYNC API (HA path) ------------------------------
 
-async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
+async def async_spot_request(api_scope: str, payload: bytes, rpc_class: str = RPC_ACTION) -> bytes:
     """
     Perform a SPOT gRPC unary request over HTTP/2 (async, preferred in HA).
 
@@ -306,12 +323,14 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
     - Keep return type stable for callers: bytes or empty bytes on trailers-only/invalid 200 bodies.
     - On persistent AuthN/AuthZ failure (gRPC 16/7) after a retry, raise to avoid silent failure.
     - Never block the event loop: blocking token retrieval runs in a worker thread.
+    - Acquire account request budget (`rpc_class`) per attempt; throttling responses
+      (HTTP 429/503, gRPC RESOURCE_EXHAUSTED/UNAVAILABLE) pause the account and raise.
+    - Fail fast while the method's circuit breaker is open (repeated timeouts,
+      transport errors or HTTP 5xx); a single probe is let through afterwards.
 
     Returns:
         Raw protobuf payload (bytes), or b"" for trailers-only/invalid 200 bodies.
     """
-    url = "https://spot-pa.googleapis.com/google.internal.spot.v1.SpotService/" + api_scope
-
     # Ensure HTTP/2 support is available (httpx[http2] -> h2)
     try:
         import h2  # noqa: F401
@@ -320,6 +339,17 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
             "HTTP/2 support is required for SPOT gRPC. Please install the HTTP/2 extra: pip install 'httpx[http2]'"
         ) from e
 
+    breaker = get_circuit_breaker(api_scope)
+    try:
+        with breaker.guard(lambda err: isinstance(err, SpotTransportError)):
+            return await _async_spot_request_once(api_scope, payload, rpc_class)
+    except CircuitOpenError as e:
+        raise RuntimeError(f"SPOT {api_scope} skipped: {e}") from e
+
+
+async def _async_spot_request_once(api_scope: str, payload: bytes, rpc_class: str) -> bytes:
+    """Run one SPOT call (with its single auth/transport retry); see async_spot_request."""
+    url = "https://spot-pa.googleapis.com/google.internal.spot.v1.SpotService/" + api_scope
     grpc_body = GrpcParser.construct_grpc(payload)
 
     attempts = 0
@@ -328,6 +358,11 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
     async with httpx.AsyncClient(http2=True, timeout=30.0) as client:
         while attempts < 2:
             token, kind, token_user = await _pick_auth_token_async(prefer_adm=prefer_adm)
+            governor = get_governor(token_user)
+            try:
+                await governor.acquire(rpc_class)
+            except RequestBudgetExceeded as e:
+                raise RuntimeError(f"SPOT {api_scope} deferred: {e}") from e
 
             headers = {
                 "User-Agent": "com.google.android.gms/244433022 grpc-java-cronet/1.69.0-SNAPSHOT",
@@ -345,14 +380,14 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
                     _LOGGER.warning("SPOT %s: request timed out; retrying once…", api_scope)
                     attempts += 1
                     continue
-                raise RuntimeError("SPOT request timed out after retry")
+                raise SpotTransportError("SPOT request timed out after retry")
             except httpx.TransportError as e:
                 # Network errors: retry once
                 if attempts == 0:
                     _LOGGER.warning("SPOT %s: transport error (%s); retrying once…", api_scope, e)
                     attempts += 1
                     continue
-                raise RuntimeError(f"SPOT transport error after retry: {e}")
+                raise SpotTransportError(f"SPOT transport error after retry: {e}")
 
             status = resp.status_code
             ctype = resp.headers.get("Content-Type")
@@ -362,12 +397,24 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
 
             # (1) Happy path: 200 + valid gRPC message frame
             if status == 200 and clen >= 5 and content[0] in (0, 1):
+                governor.note_success()
                 return GrpcParser.extract_grpc_payload(content)
 
             # (2) Trailer-only / invalid-body handling (HTTP 200 without a usable frame)
             grpc_status = resp.headers.get("grpc-status")
             grpc_msg = resp.headers.get("grpc-message")
 
+            # Server throttling: pause the account and surface the error.
+            retry_after = resp.headers.get("Retry-After")
+            if is_throttle_response(status, grpc_status if status == 200 else None, retry_after=retry_after):
+                governor.note_throttled(parse_retry_after(retry_after))
+                raise RuntimeError(
+                    f"SPOT {api_scope} throttled (HTTP {status}, grpc-status={grpc_status})"
+                )
+            if status == 200 and grpc_status == "14":
+                # UNAVAILABLE without Retry-After: an outage (counts towards the breaker)
+                raise SpotTransportError(f"SPOT {api_scope} unavailable (grpc-status=14)")
+
             if status == 200:
                 if grpc_status and grpc_status != "0":
                     code_name = {"16": "UNAUTHENTICATED", "7": "PERMISSION_DENIED"}.get(grpc_status, "NON_OK")
@@ -431,6 +478,8 @@ async def async_spot_request(api_scope: str, payload: bytes) -> bytes:
             except Exception:
                 pretty = ""
             _LOGGER.debug("SPOT %s HTTP error body: %r", api_scope, pretty)
+            if status >= 500:
+                raise SpotTransportError(f"Spot API HTTP {status} for {api_scope}")
             raise RuntimeError(f"Spot API HTTP {status} for {api_scope}")
 
     raise RuntimeError("Spot request failed after retries")
@@ -26,6 +26,15 @@ from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.network import get_url
+
+try:  # Service responses (HA 2023.7+)
+    from homeassistant.core import SupportsResponse
+except ImportError:  # pragma: no cover - minimal cores/stubs without service responses
+    SupportsResponse = None  # type: ignore[assignment,misc]
+try:
+    from homeassistant.exceptions import Unauthorized
+except ImportError:  # pragma: no cover - minimal cores/stubs
+    Unauthorized = HomeAssistantError  # type: ignore[assignment,misc]
 # from homeassistant.helpers.instance_id import async_get as async_get_instance_id  # optional
 
 # Token cache (new: entry-scoped HA Store-backed cache + registry/facade)
@@ -56,6 +65,13 @@ from .const import (
     OPT_MIN_ACCURACY_THRESHOLD,
     OPT_ALLOW_HISTORY_FALLBACK,
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
+    OPT_PUSH_BATCH_WINDOW_MS,
+    OPT_POLL_SPACING_MIN_S,
+    OPT_POLL_SPACING_MAX_S,
+    OPT_POLL_CYCLE_BUDGET_S,
+    OPT_SNAPSHOT_CHUNK_SIZE,
+    OPT_DEVICE_POLL_OVERRIDES,
+    OPT_ENABLE_LOOP_WATCHDOG,
     OPT_IGNORED_DEVICES,  # persist user's delete decision
     # Defaults
     DEFAULT_OPTIONS,
@@ -64,6 +80,12 @@ from .const import (
     DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_MIN_ACCURACY_THRESHOLD,
     DEFAULT_MAP_VIEW_TOKEN_EXPIRATION,
+    DEFAULT_PUSH_BATCH_WINDOW_MS,
+    DEFAULT_POLL_SPACING_MIN_S,
+    DEFAULT_POLL_SPACING_MAX_S,
+    DEFAULT_POLL_CYCLE_BUDGET_S,
+    DEFAULT_SNAPSHOT_CHUNK_SIZE,
+    DEFAULT_ENABLE_LOOP_WATCHDOG,
     # Services
     SERVICE_LOCATE_DEVICE,
     SERVICE_PLAY_SOUND,
@@ -71,17 +93,34 @@ from .const import (
     SERVICE_LOCATE_EXTERNAL,
     SERVICE_REFRESH_DEVICE_URLS,
     SERVICE_REBUILD_REGISTRY,
+    SERVICE_SET_POLL_INTERVAL,
+    SERVICE_PROFILE,
+    ATTR_INTERVAL,
+    DEVICE_POLL_OVERRIDE_MAX_S,
     # Rebuild service schema constants
     ATTR_MODE,
     ATTR_DEVICE_IDS,
     MODE_REBUILD,
     MODE_MIGRATE,
     REBUILD_REGISTRY_MODES,
+    # Profiling service schema constants
+    ATTR_DURATION,
+    ATTR_TOP,
+    PROFILE_MODES,
+    PROFILE_MODE_SAMPLING,
+    DEFAULT_PROFILE_DURATION_S,
+    PROFILE_DURATION_MAX_S,
+    DEFAULT_PROFILE_TOP,
     OPT_OPTIONS_SCHEMA_VERSION,
+    STORAGE_KEY,
+    WARM_START_STORAGE_KEY,
     coerce_ignored_mapping,
 )
 from .coordinator import GoogleFindMyCoordinator
+from .loop_watchdog import LoopLagWatchdog
 from .map_view import GoogleFindMyMapRedirectView, GoogleFindMyMapView
+from .metrics_view import GoogleFindMyMetricsView
+from .profiling import ProfileBusyError, async_profile as async_profile_capture
 
 # Shared FCM provider (HA-managed singleton)
 from .Auth.fcm_receiver_ha import FcmReceiverHA
@@ -369,6 +408,34 @@ async def _async_release_shared_fcm(hass: HomeAssistant) -> None:
                 _LOGGER.warning("Stopping FCM receiver failed: %s", err)
 
 
+# --------------------------- Shared loop watchdog ---------------------------
+
+def _acquire_loop_watchdog(hass: HomeAssistant) -> LoopLagWatchdog:
+    """Get or start the shared event-loop watchdog (refcounted across entries)."""
+    bucket = hass.data.setdefault(DOMAIN, {})
+    watchdog: LoopLagWatchdog | None = bucket.get("loop_watchdog")
+    if watchdog is None:
+        watchdog = LoopLagWatchdog()
+        watchdog.start(hass.loop)
+        bucket["loop_watchdog"] = watchdog
+        _LOGGER.debug("Event loop watchdog started")
+    bucket["loop_watchdog_refcount"] = int(bucket.get("loop_watchdog_refcount", 0)) + 1
+    return watchdog
+
+
+def _release_loop_watchdog(hass: HomeAssistant) -> None:
+    """Decrease refcount; stop the watchdog when no entry uses it anymore."""
+    bucket = hass.data.setdefault(DOMAIN, {})
+    refcount = max(int(bucket.get("loop_watchdog_refcount", 0)) - 1, 0)
+    bucket["loop_watchdog_refcount"] = refcount
+    if refcount:
+        return
+    watchdog: LoopLagWatchdog | None = bucket.pop("loop_watchdog", None)
+    if watchdog is not None:
+        watchdog.stop()
+        _LOGGER.debug("Event loop watchdog stopped")
+
+
 async def _async_cleanup_orphaned_cache_files(hass: HomeAssistant) -> None:
     """Delete cache files that don't correspond to any active integration entry."""
     try:
@@ -384,10 +451,12 @@ async def _async_cleanup_orphaned_cache_files(hass: HomeAssistant) -> None:
 
         deleted_count = 0
         filenames = await hass.async_add_executor_job(os.listdir, storage_path)
+        prefixes = (f"{STORAGE_KEY}_", f"{WARM_START_STORAGE_KEY}_")
         for filename in filenames:
-            if filename.startswith("googlefindmy_secrets_"):
-                # Extract entry_id from filename (format: googlefindmy_secrets_{entry_id})
-                entry_id = filename.replace("googlefindmy_secrets_", "")
+            prefix = next((p for p in prefixes if filename.startswith(p)), None)
+            if prefix is not None:
+                # Extract entry_id from filename (format: {prefix}{entry_id})
+                entry_id = filename[len(prefix):]
                 if entry_id not in active_entry_ids:
                     # This is an orphaned cache file - delete it
                     file_path = os.path.join(storage_path, filename)
@@ -535,6 +604,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         allow_history_fallback=_opt(
             entry, OPT_ALLOW_HISTORY_FALLBACK, DEFAULT_OPTIONS.get(OPT_ALLOW_HISTORY_FALLBACK, False)
         ),
+        push_batch_window_ms=_opt(entry, OPT_PUSH_BATCH_WINDOW_MS, DEFAULT_PUSH_BATCH_WINDOW_MS),
+        poll_spacing_min_s=_opt(entry, OPT_POLL_SPACING_MIN_S, DEFAULT_POLL_SPACING_MIN_S),
+        poll_spacing_max_s=_opt(entry, OPT_POLL_SPACING_MAX_S, DEFAULT_POLL_SPACING_MAX_S),
+        poll_cycle_budget_s=_opt(entry, OPT_POLL_CYCLE_BUDGET_S, DEFAULT_POLL_CYCLE_BUDGET_S),
+        snapshot_chunk_size=_opt(entry, OPT_SNAPSHOT_CHUNK_SIZE, DEFAULT_SNAPSHOT_CHUNK_SIZE),
+        device_poll_overrides=_opt(entry, OPT_DEVICE_POLL_OVERRIDES, {}),
     )
     coordinator.config_entry = entry  # convenience for platforms
 
@@ -567,13 +642,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "FCM receiver has no _start_listening(); relying on on-demand start via per-request registration."
         )
 
+    # Optional event-loop lag watchdog (shared; stall attribution in diagnostics/sensor)
+    if _opt(entry, OPT_ENABLE_LOOP_WATCHDOG, DEFAULT_ENABLE_LOOP_WATCHDOG):
+        coordinator.loop_watchdog = _acquire_loop_watchdog(hass)
+        entry.async_on_unload(lambda: _release_loop_watchdog(hass))
+
     # Expose runtime object for modern consumers (diagnostics, repair, etc.). No secrets.
     entry.runtime_data = coordinator
 
     # Optional: attach Google Home filter (options-first configuration)
     from .google_home_filter import GoogleHomeFilter
 
-    coordinator.google_home_filter = GoogleHomeFilter(hass, _effective_config(entry))
+    coordinator.google_home_filter = GoogleHomeFilter(
+        hass, _effective_config(entry), entity_resolver=coordinator.get_tracker_entity_id
+    )
     _LOGGER.debug("Initialized Google Home filter (options-first)")
 
     # Share coordinator in hass.data
@@ -584,12 +666,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # (precondition for registry-driven polling targets)
     await coordinator.async_setup()
 
-    # Register map views (idempotent across multi-entry)
+    # Register map and metrics views (idempotent across multi-entry)
     if not bucket.get("views_registered"):
         hass.http.register_view(GoogleFindMyMapView(hass))
         hass.http.register_view(GoogleFindMyMapRedirectView(hass))
+        hass.http.register_view(GoogleFindMyMetricsView(hass))
         bucket["views_registered"] = True
-        _LOGGER.debug("Registered map views")
+        _LOGGER.debug("Registered map and metrics views")
 
     # Register services (available regardless of data freshness; idempotent)
     await _async_register_services(hass, coordinator)
@@ -993,6 +1076,51 @@ async def _async_register_services(hass: HomeAssistant, coordinator: GoogleFindM
                 len(to_reload),
             )
 
+        async def async_set_poll_interval_service(call: ServiceCall) -> None:
+            """Handle set poll interval service call (per-device override; 0 clears it)."""
+            raw = call.data["device_id"]
+            interval = int(call.data[ATTR_INTERVAL])
+            try:
+                canonical_id, friendly = _resolve_canonical_from_any(str(raw))
+                coord = _get_coordinator_for_canonical_id(canonical_id)
+                if coord is None:
+                    raise ValueError(f"No coordinator found for device '{canonical_id}'")
+                coord.set_device_poll_override(canonical_id, interval or None)
+                if interval:
+                    _LOGGER.info("Poll interval for %s (%s) set to %ss", friendly, canonical_id, interval)
+                else:
+                    _LOGGER.info("Poll interval override for %s (%s) cleared", friendly, canonical_id)
+            except ValueError as err:
+                _LOGGER.error("Failed to set poll interval: %s", err)
+
+        async def async_profile_service(call: ServiceCall) -> dict[str, Any]:
+            """Run a time-boxed profiling capture and return the top functions (admin only)."""
+            user_id = call.context.user_id
+            if user_id is not None:
+                user = await hass.auth.async_get_user(user_id)
+                if user is None or not user.is_admin:
+                    raise Unauthorized(context=call.context)
+            mode = call.data[ATTR_MODE]
+            _LOGGER.info("Profiling capture started (%s, %ss)", mode, call.data[ATTR_DURATION])
+            try:
+                response = await async_profile_capture(
+                    call.data[ATTR_DURATION],
+                    sampling=mode == PROFILE_MODE_SAMPLING,
+                    top=call.data[ATTR_TOP],
+                    path_for=hass.config.path,
+                    run_in_executor=hass.async_add_executor_job,
+                )
+            except ProfileBusyError as err:
+                raise HomeAssistantError("A profiling capture is already running") from err
+            except ValueError as err:
+                # cProfile refuses to start while another profiler (e.g. HA's profiler) is active
+                raise HomeAssistantError(f"Profiler could not be started: {err}") from err
+            _LOGGER.info(
+                "Profiling capture finished; wrote %s",
+                ", ".join(response["files"].values()) or "no file (nothing sampled)",
+            )
+            return response
+
         # Register all services for the integration under the lock.
         hass.services.async_register(
             DOMAIN,
@@ -1018,6 +1146,19 @@ async def _async_register_services(hass: HomeAssistant, coordinator: GoogleFindM
             async_locate_external_service,
             schema=vol.Schema({vol.Required("device_id"): cv.string, vol.Optional("device_name"): cv.string}),
         )
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SET_POLL_INTERVAL,
+            async_set_poll_interval_service,
+            schema=vol.Schema(
+                {
+                    vol.Required("device_id"): cv.string,
+                    vol.Required(ATTR_INTERVAL): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=DEVICE_POLL_OVERRIDE_MAX_S)
+                    ),
+                }
+            ),
+        )
         hass.services.async_register(
             DOMAIN,
             SERVICE_REFRESH_DEVICE_URLS,
@@ -1036,6 +1177,27 @@ async def _async_register_services(hass: HomeAssistant, coordinator: GoogleFindM
             ),
         )
 
+        profile_kwargs: dict[str, Any] = {}
+        if SupportsResponse is not None:
+            profile_kwargs["supports_response"] = SupportsResponse.OPTIONAL
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            async_profile_service,
+            schema=vol.Schema(
+                {
+                    vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION_S): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=PROFILE_DURATION_MAX_S)
+                    ),
+                    vol.Optional(ATTR_MODE, default=PROFILE_MODE_SAMPLING): vol.In(PROFILE_MODES),
+                    vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=100)
+                    ),
+                }
+            ),
+            **profile_kwargs,
+        )
+
         domain_bucket["services_registered"] = True
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from time import perf_counter
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, runtime_checkable
 
 from aiohttp import ClientError, ClientSession
@@ -28,6 +29,8 @@ from .ProtoDecoders.decoder import (
     parse_device_list_protobuf,
 )
 from .const import CONF_OAUTH_TOKEN  # used by the ephemeral flow cache
+from .latency import STAGE_SELECT_BEST, observe_stage
+from .tracing import trace_span
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -521,7 +524,7 @@ class GoogleFindMyAPI:
 
     # --------------------------------- Location ----------------------------------
     async def async_get_device_location(
-        self, device_id: str, device_name: str
+        self, device_id: str, device_name: str, *, timeout_s: Optional[float] = None
     ) -> Dict[str, Any]:
         """Async, HA-compatible location request for a single device.
 
@@ -531,10 +534,15 @@ class GoogleFindMyAPI:
         Args:
             device_id: The canonical ID of the device.
             device_name: The human-readable name of the device for logging.
+            timeout_s: Optional bound for the FCM response wait (adaptive timeouts).
 
         Returns:
             A dictionary containing the best available location data for the device.
             Returns an empty dictionary on failure.
+
+        Raises:
+            NovaRateLimitError: The locate request was throttled.
+            NovaHTTPError: Server error or open circuit (classified by the caller).
         """
         # Register cache provider for multi-entry support
         from .NovaApi import nova_request
@@ -552,10 +560,18 @@ class GoogleFindMyAPI:
                 "API v3.0 Async: Requesting location for %s (%s)", device_name, device_id
             )
             # Explicitly pass cache to prevent cross-account contamination
+            extra: Dict[str, Any] = {}
+            if timeout_s is not None:
+                extra["fcm_timeout_s"] = timeout_s
             records = await get_location_data_for_device(
-                device_id, device_name, session=self._session, username=username, cache=self._cache
+                device_id, device_name, session=self._session, username=username, cache=self._cache,
+                **extra,
             )
+            select_started = perf_counter()
             best = self._select_best_location(records)
+            select_s = perf_counter() - select_started
+            observe_stage(STAGE_SELECT_BEST, select_s)
+            trace_span(STAGE_SELECT_BEST, select_s)
             if best:
                 _LOGGER.info(
                     "API v3.0 Async: Selected location record for %s (have %d total)",
@@ -565,6 +581,8 @@ class GoogleFindMyAPI:
                 return best
             _LOGGER.debug("API v3.0 Async: No location data for %s", device_name)
             return {}
+        except (NovaRateLimitError, NovaHTTPError):
+            raise
         except ClientError as err:
             _LOGGER.error(
                 "Network error while getting async location for %s (%s): %s",
@@ -19,7 +19,6 @@ Quality & design notes (HA Platinum guidelines)
 """
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
 from typing import Any
@@ -35,7 +34,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from .const import DEFAULT_MAP_VIEW_TOKEN_EXPIRATION, DOMAIN, SERVICE_LOCATE_DEVICE
-from .coordinator import GoogleFindMyCoordinator
+from .coordinator import DeviceSnapshot, GoogleFindMyCoordinator
+from .map_view import map_token_digest
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,25 +64,32 @@ LOCATE_DEVICE_DESCRIPTION = ButtonEntityDescription(
 )
 
 
-def _maybe_update_device_registry_name(hass: HomeAssistant, entity_id: str, new_name: str) -> None:
+def _maybe_update_device_registry_name(
+    hass: HomeAssistant, entity_id: str, new_name: str, registry_device_id: str | None = None
+) -> None:
     """Update the device's name in the registry if the user hasn't overridden it.
 
     Best practice:
     - Do not touch user-defined names (name_by_user).
     - Keep device registry name aligned with the upstream device label so that
       entity names composed via has_entity_name=True stay current.
+
+    `registry_device_id` (from the coordinator's tracker entity index) skips the
+    Entity Registry lookup.
     """
     try:
-        ent_reg = er.async_get(hass)
-        ent = ent_reg.async_get(entity_id)
-        if not ent or not ent.device_id:
-            return
+        device_id = registry_device_id
+        if not device_id:
+            ent = er.async_get(hass).async_get(entity_id)
+            if not ent or not ent.device_id:
+                return
+            device_id = ent.device_id
         dev_reg = dr.async_get(hass)
-        dev = dev_reg.async_get(ent.device_id)
+        dev = dev_reg.async_get(device_id)
         if not dev or dev.name_by_user:
             return
         if new_name and dev.name != new_name:
-            dev_reg.async_update_device(device_id=ent.device_id, name=new_name)
+            dev_reg.async_update_device(device_id=device_id, name=new_name)
             _LOGGER.debug(
                 "Device registry name updated for %s: '%s' -> '%s'",
                 entity_id,
@@ -105,7 +112,7 @@ async def async_setup_entry(
     entities: list[ButtonEntity] = []
 
     # Initial population from coordinator.data (if already available)
-    for device in coordinator.data or []:
+    for device in (coordinator.data or {}).values():
         dev_id = device.get("id")
         name = device.get("name")
         if dev_id and name and dev_id not in known_ids:
@@ -122,7 +129,10 @@ async def async_setup_entry(
     @callback
     def _add_new_devices() -> None:
         new_entities: list[ButtonEntity] = []
-        for device in coordinator.data or []:
+        data = coordinator.data or {}
+        # New devices are always among the changed ids of the published snapshot
+        devices = data.changed_entries() if isinstance(data, DeviceSnapshot) else data.values()
+        for device in devices:
             dev_id = device.get("id")
             name = device.get("name")
             if dev_id and name and dev_id not in known_ids:
@@ -150,17 +160,28 @@ class GoogleFindMyPlaySoundButton(CoordinatorEntity, ButtonEntity):
 
     def __init__(self, coordinator: GoogleFindMyCoordinator, device: dict[str, Any]) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self._device = device
+        # Per-device listener: only woken when this device's snapshot entry changes.
+        super().__init__(coordinator, device["id"])
+        # Own copy: snapshot entries are shared between published snapshots (read-only).
+        self._device = dict(device)
         dev_id = device["id"]
         # Include entry_id in unique_id for multi-account support
         entry_id = coordinator.config_entry.entry_id if coordinator.config_entry else "default"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{dev_id}_play_sound"
+        # Gating is evaluated once per coordinator update; identical states are not rewritten.
+        self._available_cache: bool | None = None
+        self._last_written_available: bool | None = None
         # Do not set _attr_name: with has_entity_name=True the UI composes the name automatically.
 
     # ---------------- Availability ----------------
     @property
     def available(self) -> bool:
+        """Return the availability computed at the last coordinator update."""
+        if self._available_cache is None:
+            self._available_cache = self._compute_available()
+        return self._available_cache
+
+    def _compute_available(self) -> bool:
         """Return True only if the device is present AND can likely play a sound.
 
         Presence has priority: if the device is absent from the latest Google list,
@@ -187,30 +208,36 @@ class GoogleFindMyPlaySoundButton(CoordinatorEntity, ButtonEntity):
         """React to coordinator updates (availability and device name may change)."""
         # Keep the raw device name in sync and update device registry if needed.
         try:
-            data = getattr(self.coordinator, "data", None) or []
             my_id = self._device["id"]
-            for dev in data:
-                if dev.get("id") == my_id:
-                    new_name = dev.get("name")
-                    # Never write bootstrap placeholders into the registry
-                    if (
-                        new_name
-                        and new_name != "Google Find My Device"
-                        and new_name != self._device.get("name")
-                    ):
-                        old = self._device.get("name")
-                        self._device["name"] = new_name
-                        _maybe_update_device_registry_name(self.hass, self.entity_id, new_name)
-                        _LOGGER.debug(
-                            "Button device label refreshed for %s: '%s' -> '%s'",
-                            my_id,
-                            old,
-                            new_name,
-                        )
-                    break
+            dev = self.coordinator.get_device_snapshot_entry(my_id)
+            new_name = dev.get("name") if dev else None
+            # Never write bootstrap placeholders into the registry
+            if (
+                new_name
+                and new_name != "Google Find My Device"
+                and new_name != self._device.get("name")
+            ):
+                old = self._device.get("name")
+                self._device["name"] = new_name
+                _maybe_update_device_registry_name(
+                    self.hass,
+                    self.entity_id,
+                    new_name,
+                    registry_device_id=self.coordinator.get_registry_device_id(my_id),
+                )
+                _LOGGER.debug(
+                    "Button device label refreshed for %s: '%s' -> '%s'",
+                    my_id,
+                    old,
+                    new_name,
+                )
         except (AttributeError, TypeError):
             pass
 
+        self._available_cache = self._compute_available()
+        if self._available_cache == self._last_written_available:
+            return
+        self._last_written_available = self._available_cache
         self.async_write_ha_state()
 
     # ---------------- Device Info + Map Link ----------------
@@ -282,7 +309,7 @@ class GoogleFindMyPlaySoundButton(CoordinatorEntity, ButtonEntity):
         else:
             token_src = f"{ha_uuid}:static"
 
-        return hashlib.md5(token_src.encode()).hexdigest()[:16]
+        return map_token_digest(token_src)
 
     # ---------------- Action ----------------
     async def async_press(self) -> None:
@@ -290,7 +317,7 @@ class GoogleFindMyPlaySoundButton(CoordinatorEntity, ButtonEntity):
         device_id = self._device["id"]
         device_name = self._device.get("name", device_id)
 
-        if not self.available:
+        if not self._compute_available():
             _LOGGER.warning(
                 "Play Sound not available for %s (%s) — push not ready, device not capable, or absent",
                 device_name,
@@ -319,15 +346,26 @@ class GoogleFindMyStopSoundButton(CoordinatorEntity, ButtonEntity):
 
     def __init__(self, coordinator: GoogleFindMyCoordinator, device: dict[str, Any]) -> None:
         """Initialize the stop-sound button."""
-        super().__init__(coordinator)
-        self._device = device
+        # Per-device listener: only woken when this device's snapshot entry changes.
+        super().__init__(coordinator, device["id"])
+        # Own copy: snapshot entries are shared between published snapshots (read-only).
+        self._device = dict(device)
         dev_id = device["id"]
         # Include entry_id in unique_id for multi-account support
         entry_id = coordinator.config_entry.entry_id if coordinator.config_entry else "default"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{dev_id}_stop_sound"
+        # Gating is evaluated once per coordinator update; identical states are not rewritten.
+        self._available_cache: bool | None = None
+        self._last_written_available: bool | None = None
 
     @property
     def available(self) -> bool:
+        """Return the availability computed at the last coordinator update."""
+        if self._available_cache is None:
+            self._available_cache = self._compute_available()
+        return self._available_cache
+
+    def _compute_available(self) -> bool:
         """Return True if the device is present; do not couple to Play gating.
 
         Rationale:
@@ -360,29 +398,35 @@ class GoogleFindMyStopSoundButton(CoordinatorEntity, ButtonEntity):
     def _handle_coordinator_update(self) -> None:
         """React to coordinator updates (availability and device name may change)."""
         try:
-            data = getattr(self.coordinator, "data", None) or []
             my_id = self._device["id"]
-            for dev in data:
-                if dev.get("id") == my_id:
-                    new_name = dev.get("name")
-                    if (
-                        new_name
-                        and new_name != "Google Find My Device"
-                        and new_name != self._device.get("name")
-                    ):
-                        old = self._device.get("name")
-                        self._device["name"] = new_name
-                        _maybe_update_device_registry_name(self.hass, self.entity_id, new_name)
-                        _LOGGER.debug(
-                            "StopSound button device label refreshed for %s: '%s' -> '%s'",
-                            my_id,
-                            old,
-                            new_name,
-                        )
-                    break
+            dev = self.coordinator.get_device_snapshot_entry(my_id)
+            new_name = dev.get("name") if dev else None
+            if (
+                new_name
+                and new_name != "Google Find My Device"
+                and new_name != self._device.get("name")
+            ):
+                old = self._device.get("name")
+                self._device["name"] = new_name
+                _maybe_update_device_registry_name(
+                    self.hass,
+                    self.entity_id,
+                    new_name,
+                    registry_device_id=self.coordinator.get_registry_device_id(my_id),
+                )
+                _LOGGER.debug(
+                    "StopSound button device label refreshed for %s: '%s' -> '%s'",
+                    my_id,
+                    old,
+                    new_name,
+                )
         except (AttributeError, TypeError):
             pass
 
+        self._available_cache = self._compute_available()
+        if self._available_cache == self._last_written_available:
+            return
+        self._last_written_available = self._available_cache
         self.async_write_ha_state()
 
     @property
@@ -447,14 +491,14 @@ class GoogleFindMyStopSoundButton(CoordinatorEntity, ButtonEntity):
         else:
             token_src = f"{ha_uuid}:static"
 
-        return hashlib.md5(token_src.encode()).hexdigest()[:16]
+        return map_token_digest(token_src)
 
     async def async_press(self) -> None:
         """Handle the button press (stop sound)."""
         device_id = self._device["id"]
         device_name = self._device.get("name", device_id)
 
-        if not self.available:
+        if not self._compute_available():
             _LOGGER.warning(
                 "Stop Sound not available for %s (%s) — device absent or not eligible",
                 device_name,
@@ -483,16 +527,27 @@ class GoogleFindMyLocateButton(CoordinatorEntity, ButtonEntity):
 
     def __init__(self, coordinator: GoogleFindMyCoordinator, device: dict[str, Any]) -> None:
         """Initialize the locate button entity."""
-        super().__init__(coordinator)
-        self._device = device
+        # Per-device listener: only woken when this device's snapshot entry changes.
+        super().__init__(coordinator, device["id"])
+        # Own copy: snapshot entries are shared between published snapshots (read-only).
+        self._device = dict(device)
         dev_id = device["id"]
         # Include entry_id in unique_id for multi-account support
         entry_id = coordinator.config_entry.entry_id if coordinator.config_entry else "default"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{dev_id}_locate_device"
+        # Gating is evaluated once per coordinator update; identical states are not rewritten.
+        self._available_cache: bool | None = None
+        self._last_written_available: bool | None = None
 
     # ---------------- Availability ----------------
     @property
     def available(self) -> bool:
+        """Return the availability computed at the last coordinator update."""
+        if self._available_cache is None:
+            self._available_cache = self._compute_available()
+        return self._available_cache
+
+    def _compute_available(self) -> bool:
         """Return True only if the device is present AND a manual locate is currently allowed.
 
         Presence has priority: if absent from Google's list, the button is unavailable.
@@ -517,29 +572,35 @@ class GoogleFindMyLocateButton(CoordinatorEntity, ButtonEntity):
     def _handle_coordinator_update(self) -> None:
         """React to coordinator updates (availability and device name may change)."""
         try:
-            data = getattr(self.coordinator, "data", None) or []
             my_id = self._device["id"]
-            for dev in data:
-                if dev.get("id") == my_id:
-                    new_name = dev.get("name")
-                    if (
-                        new_name
-                        and new_name != "Google Find My Device"
-                        and new_name != self._device.get("name")
-                    ):
-                        old = self._device.get("name")
-                        self._device["name"] = new_name
-                        _maybe_update_device_registry_name(self.hass, self.entity_id, new_name)
-                        _LOGGER.debug(
-                            "Locate button device label refreshed for %s: '%s' -> '%s'",
-                            my_id,
-                            old,
-                            new_name,
-                        )
-                    break
+            dev = self.coordinator.get_device_snapshot_entry(my_id)
+            new_name = dev.get("name") if dev else None
+            if (
+                new_name
+                and new_name != "Google Find My Device"
+                and new_name != self._device.get("name")
+            ):
+                old = self._device.get("name")
+                self._device["name"] = new_name
+                _maybe_update_device_registry_name(
+                    self.hass,
+                    self.entity_id,
+                    new_name,
+                    registry_device_id=self.coordinator.get_registry_device_id(my_id),
+                )
+                _LOGGER.debug(
+                    "Locate button device label refreshed for %s: '%s' -> '%s'",
+                    my_id,
+                    old,
+                    new_name,
+                )
         except (AttributeError, TypeError):
             pass
 
+        self._available_cache = self._compute_available()
+        if self._available_cache == self._last_written_available:
+            return
+        self._last_written_available = self._available_cache
         self.async_write_ha_state()
 
     # ---------------- Device Info + Map Link ----------------
@@ -608,7 +669,7 @@ class GoogleFindMyLocateButton(CoordinatorEntity, ButtonEntity):
         else:
             token_src = f"{ha_uuid}:static"
 
-        return hashlib.md5(token_src.encode()).hexdigest()[:16]
+        return map_token_digest(token_src)
 
     # ---------------- Action ----------------
     async def async_press(self) -> None:
@@ -620,7 +681,7 @@ class GoogleFindMyLocateButton(CoordinatorEntity, ButtonEntity):
         device_id = self._device["id"]
         device_name = self._device.get("name", device_id)
 
-        if not self.available:
+        if not self._compute_available():
             _LOGGER.warning(
                 "Locate now not available for %s (%s) — push not ready, in-flight/cooldown, or absent",
                 device_name,
@@ -63,6 +63,12 @@ from .const import (
     OPT_GOOGLE_HOME_FILTER_KEYWORDS,
     OPT_ENABLE_STATS_ENTITIES,
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
+    OPT_PUSH_BATCH_WINDOW_MS,
+    OPT_POLL_SPACING_MIN_S,
+    OPT_POLL_SPACING_MAX_S,
+    OPT_POLL_CYCLE_BUDGET_S,
+    OPT_SNAPSHOT_CHUNK_SIZE,
+    OPT_ENABLE_LOOP_WATCHDOG,
     OPT_IGNORED_DEVICES,  # visibility management
     # Defaults
     DEFAULT_LOCATION_POLL_INTERVAL,
@@ -73,6 +79,12 @@ from .const import (
     DEFAULT_GOOGLE_HOME_FILTER_KEYWORDS,
     DEFAULT_ENABLE_STATS_ENTITIES,
     DEFAULT_MAP_VIEW_TOKEN_EXPIRATION,
+    DEFAULT_PUSH_BATCH_WINDOW_MS,
+    DEFAULT_POLL_SPACING_MIN_S,
+    DEFAULT_POLL_SPACING_MAX_S,
+    DEFAULT_POLL_CYCLE_BUDGET_S,
+    DEFAULT_SNAPSHOT_CHUNK_SIZE,
+    DEFAULT_ENABLE_LOOP_WATCHDOG,
     DEFAULT_OPTIONS,
     OPT_OPTIONS_SCHEMA_VERSION,
     coerce_ignored_mapping,
@@ -729,6 +741,15 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
             OPT_MAP_VIEW_TOKEN_EXPIRATION,
             dat.get(OPT_MAP_VIEW_TOKEN_EXPIRATION, DEFAULT_MAP_VIEW_TOKEN_EXPIRATION),
         )
+        current_push_window = opt.get(
+            OPT_PUSH_BATCH_WINDOW_MS,
+            dat.get(OPT_PUSH_BATCH_WINDOW_MS, DEFAULT_PUSH_BATCH_WINDOW_MS),
+        )
+        current_spacing_min = opt.get(OPT_POLL_SPACING_MIN_S, dat.get(OPT_POLL_SPACING_MIN_S, DEFAULT_POLL_SPACING_MIN_S))
+        current_spacing_max = opt.get(OPT_POLL_SPACING_MAX_S, dat.get(OPT_POLL_SPACING_MAX_S, DEFAULT_POLL_SPACING_MAX_S))
+        current_cycle_budget = opt.get(OPT_POLL_CYCLE_BUDGET_S, dat.get(OPT_POLL_CYCLE_BUDGET_S, DEFAULT_POLL_CYCLE_BUDGET_S))
+        current_chunk_size = opt.get(OPT_SNAPSHOT_CHUNK_SIZE, dat.get(OPT_SNAPSHOT_CHUNK_SIZE, DEFAULT_SNAPSHOT_CHUNK_SIZE))
+        current_loop_watchdog = opt.get(OPT_ENABLE_LOOP_WATCHDOG, dat.get(OPT_ENABLE_LOOP_WATCHDOG, DEFAULT_ENABLE_LOOP_WATCHDOG))
 
         # Base schema *without* tracked_devices
         base_schema = vol.Schema(
@@ -741,11 +762,19 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
                 vol.Optional(OPT_GOOGLE_HOME_FILTER_KEYWORDS): str,
                 vol.Optional(OPT_ENABLE_STATS_ENTITIES): bool,
                 vol.Optional(OPT_MAP_VIEW_TOKEN_EXPIRATION): bool,
+                vol.Optional(OPT_PUSH_BATCH_WINDOW_MS): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                vol.Optional(OPT_POLL_SPACING_MIN_S): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                vol.Optional(OPT_POLL_SPACING_MAX_S): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+                vol.Optional(OPT_POLL_CYCLE_BUDGET_S): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(OPT_SNAPSHOT_CHUNK_SIZE): vol.All(vol.Coerce(int), vol.Range(min=25, max=5000)),
+                vol.Optional(OPT_ENABLE_LOOP_WATCHDOG): bool,
             }
         )
 
         if user_input is not None:
-            new_options = {
+            # Keep options managed elsewhere (ignored devices, per-device poll overrides).
+            new_options = dict(opt)
+            new_options.update({
                 OPT_LOCATION_POLL_INTERVAL: user_input.get(OPT_LOCATION_POLL_INTERVAL, current_interval),
                 OPT_DEVICE_POLL_DELAY: user_input.get(OPT_DEVICE_POLL_DELAY, current_delay),
                 OPT_MIN_ACCURACY_THRESHOLD: user_input.get(OPT_MIN_ACCURACY_THRESHOLD, current_min_acc),
@@ -754,7 +783,13 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
                 OPT_GOOGLE_HOME_FILTER_KEYWORDS: user_input.get(OPT_GOOGLE_HOME_FILTER_KEYWORDS, current_gh_keywords),
                 OPT_ENABLE_STATS_ENTITIES: user_input.get(OPT_ENABLE_STATS_ENTITIES, current_stats),
                 OPT_MAP_VIEW_TOKEN_EXPIRATION: user_input.get(OPT_MAP_VIEW_TOKEN_EXPIRATION, current_map_token_exp),
-            }
+                OPT_PUSH_BATCH_WINDOW_MS: user_input.get(OPT_PUSH_BATCH_WINDOW_MS, current_push_window),
+                OPT_POLL_SPACING_MIN_S: user_input.get(OPT_POLL_SPACING_MIN_S, current_spacing_min),
+                OPT_POLL_SPACING_MAX_S: user_input.get(OPT_POLL_SPACING_MAX_S, current_spacing_max),
+                OPT_POLL_CYCLE_BUDGET_S: user_input.get(OPT_POLL_CYCLE_BUDGET_S, current_cycle_budget),
+                OPT_SNAPSHOT_CHUNK_SIZE: user_input.get(OPT_SNAPSHOT_CHUNK_SIZE, current_chunk_size),
+                OPT_ENABLE_LOOP_WATCHDOG: user_input.get(OPT_ENABLE_LOOP_WATCHDOG, current_loop_watchdog),
+            })
 
             # Commit options and trigger automatic reload via OptionsFlowWithReload.
             return self.async_create_entry(title="", data=new_options)
@@ -768,6 +803,12 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
             OPT_GOOGLE_HOME_FILTER_KEYWORDS: current_gh_keywords,
             OPT_ENABLE_STATS_ENTITIES: current_stats,
             OPT_MAP_VIEW_TOKEN_EXPIRATION: current_map_token_exp,
+            OPT_PUSH_BATCH_WINDOW_MS: current_push_window,
+            OPT_POLL_SPACING_MIN_S: current_spacing_min,
+            OPT_POLL_SPACING_MAX_S: current_spacing_max,
+            OPT_POLL_CYCLE_BUDGET_S: current_cycle_budget,
+            OPT_SNAPSHOT_CHUNK_SIZE: current_chunk_size,
+            OPT_ENABLE_LOOP_WATCHDOG: current_loop_watchdog,
         }
 
         return self.async_show_form(
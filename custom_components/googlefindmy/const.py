@@ -39,6 +39,13 @@ OPT_GOOGLE_HOME_FILTER_ENABLED: str = "google_home_filter_enabled"
 OPT_GOOGLE_HOME_FILTER_KEYWORDS: str = "google_home_filter_keywords"
 OPT_MAP_VIEW_TOKEN_EXPIRATION: str = "map_view_token_expiration"
 OPT_IGNORED_DEVICES: str = "ignored_devices"
+OPT_PUSH_BATCH_WINDOW_MS: str = "push_batch_window_ms"
+OPT_POLL_SPACING_MIN_S: str = "poll_spacing_min_s"
+OPT_POLL_SPACING_MAX_S: str = "poll_spacing_max_s"
+OPT_DEVICE_POLL_OVERRIDES: str = "device_poll_overrides"
+OPT_POLL_CYCLE_BUDGET_S: str = "poll_cycle_budget_s"
+OPT_SNAPSHOT_CHUNK_SIZE: str = "snapshot_chunk_size"
+OPT_ENABLE_LOOP_WATCHDOG: str = "enable_loop_watchdog"
 
 # Canonical list of option keys supported by the integration (without tracked_devices)
 OPTION_KEYS: tuple[str, ...] = (
@@ -53,6 +60,13 @@ OPTION_KEYS: tuple[str, ...] = (
     OPT_GOOGLE_HOME_FILTER_ENABLED,
     OPT_GOOGLE_HOME_FILTER_KEYWORDS,
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
+    OPT_PUSH_BATCH_WINDOW_MS,
+    OPT_POLL_SPACING_MIN_S,
+    OPT_POLL_SPACING_MAX_S,
+    OPT_DEVICE_POLL_OVERRIDES,
+    OPT_POLL_CYCLE_BUDGET_S,
+    OPT_SNAPSHOT_CHUNK_SIZE,
+    OPT_ENABLE_LOOP_WATCHDOG,
 )
 
 # Keys which may exist historically in entry.data and should be soft-copied to entry.options
@@ -68,6 +82,32 @@ DEFAULT_LOCATION_POLL_INTERVAL: int = 300  # seconds; start a new polling cycle
 DEFAULT_DEVICE_POLL_DELAY: int = 5         # seconds; inter-device delay within one cycle
 DEFAULT_MIN_POLL_INTERVAL: int = 60        # seconds; hard lower bound between cycles
 
+# Push publishing: coalesce per-device commits arriving within this window into one
+# snapshot publish (0 => publish every push immediately).
+DEFAULT_PUSH_BATCH_WINDOW_MS: int = 250
+
+# Adaptive inter-device spacing (AIMD): the effective delay between devices starts at
+# device_poll_delay, shrinks while locates succeed quickly and backs off on timeouts/errors,
+# always clamped to [min, max].
+DEFAULT_POLL_SPACING_MIN_S: int = 1
+DEFAULT_POLL_SPACING_MAX_S: int = 60
+
+# Per-device poll cadence: user overrides are stored as {device_id: seconds} and take
+# precedence over the movement/zone-aware cadence model (set via the service).
+DEVICE_POLL_OVERRIDE_MAX_S: int = 86400
+
+# Poll cycle wall-clock budget: a cycle stops after this many seconds and the remaining
+# (staleness-ordered) queue is resumed first by the next cycle (0 => unlimited).
+DEFAULT_POLL_CYCLE_BUDGET_S: int = 600
+
+# Cooperative snapshot building: devices processed per slice before yielding to the
+# event loop (bounds loop stalls on very large accounts).
+DEFAULT_SNAPSHOT_CHUNK_SIZE: int = 250
+
+# Event-loop lag watchdog (diagnostics aid): measures scheduling lag and attributes
+# stalls to the integration code that was running. Off by default.
+DEFAULT_ENABLE_LOOP_WATCHDOG: bool = False
+
 # Manual locate policy (button/service)
 LOCATE_COOLDOWN_S: int = DEFAULT_MIN_POLL_INTERVAL
 """Cooldown window (seconds) applied after a manual locate trigger."""
@@ -104,6 +144,13 @@ DEFAULT_OPTIONS: dict[str, object] = {
     OPT_GOOGLE_HOME_FILTER_ENABLED: DEFAULT_GOOGLE_HOME_FILTER_ENABLED,
     OPT_GOOGLE_HOME_FILTER_KEYWORDS: DEFAULT_GOOGLE_HOME_FILTER_KEYWORDS,
     OPT_MAP_VIEW_TOKEN_EXPIRATION: DEFAULT_MAP_VIEW_TOKEN_EXPIRATION,
+    OPT_PUSH_BATCH_WINDOW_MS: DEFAULT_PUSH_BATCH_WINDOW_MS,
+    OPT_POLL_SPACING_MIN_S: DEFAULT_POLL_SPACING_MIN_S,
+    OPT_POLL_SPACING_MAX_S: DEFAULT_POLL_SPACING_MAX_S,
+    OPT_DEVICE_POLL_OVERRIDES: {},
+    OPT_POLL_CYCLE_BUDGET_S: DEFAULT_POLL_CYCLE_BUDGET_S,
+    OPT_SNAPSHOT_CHUNK_SIZE: DEFAULT_SNAPSHOT_CHUNK_SIZE,
+    OPT_ENABLE_LOOP_WATCHDOG: DEFAULT_ENABLE_LOOP_WATCHDOG,
 }
 
 # -------------------- Options schema versioning (lightweight) --------------------
@@ -226,8 +273,42 @@ CONFIG_FIELDS: dict[str, dict[str, object]] = {
     OPT_MAP_VIEW_TOKEN_EXPIRATION: {
         "type": "bool",
     },
+    OPT_PUSH_BATCH_WINDOW_MS: {
+        "type": "int",
+        "min": 0,
+        "max": 1000,
+        "step": 50,
+    },
+    OPT_POLL_SPACING_MIN_S: {
+        "type": "int",
+        "min": 0,
+        "max": 60,
+        "step": 1,
+    },
+    OPT_POLL_SPACING_MAX_S: {
+        "type": "int",
+        "min": 1,
+        "max": 600,
+        "step": 1,
+    },
+    OPT_POLL_CYCLE_BUDGET_S: {
+        "type": "int",
+        "min": 0,
+        "max": 3600,
+        "step": 30,
+    },
+    OPT_SNAPSHOT_CHUNK_SIZE: {
+        "type": "int",
+        "min": 25,
+        "max": 5000,
+        "step": 25,
+    },
+    OPT_ENABLE_LOOP_WATCHDOG: {
+        "type": "bool",
+    },
     # OPT_IGNORED_DEVICES is intentionally omitted: it is managed by a dedicated
     # visibility flow and not edited as a raw field (list of ids).
+    # OPT_DEVICE_POLL_OVERRIDES is omitted likewise: it is managed via SERVICE_SET_POLL_INTERVAL.
 }
 
 # --------------------------------------------------------------------------------------
@@ -243,6 +324,7 @@ SERVICE_REFRESH_DEVICE_URLS: str = "refresh_device_urls"
 SERVICE_REFRESH_URLS: str = SERVICE_REFRESH_DEVICE_URLS
 
 SERVICE_REBUILD_REGISTRY: str = "rebuild_registry"
+SERVICE_SET_POLL_INTERVAL: str = "set_poll_interval"
 
 # Optional attrs/modes for rebuild service
 ATTR_MODE: str = "mode"
@@ -251,6 +333,20 @@ MODE_REBUILD: str = "rebuild"
 MODE_MIGRATE: str = "migrate"
 REBUILD_REGISTRY_MODES: tuple[str, str] = (MODE_REBUILD, MODE_MIGRATE)
 
+# Attrs for the per-device poll interval service (0 clears the override)
+ATTR_INTERVAL: str = "interval"
+
+# Admin profiling service: time-boxed capture of the integration's hot paths
+SERVICE_PROFILE: str = "profile"
+ATTR_DURATION: str = "duration"
+ATTR_TOP: str = "top"
+PROFILE_MODE_SAMPLING: str = "sampling"
+PROFILE_MODE_CPROFILE: str = "cprofile"
+PROFILE_MODES: tuple[str, str] = (PROFILE_MODE_SAMPLING, PROFILE_MODE_CPROFILE)
+DEFAULT_PROFILE_DURATION_S: int = 30
+PROFILE_DURATION_MAX_S: int = 300
+DEFAULT_PROFILE_TOP: int = 15
+
 # --------------------------------------------------------------------------------------
 # Optional request timeouts (prefer central constants over scattered literals)
 # --------------------------------------------------------------------------------------
@@ -282,6 +378,9 @@ FCM_ABORT_ON_SEQ_ERROR_COUNT: int = 3
 # --------------------------------------------------------------------------------------
 STORAGE_KEY: str = f"{DOMAIN}_secrets"
 STORAGE_VERSION: int = 1
+# Warm-start cache (last device list + last known locations), one file per entry
+WARM_START_STORAGE_KEY: str = f"{DOMAIN}_warm_start"
+WARM_START_STORAGE_VERSION: int = 1
 
 __all__ = [
     "DOMAIN",
@@ -301,12 +400,26 @@ __all__ = [
     "OPT_GOOGLE_HOME_FILTER_ENABLED",
     "OPT_GOOGLE_HOME_FILTER_KEYWORDS",
     "OPT_MAP_VIEW_TOKEN_EXPIRATION",
+    "OPT_PUSH_BATCH_WINDOW_MS",
+    "OPT_POLL_SPACING_MIN_S",
+    "OPT_POLL_SPACING_MAX_S",
+    "OPT_DEVICE_POLL_OVERRIDES",
+    "OPT_POLL_CYCLE_BUDGET_S",
+    "OPT_SNAPSHOT_CHUNK_SIZE",
+    "OPT_ENABLE_LOOP_WATCHDOG",
     "OPTION_KEYS",
     "MIGRATE_DATA_KEYS_TO_OPTIONS",
     "UPDATE_INTERVAL",
     "DEFAULT_LOCATION_POLL_INTERVAL",
     "DEFAULT_DEVICE_POLL_DELAY",
     "DEFAULT_MIN_POLL_INTERVAL",
+    "DEFAULT_PUSH_BATCH_WINDOW_MS",
+    "DEFAULT_POLL_SPACING_MIN_S",
+    "DEFAULT_POLL_SPACING_MAX_S",
+    "DEVICE_POLL_OVERRIDE_MAX_S",
+    "DEFAULT_POLL_CYCLE_BUDGET_S",
+    "DEFAULT_SNAPSHOT_CHUNK_SIZE",
+    "DEFAULT_ENABLE_LOOP_WATCHDOG",
     "LOCATE_COOLDOWN_S",
     "DEFAULT_MIN_ACCURACY_THRESHOLD",
     "DEFAULT_MOVEMENT_THRESHOLD",
@@ -325,11 +438,22 @@ __all__ = [
     "SERVICE_REFRESH_DEVICE_URLS",
     "SERVICE_REFRESH_URLS",
     "SERVICE_REBUILD_REGISTRY",
+    "SERVICE_SET_POLL_INTERVAL",
     "ATTR_MODE",
     "ATTR_DEVICE_IDS",
     "MODE_REBUILD",
     "MODE_MIGRATE",
     "REBUILD_REGISTRY_MODES",
+    "ATTR_INTERVAL",
+    "SERVICE_PROFILE",
+    "ATTR_DURATION",
+    "ATTR_TOP",
+    "PROFILE_MODE_SAMPLING",
+    "PROFILE_MODE_CPROFILE",
+    "PROFILE_MODES",
+    "DEFAULT_PROFILE_DURATION_S",
+    "PROFILE_DURATION_MAX_S",
+    "DEFAULT_PROFILE_TOP",
     "LOCATION_REQUEST_TIMEOUT_S",
     "NOVA_API_USER_AGENT",
     "FCM_CLIENT_HEARTBEAT_INTERVAL_S",
@@ -340,6 +464,8 @@ __all__ = [
     "FCM_ABORT_ON_SEQ_ERROR_COUNT",
     "STORAGE_KEY",
     "STORAGE_VERSION",
+    "WARM_START_STORAGE_KEY",
+    "WARM_START_STORAGE_VERSION",
     "coerce_ignored_mapping",
     "ignored_choices_for_ui",
 ]
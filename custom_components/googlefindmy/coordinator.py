@@ -5,6 +5,8 @@ Discovery vs. polling semantics:
 - Every coordinator tick fetches the lightweight **full** Google device list.
 - Presence and name/capability caches are updated for all devices.
 - The published snapshot (`self.data`) contains **all** devices (for dynamic entity creation).
+  It is an immutable keyed `DeviceSnapshot` (device id -> entry); push and poll-cycle
+  publishes merge only the changed entries (copy-on-write) and carry `changed_ids`.
 - The sequential **polling cycle** polls **only devices that are enabled** in Home Assistant's
   Device Registry (devices with `disabled_by is None`) for **this** config entry. Devices explicitly
   ignored via options are filtered out as well. Devices without a Device Registry entry yet are
@@ -37,35 +39,95 @@ Implementation notes (server behaviour, POPETS'25):
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import math
 import time
 from collections import deque
+from collections.abc import (
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    ValuesView,
+)
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Protocol, Set, Callable
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple, Callable
 
 from homeassistant.components.recorder import (
     get_instance as get_recorder,
     history as recorder_history,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 # HA session is provided by the integration and reused across I/O
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
 from .api import GoogleFindMyAPI
+from .Auth.username_provider import username_string
+from .NovaApi.nova_request import NovaCircuitOpenError, NovaHTTPError, NovaRateLimitError
+from .NovaApi.scopes import NOVA_ACTION_API_SCOPE
+from .entity_index import TrackerEntityIndex
+from .latency import STAGE_GATING, STAGE_PUBLISH, PipelineLatency, pipeline_latency
+from .loop_watchdog import LoopLagWatchdog, loop_section, record_section
+from .tracing import (
+    OUTCOME_ERROR,
+    OUTCOME_FILTERED,
+    OUTCOME_INVALID,
+    OUTCOME_LOW_ACCURACY,
+    OUTCOME_NO_LOCATION,
+    OUTCOME_NOT_SIGNIFICANT,
+    OUTCOME_STALE,
+    OUTCOME_TIMEOUT,
+    TRACE_MANUAL,
+    TRACE_POLL,
+    LocateTrace,
+    TraceBuffer,
+    bind_trace,
+    current_trace,
+)
+from .device_state import (
+    DeviceState,
+    DeviceStateField,
+    DeviceStateFlag,
+    DeviceStateRegistry,
+    device_state_registry,
+)
+from .request_governor import (
+    LANE_BACKGROUND,
+    LANE_INTERACTIVE,
+    RequestDispatcher,
+    RequestGovernor,
+    circuit_breaker_states,
+    get_circuit_breaker,
+    get_governor,
+)
 from .const import (
     DOMAIN,
     UPDATE_INTERVAL,
     LOCATION_REQUEST_TIMEOUT_S,
     DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_PUSH_BATCH_WINDOW_MS,
+    DEFAULT_POLL_SPACING_MIN_S,
+    DEFAULT_POLL_SPACING_MAX_S,
+    DEFAULT_POLL_CYCLE_BUDGET_S,
+    DEFAULT_SNAPSHOT_CHUNK_SIZE,
     OPT_IGNORED_DEVICES,
+    OPT_DEVICE_POLL_OVERRIDES,
+    DEVICE_POLL_OVERRIDE_MAX_S,
     DEFAULT_OPTIONS,
+    WARM_START_STORAGE_KEY,
+    WARM_START_STORAGE_VERSION,
     coerce_ignored_mapping,
 )
 
@@ -91,12 +153,197 @@ _COOLDOWN_MIN_HIGH_TRAFFIC_S  = 300  # 5 min
 # -------------------------------------------------------------------------
 _EMPTY_LIST_QUORUM = 2  # require N consecutive *successful* empties before clearing
 
+# Adaptive device-list refresh: the full list is fetched at most every
+# `_device_list_interval_s`, which doubles (up to the maximum) while the decoded list
+# is unchanged and drops back to the minimum when it changes. Push hints for unknown
+# devices, Device Registry changes and reloads force the next tick to fetch.
+_DEVICE_LIST_REFRESH_MIN_S = UPDATE_INTERVAL
+_DEVICE_LIST_REFRESH_MAX_S = 3600
+_DEVICE_LIST_FIELDS = ("id", "name", "can_ring")
+
+# Stale-while-revalidate: once a snapshot is published, a due list fetch runs in the
+# background (bounded by the deadline) while the tick republishes the cached view.
+# A reused list keeps devices present only while it was validated within the
+# maximum list interval (plus the deadline); after that the presence TTL decides.
+_DEVICE_LIST_REVALIDATE_TIMEOUT_S = 30.0
+_DEVICE_LIST_MAX_AGE_S = _DEVICE_LIST_REFRESH_MAX_S + _DEVICE_LIST_REVALIDATE_TIMEOUT_S
+
+# Device Registry fields that can change whether/how a device is a poll target
+_DR_TARGET_FIELDS = frozenset({"config_entries", "identifiers", "disabled_by"})
+
+
+# -------------------------------------------------------------------------
+# No-op suppression: snapshot entry fields that are visible to entities. A device
+# whose fingerprint (these fields + presence/gating flags) is unchanged keeps its
+# previous entry and version, so its listeners are not woken.
+# `last_updated` is intentionally excluded (re-fetching the same fix is a no-op).
+# -------------------------------------------------------------------------
+_FINGERPRINT_FIELDS = (
+    "name",
+    "latitude",
+    "longitude",
+    "altitude",
+    "accuracy",
+    "last_seen",
+    "status",
+    "is_own_report",
+    "semantic_name",
+    "battery_level",
+    "location_source",
+)
+
+# -------------------------------------------------------------------------
+# Snapshot layering: a partial merge publishes an overlay of the changed entries
+# on the previous snapshot (O(changed)). Lookups walk at most this many layers;
+# a deeper merge, or one replacing a large part of the fleet, is compacted into
+# a flat snapshot. Full refreshes always publish a flat snapshot.
+# -------------------------------------------------------------------------
+_SNAPSHOT_MAX_LAYERS = 8
+
+
+# -------------------------------------------------------------------------
+# AIMD inter-device poll spacing: additive decrease of the delay after a fast
+# locate, multiplicative increase after a timeout/error (bounded by options).
+# -------------------------------------------------------------------------
+_SPACING_DECREASE_STEP_S = 0.5
+_SPACING_BACKOFF_FACTOR = 2.0
+_SPACING_FAST_LOCATE_S = LOCATION_REQUEST_TIMEOUT_S / 3  # "fast" = well below the timeout
+
+# -------------------------------------------------------------------------
+# Per-device poll cadence (multipliers of the base poll interval):
+# - moving: moved beyond the movement threshold within the moving window
+# - home: last fix inside zone.home and not moving
+# - stale: last report older than the stale age; each poll that yields nothing
+#   newer doubles the interval (bounded strikes), capped at the max interval
+# -------------------------------------------------------------------------
+_CADENCE_MOVING_WINDOW_S = 900
+_CADENCE_MOVING_FACTOR = 0.5
+_CADENCE_HOME_FACTOR = 4.0
+_CADENCE_STALE_AGE_S = 6 * 3600
+_CADENCE_STALE_MAX_STRIKES = 6
+_CADENCE_MAX_INTERVAL_S = 6 * 3600
+
+# Poll cycle ordering: priority = age of the last fix, halved per consecutive failure
+# (bounded) and doubled for devices with a user override. Never-located devices use a
+# large finite age so failures can still demote them.
+_PRIORITY_UNKNOWN_AGE_S = 7 * 86400
+_PRIORITY_MAX_FAILURE_HALVINGS = 6
+_PRIORITY_OVERRIDE_BOOST = 2.0
+_POLL_CYCLE_STATE_KEY = "poll_cycle_state"
+
+# Warm start: the last device list and location cache are written (debounced) to an
+# entry-scoped Store and published from it at setup, before the first network refresh.
+_WARM_START_SAVE_DELAY_S = 30.0
+_WARM_START_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# History fallback: how far back to search for a GPS-bearing state when an entity's
+# latest recorded state has no coordinates.
+_HISTORY_GPS_LOOKBACK_S = 7 * 86400
+
+# -------------------------------------------------------------------------
+# Adaptive locate timeouts: per-device smoothed latency/deviation (TCP-RTO style)
+# and a global EWMA + high percentile over recent successful locates. Devices that
+# timed out repeatedly are "unlikely to answer" and only get the minimum timeout,
+# with a full-length probe every few attempts so they can recover.
+# -------------------------------------------------------------------------
+_LOCATE_TIMEOUT_MIN_S = 10.0
+_LOCATE_TIMEOUT_MARGIN = 1.5  # applied to the global high percentile
+_LOCATE_GLOBAL_PERCENTILE = 0.95
+_LOCATE_GLOBAL_MIN_SAMPLES = 5
+_LOCATE_LATENCY_WINDOW = 64
+_LOCATE_FAST_FAIL_AFTER = 3  # consecutive timeouts
+_LOCATE_FULL_PROBE_EVERY = 4  # every Nth fast-fail attempt uses the full timeout
+_LOCATE_OUTER_GRACE_S = 5.0  # outer wait_for slack over the FCM wait
+
 
 def _clamp(val: float, lo: float, hi: float) -> float:
     """Return val clamped into [lo, hi]."""
     return max(lo, min(hi, val))
 
 
+def _parse_poll_overrides(raw: Any) -> Dict[str, int]:
+    """Return the valid per-device poll overrides {device_id: seconds} of an option value."""
+    if not isinstance(raw, Mapping):
+        return {}
+    overrides: Dict[str, int] = {}
+    for dev_id, seconds in raw.items():
+        try:
+            value = int(seconds)
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            overrides[str(dev_id)] = value
+    return overrides
+
+
+def _device_list_fingerprint(devices: List[Dict[str, Any]]) -> Hashable:
+    """Return an order-insensitive fingerprint of the fields the coordinator caches."""
+    return frozenset(tuple(dev.get(key) for key in _DEVICE_LIST_FIELDS) for dev in devices)
+
+
+class _LoopSlicer:
+    """Cooperative slicing of long per-device passes on the event loop.
+
+    Callers report processed items with `tick(n)`; once `chunk_size` items were
+    processed since the last yield it returns True and the caller awaits `pause()`,
+    which yields to the loop. The longest uninterrupted slice is tracked (blocking
+    time); `close()`/`resume()` bracket awaits that are not part of the pass.
+    """
+
+    __slots__ = (
+        "chunk_size",
+        "_count",
+        "_slice_started",
+        "block_s",
+        "max_block_s",
+        "pauses",
+        "touched",
+    )
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = max(1, int(chunk_size))
+        # Device ids published by other paths while this pass was yielding
+        self.touched: Set[str] = set()
+        self._count = 0
+        self._slice_started: Optional[float] = perf_counter()
+        self.block_s = 0.0
+        self.max_block_s = 0.0
+        self.pauses = 0
+
+    def tick(self, items: int = 1) -> bool:
+        """Count processed items; return True when the pass should yield."""
+        self._count += items
+        return self._count >= self.chunk_size
+
+    def close(self) -> None:
+        """End the current slice (before an await or at the end of the pass)."""
+        if self._slice_started is not None:
+            ended = perf_counter()
+            elapsed = ended - self._slice_started
+            self.block_s += elapsed
+            self.max_block_s = max(self.max_block_s, elapsed)
+            record_section("snapshot_pass", self._slice_started, ended)
+            self._slice_started = None
+
+    def resume(self) -> None:
+        """Start a new slice."""
+        self._count = 0
+        self._slice_started = perf_counter()
+
+    async def pause(self) -> None:
+        """Yield to the event loop between two slices."""
+        self.close()
+        self.pauses += 1
+        await asyncio.sleep(0)
+        self.resume()
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of `items` with at most `size` elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
 class CacheProtocol(Protocol):
     """Defines the interface for a cache that the coordinator can use.
 
@@ -108,9 +355,445 @@ class CacheProtocol(Protocol):
     async def async_set_cached_value(self, key: str, value: Any) -> None: ...
 
 
+class DeviceSnapshot(Mapping[str, Dict[str, Any]]):
+    """Immutable keyed snapshot published as `coordinator.data` (device id -> entry).
+
+    Copy-on-write semantics:
+    - A snapshot is never mutated after publication. `merge()` returns a **new**
+      snapshot that reuses every unchanged entry object and replaces only the
+      changed ones, so listeners can use identity/version checks cheaply.
+    - `version(device_id)` increases by one each time that device's entry is replaced.
+    - `changed_ids` holds the ids replaced or removed relative to the previous snapshot.
+
+    A partial merge stores only the changed entries (and the dropped ids) in a new
+    layer on top of the previous snapshot, so publishing a one-device update does
+    not copy the fleet. Lookups walk the layers (at most `_SNAPSHOT_MAX_LAYERS`);
+    iteration flattens them.
+
+    Entries are plain dicts for compatibility with existing consumers; treat them as
+    read-only (copy before modifying).
+    """
+
+    __slots__ = (
+        "_entries",
+        "_versions",
+        "_fingerprints",
+        "_removed",
+        "_parent",
+        "_depth",
+        "_size",
+        "changed_ids",
+    )
+
+    def __init__(
+        self,
+        entries: Optional[Dict[str, Dict[str, Any]]] = None,
+        versions: Optional[Dict[str, int]] = None,
+        changed_ids: frozenset[str] = frozenset(),
+        fingerprints: Optional[Dict[str, Hashable]] = None,
+    ) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = entries if entries is not None else {}
+        self._versions: Dict[str, int] = versions if versions is not None else {}
+        self._fingerprints: Dict[str, Optional[Hashable]] = (
+            fingerprints if fingerprints is not None else {}
+        )
+        self._removed: frozenset[str] = frozenset()
+        self._parent: Optional[DeviceSnapshot] = None
+        self._depth = 0
+        self._size = len(self._entries)
+        self.changed_ids: frozenset[str] = changed_ids
+
+    def _layer_of(self, device_id: str) -> Optional["DeviceSnapshot"]:
+        """Return the layer holding the device's current entry (None if absent)."""
+        layer: Optional[DeviceSnapshot] = self
+        while layer is not None:
+            if device_id in layer._entries:
+                return layer
+            if device_id in layer._removed:
+                return None
+            layer = layer._parent
+        return None
+
+    def __getitem__(self, device_id: str) -> Dict[str, Any]:
+        layer = self._layer_of(device_id)
+        if layer is None:
+            raise KeyError(device_id)
+        return layer._entries[device_id]
+
+    def __contains__(self, device_id: object) -> bool:
+        return isinstance(device_id, str) and self._layer_of(device_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._flatten()[0])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"DeviceSnapshot(devices={self._size}, changed={len(self.changed_ids)})"
+
+    def keys(self) -> KeysView[str]:
+        return self._flatten()[0].keys()
+
+    def values(self) -> ValuesView[Dict[str, Any]]:
+        return self._flatten()[0].values()
+
+    def items(self) -> ItemsView[str, Dict[str, Any]]:
+        return self._flatten()[0].items()
+
+    def version(self, device_id: str) -> int:
+        """Return the entry version for a device (0 if unknown)."""
+        layer = self._layer_of(device_id)
+        return layer._versions.get(device_id, 0) if layer is not None else 0
+
+    def _fingerprint(self, device_id: str) -> Optional[Hashable]:
+        """Return the stored content fingerprint of a device (None if unknown)."""
+        layer = self._layer_of(device_id)
+        return layer._fingerprints.get(device_id) if layer is not None else None
+
+    def _flatten(
+        self,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int], Dict[str, Optional[Hashable]]]:
+        """Return the entries, versions and fingerprints of all layers as flat maps.
+
+        A flat snapshot returns its own maps (read-only); a layered one returns new
+        maps in the order a copy-and-update merge would have produced.
+        """
+        if self._parent is None:
+            return self._entries, self._versions, self._fingerprints
+        chain: List[DeviceSnapshot] = []
+        layer: Optional[DeviceSnapshot] = self
+        while layer is not None:
+            chain.append(layer)
+            layer = layer._parent
+        root = chain.pop()
+        entries, versions, fps = dict(root._entries), dict(root._versions), dict(root._fingerprints)
+        for layer in reversed(chain):
+            for dev_id in layer._removed:
+                entries.pop(dev_id, None)
+                versions.pop(dev_id, None)
+                fps.pop(dev_id, None)
+            entries.update(layer._entries)
+            versions.update(layer._versions)
+            fps.update(layer._fingerprints)
+        return entries, versions, fps
+
+    def _overlay(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+        versions: Dict[str, int],
+        fingerprints: Dict[str, Optional[Hashable]],
+        removed: frozenset[str],
+        changed_ids: frozenset[str],
+        size: int,
+    ) -> "DeviceSnapshot":
+        """Return a snapshot layering a partial merge on this one (compacted if deep or large)."""
+        touched = len(entries) + len(removed)
+        if self._depth >= _SNAPSHOT_MAX_LAYERS or 2 * touched >= self._size:
+            flat_entries, flat_versions, flat_fps = self._flatten()
+            if self._parent is None:  # our own maps: copy before updating
+                flat_entries, flat_versions, flat_fps = (
+                    dict(flat_entries), dict(flat_versions), dict(flat_fps)
+                )
+            for dev_id in removed:
+                flat_entries.pop(dev_id, None)
+                flat_versions.pop(dev_id, None)
+                flat_fps.pop(dev_id, None)
+            flat_entries.update(entries)
+            flat_versions.update(versions)
+            flat_fps.update(fingerprints)
+            return DeviceSnapshot(flat_entries, flat_versions, changed_ids, flat_fps)
+        snapshot = DeviceSnapshot(entries, versions, changed_ids, fingerprints)
+        snapshot._removed = removed
+        snapshot._parent = self
+        snapshot._depth = self._depth + 1
+        snapshot._size = size
+        return snapshot
+
+    def merge(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        *,
+        replace_all: bool = False,
+        removed: Iterable[str] = (),
+        fingerprints: Optional[Dict[str, Hashable]] = None,
+    ) -> "DeviceSnapshot":
+        """Return a new snapshot with `entries` applied on top of this one.
+
+        Args:
+            entries: Snapshot entries (each carrying an ``id``) to insert or replace.
+            replace_all: If True, devices absent from `entries` are dropped (full refresh);
+                otherwise they are carried over unchanged (partial update).
+            removed: Device ids to drop explicitly (e.g. purge).
+            fingerprints: Optional content fingerprints per device id. An update whose
+                fingerprint equals the stored one is suppressed: the previous entry and
+                version are kept and the id is not reported as changed.
+
+        Returns:
+            The merged snapshot; `changed_ids` lists replaced, added and dropped ids.
+        """
+        merger = self.merger(replace_all=replace_all)
+        merger.add(entries, fingerprints)
+        return merger.finish(removed)
+
+    def merger(self, *, replace_all: bool = False) -> "_SnapshotMerger":
+        """Return an incremental merge onto this snapshot (entries added in chunks)."""
+        return _SnapshotMerger(self, replace_all)
+
+    def with_changed(self, device_ids: Iterable[str]) -> "DeviceSnapshot":
+        """Return a snapshot sharing all entries that flags `device_ids` as changed.
+
+        Used when per-device gating (availability) changed without a new entry.
+        """
+        snapshot = DeviceSnapshot(self._entries, self._versions, frozenset(device_ids), self._fingerprints)
+        snapshot._removed = self._removed
+        snapshot._parent = self._parent
+        snapshot._depth = self._depth
+        snapshot._size = self._size
+        return snapshot
+
+    def changed_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of the changed devices that are still present (O(changed))."""
+        for device_id in self.changed_ids:
+            layer = self._layer_of(device_id)
+            if layer is not None:
+                yield layer._entries[device_id]
+
+
+class _SnapshotMerger:
+    """Incremental `DeviceSnapshot.merge()`: `add()` chunks of entries, then `finish()`.
+
+    Works in one pass over the added entries into new maps: the changed entries
+    only (partial merge, published as a layer on the base) or every entry (full
+    refresh). Carried-over devices are never visited individually and a chunked
+    caller can yield between `add()` calls.
+    """
+
+    __slots__ = ("_base", "_replace_all", "_entries", "_versions", "_fps", "_changed", "suppressed")
+
+    def __init__(self, base: DeviceSnapshot, replace_all: bool) -> None:
+        self._base = base
+        self._replace_all = replace_all
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._fps: Dict[str, Optional[Hashable]] = {}
+        self._changed: Set[str] = set()
+        self.suppressed = 0  # entries of known devices kept as-is (no-op updates)
+
+    def add(
+        self, entries: Iterable[Dict[str, Any]], fingerprints: Optional[Dict[str, Hashable]] = None
+    ) -> None:
+        """Apply entries (see `DeviceSnapshot.merge()` for the fingerprint semantics)."""
+        fps = fingerprints or {}
+        base = self._base
+        new_entries, versions, new_fps, changed = self._entries, self._versions, self._fps, self._changed
+        for entry in entries:
+            dev_id = entry.get("id")
+            if not isinstance(dev_id, str):
+                continue
+            fp = fps.get(dev_id)
+            layer = base._layer_of(dev_id)
+            previous = layer._entries[dev_id] if layer is not None else None
+            version = layer._versions.get(dev_id, 0) if layer is not None else 0
+            merged = entry
+            if (
+                previous is not None
+                and fp is not None
+                and layer is not None
+                and layer._fingerprints.get(dev_id) == fp
+            ):
+                # No-op update: keep the previous entry object (structural reuse).
+                merged = previous
+            if merged is previous:
+                changed.discard(dev_id)
+                self.suppressed += 1
+                if not self._replace_all:
+                    # Unchanged in a partial merge: the base keeps serving it
+                    new_entries.pop(dev_id, None)
+                    versions.pop(dev_id, None)
+                    new_fps.pop(dev_id, None)
+                    continue
+            else:
+                version += 1
+                changed.add(dev_id)
+            new_entries[dev_id] = merged
+            versions[dev_id] = version
+            new_fps[dev_id] = fp
+
+    def finish(self, removed: Iterable[str] = ()) -> DeviceSnapshot:
+        """Return the merged snapshot; `changed_ids` lists replaced, added and dropped ids."""
+        base = self._base
+        entries, versions, fps, changed = self._entries, self._versions, self._fps, self._changed
+        if self._replace_all:
+            changed.update(dev_id for dev_id in base if dev_id not in entries)
+        dropped: Set[str] = set()
+        for dev_id in removed:
+            entries.pop(dev_id, None)
+            versions.pop(dev_id, None)
+            fps.pop(dev_id, None)
+            if dev_id in base:
+                dropped.add(dev_id)
+                changed.add(dev_id)
+            else:
+                changed.discard(dev_id)
+        if self._replace_all:
+            return DeviceSnapshot(entries, versions, frozenset(changed), fps)
+        size = len(base) - len(dropped) + sum(1 for dev_id in entries if dev_id not in base)
+        return base._overlay(entries, versions, fps, frozenset(dropped), frozenset(changed), size)
+
+
+class PollSpacingController:
+    """AIMD controller for the delay between devices within a poll cycle.
+
+    The spacing shrinks by a fixed step after each fast, successful locate and is
+    multiplied after a timeout or error, always clamped to `[min_s, max_s]`. Slow
+    successes and empty answers leave it unchanged.
+    """
+
+    __slots__ = ("min_s", "max_s", "spacing_s")
+
+    def __init__(self, initial_s: float, min_s: float, max_s: float) -> None:
+        self.min_s = 0.0
+        self.max_s = 0.0
+        self.spacing_s = float(initial_s)
+        self.reconfigure(min_s, max_s)
+
+    def reconfigure(self, min_s: float, max_s: float, initial_s: Optional[float] = None) -> None:
+        """Apply new bounds (and optionally reset the spacing)."""
+        self.min_s = max(0.0, float(min_s))
+        self.max_s = max(self.min_s, float(max_s))
+        if initial_s is not None:
+            self.spacing_s = float(initial_s)
+        self.spacing_s = _clamp(self.spacing_s, self.min_s, self.max_s)
+
+    def on_success(self, latency_s: float) -> float:
+        """Record a successful locate; returns the new spacing."""
+        if latency_s <= _SPACING_FAST_LOCATE_S:
+            self.spacing_s = max(self.min_s, self.spacing_s - _SPACING_DECREASE_STEP_S)
+        return self.spacing_s
+
+    def on_failure(self) -> float:
+        """Record a timeout/error; returns the new spacing."""
+        grown = max(self.spacing_s * _SPACING_BACKOFF_FACTOR, self.spacing_s + _SPACING_DECREASE_STEP_S)
+        self.spacing_s = min(self.max_s, grown)
+        return self.spacing_s
+
+
+class _DeviceLatency:
+    """Per-device locate latency estimator state."""
+
+    __slots__ = ("srtt", "rttvar", "timeouts")
+
+    def __init__(self) -> None:
+        self.srtt: Optional[float] = None
+        self.rttvar: float = 0.0
+        self.timeouts: int = 0
+
+
+class LocateLatencyTracker:
+    """Latency estimators for locate requests and the timeouts derived from them.
+
+    The timeout for a device is `max(srtt + 4 * rttvar, p95 * margin)` clamped to
+    `[min_s, max_s]`; unknown devices fall back to the global estimate and, without
+    enough samples, to `max_s`. Timeouts are censored samples: they do not feed the
+    latency estimators but count towards the fast-fail mode.
+    """
+
+    __slots__ = ("min_s", "max_s", "_devices", "_window", "_global_ewma")
+
+    def __init__(self, min_s: float = _LOCATE_TIMEOUT_MIN_S, max_s: float = LOCATION_REQUEST_TIMEOUT_S) -> None:
+        self.min_s = float(min_s)
+        self.max_s = max(self.min_s, float(max_s))
+        self._devices: Dict[str, _DeviceLatency] = {}
+        self._window: deque = deque(maxlen=_LOCATE_LATENCY_WINDOW)
+        self._global_ewma: Optional[float] = None
+
+    def observe(self, device_id: str, latency_s: float) -> None:
+        """Record a successful locate and its latency."""
+        latency_s = max(0.0, float(latency_s))
+        slot = self._devices.setdefault(device_id, _DeviceLatency())
+        if slot.srtt is None:
+            slot.srtt, slot.rttvar = latency_s, latency_s / 2.0
+        else:
+            slot.rttvar = 0.75 * slot.rttvar + 0.25 * abs(slot.srtt - latency_s)
+            slot.srtt = 0.875 * slot.srtt + 0.125 * latency_s
+        slot.timeouts = 0
+        self._window.append(latency_s)
+        self._global_ewma = (
+            latency_s if self._global_ewma is None else 0.8 * self._global_ewma + 0.2 * latency_s
+        )
+
+    def observe_timeout(self, device_id: str) -> None:
+        """Record a locate that did not answer within its timeout."""
+        self._devices.setdefault(device_id, _DeviceLatency()).timeouts += 1
+
+    def forget(self, device_id: str) -> None:
+        """Drop the estimator state of a device."""
+        self._devices.pop(device_id, None)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-quantile of recent successful latencies (None without samples)."""
+        if not self._window:
+            return None
+        ordered = sorted(self._window)
+        return ordered[max(0, min(len(ordered) - 1, int(math.ceil(q * len(ordered))) - 1))]
+
+    def is_unlikely(self, device_id: str) -> bool:
+        """Return True if a device timed out often enough to be fast-failed."""
+        slot = self._devices.get(device_id)
+        return slot is not None and slot.timeouts >= _LOCATE_FAST_FAIL_AFTER
+
+    def timeout_for(self, device_id: str) -> float:
+        """Return the timeout (seconds) for the next locate of a device."""
+        slot = self._devices.get(device_id)
+        if slot is not None and slot.timeouts >= _LOCATE_FAST_FAIL_AFTER:
+            attempt = slot.timeouts - _LOCATE_FAST_FAIL_AFTER + 1
+            return self.max_s if attempt % _LOCATE_FULL_PROBE_EVERY == 0 else self.min_s
+
+        candidates: List[float] = []
+        if slot is not None and slot.srtt is not None:
+            candidates.append(slot.srtt + 4.0 * slot.rttvar)
+        if len(self._window) >= _LOCATE_GLOBAL_MIN_SAMPLES:
+            candidates.append((self.percentile(_LOCATE_GLOBAL_PERCENTILE) or 0.0) * _LOCATE_TIMEOUT_MARGIN)
+        if not candidates:
+            return self.max_s
+        return _clamp(max(candidates), self.min_s, self.max_s)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a diagnostics-friendly summary (no device identifiers)."""
+        p95 = self.percentile(_LOCATE_GLOBAL_PERCENTILE)
+        return {
+            "samples": len(self._window),
+            "ewma_s": round(self._global_ewma, 2) if self._global_ewma is not None else None,
+            "p95_s": round(p95, 2) if p95 is not None else None,
+            "default_timeout_s": round(self.timeout_for(""), 2),
+            "devices_tracked": sum(1 for slot in self._devices.values() if slot.srtt is not None),
+            "devices_fast_fail": sum(
+                1 for slot in self._devices.values() if slot.timeouts >= _LOCATE_FAST_FAIL_AFTER
+            ),
+            "timeout_bounds_s": [self.min_s, self.max_s],
+        }
+
+
 # -------------------------------------------------------------------------
 # Synchronous history helper (runs in Recorder executor)
 # -------------------------------------------------------------------------
+def _gps_fix_from_state(state: Any) -> Optional[Dict[str, Any]]:
+    """Return location fields from a recorded state, or None if it carries no GPS."""
+    attrs = getattr(state, "attributes", {}) or {}
+    lat = attrs.get("latitude")
+    lon = attrs.get("longitude")
+    if lat is None or lon is None:
+        return None
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "accuracy": attrs.get("gps_accuracy"),
+        "last_seen": int(state.last_updated.timestamp()),
+        "status": "Using historical data",
+    }
+
+
 def _sync_get_last_gps_from_history(
     hass: HomeAssistant, entity_id: str
 ) -> Optional[Dict[str, Any]]:
@@ -134,27 +817,72 @@ def _sync_get_last_gps_from_history(
         samples = changes.get(entity_id, [])
         if not samples:
             return None
-
-        last_state = samples[-1]
-        attrs = getattr(last_state, "attributes", {}) or {}
-        lat = attrs.get("latitude")
-        lon = attrs.get("longitude")
-        if lat is None or lon is None:
-            return None
-
-        return {
-            "latitude": lat,
-            "longitude": lon,
-            "accuracy": attrs.get("gps_accuracy"),
-            "last_seen": int(last_state.last_updated.timestamp()),
-            "status": "Using historical data",
-        }
+        return _gps_fix_from_state(samples[-1])
     except Exception as err:
         _LOGGER.debug("History lookup failed for %s: %s", entity_id, err)
         return None
 
 
-class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
+def _sync_get_last_gps_from_history_batch(
+    hass: HomeAssistant, entity_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch the latest GPS-bearing state for many entities with batched queries.
+
+    One query returns the current (latest) recorded state of every entity. Only
+    entities whose latest state carries no coordinates (e.g. "unavailable" after
+    a restart) are looked up again, together in one query over
+    `_HISTORY_GPS_LOOKBACK_S`, newest GPS-bearing state first.
+
+    IMPORTANT:
+        Synchronous database I/O; run it in the Recorder's executor.
+
+    Args:
+        hass: The Home Assistant instance.
+        entity_ids: The device_tracker entity IDs to query.
+
+    Returns:
+        Mapping of entity_id -> location data for entities with a GPS fix.
+    """
+    if not entity_ids:
+        return {}
+    now = datetime.now(timezone.utc)
+    found: Dict[str, Dict[str, Any]] = {}
+    try:
+        latest = recorder_history.get_significant_states(
+            hass,
+            now,
+            None,
+            list(entity_ids),
+            include_start_time_state=True,
+            significant_changes_only=False,
+        )
+        for entity_id, states in latest.items():
+            fix = _gps_fix_from_state(states[-1]) if states else None
+            if fix:
+                found[entity_id] = fix
+
+        remaining = [eid for eid in entity_ids if eid not in found]
+        if remaining:
+            window = recorder_history.get_significant_states(
+                hass,
+                now - timedelta(seconds=_HISTORY_GPS_LOOKBACK_S),
+                now,
+                remaining,
+                include_start_time_state=False,
+                significant_changes_only=False,
+            )
+            for entity_id, states in window.items():
+                for state in reversed(states):
+                    fix = _gps_fix_from_state(state)
+                    if fix:
+                        found[entity_id] = fix
+                        break
+    except Exception as err:
+        _LOGGER.debug("Batched history lookup failed for %d entities: %s", len(entity_ids), err)
+    return found
+
+
+class GoogleFindMyCoordinator(DataUpdateCoordinator[DeviceSnapshot]):
     """Coordinator that manages polling, cache, and push updates for Google Find My Device.
 
     Thread-safety & event loop rules (IMPORTANT):
@@ -177,6 +905,27 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
       HA event loop – the loop itself is the synchronization primitive.
     """
 
+    # Per-device state lives in one `DeviceState` record per device (see `_devices`);
+    # these attributes are live per-concern views over the record fields.
+    _device_location_data = DeviceStateField("location")  # device_id -> location dict
+    _device_names = DeviceStateField("name")  # device_id -> human name
+    _device_caps = DeviceStateField("caps")  # device_id -> caps (e.g., {"can_ring": True})
+    _device_location_source = DeviceStateField("location_source")  # "poll" | "push" | "restored"
+    _present_last_seen = DeviceStateField("present_last_seen")  # mono, last seen in full list
+    _locate_inflight = DeviceStateFlag("locate_inflight")  # devices with a manual locate running
+    _locate_cooldown_until = DeviceStateField("locate_cooldown_until")  # mono deadline
+    _sound_request_uuids = DeviceStateField("sound_request_uuid")  # last Play Sound request
+    _device_poll_cooldown_until = DeviceStateField("poll_cooldown_until")  # mono deadline
+    _device_next_poll_mono = DeviceStateField("next_poll_mono")  # mono due time
+    _device_last_moved_wall = DeviceStateField("last_moved_wall")  # epoch of last movement
+    _device_stale_strikes = DeviceStateField("stale_strikes")  # polls without newer fix
+    _device_poll_failures = DeviceStateField("poll_failures")  # consecutive poll failures
+
+    @property
+    def _devices(self) -> DeviceStateRegistry:
+        """Return the per-device state registry (created on first use)."""
+        return device_state_registry(self)
+
     # ---------------------------- Lifecycle ---------------------------------
     def __init__(
         self,
@@ -189,6 +938,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         min_accuracy_threshold: int = 100,
         movement_threshold: int = 50,
         allow_history_fallback: bool = False,
+        push_batch_window_ms: int = DEFAULT_PUSH_BATCH_WINDOW_MS,
+        poll_spacing_min_s: int = DEFAULT_POLL_SPACING_MIN_S,
+        poll_spacing_max_s: int = DEFAULT_POLL_SPACING_MAX_S,
+        poll_cycle_budget_s: int = DEFAULT_POLL_CYCLE_BUDGET_S,
+        snapshot_chunk_size: int = DEFAULT_SNAPSHOT_CHUNK_SIZE,
+        device_poll_overrides: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Initialize the coordinator.
 
@@ -208,6 +963,13 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             min_accuracy_threshold: The minimum GPS accuracy in meters to accept a location.
             movement_threshold: Movement delta in meters for significance gating (default 50 m).
             allow_history_fallback: Whether to fall back to Recorder history for location.
+            push_batch_window_ms: Window in milliseconds for coalescing push commits into
+                a single snapshot publish (0 disables batching).
+            poll_spacing_min_s: Lower bound for the adaptive inter-device spacing.
+            poll_spacing_max_s: Upper bound for the adaptive inter-device spacing.
+            poll_cycle_budget_s: Wall-clock budget of one poll cycle in seconds (0 = unlimited).
+            snapshot_chunk_size: Devices per cooperative slice of a snapshot build.
+            device_poll_overrides: Per-device poll intervals {device_id: seconds}.
         """
         self.hass = hass
         self._cache = cache
@@ -223,18 +985,32 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._min_accuracy_threshold = int(min_accuracy_threshold)  # quality filter (meters)
         self._movement_threshold = int(movement_threshold)  # meters; used by significance gate
         self.allow_history_fallback = bool(allow_history_fallback)
-
-        # Internal caches & bookkeeping
-        self._device_location_data: Dict[str, Dict[str, Any]] = {}  # device_id -> location dict
-        self._device_names: Dict[str, str] = {}  # device_id -> human name
-        self._device_caps: Dict[str, Dict[str, Any]] = {}  # device_id -> caps (e.g., {"can_ring": True})
+        self.push_batch_window_s = max(0, int(push_batch_window_ms)) / 1000.0
+        # Adaptive inter-device spacing, seeded from device_poll_delay
+        self._poll_spacing = PollSpacingController(
+            self.device_poll_delay, poll_spacing_min_s, poll_spacing_max_s
+        )
+        self.poll_cycle_budget_s = max(0, int(poll_cycle_budget_s))
+        self.snapshot_chunk_size = max(1, int(snapshot_chunk_size))
+        self._poll_overrides = _parse_poll_overrides(device_poll_overrides)
+        # Cooperative snapshot passes: active passes (to learn about concurrent
+        # publishes) and the loop-blocking figures of the latest pass (see _LoopSlicer)
+        self._snapshot_passes: List[_LoopSlicer] = []
+        self._snapshot_pass_info: Dict[str, Any] = {}
+        # Adaptive locate timeouts derived from observed latencies
+        self._locate_latency = LocateLatencyTracker()
+        # Per-stage latency histograms of the location pipeline (poll and push paths)
+        self._pipeline_latency = PipelineLatency()
+        # End-to-end timelines of the latest locates (poll, manual and push)
+        self._locate_traces = TraceBuffer()
+
+        # Internal caches & bookkeeping (per-device fields: see the class-level views)
         self._present_device_ids: Set[str] = set()  # diagnostics-only set from latest non-empty list
 
         # Presence smoothing (TTL):
-        # - Per-device "last seen in full list" timestamp (monotonic)
+        # - Per-device "last seen in full list" timestamp (monotonic, `_present_last_seen`)
         # - Cold-start marker: timestamp of last non-empty list (monotonic)
         # - Presence TTL in seconds (derived from poll interval, min 120s)
-        self._present_last_seen: Dict[str, float] = {}
         self._last_nonempty_wall: float = 0.0
         self._presence_ttl_s: int = 120
 
@@ -242,6 +1018,18 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._last_device_list: List[Dict[str, Any]] = []
         self._empty_list_streak: int = 0
 
+        # Adaptive device-list refresh (see _device_list_refresh_due())
+        self._device_list_fetched_mono: float = 0.0
+        self._device_list_interval_s: float = float(_DEVICE_LIST_REFRESH_MIN_S)
+        self._device_list_refresh_requested: bool = False
+        self._device_list_fp: Optional[Hashable] = None  # decoded list
+        self._device_view_fp: Optional[Hashable] = None  # decoded list + ignore filter
+        # Background list revalidation (stale-while-revalidate, see _async_revalidate_device_list())
+        self._device_list_validated_mono: float = 0.0  # last successful fetch
+        self._revalidate_task: Optional[asyncio.Task] = None
+        self._revalidate_error: Optional[str] = None  # last failure (diagnostics)
+        self._revalidate_auth_failed: Optional[ConfigEntryAuthFailed] = None
+
         # Polling state
         self._poll_lock = asyncio.Lock()
         self._is_polling = False
@@ -256,20 +1044,39 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._push_ready_memo: Optional[bool] = None
         self._push_cooldown_until: float = 0.0
 
-        # Manual locate gating (UX + server protection)
-        self._locate_inflight: Set[str] = set()                # device_id -> in-flight flag
-        self._locate_cooldown_until: Dict[str, float] = {}     # device_id -> mono deadline
-
-        # Play Sound UUID tracking (needed to properly cancel sound requests)
-        self._sound_request_uuids: Dict[str, str] = {}         # device_id -> request_uuid
-
-        # Per-device poll cooldowns after owner/crowdsourced reports.
-        self._device_poll_cooldown_until: Dict[str, float] = {}
+        # Resumable poll cycles: queue left over by a cycle that hit its budget or was
+        # cancelled (polled first next time). Persisted alongside the statistics together
+        # with the per-device poll failure counts.
+        self._poll_carryover: List[str] = []
+        self._poll_task: Optional[asyncio.Task] = None
 
         # DR-driven poll targeting
         self._enabled_poll_device_ids: Set[str] = set()
         self._devices_with_entry: Set[str] = set()
         self._dr_unsub: Optional[Callable] = None
+        # Incremental DR index for this entry: registry device id -> our device id, and
+        # our device id -> {registry device id: enabled}. Built by the full reindex, then
+        # maintained from create/update/remove event payloads.
+        self._dr_index: Dict[str, str] = {}
+        self._dr_targets: Dict[str, Dict[str, bool]] = {}
+        self._dr_indexed_entry_id: Optional[str] = None
+        # Device id <-> tracker entity id <-> HA device id for this entry (built lazily,
+        # maintained from Entity Registry events while subscribed)
+        self._entity_index: Optional[TrackerEntityIndex] = None
+        # Shared event-loop watchdog, set by setup when enabled in the options
+        self.loop_watchdog: Optional[LoopLagWatchdog] = None
+        self._er_unsub: Optional[Callable] = None
+
+        # Push micro-batching: device ids committed since the last publish and the
+        # pending flush timer (one snapshot publish per window instead of per device).
+        self._push_pending_ids: Set[str] = set()
+        self._push_flush_cancel: Optional[Callable[[], None]] = None
+
+        # Account-wide request governor (shared with the Nova/SPOT transports; resolved lazily
+        # because the account name lives in the token cache).
+        self._request_governor: Optional[RequestGovernor] = None
+        # Interactive (buttons/services) vs background (poll cycle) request lanes
+        self._dispatcher = RequestDispatcher(on_wait=self._note_lane_wait)
 
         # Statistics (extend as needed)
         self.stats: Dict[str, int] = {
@@ -281,6 +1088,20 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             "invalid_coords": 0,
             "low_quality_dropped": 0,
             "non_significant_dropped": 0,
+            "push_updates_coalesced": 0,  # push_updated() calls merged into a pending batch
+            "suppressed_updates": 0,  # device updates skipped as no-op (fingerprint unchanged)
+            "throttle_deferrals": 0,  # poll cycles deferred while the account was paused
+            "poll_budget_exhausted": 0,  # poll cycles stopped early by the wall-clock budget
+            "locate_fast_fail": 0,    # locates issued with the short timeout (unlikely to answer)
+            "circuit_open_deferrals": 0,  # poll cycles stopped because the locate endpoint's circuit is open
+            "device_list_fetches": 0,  # full device-list RPCs
+            "device_list_unchanged": 0,  # fetched lists identical to the previous one
+            "stale_while_revalidate": 0,  # ticks that republished cached data during a list revalidation
+            "revalidation_failures": 0,  # background list fetches that failed or missed the deadline
+            "snapshot_block_ms": 0,  # cumulative event-loop blocking time of snapshot passes
+            "snapshot_yields": 0,    # cooperative yields to the loop during snapshot passes
+            "interactive_queue_wait_ms": 0,  # cumulative dispatcher queue wait, interactive lane
+            "background_queue_wait_ms": 0,   # cumulative dispatcher queue wait, background lane
         }
         _LOGGER.debug("Initialized stats: %s", self.stats)
 
@@ -292,12 +1113,19 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._stats_save_task: Optional[asyncio.Task] = None
         self._stats_debounce_seconds: float = 5.0
 
+        # Warm-start cache (Store is bound to the config entry in async_setup())
+        self._warm_store: Optional[Store] = None
+        self._warm_start_info: Dict[str, Any] = {}
+
         # Load persistent statistics asynchronously (name the task for better debugging)
         self.hass.async_create_task(self._async_load_stats(), name=f"{DOMAIN}.load_stats")
 
         # Short-retry scheduling handle (coalesced)
         self._short_retry_cancel: Optional[Callable[[], None]] = None
 
+        # Listener fan-out: last `last_update_success` seen by async_update_listeners()
+        self._fanout_last_success: bool = True
+
         super().__init__(
             hass,
             _LOGGER,
@@ -310,14 +1138,29 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
         - Loads stats (already scheduled in __init__, so this is idempotent).
         - Indexes poll targets from the Device Registry.
-        - Subscribes to DR updates (unsubscribed in `async_shutdown()`).
+        - Subscribes to relevant DR updates (filtered per event; unsubscribed in
+          `async_shutdown()`).
+        - Subscribes to Entity Registry updates that affect the tracker entity index.
+        - Publishes the warm-start snapshot (if any) so platforms set up with data.
         """
         # Initial index (works even if config_entry is not yet bound; will re-run on DR event)
-        self._reindex_poll_targets_from_device_registry()
+        with loop_section("registry_reindex"):
+            self._reindex_poll_targets_from_device_registry()
         if self._dr_unsub is None:
             self._dr_unsub = self.hass.bus.async_listen(
-                EVENT_DEVICE_REGISTRY_UPDATED, self._handle_dr_event
+                EVENT_DEVICE_REGISTRY_UPDATED,
+                self._handle_dr_event,
+                event_filter=self._dr_event_filter,
+            )
+        if self._er_unsub is None:
+            # Anything indexed before this point may have missed events: rebuild on next use.
+            self._entity_index = None
+            self._er_unsub = self.hass.bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                self._handle_er_event,
+                event_filter=self._er_event_filter,
             )
+        await self._async_restore_warm_start()
 
     async def async_shutdown(self) -> None:
         """Clean up listeners and timers on entry unload to avoid leaks."""
@@ -328,6 +1171,13 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             except Exception:
                 pass
             self._dr_unsub = None
+        if self._er_unsub is not None:
+            try:
+                self._er_unsub()
+            except Exception:
+                pass
+            self._er_unsub = None
+        self._entity_index = None
         # Cancel short-retry callback if scheduled
         if self._short_retry_cancel is not None:
             try:
@@ -335,9 +1185,35 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             except Exception:
                 pass
             self._short_retry_cancel = None
-        # Cancel pending debounced stats write
+        # Drop a pending push batch (entities are being torn down anyway)
+        if self._push_flush_cancel is not None:
+            try:
+                self._push_flush_cancel()
+            except Exception:
+                pass
+            self._push_flush_cancel = None
+        self._push_pending_ids.clear()
+        # Stop a running poll cycle; its remaining queue becomes the carry-over.
+        if self._poll_task is not None and not self._poll_task.done():
+            self._poll_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poll_task
+        self._poll_task = None
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            self._revalidate_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._revalidate_task
+        self._revalidate_task = None
+        # Cancel pending debounced stats write and flush once (keeps the poll queue)
         if self._stats_save_task and not self._stats_save_task.done():
             self._stats_save_task.cancel()
+        await self._async_save_stats()
+        # Flush the warm-start cache so a reload starts from the latest state
+        if self._warm_store is not None:
+            try:
+                await self._warm_store.async_save(self._warm_start_payload())
+            except Exception as err:
+                _LOGGER.debug("Failed to save warm-start cache: %s", err)
 
     # ---------------------------- Event loop helpers ------------------------
     def _is_on_hass_loop(self) -> bool:
@@ -400,25 +1276,149 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         else:
             self._run_on_hass_loop(_do_schedule)
 
+    # ---------------------------- Listener fan-out --------------------------
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, scoping per-device listeners to changed devices.
+
+        Entities bound to one device register with `context=<device_id>`
+        (`CoordinatorEntity(coordinator, device_id)`). They are only called when
+        that device is in `data.changed_ids`, so a push for one tracker no longer
+        wakes every entity of the account. Listeners without a context (platform
+        discovery, diagnostic entities) are always called.
+
+        All listeners are notified when the data is not a keyed snapshot or when
+        `last_update_success` changed (entity availability depends on it).
+
+        The fan-out is recorded as the `publish` stage of the pipeline latencies
+        (and as a loop section for the loop watchdog); it completes the locate
+        traces committed for the published devices.
+        """
+        started = perf_counter()
+        published: Optional[Iterable[str]] = None
+        try:
+            data = self.data
+            success = self.last_update_success
+            success_changed = success != getattr(self, "_fanout_last_success", True)
+            self._fanout_last_success = success
+            if not isinstance(data, DeviceSnapshot) or not success or success_changed:
+                super().async_update_listeners()
+                return
+
+            changed = published = data.changed_ids
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or context in changed:
+                    update_callback()
+        finally:
+            ended = perf_counter()
+            self._pipeline_latency.observe(STAGE_PUBLISH, ended - started)
+            self._locate_traces.published(published, started, ended)
+            record_section("listener_fanout", started, ended)
+
+    def get_device_snapshot_entry(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """Return the published snapshot entry for a device (O(1)), or None."""
+        data = self.data
+        if isinstance(data, DeviceSnapshot):
+            return data.get(device_id)
+        return None
+
+    def get_device_snapshot_version(self, device_id: str) -> int:
+        """Return the published entry version for a device (0 if unknown).
+
+        Entities use this to recompute derived state only when their entry changed.
+        """
+        data = self.data
+        if isinstance(data, DeviceSnapshot):
+            return data.version(device_id)
+        return 0
+
+    async def _async_get_request_governor(self) -> Optional[RequestGovernor]:
+        """Return this account's request governor (resolved once from the token cache)."""
+        if self._request_governor is None:
+            try:
+                username = await self._cache.async_get_cached_value(username_string)
+            except Exception:  # noqa: BLE001 - cache not ready; retry on next call
+                username = None
+            if isinstance(username, str) and username:
+                self._request_governor = get_governor(username)
+        return self._request_governor
+
+    def _note_lane_wait(self, lane: str, waited_s: float) -> None:
+        """Accumulate dispatcher queue wait per lane into the statistics."""
+        waited_ms = int(round(waited_s * 1000))
+        key = f"{lane}_queue_wait_ms"
+        if waited_ms > 0 and key in self.stats:
+            self.stats[key] += waited_ms
+            self._schedule_stats_persist()
+
+    def get_request_lanes_state(self) -> Dict[str, Any]:
+        """Return per-lane request counts and queue waits for diagnostics."""
+        return self._dispatcher.as_dict()
+
+    def get_locate_latency_state(self) -> Dict[str, Any]:
+        """Return the adaptive locate timeout estimators for diagnostics."""
+        return self._locate_latency.as_dict()
+
+    @property
+    def pipeline_latency(self) -> PipelineLatency:
+        """Per-stage latency histograms (recorded by the API, FCM and decrypt layers)."""
+        return self._pipeline_latency
+
+    def get_stage_latency_state(self) -> Dict[str, Dict[str, Any]]:
+        """Return count, mean, p50/p95/p99 and max per pipeline stage for diagnostics."""
+        return self._pipeline_latency.as_dict()
+
+    @property
+    def locate_traces(self) -> TraceBuffer:
+        """Ring buffer of the latest locate traces (the FCM receiver adds push traces)."""
+        return self._locate_traces
+
+    def get_recent_traces(
+        self, device_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the latest locate traces, newest first (optionally of one device)."""
+        return self._locate_traces.recent(device_id, limit)
+
+    def get_loop_watchdog_state(self) -> Optional[Dict[str, Any]]:
+        """Return loop lag, stall counts and worst offenders (None if not enabled)."""
+        watchdog = getattr(self, "loop_watchdog", None)
+        return watchdog.as_dict() if watchdog is not None else None
+
+    @property
+    def poll_spacing_s(self) -> float:
+        """Return the current effective (adaptive) delay between devices in a poll cycle."""
+        return round(self._poll_spacing.spacing_s, 2)
+
+    def get_circuit_breaker_state(self) -> Dict[str, Dict[str, Any]]:
+        """Return the per-endpoint circuit breaker states for diagnostics."""
+        return circuit_breaker_states()
+
+    def get_request_governor_state(self) -> Optional[Dict[str, Any]]:
+        """Return request budget/throttle state for diagnostics (None until resolved)."""
+        if self._request_governor is None:
+            return None
+        return self._request_governor.as_dict()
+
     # ---------------------------- Device Registry helpers -------------------
     def _reindex_poll_targets_from_device_registry(self) -> None:
         """Rebuild internal poll target sets from the Device Registry.
 
-        This runs on the HA loop and is called rarely (startup and on DR updates).
-        We **only** index devices that belong to *this* config entry to avoid
+        This runs on the HA loop and is called rarely: at startup and as a fallback when
+        a DR event cannot be applied incrementally (see `_apply_dr_event()`). We **only** index devices that belong to *this* config entry to avoid
         cross-account leakage in multi-entry setups.
         """
         dev_reg = dr.async_get(self.hass)
         entry = getattr(self, "config_entry", None)
         entry_id = getattr(entry, "entry_id", None)
+        self._dr_index = {}
+        self._dr_targets = {}
         if not entry_id:
             _LOGGER.debug("Skipping DR reindex: no config_entry bound yet")
             self._devices_with_entry = set()
             self._enabled_poll_device_ids = set()
+            self._dr_indexed_entry_id = None
             return
 
-        enabled: Set[str] = set()
-        present: Set[str] = set()
         # Collect devices belonging to the same domain but different entries (informational only).
         other_account: List[tuple[str, str]] = []
 
@@ -436,24 +1436,16 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                     # Malformed identifier, skip this device
                     _LOGGER.debug("Skipping device with malformed identifiers: %s", device.id)
                 continue
-            try:
-                # Find the first identifier of our integration: (DOMAIN, <device_id>).
-                # Defensive: handle malformed identifiers
-                for ident in device.identifiers:
-                    if not isinstance(ident, (tuple, list)) or len(ident) != 2:
-                        continue
-                    domain, dev_id = ident
-                    if domain == DOMAIN and isinstance(dev_id, str) and dev_id:
-                        present.add(dev_id)
-                        if device.disabled_by is None:
-                            enabled.add(dev_id)
-                        break  # stop after the first matching identifier
-            except Exception as err:
-                _LOGGER.debug("Device registry scan error: %s", err)
-                continue
-
-        self._devices_with_entry = present
-        self._enabled_poll_device_ids = enabled
+            target = self._dr_poll_target(device, entry_id)
+            if target is not None:
+                self._dr_index[device.id] = target[0]
+                self._dr_targets.setdefault(target[0], {})[device.id] = target[1]
+
+        self._devices_with_entry = set(self._dr_targets)
+        self._enabled_poll_device_ids = {
+            dev_id for dev_id, regs in self._dr_targets.items() if any(regs.values())
+        }
+        self._dr_indexed_entry_id = entry_id
         _LOGGER.debug(
             "Reindexed Device Registry targets for entry %s: %d present / %d enabled",
             entry_id,
@@ -473,9 +1465,106 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 "…" if len(other_account) > 5 else "",
             )
 
-    async def _handle_dr_event(self, _event) -> None:
-        """Handle Device Registry changes by rebuilding poll targets (rare)."""
-        self._reindex_poll_targets_from_device_registry()
+    @staticmethod
+    def _dr_poll_target(device: Any, entry_id: str) -> Optional[tuple[str, bool]]:
+        """Return (our device id, enabled) for a registry device of this entry, else None."""
+        if entry_id not in device.config_entries:
+            return None
+        try:
+            # Find the first identifier of our integration: (DOMAIN, <device_id>).
+            # Defensive: handle malformed identifiers
+            for ident in device.identifiers:
+                if not isinstance(ident, (tuple, list)) or len(ident) != 2:
+                    continue
+                domain, dev_id = ident
+                if domain == DOMAIN and isinstance(dev_id, str) and dev_id:
+                    return dev_id, device.disabled_by is None
+        except Exception as err:
+            _LOGGER.debug("Device registry scan error: %s", err)
+        return None
+
+    @callback
+    def _dr_event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Return True if a DR event can affect this entry's poll targets (runs per event)."""
+        if self._dr_indexed_entry_id is None:
+            return True  # index not built yet: let the handler do a full reindex
+        device_id = event_data.get("device_id")
+        action = event_data.get("action")
+        changes = event_data.get("changes") or {}
+        if device_id in self._dr_index:
+            if action == "update":
+                return not _DR_TARGET_FIELDS.isdisjoint(changes)
+            return action in ("remove", "create")
+        if action == "create":
+            return True  # may be ours; resolved with one registry lookup
+        if action == "update":
+            return "config_entries" in changes or "identifiers" in changes
+        return False
+
+    def _apply_dr_event(self, action: Optional[str], device_id: Optional[str]) -> bool:
+        """Update the DR index from one event in O(1); return True if targets changed."""
+        entry = getattr(self, "config_entry", None)
+        entry_id = getattr(entry, "entry_id", None)
+        if (
+            not isinstance(device_id, str)
+            or action not in ("create", "update", "remove")
+            or self._dr_indexed_entry_id is None
+            or entry_id != self._dr_indexed_entry_id
+        ):
+            before = (set(self._devices_with_entry), set(self._enabled_poll_device_ids))
+            with loop_section("registry_reindex"):
+                self._reindex_poll_targets_from_device_registry()
+            return before != (self._devices_with_entry, self._enabled_poll_device_ids)
+
+        target = None
+        if action != "remove":
+            device = dr.async_get(self.hass).async_get(device_id)
+            if device is not None:
+                target = self._dr_poll_target(device, entry_id)
+
+        affected = {self._dr_index.get(device_id), target[0] if target else None} - {None}
+        before = {
+            dev_id: (dev_id in self._devices_with_entry, dev_id in self._enabled_poll_device_ids)
+            for dev_id in affected
+        }
+        old_dev_id = self._dr_index.pop(device_id, None)
+        if old_dev_id is not None:
+            regs = self._dr_targets.get(old_dev_id, {})
+            regs.pop(device_id, None)
+            if not regs:
+                self._dr_targets.pop(old_dev_id, None)
+        if target is not None:
+            self._dr_index[device_id] = target[0]
+            self._dr_targets.setdefault(target[0], {})[device_id] = target[1]
+
+        changed = False
+        for dev_id, was in before.items():
+            regs = self._dr_targets.get(dev_id)
+            now = (regs is not None, bool(regs) and any(regs.values()))
+            if now == was:
+                continue
+            changed = True
+            if now[0]:
+                self._devices_with_entry.add(dev_id)
+            else:
+                self._devices_with_entry.discard(dev_id)
+            if now[1]:
+                self._enabled_poll_device_ids.add(dev_id)
+            else:
+                self._enabled_poll_device_ids.discard(dev_id)
+        return changed
+
+    async def _handle_dr_event(self, event) -> None:
+        """Apply a relevant Device Registry change to the poll targets incrementally."""
+        data = getattr(event, "data", None) or {}
+        if not self._apply_dr_event(data.get("action"), data.get("device_id")):
+            return
+        _LOGGER.debug(
+            "Device Registry %s changed poll targets: %d present / %d enabled",
+            data.get("action"),
+            len(self._devices_with_entry),
+            len(self._enabled_poll_device_ids),
+        )
         # After changes, request a refresh so the next tick uses the new target sets.
         # Compatibility: async_request_refresh is a plain def on most cores, but an
         # async coroutine on some versions. Handle both safely.
@@ -492,6 +1581,42 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             except Exception as err:
                 _LOGGER.debug("async_request_refresh dispatch failed (DR event): %s", err)
 
+    # ---------------------------- Tracker entity index --------------------------
+    def _tracker_index(self) -> Optional[TrackerEntityIndex]:
+        """Return the tracker entity index for the bound entry (built on first use)."""
+        entry_id = getattr(getattr(self, "config_entry", None), "entry_id", None)
+        if not entry_id:
+            return None
+        index = getattr(self, "_entity_index", None)
+        if index is None or index.entry_id != entry_id:
+            index = self._entity_index = TrackerEntityIndex(entry_id)
+        if not index.built:
+            index.rebuild(er.async_get(self.hass))
+        return index
+
+    def get_tracker_entity_id(self, device_id: str) -> Optional[str]:
+        """Return the `device_tracker` entity id of a device (None if not registered)."""
+        index = self._tracker_index()
+        return index.entity_id(device_id) if index is not None else None
+
+    def get_registry_device_id(self, device_id: str) -> Optional[str]:
+        """Return the HA Device Registry id the device's tracker entity is linked to."""
+        index = self._tracker_index()
+        return index.registry_device_id(device_id) if index is not None else None
+
+    @callback
+    def _er_event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Pass only Entity Registry events that can change a built index."""
+        index = getattr(self, "_entity_index", None)
+        return index is not None and index.built and index.event_filter(event_data)
+
+    @callback
+    def _handle_er_event(self, event) -> None:
+        """Apply a relevant Entity Registry change to the tracker entity index."""
+        index = self._entity_index
+        if index is not None:
+            index.apply_event(er.async_get(self.hass), getattr(event, "data", None) or {})
+
     # ---------------------------- Cooldown helpers (server-aware) -----------
     def _compute_type_cooldown_seconds(self, report_hint: Optional[str]) -> int:
         """Return a server-aware cooldown duration in seconds for a crowdsourced report type.
@@ -649,6 +1774,143 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         """Return True if the device is currently ignored by user choice."""
         return device_id in self._get_ignored_set()
 
+    # ---------------------------- Poll cadence ------------------------------
+    def _get_poll_overrides(self) -> Mapping[str, int]:
+        """Return user-set per-device poll intervals {device_id: seconds} (parsed once)."""
+        return self._poll_overrides
+
+    def _is_at_home(self, location: Optional[Dict[str, Any]]) -> bool:
+        """Return True if a cached fix lies inside zone.home (or is labelled 'home')."""
+        if not location:
+            return False
+        semantic = location.get("semantic_name")
+        if isinstance(semantic, str) and semantic.strip().lower() == "home":
+            return True
+        lat, lon = location.get("latitude"), location.get("longitude")
+        gh_filter = getattr(self, "google_home_filter", None)
+        if lat is None or lon is None or gh_filter is None:
+            return False
+        home = gh_filter.get_home_zone_attributes()
+        if not home or "latitude" not in home or "longitude" not in home:
+            return False
+        try:
+            distance = self._haversine_distance(home["latitude"], home["longitude"], lat, lon)
+        except (TypeError, ValueError):
+            return False
+        radius = float(home.get("radius") or 100.0)
+        acc = location.get("accuracy")
+        slack = float(acc) if isinstance(acc, (int, float)) else 0.0
+        return distance <= radius + slack
+
+    def _device_cadence_mode(self, device_id: str, wall_now: Optional[float] = None) -> str:
+        """Classify a device for poll cadence: 'moving', 'stale', 'home' or 'normal'."""
+        return self._cadence_mode(self._devices.get(device_id), wall_now)
+
+    def _cadence_mode(self, state: Optional[DeviceState], wall_now: Optional[float] = None) -> str:
+        """Classify a device record for poll cadence (see `_device_cadence_mode()`)."""
+        if state is None:
+            return "normal"
+        wall_now = time.time() if wall_now is None else wall_now
+        moved = state.last_moved_wall
+        if moved is not None and wall_now - moved <= _CADENCE_MOVING_WINDOW_S:
+            return "moving"
+        if state.stale_strikes:
+            return "stale"
+        if self._is_at_home(state.location):
+            return "home"
+        return "normal"
+
+    def _device_poll_interval(self, device_id: str, wall_now: Optional[float] = None) -> float:
+        """Return the poll interval (seconds) for one device.
+
+        A user override wins; otherwise the base interval is scaled by the cadence
+        mode (moving: faster, at home: slower, stale: exponential backoff) and
+        clamped to [min_poll_interval, max(base, _CADENCE_MAX_INTERVAL_S)].
+        """
+        override = self._get_poll_overrides().get(device_id)
+        if override:
+            return float(max(override, self.min_poll_interval))
+
+        base = float(max(self.location_poll_interval, self.min_poll_interval))
+        state = self._devices.get(device_id)
+        mode = self._cadence_mode(state, wall_now)
+        if mode == "moving":
+            factor = _CADENCE_MOVING_FACTOR
+        elif mode == "home":
+            factor = _CADENCE_HOME_FACTOR
+        elif mode == "stale" and state is not None:
+            factor = float(2 ** (state.stale_strikes or 0))
+        else:
+            factor = 1.0
+        return _clamp(base * factor, float(self.min_poll_interval), max(base, _CADENCE_MAX_INTERVAL_S))
+
+    def _note_device_fix(self, device_id: str, location: Dict[str, Any]) -> None:
+        """Update cadence state for a fix about to be committed to the cache."""
+        state = self._devices.get(device_id)
+        if state is None:
+            return
+        state.stale_strikes = None
+        prev = state.location
+        if not prev:
+            return
+        coords = (prev.get("latitude"), prev.get("longitude"), location.get("latitude"), location.get("longitude"))
+        if any(c is None for c in coords):
+            return
+        try:
+            distance = self._haversine_distance(*coords)
+        except (TypeError, ValueError):
+            return
+        if distance > self._movement_threshold:
+            state.last_moved_wall = time.time()
+
+    def _schedule_next_device_poll(self, device_id: str, *, fresh: bool) -> None:
+        """Set the next due time of a device after it was polled.
+
+        A poll that yields no newer fix for a device whose last report is older than
+        `_CADENCE_STALE_AGE_S` adds a backoff strike (bounded).
+        """
+        state = self._devices.ensure(device_id)
+        if not fresh:
+            last_seen = (state.location or {}).get("last_seen")
+            try:
+                age = time.time() - float(last_seen)
+            except (TypeError, ValueError):
+                age = float("inf")
+            if age > _CADENCE_STALE_AGE_S:
+                state.stale_strikes = min((state.stale_strikes or 0) + 1, _CADENCE_STALE_MAX_STRIKES)
+        state.next_poll_mono = time.monotonic() + self._device_poll_interval(device_id)
+
+    def set_device_poll_override(self, device_id: str, seconds: Optional[int]) -> None:
+        """Persist (or clear with None/0) a per-device poll interval override."""
+        entry = getattr(self, "config_entry", None)
+        if entry is None:
+            return
+        overrides: Dict[str, Any] = dict(entry.options.get(OPT_DEVICE_POLL_OVERRIDES) or {})
+        if seconds:
+            overrides[device_id] = int(_clamp(int(seconds), self.min_poll_interval, DEVICE_POLL_OVERRIDE_MAX_S))
+        else:
+            overrides.pop(device_id, None)
+        options = dict(entry.options)
+        options[OPT_DEVICE_POLL_OVERRIDES] = overrides
+        self.hass.config_entries.async_update_entry(entry, options=options)
+        self._poll_overrides = _parse_poll_overrides(overrides)
+        # Re-evaluate the due time with the new interval on the next tick.
+        self._device_next_poll_mono.pop(device_id, None)
+
+    def get_poll_cadence_summary(self) -> Dict[str, int]:
+        """Return per-mode device counts for diagnostics (no device identifiers)."""
+        wall_now = time.time()
+        overrides = self._get_poll_overrides()
+        counts = {"moving": 0, "home": 0, "stale": 0, "normal": 0, "override": 0}
+        for dev_id, state in self._devices.records():
+            if state.name is None:
+                continue
+            if dev_id in overrides:
+                counts["override"] += 1
+            else:
+                counts[self._cadence_mode(state, wall_now)] += 1
+        return counts
+
     # Public read-only state for diagnostics/UI
     @property
     def is_polling(self) -> bool:
@@ -813,23 +2075,32 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._fcm_defer_started_mono = 0.0
         self._fcm_last_stage = 0
 
-    async def _async_update_data(self) -> List[Dict[str, Any]]:
+    async def _async_update_data(self) -> DeviceSnapshot:
         """Provide cached device data; trigger background poll if due.
 
         Discovery semantics:
-        - Always fetch the **full** lightweight device list (no executor).
-        - Update presence and metadata caches for **all** devices.
+        - Fetch the **full** lightweight device list (no executor) when the adaptive
+          list interval has elapsed or a refresh was requested; otherwise reuse the
+          last accepted list (see `_device_list_refresh_due()`).
+        - Stale-while-revalidate: once a snapshot is published, a due fetch runs in the
+          background with a deadline and this tick republishes the cached view at once;
+          a changed list requests a refresh when it arrives. Only the first fetch (or
+          one without a usable cached list) is awaited inline.
+        - Update presence for **all** devices; name/capability caches and the full
+          snapshot rebuild only run when the decoded list (or ignore filter) changed.
         - The published snapshot (`self.data`) contains **all** devices (for dynamic entity creation).
         - The sequential **polling cycle** polls devices that are enabled in HA's Device Registry
           **for this config entry** and not explicitly ignored in integration options.
 
         Returns:
-            A list of dictionaries, where each dictionary represents a device's state.
+            The full keyed device snapshot (unchanged entries are reused structurally).
 
         Raises:
             ConfigEntryAuthFailed: If authentication fails during device list fetching.
             UpdateFailed: For other transient or unexpected errors.
         """
+        slicer: Optional[_LoopSlicer] = None
+        all_devices: List[Dict[str, Any]] = []
         try:
             # One-time wait for FCM on first run.
             if not self._startup_complete:
@@ -843,37 +2114,39 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                         _LOGGER.warning("FCM provider not ready after 15s; proceeding anyway.")
                 self._startup_complete = True
 
-            # 1) Always fetch the lightweight FULL device list using native async API
-            all_devices = await self.api.async_get_basic_device_list()
-            all_devices = all_devices or []
+            # Surface an auth failure seen by the background revalidation (re-auth flow)
+            if self._revalidate_auth_failed is not None:
+                auth_failed, self._revalidate_auth_failed = self._revalidate_auth_failed, None
+                raise auth_failed
 
-            # Minimal hardening against false empties (keep prior behaviour)
-            if not all_devices:
-                self._empty_list_streak += 1
-                if self._empty_list_streak < _EMPTY_LIST_QUORUM and self._last_device_list:
-                    # Defer clearing once; keep previous view stable.
-                    _LOGGER.debug(
-                        "Successful empty device list received (%d/%d). Deferring clear until quorum is met.",
-                        self._empty_list_streak,
-                        _EMPTY_LIST_QUORUM,
-                    )
-                    all_devices = list(self._last_device_list)
-                else:
-                    _LOGGER.debug(
-                        "Accepting empty device list after %d consecutive empties.",
-                        self._empty_list_streak,
-                    )
-                    # Once accepted, forget any prior list so snapshot becomes empty below.
-                    self._last_device_list = []
+            # 1) Fetch the lightweight FULL device list when due, else reuse the last one
+            now_mono = time.monotonic()
+            fetched = False
+            if not self._device_list_refresh_due(now_mono):
+                all_devices = list(self._last_device_list)
+            elif self._last_device_list and isinstance(self.data, DeviceSnapshot):
+                # Serve the cached view now; the fetch finishes in the background.
+                self._start_device_list_revalidation()
+                self.increment_stat("stale_while_revalidate")
+                all_devices = list(self._last_device_list)
             else:
-                # Non-empty result: reset streak and remember latest good list.
-                self._empty_list_streak = 0
-                self._last_device_list = list(all_devices)
+                all_devices = await self._async_fetch_device_list()
+                fetched = True
+
+            # Everything below runs on the loop: slice it (see _LoopSlicer)
+            slicer = self._begin_snapshot_pass()
+            list_fp = _device_list_fingerprint(all_devices)
+            list_changed = list_fp != self._device_list_fp
+            if fetched:
+                self._adapt_device_list_interval(list_changed)
+            if list_changed:
+                self._device_list_fp = list_fp
+                if all_devices:
+                    self._schedule_warm_start_save()
 
             # Presence TTL derives from the effective poll cadence
             effective_interval = max(self.location_poll_interval, self.min_poll_interval)
             self._presence_ttl_s = max(2 * effective_interval, 120)
-            now_mono = time.monotonic()
 
             # Cold-start guard: if the very first seen list is empty, treat it as transient
             if not all_devices and self._last_nonempty_wall == 0.0:
@@ -881,29 +2154,35 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
             ignored = self._get_ignored_set()
 
-            # Record presence timestamps from the full list (unfiltered by ignore)
+            # Record presence timestamps from the full list (unfiltered by ignore); a
+            # reused list stays authoritative while it was validated recently enough.
             if all_devices:
-                for d in all_devices:
-                    dev_id = d.get("id")
-                    if isinstance(dev_id, str):
-                        self._present_last_seen[dev_id] = now_mono
-                # Keep a diagnostics-only set mirroring the latest non-empty list
-                self._present_device_ids = {
-                    d["id"] for d in all_devices if isinstance(d.get("id"), str)
-                }
+                if (now_mono - self._device_list_validated_mono) <= _DEVICE_LIST_MAX_AGE_S:
+                    for d in all_devices:
+                        dev_id = d.get("id")
+                        if isinstance(dev_id, str):
+                            self._present_last_seen[dev_id] = now_mono
+                if list_changed:
+                    # Keep a diagnostics-only set mirroring the latest non-empty list
+                    self._present_device_ids = {
+                        d["id"] for d in all_devices if isinstance(d.get("id"), str)
+                    }
                 self._last_nonempty_wall = now_mono
             # If the list is empty, leave _present_last_seen untouched; TTL will decide availability.
 
-            # 2) Update internal name/capability caches for ALL devices
-            for dev in all_devices:
-                dev_id = dev["id"]
-                self._device_names[dev_id] = dev.get("name", dev_id)
+            # 2) Update internal name/capability caches for ALL devices (list changed only)
+            for chunk in _chunks(all_devices, slicer.chunk_size) if list_changed else ():
+                for dev in chunk:
+                    dev_id = dev["id"]
+                    self._device_names[dev_id] = dev.get("name", dev_id)
 
-                # Normalize and cache the "can ring" capability
-                if "can_ring" in dev:
-                    can_ring = bool(dev.get("can_ring"))
-                    slot = self._device_caps.setdefault(dev_id, {})
-                    slot["can_ring"] = can_ring
+                    # Normalize and cache the "can ring" capability
+                    if "can_ring" in dev:
+                        can_ring = bool(dev.get("can_ring"))
+                        slot = self._device_caps.setdefault(dev_id, {})
+                        slot["can_ring"] = can_ring
+                if slicer.tick(len(chunk)):
+                    await slicer.pause()
 
             # 3) Decide whether to trigger a poll cycle (monotonic clock)
             # Build list of devices to POLL:
@@ -916,22 +2195,35 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 )
             ]
 
-            # Apply per-device poll cooldowns
-            if self._device_poll_cooldown_until and devices_to_poll:
-                devices_to_poll = [
-                    d for d in devices_to_poll
-                    if now_mono >= self._device_poll_cooldown_until.get(d["id"], 0.0)
-                ]
+            # Apply per-device poll cooldowns and, per device cadence, collect the devices
+            # whose own interval has elapsed (min_poll_interval still bounds the gap
+            # between two cycles); one record lookup per device.
+            records = self._devices
+            cooled: List[Dict[str, Any]] = []
+            due_devices: List[Dict[str, Any]] = []
+            next_polls: List[float] = []
+            for d in devices_to_poll:
+                state = records.get(d["id"])
+                if state is not None and now_mono < (state.poll_cooldown_until or 0.0):
+                    continue
+                cooled.append(d)
+                next_poll = (state.next_poll_mono or 0.0) if state is not None else 0.0
+                next_polls.append(next_poll)
+                if now_mono >= next_poll:
+                    due_devices.append(d)
+            devices_to_poll = cooled
+            next_due = min(next_polls, default=now_mono)
 
             # Cold start detection: force immediate poll on first install when devices have no location data
             is_cold_start = (
                 self._last_poll_mono == 0.0
                 and all_devices
-                and not any(self._device_location_data.get(d["id"]) for d in all_devices)
+                and not any(getattr(records.get(d["id"]), "location", None) for d in all_devices)
             )
-
-            due = (now_mono - self._last_poll_mono) >= effective_interval or is_cold_start
-            if due and not self._is_polling and devices_to_poll:
+            cycle_gap_ok = (now_mono - self._last_poll_mono) >= self.min_poll_interval
+            due = (cycle_gap_ok and bool(due_devices)) or is_cold_start
+            poll_targets = devices_to_poll if is_cold_start else due_devices
+            if due and not self._is_polling and poll_targets:
                 if not self._is_fcm_ready_soft():
                     # No baseline jump; schedule a short retry and escalate politely.
                     self._note_fcm_deferral(now_mono)
@@ -942,35 +2234,52 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                     if is_cold_start:
                         _LOGGER.info(
                             "Cold start detected: fetching fresh location data for %d devices immediately",
-                            len(devices_to_poll),
+                            len(poll_targets),
                         )
                     else:
                         _LOGGER.debug(
-                            "Scheduling background polling cycle (devices=%d, interval=%ds)",
+                            "Scheduling background polling cycle (due devices=%d/%d)",
+                            len(poll_targets),
                             len(devices_to_poll),
-                            effective_interval,
                         )
-                    self.hass.async_create_task(
-                        self._async_start_poll_cycle(devices_to_poll),
+                    self._poll_task = self.hass.async_create_task(
+                        self._async_start_poll_cycle(poll_targets),
                         name=f"{DOMAIN}.poll_cycle",
                     )
             else:
                 _LOGGER.debug(
-                    "Poll not due (elapsed=%.1fs/%ss) or already running=%s",
+                    "Poll not due (elapsed=%.1fs/%ss, due devices=%d) or already running=%s",
                     now_mono - self._last_poll_mono,
-                    effective_interval,
+                    self.min_poll_interval,
+                    len(due_devices),
                     self._is_polling,
                 )
 
-            # 4) Build data snapshot for devices visible to the user (ignore-filter applied)
+
+            # 4) Build data snapshot for devices visible to the user (ignore-filter applied).
+            # With an unchanged list and filter the published entries are current (polls and
+            # pushes publish their own commits); only re-evaluate status and gating flags.
+            view_fp = (list_fp, frozenset(ignored))
+            if view_fp == self._device_view_fp and isinstance(self.data, DeviceSnapshot):
+                _LOGGER.debug(
+                    "Device list unchanged; refreshing status of %d entries; next device poll in ~%ds",
+                    len(self.data),
+                    int(max(0.0, next_due - time.monotonic())),
+                )
+                entries = await self._async_refresh_snapshot_status(time.time(), slicer)
+                return await self._async_merge_snapshot(entries, slicer)
+
             visible_devices = [d for d in all_devices if d["id"] not in ignored]
-            snapshot = await self._async_build_device_snapshot_with_fallbacks(visible_devices)
+            snapshot = await self._async_build_device_snapshot_with_fallbacks(
+                visible_devices, slicer=slicer
+            )
+            self._device_view_fp = view_fp
             _LOGGER.debug(
-                "Returning %d device entries; next poll in ~%ds",
+                "Returning %d device entries; next device poll in ~%ds",
                 len(snapshot),
-                int(max(0, effective_interval - (time.monotonic() - self._last_poll_mono))),
+                int(max(0.0, next_due - time.monotonic())),
             )
-            return snapshot
+            return await self._async_merge_snapshot(snapshot, slicer, replace_all=True)
 
         except asyncio.CancelledError:
             raise
@@ -984,8 +2293,206 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             # Record and raise as UpdateFailed per coordinator contract
             self.note_error(exc, where="_async_update_data")
             raise UpdateFailed(exc) from exc
+        finally:
+            if slicer is not None:
+                self._end_snapshot_pass(slicer, "refresh", len(all_devices))
+
+    # ---------------------------- Device list refresh -----------------------
+    def _device_list_refresh_due(self, now_mono: float) -> bool:
+        """Return True if this tick must fetch the device list from the server."""
+        return (
+            self._device_list_refresh_requested
+            or not self._last_device_list
+            or self._empty_list_streak > 0  # confirm (or refute) a pending empty list
+            or (now_mono - self._device_list_fetched_mono) >= self._device_list_interval_s
+        )
+
+    async def _async_fetch_device_list(self) -> List[Dict[str, Any]]:
+        """Fetch the full device list and return the accepted view.
+
+        Applies the empty-list quorum: a successful empty list only replaces a
+        non-empty one after `_EMPTY_LIST_QUORUM` consecutive empties.
+        """
+        self._device_list_refresh_requested = False
+        self._device_list_fetched_mono = time.monotonic()
+        self.increment_stat("device_list_fetches")
+        all_devices = await self.api.async_get_basic_device_list()
+        all_devices = all_devices or []
+        self._device_list_validated_mono = time.monotonic()
+
+        # Minimal hardening against false empties (keep prior behaviour)
+        if not all_devices:
+            self._empty_list_streak += 1
+            if self._empty_list_streak < _EMPTY_LIST_QUORUM and self._last_device_list:
+                # Defer clearing once; keep previous view stable.
+                _LOGGER.debug(
+                    "Successful empty device list received (%d/%d). Deferring clear until quorum is met.",
+                    self._empty_list_streak,
+                    _EMPTY_LIST_QUORUM,
+                )
+                return list(self._last_device_list)
+            _LOGGER.debug(
+                "Accepting empty device list after %d consecutive empties.",
+                self._empty_list_streak,
+            )
+            # Once accepted, forget any prior list so snapshot becomes empty below.
+            self._last_device_list = []
+            return []
+
+        # Non-empty result: reset streak and remember latest good list.
+        self._empty_list_streak = 0
+        self._last_device_list = list(all_devices)
+        return all_devices
+
+    def _start_device_list_revalidation(self) -> None:
+        """Start the background list fetch unless one is already running."""
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            return
+        self._revalidate_task = self.hass.async_create_task(
+            self._async_revalidate_device_list(),
+            name=f"{DOMAIN}.revalidate_device_list",
+        )
+
+    async def _async_revalidate_device_list(self) -> None:
+        """Fetch the device list off the tick; request a refresh if it changed.
+
+        Failures and deadline misses keep the cached view published (recorded in
+        stats/diagnostics); an auth failure is raised by the next tick instead.
+        """
+        try:
+            async with asyncio.timeout(_DEVICE_LIST_REVALIDATE_TIMEOUT_S):
+                devices = await self._async_fetch_device_list()
+        except asyncio.CancelledError:
+            raise
+        except ConfigEntryAuthFailed as err:
+            self._revalidate_auth_failed = err
+            self._revalidate_error = "auth_failed"
+        except Exception as err:
+            self.increment_stat("revalidation_failures")
+            self._revalidate_error = type(err).__name__
+            if not isinstance(err, TimeoutError):
+                self.note_error(err, where="revalidate_device_list")
+            _LOGGER.debug("Background device list revalidation failed; keeping cached view: %s", err)
+            return
+        else:
+            self._revalidate_error = None
+            changed = _device_list_fingerprint(devices) != self._device_list_fp
+            self._adapt_device_list_interval(changed)
+            if not changed:
+                return
+            _LOGGER.debug("Background revalidation found a changed device list; refreshing")
+        await self.async_request_refresh()
+
+    def _adapt_device_list_interval(self, changed: bool) -> None:
+        """Double the list interval while the list is stable; reset it on change."""
+        if changed:
+            self._device_list_interval_s = float(_DEVICE_LIST_REFRESH_MIN_S)
+            return
+        self.increment_stat("device_list_unchanged")
+        self._device_list_interval_s = min(
+            self._device_list_interval_s * 2.0, float(_DEVICE_LIST_REFRESH_MAX_S)
+        )
+
+    def request_device_list_refresh(self) -> None:
+        """Make the next refresh fetch the device list (hint that it may have changed).
+
+        Called for pushes from unknown devices, Device Registry changes and reloads.
+        This does not schedule a refresh by itself.
+        """
+        self._device_list_refresh_requested = True
+        self._device_list_interval_s = float(_DEVICE_LIST_REFRESH_MIN_S)
+
+    def get_device_list_refresh_state(self) -> Dict[str, Any]:
+        """Return the adaptive device-list refresh state for diagnostics."""
+        age = (
+            round(time.monotonic() - self._device_list_fetched_mono, 1)
+            if self._device_list_fetched_mono
+            else None
+        )
+        return {
+            "interval_s": round(self._device_list_interval_s, 1),
+            "last_fetch_age_s": age,
+            "refresh_requested": self._device_list_refresh_requested,
+            "fetches": self.stats.get("device_list_fetches", 0),
+            "unchanged": self.stats.get("device_list_unchanged", 0),
+            "revalidating": self.is_revalidating,
+            "last_validated_age_s": (
+                round(time.monotonic() - self._device_list_validated_mono, 1)
+                if self._device_list_validated_mono
+                else None
+            ),
+            "last_revalidation_error": self._revalidate_error,
+            "stale_while_revalidate": self.stats.get("stale_while_revalidate", 0),
+            "revalidation_failures": self.stats.get("revalidation_failures", 0),
+        }
+
+    @property
+    def is_revalidating(self) -> bool:
+        """Return True while a background device-list revalidation is running."""
+        task = self._revalidate_task
+        return task is not None and not task.done()
+
+    def get_device_freshness(self, device_id: str) -> Dict[str, Any]:
+        """Return freshness metadata of a device's published location.
+
+        `age_s` is computed on read (seconds since the fix was stored) so it never
+        churns the snapshot; `source` is the entry's `location_source`
+        ("push" | "poll" | "restored" | "state" | "history", None without a fix).
+        """
+        entry = self._current_snapshot().get(device_id) or {}
+        cached = self._device_location_data.get(device_id) or {}
+        stamp = cached.get("last_updated") or entry.get("last_seen")
+        try:
+            age = round(max(0.0, time.time() - float(stamp)), 1) if stamp is not None else None
+        except (TypeError, ValueError):
+            age = None
+        return {
+            "age_s": age,
+            "source": entry.get("location_source"),
+            "revalidating": self.is_revalidating,
+        }
 
     # ---------------------------- Polling Cycle -----------------------------
+    def _poll_priority(self, device_id: str, wall_now: float, overrides: Mapping[str, int]) -> float:
+        """Return the poll priority of a device (higher polls earlier in a cycle)."""
+        state = self._devices.get(device_id)
+        last_seen = (state.location or {}).get("last_seen") if state is not None else None
+        try:
+            age = max(0.0, wall_now - float(last_seen))
+        except (TypeError, ValueError):
+            age = float(_PRIORITY_UNKNOWN_AGE_S)
+        failures = (state.poll_failures or 0) if state is not None else 0
+        failures = min(failures, _PRIORITY_MAX_FAILURE_HALVINGS)
+        score = age / (2 ** failures)
+        if device_id in overrides:
+            score *= _PRIORITY_OVERRIDE_BOOST
+        return score
+
+    def _order_poll_targets(self, devices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order poll targets: carried-over queue first (in order), then by priority."""
+        by_id = {d["id"]: d for d in devices}
+        resumed = [by_id[dev_id] for dev_id in self._poll_carryover if dev_id in by_id]
+        resumed_ids = {d["id"] for d in resumed}
+        wall_now = time.time()
+        overrides = self._get_poll_overrides()
+        rest = sorted(
+            (d for d in devices if d["id"] not in resumed_ids),
+            key=lambda d: self._poll_priority(d["id"], wall_now, overrides),
+            reverse=True,
+        )
+        return resumed + rest
+
+    def _set_poll_carryover(self, ordered: List[Dict[str, Any]], attempted: int) -> None:
+        """Remember the unpolled tail of a cycle (plus older carry-over not in this cycle)."""
+        in_cycle = {d["id"] for d in ordered}
+        tail = [d["id"] for d in ordered[attempted:]]
+        older = [
+            dev_id for dev_id in self._poll_carryover
+            if dev_id not in in_cycle and dev_id in self._device_names
+        ]
+        self._poll_carryover = tail + older
+        self._schedule_stats_persist()
+
     async def _async_start_poll_cycle(self, devices: List[Dict[str, Any]]) -> None:
         """Run a full sequential polling cycle in a background task.
 
@@ -1021,30 +2528,97 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 if self._fcm_defer_started_mono:
                     self._clear_fcm_deferral()
 
+            # Account paused after server throttling: do not start a cycle that would
+            # only fail fast; retry once the (jittered) pause has elapsed.
+            governor = await self._async_get_request_governor()
+            paused_for = governor.paused_for() if governor is not None else 0.0
+            if paused_for > 0:
+                _LOGGER.info(
+                    "Google API throttling pause active; deferring poll cycle by %.0fs", paused_for
+                )
+                self.increment_stat("throttle_deferrals")
+                self._schedule_short_retry(paused_for)
+                return
+
             self._is_polling = True
-            self.safe_update_metric("last_poll_start_mono", time.monotonic())
-            _LOGGER.debug("Starting sequential poll of %d devices", len(devices))
+            cycle_started = time.monotonic()
+            self.safe_update_metric("last_poll_start_mono", cycle_started)
+            ordered = self._order_poll_targets(devices)
+            attempted = 0
+            _LOGGER.debug(
+                "Starting sequential poll of %d devices (%d resumed from previous cycle)",
+                len(ordered),
+                sum(1 for d in ordered if d["id"] in self._poll_carryover),
+            )
 
             try:
-                for idx, dev in enumerate(devices):
+                for idx, dev in enumerate(ordered):
+                    attempted = idx  # devices before idx are done; idx itself is pending
+                    if (
+                        self.poll_cycle_budget_s
+                        and idx > 0
+                        and time.monotonic() - cycle_started >= self.poll_cycle_budget_s
+                    ):
+                        _LOGGER.info(
+                            "Poll cycle budget of %ss used up; %d device(s) carried over to the next cycle",
+                            self.poll_cycle_budget_s,
+                            len(ordered) - idx,
+                        )
+                        self.increment_stat("poll_budget_exhausted")
+                        break
+                    circuit_retry_s = get_circuit_breaker(NOVA_ACTION_API_SCOPE).retry_in()
+                    if circuit_retry_s > 0:
+                        # Endpoint is down: every locate would fail fast; resume after the open period.
+                        _LOGGER.info(
+                            "Locate endpoint unavailable; %d device(s) carried over, retrying in %.0fs",
+                            len(ordered) - idx,
+                            circuit_retry_s,
+                        )
+                        self.increment_stat("circuit_open_deferrals")
+                        self._schedule_short_retry(circuit_retry_s)
+                        break
                     dev_id = dev["id"]
                     dev_name = dev.get("name", dev_id)
                     _LOGGER.debug(
                         "Sequential poll: requesting location for %s (%d/%d)",
                         dev_name,
                         idx + 1,
-                        len(devices),
+                        len(ordered),
                     )
 
+                    cached_before = self._device_location_data.get(dev_id)
+                    if dev_id in self._locate_inflight:
+                        # A manual locate is already answering for this device.
+                        _LOGGER.debug("Skipping poll of %s: manual locate in flight", dev_name)
+                        continue
+                    # Adaptive timeout: short for devices that are unlikely to answer.
+                    locate_timeout = self._locate_latency.timeout_for(dev_id)
+                    if self._locate_latency.is_unlikely(dev_id) and locate_timeout < self._locate_latency.max_s:
+                        self.increment_stat("locate_fast_fail")
+                    trace = self._locate_traces.start(dev_id, TRACE_POLL)
                     try:
-                        # Protect API awaitable with timeout
-                        location = await asyncio.wait_for(
-                            self.api.async_get_device_location(dev_id, dev_name),
-                            timeout=LOCATION_REQUEST_TIMEOUT_S,
-                        )
+                        # Protect API awaitable with timeout (the API bounds its FCM wait itself)
+                        async with self._dispatcher.slot(LANE_BACKGROUND, dev_id):
+                            started = time.monotonic()
+                            with pipeline_latency(self._pipeline_latency), bind_trace(trace):
+                                location = await asyncio.wait_for(
+                                    self.api.async_get_device_location(
+                                        dev_id, dev_name, timeout_s=locate_timeout
+                                    ),
+                                    timeout=locate_timeout + _LOCATE_OUTER_GRACE_S,
+                                )
+                            elapsed = time.monotonic() - started
+                        if location:
+                            self._poll_spacing.on_success(elapsed)
+                            self._locate_latency.observe(dev_id, elapsed)
+                        elif elapsed >= locate_timeout:
+                            # Empty answer after the full FCM wait: no response in time.
+                            raise asyncio.TimeoutError
+                        self._device_poll_failures.pop(dev_id, None)
 
                         if not location:
                             _LOGGER.info("No location data available for %s (device may be out of range or offline)", dev_name)
+                            trace.finish(OUTCOME_NO_LOCATION)
                             continue
 
                         # --- Apply Google Home filter (keep parity with FCM push path) ---
@@ -1064,6 +2638,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                                     _LOGGER.debug(
                                         "Filtering out Google Home spam detection for %s", dev_name
                                     )
+                                    trace.finish(OUTCOME_FILTERED)
                                     continue
                                 if replacement_attrs:
                                     _LOGGER.info(
@@ -1103,6 +2678,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                             # Nothing to commit/update in cache
                             # Strip any internal hint before dropping to avoid accidental exposure
                             location.pop("_report_hint", None)
+                            trace.finish(OUTCOME_INVALID)
                             continue
 
                         # Accuracy quality filter
@@ -1122,11 +2698,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                             self.increment_stat("low_quality_dropped")
                             # Strip any internal hint before dropping to avoid accidental exposure
                             location.pop("_report_hint", None)
+                            trace.finish(OUTCOME_LOW_ACCURACY)
                             continue
 
                         # Significance gate (replaces naive duplicate check)
                         last_seen = location.get("last_seen", 0)
-                        if not self._is_significant_update(dev_id, location):
+                        if not self._passes_significance_gate(dev_id, location, trace):
                             _LOGGER.debug(
                                 "Skipping non-significant update for %s (last_seen=%s)",
                                 dev_name,
@@ -1135,6 +2712,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                             self.increment_stat("non_significant_dropped")
                             # Strip internal hint before dropping to avoid accidental exposure
                             location.pop("_report_hint", None)
+                            trace.finish(OUTCOME_NOT_SIGNIFICANT)
                             continue
 
                         # Age diagnostics (informational)
@@ -1167,43 +2745,152 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
                         # Commit to cache and bump statistics
                         location["last_updated"] = wall_now  # wall-clock for UX
+                        self._note_device_fix(dev_id, location)
                         self._device_location_data[dev_id] = location
+                        self._device_location_source[dev_id] = "poll"
+                        self._schedule_warm_start_save()
                         self.increment_stat("polled_updates")
+                        self._locate_traces.committed(trace)
 
                         # Immediate per-device update for more responsive UI during long poll cycles.
                         self.push_updated([dev_id])
 
                     except asyncio.TimeoutError as terr:
                         _LOGGER.info(
-                            "Location request timed out for %s after %s seconds",
+                            "Location request timed out for %s after %.0f seconds",
                             dev_name,
-                            LOCATION_REQUEST_TIMEOUT_S,
+                            locate_timeout,
                         )
+                        self._locate_latency.observe_timeout(dev_id)
                         self.increment_stat("timeouts")
+                        trace.finish(OUTCOME_TIMEOUT)
                         self.note_error(terr, where="poll_timeout", device=dev_name)
+                        self._poll_spacing.on_failure()
+                        self._device_poll_failures[dev_id] = self._device_poll_failures.get(dev_id, 0) + 1
+                    except NovaCircuitOpenError as err:
+                        # Endpoint tripped mid-cycle; the breaker already logged the outage.
+                        _LOGGER.debug("Location request for %s skipped: %s", dev_name, err)
+                        self._poll_spacing.on_failure()
+                        self._device_poll_failures[dev_id] = self._device_poll_failures.get(dev_id, 0) + 1
+                    except (NovaRateLimitError, NovaHTTPError) as err:
+                        # Throttled or server error: widen the spacing before the next device.
+                        _LOGGER.warning("Location request for %s failed upstream: %s", dev_name, err)
+                        self.note_error(err, where="poll_upstream", device=dev_name)
+                        self._poll_spacing.on_failure()
+                        self._device_poll_failures[dev_id] = self._device_poll_failures.get(dev_id, 0) + 1
                     except ConfigEntryAuthFailed:
                         # Escalate auth failures to HA; abort remaining devices
                         raise
                     except Exception as err:
                         _LOGGER.error("Failed to get location for %s: %s", dev_name, err)
                         self.note_error(err, where="poll_exception", device=dev_name)
+                        self._poll_spacing.on_failure()
+                        self._device_poll_failures[dev_id] = self._device_poll_failures.get(dev_id, 0) + 1
+                    finally:
+                        if trace.outcome is None:
+                            trace.finish(OUTCOME_ERROR)
+                        self._schedule_next_device_poll(
+                            dev_id, fresh=self._device_location_data.get(dev_id) is not cached_before
+                        )
 
-                    # Inter-device delay (except after the last one)
-                    if idx < len(devices) - 1 and self.device_poll_delay > 0:
-                        await asyncio.sleep(self.device_poll_delay)
+                    # Adaptive inter-device delay (except after the last one)
+                    spacing = self._poll_spacing.spacing_s
+                    if idx < len(ordered) - 1 and spacing > 0:
+                        await asyncio.sleep(spacing)
 
-                _LOGGER.debug("Completed polling cycle for %d devices", len(devices))
+                else:
+                    attempted = len(ordered)
+                _LOGGER.debug("Completed polling cycle for %d/%d devices", attempted, len(ordered))
             finally:
+                # Carry the unpolled tail over (budget, cancellation or auth abort)
+                self._set_poll_carryover(ordered, attempted)
                 # Update scheduling baseline and clear flag, then push end snapshot
                 self._last_poll_mono = time.monotonic()
                 self._is_polling = False
                 self.safe_update_metric("last_poll_end_mono", time.monotonic())
-                end_snapshot = self._build_snapshot_from_cache(
-                    devices, wall_now=time.time()
-                )
-                self.async_set_updated_data(end_snapshot)
+                slicer = self._begin_snapshot_pass()
+                try:
+                    end_snapshot = await self._async_build_snapshot_from_cache(
+                        devices, time.time(), slicer
+                    )
+                    self.async_set_updated_data(
+                        await self._async_merge_snapshot(end_snapshot, slicer)
+                    )
+                finally:
+                    self._end_snapshot_pass(slicer, "poll_cycle_end", len(devices))
 
     # ---------------------------- Snapshot helpers --------------------------
+    def _current_snapshot(self) -> DeviceSnapshot:
+        """Return the published snapshot, or an empty one before the first publish."""
+        data = getattr(self, "data", None)
+        return data if isinstance(data, DeviceSnapshot) else DeviceSnapshot()
+
+    def _entry_fingerprints(self, entries: List[Dict[str, Any]]) -> Dict[str, Hashable]:
+        """Return a cheap content fingerprint per entry (visible fields + gating flags).
+
+        Besides the entry fields, presence and the inputs of button availability
+        (capability, push readiness, in-flight and active cooldowns) are included so
+        availability transitions still reach the device's entities.
+        """
+        now_mono = time.monotonic()
+        push_ready = self._api_push_ready()
+        ttl = float(self._presence_ttl_s)
+        devices = self._devices
+        fps: Dict[str, Hashable] = {}
+        for entry in entries:
+            dev_id = entry.get("id")
+            if not isinstance(dev_id, str):
+                continue
+            state = devices.get(dev_id)
+            if state is None:
+                gates: tuple[Any, ...] = (False, None, False, False, False)
+            else:
+                seen = state.present_last_seen
+                gates = (
+                    bool(seen) and (now_mono - seen) <= ttl,
+                    (state.caps or {}).get("can_ring"),
+                    state.locate_inflight,
+                    now_mono < (state.locate_cooldown_until or 0.0),
+                    now_mono < (state.poll_cooldown_until or 0.0),
+                )
+            fps[dev_id] = (tuple(entry.get(key) for key in _FINGERPRINT_FIELDS), push_ready, gates)
+        return fps
+
+    def _merge_snapshot(
+        self,
+        entries: List[Dict[str, Any]],
+        *,
+        replace_all: bool = False,
+        fingerprints: Optional[Dict[str, Hashable]] = None,
+    ) -> DeviceSnapshot:
+        """Merge entries into the published snapshot, suppressing no-op device updates.
+
+        Args:
+            entries: Freshly built snapshot entries.
+            replace_all: True for a full refresh (drops devices missing from `entries`).
+            fingerprints: Precomputed `_entry_fingerprints(entries)` (cooperative passes).
+
+        Returns:
+            The new snapshot to publish; unchanged devices are not in `changed_ids`.
+        """
+        if fingerprints is None:
+            fingerprints = self._entry_fingerprints(entries)
+        merger = self._current_snapshot().merger(replace_all=replace_all)
+        merger.add(entries, fingerprints)
+        return self._finish_merge(merger)
+
+    def _finish_merge(self, merger: _SnapshotMerger) -> DeviceSnapshot:
+        """Finish a merge: notify running passes and count suppressed updates."""
+        merged = merger.finish()
+        for active in getattr(self, "_snapshot_passes", ()):
+            active.touched.update(merged.changed_ids)
+        if merger.suppressed:
+            self.stats["suppressed_updates"] = (
+                self.stats.get("suppressed_updates", 0) + merger.suppressed
+            )
+            self._schedule_stats_persist()
+        return merged
+
     def _build_base_snapshot_entry(self, device_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Create the base snapshot entry for a device (no cache lookups here).
 
@@ -1230,6 +2917,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             "is_own_report": None,
             "semantic_name": None,
             "battery_level": None,
+            "location_source": None,
         }
 
     def _update_entry_from_cache(self, entry: Dict[str, Any], wall_now: float) -> bool:
@@ -1248,16 +2936,39 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             return False
 
         entry.update(cached)
-        last_updated_ts = cached.get("last_updated", 0)
-        age = max(0.0, wall_now - float(last_updated_ts))
-        if age < self.location_poll_interval:
-            entry["status"] = "Location data current"
-        elif age < self.location_poll_interval * 2:
-            entry["status"] = "Location data aging"
-        else:
-            entry["status"] = "Location data stale"
+        entry["status"] = self._cache_status(cached, wall_now)
+        entry["location_source"] = self._device_location_source.get(dev_id) or "poll"
         return True
 
+    def _cache_status(self, cached: Mapping[str, Any], wall_now: float) -> str:
+        """Return the age-based status text of a cached location."""
+        age = max(0.0, wall_now - float(cached.get("last_updated", 0)))
+        if age < self.location_poll_interval:
+            return "Location data current"
+        if age < self.location_poll_interval * 2:
+            return "Location data aging"
+        return "Location data stale"
+
+    def _refresh_snapshot_status(
+        self, wall_now: float, items: Optional[Iterable[tuple[str, Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the published entries with their cache-age status re-evaluated.
+
+        Entries whose status is unchanged are returned as-is (the merge keeps them
+        unless presence or gating flags changed); others are shallow copies.
+        `items` restricts the pass to a slice of the snapshot's `(id, entry)` pairs.
+        """
+        entries: List[Dict[str, Any]] = []
+        for dev_id, entry in self._current_snapshot().items() if items is None else items:
+            refreshed = entry
+            cached = self._device_location_data.get(dev_id)
+            if cached:
+                status = self._cache_status(cached, wall_now)
+                if entry.get("status") != status:
+                    refreshed = {**entry, "status": status}
+            entries.append(refreshed)
+        return entries
+
     def _build_snapshot_from_cache(
         self, devices: List[Dict[str, Any]], wall_now: float
     ) -> List[Dict[str, Any]]:
@@ -1280,40 +2991,149 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             snapshot.append(entry)
         return snapshot
 
+    # ---------------------------- Cooperative snapshot passes ---------------
+    def _new_loop_slicer(self) -> _LoopSlicer:
+        return _LoopSlicer(getattr(self, "snapshot_chunk_size", DEFAULT_SNAPSHOT_CHUNK_SIZE))
+
+    def _begin_snapshot_pass(self) -> _LoopSlicer:
+        """Start a cooperative snapshot pass (see `_async_merge_snapshot()`)."""
+        slicer = self._new_loop_slicer()
+        self._snapshot_passes.append(slicer)
+        return slicer
+
+    def _end_snapshot_pass(self, slicer: _LoopSlicer, kind: str, devices: int) -> None:
+        """Finish a pass and record its event-loop blocking time."""
+        slicer.close()
+        with contextlib.suppress(ValueError):
+            self._snapshot_passes.remove(slicer)
+        block_ms = slicer.block_s * 1000.0
+        self.stats["snapshot_block_ms"] = self.stats.get("snapshot_block_ms", 0) + int(round(block_ms))
+        self.stats["snapshot_yields"] = self.stats.get("snapshot_yields", 0) + slicer.pauses
+        self._schedule_stats_persist()
+        peak = max(self._snapshot_pass_info.get("peak_max_block_ms", 0.0), slicer.max_block_s * 1000.0)
+        self._snapshot_pass_info = {
+            "kind": kind,
+            "devices": devices,
+            "chunk_size": slicer.chunk_size,
+            "yields": slicer.pauses,
+            "block_ms": round(block_ms, 2),
+            "max_block_ms": round(slicer.max_block_s * 1000.0, 2),
+            "peak_max_block_ms": round(peak, 2),
+        }
+
+    def get_snapshot_pass_state(self) -> Dict[str, Any]:
+        """Return the loop-blocking figures of the latest snapshot pass (diagnostics)."""
+        return dict(self._snapshot_pass_info)
+
+    async def _async_build_snapshot_from_cache(
+        self, devices: List[Dict[str, Any]], wall_now: float, slicer: _LoopSlicer
+    ) -> List[Dict[str, Any]]:
+        """Cooperative `_build_snapshot_from_cache()`: yields between chunks."""
+        snapshot: List[Dict[str, Any]] = []
+        for chunk in _chunks(devices, slicer.chunk_size):
+            snapshot.extend(self._build_snapshot_from_cache(chunk, wall_now))
+            if slicer.tick(len(chunk)):
+                await slicer.pause()
+        return snapshot
+
+    async def _async_refresh_snapshot_status(
+        self, wall_now: float, slicer: _LoopSlicer
+    ) -> List[Dict[str, Any]]:
+        """Cooperative `_refresh_snapshot_status()`: yields between chunks."""
+        entries: List[Dict[str, Any]] = []
+        for chunk in _chunks(list(self._current_snapshot().items()), slicer.chunk_size):
+            entries.extend(self._refresh_snapshot_status(wall_now, chunk))
+            if slicer.tick(len(chunk)):
+                await slicer.pause()
+        return entries
+
+    async def _async_merge_snapshot(
+        self, entries: List[Dict[str, Any]], slicer: _LoopSlicer, *, replace_all: bool = False
+    ) -> DeviceSnapshot:
+        """Cooperative `_merge_snapshot()`: entries are fingerprinted and merged in chunks.
+
+        If another path (push, poll commit) published while this pass was yielding,
+        the chunked merge is based on a stale snapshot and is redone against the
+        published one; devices published meanwhile keep their newer entry instead
+        of the one built here.
+        """
+        published = getattr(self, "data", None)
+        base = self._current_snapshot()
+        entries = self._prefer_published(entries, slicer, base)
+        merger = base.merger(replace_all=replace_all)
+        fingerprints: Dict[str, Hashable] = {}
+        for chunk in _chunks(entries, slicer.chunk_size):
+            chunk_fps = self._entry_fingerprints(chunk)
+            fingerprints.update(chunk_fps)
+            merger.add(chunk, chunk_fps)
+            if slicer.tick(len(chunk)):
+                await slicer.pause()
+        if getattr(self, "data", None) is published:
+            return self._finish_merge(merger)
+        entries = self._prefer_published(entries, slicer, self._current_snapshot())
+        touched = [entry for entry in entries if entry.get("id") in slicer.touched]
+        if touched:
+            fingerprints.update(self._entry_fingerprints(touched))
+        return self._merge_snapshot(entries, replace_all=replace_all, fingerprints=fingerprints)
+
+    @staticmethod
+    def _prefer_published(
+        entries: List[Dict[str, Any]], slicer: _LoopSlicer, current: DeviceSnapshot
+    ) -> List[Dict[str, Any]]:
+        """Replace entries of devices published during the pass by their published entry."""
+        if not slicer.touched:
+            return entries
+        return [
+            current[dev_id]
+            if (dev_id := entry.get("id")) in slicer.touched and dev_id in current
+            else entry
+            for entry in entries
+        ]
+
     async def _async_build_device_snapshot_with_fallbacks(
-        self, devices: List[Dict[str, Any]]
+        self, devices: List[Dict[str, Any]], slicer: Optional[_LoopSlicer] = None
     ) -> List[Dict[str, Any]]:
         """Build a snapshot using cache, HA state and (optionally) history fallback.
 
+        Tracker entities are resolved from the entry's `TrackerEntityIndex` rather
+        than per-device registry lookups. Devices that miss both the cache and a live
+        state are collected and resolved from Recorder history in a single executor
+        job (see `_sync_get_last_gps_from_history_batch`). The pass yields to the
+        event loop every `snapshot_chunk_size` devices.
+
         Args:
             devices: A list of device dictionaries to build the snapshot for.
+            slicer: The cooperative pass this build belongs to (a new one if None).
 
         Returns:
             A complete list of device state dictionaries with fallbacks applied.
         """
         snapshot: List[Dict[str, Any]] = []
+        history_misses: List[tuple[Dict[str, Any], str]] = []
         wall_now = time.time()
-        ent_reg = er.async_get(self.hass)
+        index = self._tracker_index()
+        if slicer is None:
+            slicer = self._new_loop_slicer()
 
         for dev in devices:
-            entry = self._build_base_snapshot_entry(dev)
+            if slicer.tick():
+                await slicer.pause()
+            entry_data = self._build_base_snapshot_entry(dev)
+            snapshot.append(entry_data)
 
             # Prefer cached result
-            if self._update_entry_from_cache(entry, wall_now):
-                snapshot.append(entry)
+            if self._update_entry_from_cache(entry_data, wall_now):
                 continue
 
-            # No cache -> Registry + State (cheap, non-blocking)
-            dev_id = entry["device_id"]
-            unique_id = f"{DOMAIN}_{dev_id}"
-            entity_id = ent_reg.async_get_entity_id("device_tracker", DOMAIN, unique_id)
+            # No cache -> tracker index + State (cheap, non-blocking)
+            dev_id = entry_data["device_id"]
+            entity_id = index.entity_id(dev_id) if index is not None else None
             if not entity_id:
                 _LOGGER.debug(
-                    "No entity registry entry for device '%s' (unique_id=%s); skipping any fallback.",
-                    entry["name"],
-                    unique_id,
+                    "No entity registry entry for device '%s' (id=%s); skipping any fallback.",
+                    entry_data["name"],
+                    dev_id,
                 )
-                snapshot.append(entry)
                 continue
 
             state = self.hass.states.get(entity_id)
@@ -1322,42 +3142,49 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 lon = state.attributes.get("longitude")
                 acc = state.attributes.get("gps_accuracy")
                 if lat is not None and lon is not None:
-                    entry.update(
+                    entry_data.update(
                         {
                             "latitude": lat,
                             "longitude": lon,
                             "accuracy": acc,
                             "last_seen": int(state.last_updated.timestamp()),
                             "status": "Using current state",
+                            "location_source": "state",
                         }
                     )
-                    snapshot.append(entry)
                     continue
 
-            # Optional history fallback
             if self.allow_history_fallback:
-                _LOGGER.warning(
-                    "No live state for %s (entity_id=%s); attempting history fallback via Recorder.",
-                    entry["name"],
-                    entity_id,
-                )
-                rec = get_recorder(self.hass)
-                result = await rec.async_add_executor_job(
-                    _sync_get_last_gps_from_history, self.hass, entity_id
-                )
+                history_misses.append((entry_data, entity_id))
+
+        # Optional history fallback: one executor job for all misses
+        if history_misses:
+            _LOGGER.warning(
+                "No live state for %d device(s); attempting history fallback via Recorder.",
+                len(history_misses),
+            )
+            rec = get_recorder(self.hass)
+            slicer.close()  # waiting for the executor does not block the loop
+            results = await rec.async_add_executor_job(
+                _sync_get_last_gps_from_history_batch,
+                self.hass,
+                [entity_id for _entry, entity_id in history_misses],
+            )
+            slicer.resume()
+            for entry_data, entity_id in history_misses:
+                result = results.get(entity_id)
                 if result:
-                    entry.update(result)
+                    entry_data.update(result)
+                    entry_data["location_source"] = "history"
                     self.increment_stat("history_fallback_used")
                 else:
                     _LOGGER.warning(
                         "No historical GPS data found for %s (entity_id=%s). "
                         "Entity may be excluded from Recorder.",
-                        entry["name"],
+                        entry_data["name"],
                         entity_id,
                     )
 
-            snapshot.append(entry)
-
         return snapshot
 
     # ---------------------------- Stats persistence -------------------------
@@ -1370,6 +3197,16 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                     if key in cached:
                         self.stats[key] = cached[key]
                 _LOGGER.debug("Loaded statistics from cache: %s", self.stats)
+            cycle_state = await self._cache.async_get_cached_value(_POLL_CYCLE_STATE_KEY)
+            if cycle_state and isinstance(cycle_state, dict):
+                queue = cycle_state.get("queue")
+                if isinstance(queue, list):
+                    self._poll_carryover = [x for x in queue if isinstance(x, str)]
+                failures = cycle_state.get("failures")
+                if isinstance(failures, dict):
+                    self._device_poll_failures = {
+                        str(k): int(v) for k, v in failures.items() if isinstance(v, int) and v > 0
+                    }
         except Exception as err:
             _LOGGER.debug("Failed to load statistics from cache: %s", err)
 
@@ -1377,9 +3214,120 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         """Persist statistics to entry-scoped cache."""
         try:
             await self._cache.async_set_cached_value("integration_stats", self.stats.copy())
+            await self._cache.async_set_cached_value(
+                _POLL_CYCLE_STATE_KEY,
+                {"queue": list(self._poll_carryover), "failures": dict(self._device_poll_failures)},
+            )
         except Exception as err:
             _LOGGER.debug("Failed to save statistics to cache: %s", err)
 
+    # ---------------------------- Warm start --------------------------------
+    def _warm_start_payload(self) -> Dict[str, Any]:
+        """Return the JSON-safe warm-start cache (device list + last known locations)."""
+
+        def _scalars(data: Mapping[str, Any]) -> Dict[str, Any]:
+            return {
+                str(k): v
+                for k, v in data.items()
+                if not str(k).startswith("_") and isinstance(v, _WARM_START_SCALAR_TYPES)
+            }
+
+        return {
+            "saved_at": time.time(),
+            "devices": [_scalars(d) for d in self._last_device_list if isinstance(d.get("id"), str)],
+            "locations": {
+                dev_id: {
+                    "data": _scalars(loc),
+                    "source": self._device_location_source.get(dev_id, "restored"),
+                }
+                for dev_id, loc in self._device_location_data.items()
+                if loc.get("last_seen") is not None
+            },
+        }
+
+    def _schedule_warm_start_save(self) -> None:
+        """Write the warm-start cache after `_WARM_START_SAVE_DELAY_S` (coalesced by Store)."""
+        if self._warm_store is not None:
+            self._warm_store.async_delay_save(self._warm_start_payload, _WARM_START_SAVE_DELAY_S)
+
+    async def _async_restore_warm_start(self) -> None:
+        """Seed caches from the warm-start Store and publish the snapshot immediately.
+
+        Restored devices count as present for one presence TTL; the deferred first
+        refresh revalidates the list and the poll cycle refreshes the locations.
+        Restored locations report the source "restored" until they are replaced;
+        their persisted poll/push source is only counted for diagnostics.
+        """
+        entry = self.config_entry
+        if entry is None or self._warm_store is not None:
+            return
+        self._warm_store = Store(
+            self.hass,
+            WARM_START_STORAGE_VERSION,
+            f"{WARM_START_STORAGE_KEY}_{entry.entry_id}",
+            private=True,
+        )
+        started = time.monotonic()
+        try:
+            cached = await self._warm_store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Failed to load warm-start cache: %s", err)
+            return
+        if not isinstance(cached, dict):
+            return
+
+        devices = [
+            d for d in cached.get("devices") or []
+            if isinstance(d, dict) and isinstance(d.get("id"), str)
+        ]
+        locations = cached.get("locations")
+        if not devices:
+            return
+        now_mono = time.monotonic()
+        self._last_device_list = devices
+        for dev in devices:
+            dev_id = dev["id"]
+            self._device_names.setdefault(dev_id, dev.get("name", dev_id))
+            if "can_ring" in dev:
+                self._device_caps.setdefault(dev_id, {})["can_ring"] = bool(dev["can_ring"])
+            self._present_last_seen.setdefault(dev_id, now_mono)
+        restored_from: Dict[str, int] = {}
+        if isinstance(locations, dict):
+            for dev_id, record in locations.items():
+                data = record.get("data") if isinstance(record, dict) else None
+                if isinstance(data, dict) and dev_id not in self._device_location_data:
+                    self._device_location_data[dev_id] = dict(data)
+                    self._device_location_source[dev_id] = "restored"
+                    origin = str(record.get("source") or "unknown")
+                    restored_from[origin] = restored_from.get(origin, 0) + 1
+
+        ignored = self._get_ignored_set()
+        visible = [d for d in devices if d["id"] not in ignored]
+        self.data = self._merge_snapshot(
+            self._build_snapshot_from_cache(visible, wall_now=time.time()), replace_all=True
+        )
+        self._warm_start_info = {
+            "restored_devices": len(visible),
+            "restored_locations": sum(1 for d in visible if d["id"] in self._device_location_data),
+            "restored_from": restored_from,
+            "saved_at": cached.get("saved_at"),
+            "load_ms": round((time.monotonic() - started) * 1000.0, 1),
+        }
+        _LOGGER.debug(
+            "Warm start: published %d device(s) from the persisted cache in %.1f ms",
+            len(visible),
+            self._warm_start_info["load_ms"],
+        )
+
+    def get_warm_start_state(self) -> Dict[str, Any]:
+        """Return warm-start statistics for diagnostics (no identifiers or locations)."""
+        info = dict(self._warm_start_info)
+        sources: Dict[str, int] = {}
+        for source in self._device_location_source.values():
+            sources[source] = sources.get(source, 0) + 1
+        info["location_sources"] = sources
+        return info
+
     async def _debounced_save_stats(self) -> None:
         """Debounce wrapper to coalesce frequent stat updates into a single write.
 
@@ -1492,6 +3440,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         - Strips `_report_hint` from the cached payload to avoid exposing internal fields.
         - Runs significance gating to prevent redundant cache churn. The cooldown still applies
           even if the update is dropped as non-significant (server-friendly behaviour).
+        - Records gating and commit on the locate trace bound by the caller (push path).
         """
         if not self._is_on_hass_loop():
             # Marshal entire update onto the HA loop to avoid cross-thread mutations.
@@ -1501,6 +3450,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         if not isinstance(location_data, dict):
             _LOGGER.debug("Ignored cache update for %s: payload is not a dict", device_id)
             return
+        trace = current_trace()
+
+        if device_id not in self._device_names:
+            # A push for a device outside the last list: a tracker was probably added.
+            self.request_device_list_refresh()
+            self._schedule_short_retry(1.0)
 
         # Discard stale updates that would regress time (push can arrive late).
         existing_data = self._device_location_data.get(device_id)
@@ -1513,6 +3468,8 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                         "Discarding stale push update for %s (new last_seen=%s < existing=%s)",
                         device_id, new_seen, existing_seen
                     )
+                    if trace is not None:
+                        trace.finish(OUTCOME_STALE)
                     return
             except (TypeError, ValueError):
                 # If timestamps are malformed, comparison is not possible.
@@ -1538,8 +3495,10 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         self._normalize_coords(slot, device_label=device_id, warn_on_invalid=False)
 
         # Significance gate (prevents redundant churn while still respecting cooldowns)
-        if not self._is_significant_update(device_id, slot):
+        if not self._passes_significance_gate(device_id, slot, trace):
             self.increment_stat("non_significant_dropped")
+            if trace is not None:
+                trace.finish(OUTCOME_NOT_SIGNIFICANT)
             return
 
         # Ensure last_updated is present
@@ -1550,9 +3509,14 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         if isinstance(name, str) and name:
             self._device_names[device_id] = name
 
+        self._note_device_fix(device_id, slot)
         self._device_location_data[device_id] = slot
+        self._device_location_source[device_id] = "push"
+        self._schedule_warm_start_save()
         # Increment background updates to account for push/manual commits.
         self.increment_stat("background_updates")
+        if trace is not None:
+            self._locate_traces.committed(trace)
 
     # ---------------------------- Significance / gating ----------------------
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -1572,6 +3536,19 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         c = 2.0 * atan2(sqrt(a), sqrt(1.0 - a))
         return R * c
 
+    def _passes_significance_gate(
+        self, device_id: str, new_data: Dict[str, Any], trace: Optional[LocateTrace] = None
+    ) -> bool:
+        """Run `_is_significant_update()`, timed as the gating stage (and as a span of `trace`)."""
+        started = perf_counter()
+        try:
+            return self._is_significant_update(device_id, new_data)
+        finally:
+            ended = perf_counter()
+            self._pipeline_latency.observe(STAGE_GATING, ended - started)
+            if trace is not None:
+                trace.span(STAGE_GATING, started, ended)
+
     def _is_significant_update(self, device_id: str, new_data: Dict[str, Any]) -> bool:
         """Return True if the update carries meaningful new information.
 
@@ -1681,10 +3658,11 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         and a time-to-live (`_presence_ttl_s`). This avoids availability flips on
         transient empty lists.
         """
-        ts = self._present_last_seen.get(device_id, 0.0)
+        state = self._devices.get(device_id)
+        ts = state.present_last_seen if state is not None else None
         if not ts:
             return False
-        return (time.monotonic() - float(ts)) <= float(self._presence_ttl_s)
+        return (time.monotonic() - ts) <= float(self._presence_ttl_s)
 
     def get_absent_device_ids(self) -> List[str]:
         """Return ids known by name/cache that are **expired** under the presence TTL.
@@ -1692,13 +3670,13 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         Useful for diagnostics. This does not imply automatic removal.
         """
         now_mono = time.monotonic()
-
-        def expired(dev_id: str) -> bool:
-            ts = self._present_last_seen.get(dev_id, 0.0)
-            return (not ts) or ((now_mono - float(ts)) > float(self._presence_ttl_s))
-
-        known = set(self._device_names) | set(self._device_location_data)
-        return sorted([d for d in known if expired(d)])
+        ttl = float(self._presence_ttl_s)
+        return sorted(
+            dev_id
+            for dev_id, state in self._devices.records()
+            if (state.name is not None or state.location is not None)
+            and (not state.present_last_seen or (now_mono - state.present_last_seen) > ttl)
+        )
 
     def purge_device(self, device_id: str) -> None:
         """Remove all cached data and cooldown state for a device (thread-safe publish).
@@ -1710,17 +3688,15 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             self._run_on_hass_loop(self.purge_device, device_id)
             return
 
-        self._device_location_data.pop(device_id, None)
-        self._device_names.pop(device_id, None)
-        self._device_caps.pop(device_id, None)
-        self._locate_inflight.discard(device_id)
-        self._locate_cooldown_until.pop(device_id, None)
-        self._sound_request_uuids.pop(device_id, None)
-        self._device_poll_cooldown_until.pop(device_id, None)
+        self._devices.pop(device_id)  # every per-device field at once
+        self._locate_latency.forget(device_id)
+        if device_id in self._poll_carryover:
+            self._poll_carryover.remove(device_id)
         self._present_device_ids.discard(device_id)
-        self._present_last_seen.pop(device_id, None)
-        # Push a minimal update so listeners can refresh availability quickly
-        self.async_set_updated_data(self.data)
+        self._last_device_list = [d for d in self._last_device_list if d.get("id") != device_id]
+        self._schedule_warm_start_save()
+        # Publish a snapshot without this device so listeners can refresh availability quickly
+        self.async_set_updated_data(self._current_snapshot().merge((), removed=(device_id,)))
 
     # ---------------------------- Push updates ------------------------------
     def push_updated(self, device_ids: Optional[List[str]] = None, *, reset_baseline: bool = True) -> None:
@@ -1730,11 +3706,17 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         publishing happens on the HA event loop.
 
         This **does not** trigger a poll. It:
-        - Immediately pushes cache state to entities via `async_set_updated_data()`.
+        - Pushes cache state to entities via `async_set_updated_data()`.
         - Optionally resets the internal poll baseline to 'now' to prevent an immediate
           re-poll when push-driven updates arrive (`reset_baseline=True` by default).
         - Optionally limits the snapshot to `device_ids`; otherwise includes all known devices.
 
+        Micro-batching:
+        - Device-scoped pushes are coalesced for `push_batch_window_s`; every id committed
+          within the window is published in **one** snapshot, so a burst of N trackers
+          costs one listener fan-out instead of N.
+        - A full push (`device_ids=None`) publishes immediately and absorbs any pending batch.
+
         Args:
             device_ids: An optional list of device IDs to include in the update.
             reset_baseline: If True (default), reset the scheduler baseline to now.
@@ -1743,16 +3725,57 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             self._run_on_hass_loop(self.push_updated, device_ids, reset_baseline=reset_baseline)
             return
 
-        wall_now = time.time()
         if reset_baseline:
-            self._last_poll_mono = time.monotonic()  # optional: reset poll timer
+            now_mono = time.monotonic()
+            self._last_poll_mono = now_mono  # optional: reset poll timer
+            # Devices that just reported are not due again before their own interval.
+            for dev_id in device_ids or ():
+                state = self._devices.ensure(dev_id)
+                state.next_poll_mono = max(
+                    state.next_poll_mono or 0.0, now_mono + self._device_poll_interval(dev_id)
+                )
+
+        if device_ids and self.push_batch_window_s > 0:
+            if self._push_pending_ids:
+                self.increment_stat("push_updates_coalesced")
+            self._push_pending_ids.update(device_ids)
+            if self._push_flush_cancel is None:
+                self._push_flush_cancel = async_call_later(
+                    self.hass, self.push_batch_window_s, self._async_flush_push_batch
+                )
+            return
 
-        # Choose device ids for the snapshot
         if device_ids:
-            ids = device_ids
+            # Batching disabled: include anything still pending from a previous window.
+            ids = list({*self._push_pending_ids, *device_ids})
         else:
             # union of all known names and cached locations
             ids = list({*self._device_names.keys(), *self._device_location_data.keys()})
+        self._cancel_push_batch()
+        self._publish_push_snapshot(ids)
+
+    @callback
+    def _async_flush_push_batch(self, _now: Any = None) -> None:
+        """Publish one snapshot covering every device committed during the batch window."""
+        self._push_flush_cancel = None
+        ids = list(self._push_pending_ids)
+        self._push_pending_ids.clear()
+        if ids:
+            self._publish_push_snapshot(ids)
+
+    def _cancel_push_batch(self) -> None:
+        """Cancel a pending batch flush and forget its ids (caller publishes them)."""
+        if self._push_flush_cancel is not None:
+            try:
+                self._push_flush_cancel()
+            except Exception:  # defensive
+                pass
+            self._push_flush_cancel = None
+        self._push_pending_ids.clear()
+
+    def _publish_push_snapshot(self, ids: List[str]) -> None:
+        """Build a snapshot for `ids` from the cache and publish it (loop only)."""
+        wall_now = time.time()
 
         # Touch presence timestamps for pushed devices (keeps presence stable)
         now_mono = time.monotonic()
@@ -1768,8 +3791,11 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             {"id": dev_id, "name": self._device_names.get(dev_id, dev_id)} for dev_id in ids
         ]
 
-        snapshot = self._build_snapshot_from_cache(devices_stub, wall_now=wall_now)
-        self.async_set_updated_data(snapshot)
+        with loop_section("push_snapshot"):
+            snapshot = self._build_snapshot_from_cache(devices_stub, wall_now=wall_now)
+            # Partial merge: unchanged devices keep their entries (no partial/full flapping).
+            merged = self._merge_snapshot(snapshot)
+        self.async_set_updated_data(merged)
         _LOGGER.debug("Pushed snapshot for %d device(s) via push_updated()", len(snapshot))
 
     # ---------------------------- Play sound helpers ------------------------
@@ -1864,9 +3890,8 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             return False
 
         # 3) Optimistic final decision based on whether we know the device.
-        is_known = (
-            device_id in self._device_names or device_id in self._device_location_data
-        )
+        state = self._devices.get(device_id)
+        is_known = state is not None and (state.name is not None or state.location is not None)
         if is_known:
             _LOGGER.debug(
                 "can_play_sound(%s) -> True (optimistic; known device, push_ready=%s)",
@@ -1895,14 +3920,17 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             return False
         if not self._api_push_ready():
             return False
-        if device_id in self._locate_inflight:
+        state = self._devices.get(device_id)
+        if state is None:
+            return True
+        if state.locate_inflight:
             return False
         # Respect both manual-locate and poll cooldowns for the device
         now_mono = time.monotonic()
-        until_manual = self._locate_cooldown_until.get(device_id, 0.0)
+        until_manual = state.locate_cooldown_until
         if until_manual and now_mono < until_manual:
             return False
-        until_poll = self._device_poll_cooldown_until.get(device_id, 0.0)
+        until_poll = state.poll_cooldown_until
         if until_poll and now_mono < until_poll:
             return False
         return True
@@ -1917,6 +3945,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         min_accuracy_threshold: Optional[int] = None,
         movement_threshold: Optional[int] = None,
         allow_history_fallback: Optional[bool] = None,
+        push_batch_window_ms: Optional[int] = None,
+        poll_spacing_min_s: Optional[int] = None,
+        poll_spacing_max_s: Optional[int] = None,
+        poll_cycle_budget_s: Optional[int] = None,
+        snapshot_chunk_size: Optional[int] = None,
+        device_poll_overrides: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Apply updated user settings provided by the config entry (options-first).
 
@@ -1931,6 +3965,12 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             min_accuracy_threshold: The minimum accuracy in meters.
             movement_threshold: The spatial delta (meters) required to treat updates as significant.
             allow_history_fallback: Whether to allow falling back to Recorder history.
+            push_batch_window_ms: Push coalescing window in milliseconds (0 disables batching).
+            poll_spacing_min_s: Lower bound for the adaptive inter-device spacing.
+            poll_spacing_max_s: Upper bound for the adaptive inter-device spacing.
+            poll_cycle_budget_s: Wall-clock budget of one poll cycle in seconds (0 = unlimited).
+            snapshot_chunk_size: Devices per cooperative slice of a snapshot build.
+            device_poll_overrides: Per-device poll intervals {device_id: seconds}.
         """
         if ignored_devices is not None:
             # This attribute is only used as a fallback when config_entry is not available.
@@ -1973,11 +4013,50 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         if allow_history_fallback is not None:
             self.allow_history_fallback = bool(allow_history_fallback)
 
+        if push_batch_window_ms is not None:
+            try:
+                self.push_batch_window_s = max(0, int(push_batch_window_ms)) / 1000.0
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid push_batch_window_ms=%r", push_batch_window_ms)
+
+        if poll_spacing_min_s is not None or poll_spacing_max_s is not None or device_poll_delay is not None:
+            try:
+                self._poll_spacing.reconfigure(
+                    self._poll_spacing.min_s if poll_spacing_min_s is None else int(poll_spacing_min_s),
+                    self._poll_spacing.max_s if poll_spacing_max_s is None else int(poll_spacing_max_s),
+                    initial_s=self.device_poll_delay if device_poll_delay is not None else None,
+                )
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "Ignoring invalid poll spacing bounds min=%r max=%r",
+                    poll_spacing_min_s,
+                    poll_spacing_max_s,
+                )
+
+        if poll_cycle_budget_s is not None:
+            try:
+                self.poll_cycle_budget_s = max(0, int(poll_cycle_budget_s))
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid poll_cycle_budget_s=%r", poll_cycle_budget_s)
+
+        if snapshot_chunk_size is not None:
+            try:
+                self.snapshot_chunk_size = max(1, int(snapshot_chunk_size))
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid snapshot_chunk_size=%r", snapshot_chunk_size)
+
+        if device_poll_overrides is not None:
+            self._poll_overrides = _parse_poll_overrides(device_poll_overrides)
+
     def force_poll_due(self) -> None:
         """Force the next poll to be due immediately (no private access required externally)."""
         effective_interval = max(self.location_poll_interval, self.min_poll_interval)
         # Move the baseline back so that (now - _last_poll_mono) >= effective_interval
         self._last_poll_mono = time.monotonic() - float(effective_interval)
+        # Every device is due again regardless of its cadence.
+        self._device_next_poll_mono.clear()
+        # Reloads may follow added/removed trackers: revalidate the list as well.
+        self.request_device_list_refresh()
 
     # ---------------------------- Passthrough API ---------------------------
     async def async_locate_device(self, device_id: str) -> Dict[str, Any]:
@@ -1989,7 +4068,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             equals `DEFAULT_MIN_POLL_INTERVAL`. This disables repeated clicks.
           - On success: reset the polling baseline and set a **per-device cooldown**
             (owner-report purge window) by clamping a dynamic guess.
-          - Always notify listeners via `async_set_updated_data(self.data)`.
+          - Always notify listeners via `async_set_updated_data()` (device flagged as changed).
 
         POPETS'25-informed behaviour:
           - If the returned payload carries an internal `_report_hint` of
@@ -2022,11 +4101,16 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         # Enter in-flight and set a lower-bound cooldown window
         self._locate_inflight.add(device_id)
         self._locate_cooldown_until[device_id] = time.monotonic() + float(DEFAULT_MIN_POLL_INTERVAL)
-        self.async_set_updated_data(self.data)
+        self.async_set_updated_data(self._current_snapshot().with_changed((device_id,)))
 
+        trace = self._locate_traces.start(device_id, TRACE_MANUAL)
         try:
-            location_data = await self.api.async_get_device_location(device_id, name)
+            # Interactive lane: served before queued background polls, with reserved budget.
+            async with self._dispatcher.slot(LANE_INTERACTIVE, device_id):
+                with pipeline_latency(self._pipeline_latency), bind_trace(trace):
+                    location_data = await self.api.async_get_device_location(device_id, name)
             if not location_data:
+                trace.finish(OUTCOME_NO_LOCATION)
                 return {}
 
             # --- Parity with polling path: Google Home semantic spam filter --------
@@ -2042,6 +4126,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                 else:
                     if should_filter:
                         _LOGGER.debug("Filtering out Google Home spam detection for %s (manual locate)", name)
+                        trace.finish(OUTCOME_FILTERED)
                         # Successful but filtered: reset baseline, clear cooldown, and refresh UI.
                         self._last_poll_mono = time.monotonic()
                         self._locate_cooldown_until.pop(device_id, None)
@@ -2074,6 +4159,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                         "No location data (coordinates or semantic name) available for %s in manual locate.",
                         name,
                     )
+                trace.finish(OUTCOME_INVALID)
                 return {}
 
             acc = location_data.get("accuracy")
@@ -2089,6 +4175,7 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                     "Dropping low-quality fix for %s (accuracy=%sm > %sm)", name, acc, self._min_accuracy_threshold
                 )
                 self.increment_stat("low_quality_dropped")
+                trace.finish(OUTCOME_LOW_ACCURACY)
                 return {}
 
             # Prepare a copy for gating/cooldown application
@@ -2106,12 +4193,14 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             slot.pop("_report_hint", None)
 
             # Significance gate also for manual locate to avoid churn.
-            if not self._is_significant_update(device_id, slot):
+            if not self._passes_significance_gate(device_id, slot, trace):
                 self.increment_stat("non_significant_dropped")
+                trace.finish(OUTCOME_NOT_SIGNIFICANT)
                 return {}
 
             # Commit to cache (update_device_cache ensures last_updated and stats)
             self.update_device_cache(device_id, slot)
+            self._locate_traces.committed(trace)
 
             # Successful manual locate:
             # - reset poll baseline,
@@ -2140,9 +4229,11 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             self.note_error(err, where="async_locate_device", device=name)
             raise
         finally:
+            if trace.outcome is None:
+                trace.finish(OUTCOME_ERROR)
             self._locate_inflight.discard(device_id)
             # Push an update so buttons/entities can refresh availability
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(self._current_snapshot().with_changed((device_id,)))
 
     async def async_play_sound(self, device_id: str) -> bool:
         """Play sound on a device using the native async API (no executor).
@@ -2166,7 +4257,8 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             )
             return False
         try:
-            ok, request_uuid = await self.api.async_play_sound(device_id)
+            async with self._dispatcher.slot(LANE_INTERACTIVE):
+                ok, request_uuid = await self.api.async_play_sound(device_id)
             if ok and request_uuid:
                 # Store the UUID so Stop Sound can cancel this specific request
                 self._sound_request_uuids[device_id] = request_uuid
@@ -2220,7 +4312,8 @@ class GoogleFindMyCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
                     device_id
                 )
 
-            ok = await self.api.async_stop_sound(device_id, request_uuid)
+            async with self._dispatcher.slot(LANE_INTERACTIVE):
+                ok = await self.api.async_stop_sound(device_id, request_uuid)
             if ok:
                 # Clear the stored UUID after successfully stopping
                 self._sound_request_uuids.pop(device_id, None)
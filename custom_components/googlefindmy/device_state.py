@@ -0,0 +1,292 @@
+# custom_components/googlefindmy/device_state.py
+"""Compact per-device state for the coordinator.
+
+The coordinator used to keep one dictionary per concern (names, cached locations,
+presence, cooldowns, cadence, ...), so every gate touched several hashes and a
+purge had to remember all of them. This module keeps one slotted `DeviceState`
+record per device in a `DeviceStateRegistry`:
+
+- hot checks (presence, locate gating, fingerprints) are a single lookup;
+- `DeviceStateRegistry.pop()` drops every per-device field at once.
+
+Hot paths (presence, locate gating, fingerprints, poll cadence and due-time
+selection) read the records directly. The remaining call sites, which read or
+write one concern of one device at a time, still use the historical attribute
+names (``_device_names``, ``_locate_inflight``, ...) through `DeviceStateField`
+/ `DeviceStateFlag` descriptors. They return live mapping/set views over one
+record field (iterating or sizing a view scans every record), and assigning a
+plain dict/set replaces that field for all devices. A record whose last field
+is cleared is dropped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSet
+from typing import Any
+
+__all__ = [
+    "DEVICE_STATE_FIELDS",
+    "DeviceState",
+    "DeviceStateField",
+    "DeviceStateFlag",
+    "DeviceStateRegistry",
+    "device_state_registry",
+]
+
+
+class DeviceState:
+    """Per-device state; `None` means "not set" for every optional field."""
+
+    __slots__ = (
+        "name",
+        "location",
+        "location_source",
+        "caps",
+        "present_last_seen",
+        "locate_inflight",
+        "locate_cooldown_until",
+        "poll_cooldown_until",
+        "sound_request_uuid",
+        "next_poll_mono",
+        "last_moved_wall",
+        "stale_strikes",
+        "poll_failures",
+    )
+
+    def __init__(self) -> None:
+        self.name: str | None = None
+        self.location: dict[str, Any] | None = None  # cached location payload
+        self.location_source: str | None = None  # "poll" | "push" | "restored"
+        self.caps: dict[str, Any] | None = None  # e.g. {"can_ring": True}
+        self.present_last_seen: float | None = None  # monotonic, last seen in full list
+        self.locate_inflight: bool = False
+        self.locate_cooldown_until: float | None = None  # monotonic deadline
+        self.poll_cooldown_until: float | None = None  # monotonic deadline
+        self.sound_request_uuid: str | None = None  # last Play Sound request
+        self.next_poll_mono: float | None = None  # monotonic due time
+        self.last_moved_wall: float | None = None  # epoch of last movement
+        self.stale_strikes: int | None = None  # polls without a newer fix
+        self.poll_failures: int | None = None  # consecutive poll failures
+
+    def is_empty(self) -> bool:
+        """Return True if no field is set (the record can be dropped)."""
+        return not self.locate_inflight and all(
+            getattr(self, name) is None for name in DEVICE_STATE_FIELDS
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) not in (None, False)
+        )
+        return f"DeviceState({fields})"
+
+
+# Optional fields (everything except the in-flight flag)
+DEVICE_STATE_FIELDS: tuple[str, ...] = tuple(
+    name for name in DeviceState.__slots__ if name != "locate_inflight"
+)
+
+
+class DeviceStateRegistry:
+    """Device id -> `DeviceState`; records are created on first write."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self) -> None:
+        self._records: dict[str, DeviceState] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def get(self, device_id: str) -> DeviceState | None:
+        """Return the record for `device_id` without creating it."""
+        return self._records.get(device_id)
+
+    def ensure(self, device_id: str) -> DeviceState:
+        """Return the record for `device_id`, creating an empty one if needed."""
+        record = self._records.get(device_id)
+        if record is None:
+            record = self._records[device_id] = DeviceState()
+        return record
+
+    def pop(self, device_id: str) -> DeviceState | None:
+        """Remove and return the record (all per-device fields at once)."""
+        return self._records.pop(device_id, None)
+
+    def records(self) -> Iterable[tuple[str, DeviceState]]:
+        """Return a live (device_id, record) view."""
+        return self._records.items()
+
+    def set_field(self, device_id: str, field: str, value: Any) -> None:
+        """Set one field, creating the record if needed."""
+        setattr(self.ensure(device_id), field, value)
+
+    def clear_field(self, device_id: str, field: str, unset: Any = None) -> None:
+        """Unset one field; a record left without any field set is dropped."""
+        record = self._records.get(device_id)
+        if record is None:
+            return
+        setattr(record, field, unset)
+        if record.is_empty():
+            del self._records[device_id]
+
+
+def device_state_registry(owner: Any) -> DeviceStateRegistry:
+    """Return the registry stored on `owner`, creating it on first use."""
+    try:
+        return owner.__dict__["_device_state_registry"]
+    except KeyError:
+        registry = owner.__dict__["_device_state_registry"] = DeviceStateRegistry()
+        return registry
+
+
+class _FieldView(MutableMapping[str, Any]):
+    """Live `device_id -> value` mapping over one optional record field."""
+
+    __slots__ = ("_registry", "_field")
+
+    def __init__(self, registry: DeviceStateRegistry, field: str) -> None:
+        self._registry = registry
+        self._field = field
+
+    def __getitem__(self, device_id: str) -> Any:
+        record = self._registry.get(device_id)
+        value = None if record is None else getattr(record, self._field)
+        if value is None:
+            raise KeyError(device_id)
+        return value
+
+    def get(self, device_id: str, default: Any = None) -> Any:
+        record = self._registry.get(device_id)
+        value = None if record is None else getattr(record, self._field)
+        return default if value is None else value
+
+    def __contains__(self, device_id: object) -> bool:
+        record = self._registry.get(device_id)  # type: ignore[arg-type]
+        return record is not None and getattr(record, self._field) is not None
+
+    def __setitem__(self, device_id: str, value: Any) -> None:
+        if value is None:
+            raise ValueError(f"{self._field}: None is reserved for 'not set'")
+        self._registry.set_field(device_id, self._field, value)
+
+    def __delitem__(self, device_id: str) -> None:
+        if device_id not in self:
+            raise KeyError(device_id)
+        self._registry.clear_field(device_id, self._field)
+
+    def __iter__(self) -> Iterator[str]:
+        field = self._field
+        return iter(
+            [dev_id for dev_id, record in self._registry.records() if getattr(record, field) is not None]
+        )
+
+    def __len__(self) -> int:
+        field = self._field
+        return sum(1 for _, record in self._registry.records() if getattr(record, field) is not None)
+
+    def clear(self) -> None:
+        for dev_id in list(self):
+            self._registry.clear_field(dev_id, self._field)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class _FlagView(MutableSet[str]):
+    """Live set of device ids whose boolean record field is True."""
+
+    __slots__ = ("_registry", "_field")
+
+    def __init__(self, registry: DeviceStateRegistry, field: str) -> None:
+        self._registry = registry
+        self._field = field
+
+    def __contains__(self, device_id: object) -> bool:
+        record = self._registry.get(device_id)  # type: ignore[arg-type]
+        return record is not None and getattr(record, self._field)
+
+    def __iter__(self) -> Iterator[str]:
+        field = self._field
+        return iter([dev_id for dev_id, record in self._registry.records() if getattr(record, field)])
+
+    def __len__(self) -> int:
+        field = self._field
+        return sum(1 for _, record in self._registry.records() if getattr(record, field))
+
+    def add(self, device_id: str) -> None:
+        self._registry.set_field(device_id, self._field, True)
+
+    def discard(self, device_id: str) -> None:
+        if device_id in self:
+            self._registry.clear_field(device_id, self._field, False)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)!r})"
+
+
+class DeviceStateField:
+    """Descriptor exposing one `DeviceState` field as a per-device mapping.
+
+    Assigning a mapping replaces the field for all devices (``obj.attr = {}``
+    clears it), so callers and tests written against the former dicts keep
+    working.
+    """
+
+    def __init__(self, field: str) -> None:
+        if field not in DEVICE_STATE_FIELDS:
+            raise ValueError(f"Unknown device state field: {field}")
+        self.field = field
+        self.attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        view = obj.__dict__.get(self.attr)
+        if view is None:
+            view = obj.__dict__[self.attr] = _FieldView(device_state_registry(obj), self.field)
+        return view
+
+    def __set__(self, obj: Any, value: Mapping[str, Any]) -> None:
+        items = list(value.items())
+        view = self.__get__(obj)
+        view.clear()
+        for device_id, item in items:
+            view[device_id] = item
+
+
+class DeviceStateFlag:
+    """Descriptor exposing a boolean `DeviceState` field as a set of device ids."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        view = obj.__dict__.get(self.attr)
+        if view is None:
+            view = obj.__dict__[self.attr] = _FlagView(device_state_registry(obj), self.field)
+        return view
+
+    def __set__(self, obj: Any, value: Iterable[str]) -> None:
+        ids = list(value)
+        view = self.__get__(obj)
+        view.clear()
+        for device_id in ids:
+            view.add(device_id)
@@ -2,7 +2,6 @@
 """Device tracker platform for Google Find My Device."""
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
 from datetime import datetime, timezone
@@ -25,7 +24,8 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEFAULT_MAP_VIEW_TOKEN_EXPIRATION, DOMAIN
-from .coordinator import GoogleFindMyCoordinator
+from .coordinator import DeviceSnapshot, GoogleFindMyCoordinator
+from .map_view import map_token_digest
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,23 +34,30 @@ _LOGGER = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def _maybe_update_device_registry_name(hass: HomeAssistant, entity_id: str, new_name: str) -> None:
+def _maybe_update_device_registry_name(
+    hass: HomeAssistant, entity_id: str, new_name: str, registry_device_id: str | None = None
+) -> None:
     """Write the real Google device label into the device registry once known.
 
     We never touch the registry if the user renamed the device (name_by_user set).
+
+    `registry_device_id` (from the coordinator's tracker entity index) skips the
+    Entity Registry lookup.
     """
     try:
-        ent_reg = er.async_get(hass)
-        ent = ent_reg.async_get(entity_id)
-        if not ent or not ent.device_id:
-            return
+        device_id = registry_device_id
+        if not device_id:
+            ent = er.async_get(hass).async_get(entity_id)
+            if not ent or not ent.device_id:
+                return
+            device_id = ent.device_id
         dev_reg = dr.async_get(hass)
-        dev = dev_reg.async_get(ent.device_id)
+        dev = dev_reg.async_get(device_id)
         # Respect user overrides
         if not dev or dev.name_by_user:
             return
         if new_name and dev.name != new_name:
-            dev_reg.async_update_device(device_id=ent.device_id, name=new_name)
+            dev_reg.async_update_device(device_id=device_id, name=new_name)
             _LOGGER.debug(
                 "Device registry name updated for %s: '%s' -> '%s'",
                 entity_id,
@@ -84,7 +91,7 @@ async def async_setup_entry(
 
     # Startup population from coordinator snapshot (if already present)
     if coordinator.data:
-        for device in coordinator.data:
+        for device in coordinator.data.values():
             dev_id = device.get("id")
             name = device.get("name")
             if dev_id and name:
@@ -99,11 +106,14 @@ async def async_setup_entry(
     # Dynamically add new trackers when the coordinator learns about more devices
     @callback
     def _sync_entities_from_coordinator() -> None:
-        if not coordinator.data:
+        data = coordinator.data
+        if not data:
             return
 
         to_add: list[GoogleFindMyDeviceTracker] = []
-        for device in coordinator.data:
+        # New devices are always among the changed ids of the published snapshot
+        devices = data.changed_entries() if isinstance(data, DeviceSnapshot) else data.values()
+        for device in devices:
             dev_id = device.get("id")
             name = device.get("name")
             if not dev_id or not name:
@@ -153,8 +163,10 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
         device: dict[str, Any],
     ) -> None:
         """Initialize the tracker entity."""
-        super().__init__(coordinator)
-        self._device = device
+        # Per-device listener: only woken when this device's snapshot entry changes.
+        super().__init__(coordinator, device["id"])
+        # Own copy: snapshot entries are shared between published snapshots (read-only).
+        self._device = dict(device)
         # Include entry_id in unique_id for multi-account support
         entry_id = coordinator.config_entry.entry_id if coordinator.config_entry else "default"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{device['id']}"
@@ -162,6 +174,11 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
         # If name is missing during cold boot, HA will show the entity_id; that's fine.
         self._attr_name = self._display_name(device.get("name"))
         self._last_good_accuracy_data: dict[str, Any] | None = None  # persisted coordinates for writes
+        # Derived-state cache: attributes are rebuilt only when the entry version changes,
+        # and identical states are not written again.
+        self._attrs_cache: dict[str, Any] | None = None
+        self._attrs_version: int | None = None
+        self._last_written_signature: tuple[Any, ...] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore last known location and seed the coordinator cache."""
@@ -194,6 +211,7 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
 
         if restored:
             self._last_good_accuracy_data = {**restored}
+            self._attrs_cache = None
             # Prime coordinator cache using its public API (no private access).
             dev_id = self._device["id"]
             try:
@@ -352,7 +370,35 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes for diagnostics/UX."""
+        """Return extra state attributes for diagnostics/UX.
+
+        The entry-derived part is cached per entry version; the freshness of the
+        fix (age, source, revalidation) is read from the coordinator on access.
+        """
+        return {**self._cached_attributes(), **self._freshness_attributes()}
+
+    def _cached_attributes(self) -> dict[str, Any]:
+        """Return the entry-derived attributes (rebuilt once per entry version)."""
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_extra_state_attributes()
+        return self._attrs_cache
+
+    def _freshness_attributes(self) -> dict[str, Any]:
+        """Return the coordinator's freshness metadata of this device's fix."""
+        try:
+            freshness = self.coordinator.get_device_freshness(self._device["id"])
+        except AttributeError:
+            # Older coordinator builds without freshness metadata
+            return {}
+        attributes: dict[str, Any] = {"revalidating": bool(freshness.get("revalidating"))}
+        if (age := freshness.get("age_s")) is not None:
+            attributes["location_age_s"] = age
+        if source := freshness.get("source"):
+            attributes["location_source"] = source
+        return attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the coordinator cache."""
         attributes: dict[str, Any] = {}
         if device_data := self._current_device_data:
             if last_seen_ts := device_data.get("last_seen"):
@@ -367,6 +413,8 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
                 attributes["is_own_report"] = is_own
             if semantic_name := device_data.get("semantic_name"):
                 attributes["semantic_location"] = semantic_name
+            if source := device_data.get("location_source"):
+                attributes["location_source"] = source
         return attributes
 
     def _get_map_token(self) -> str:
@@ -392,7 +440,29 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
             # Static token (no rotation).
             secret = f"{ha_uuid}:static"
 
-        return hashlib.md5(secret.encode()).hexdigest()[:16]
+        return map_token_digest(secret)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return everything a state write would publish, as a comparable tuple."""
+        return (
+            self.available,
+            self.latitude,
+            self.longitude,
+            self.location_accuracy,
+            self.location_name,
+            self._attr_name,
+            # Freshness is excluded: the age changes on every read and must not force writes
+            tuple(self._cached_attributes().items()),
+        )
+
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write state only if it differs from the last state written by this entity."""
+        signature = self._state_signature()
+        if signature == self._last_written_signature:
+            return
+        self._last_written_signature = signature
+        self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -400,40 +470,53 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
 
         - Keep the device's human-readable name in sync with the coordinator snapshot.
         - Maintain 'last good' accuracy data when new fixes are worse than the threshold.
+        - Recompute derived state only for a new entry version; skip identical writes.
         """
+        version = self.coordinator.get_device_snapshot_version(self._device["id"])
+        if version == self._attrs_version and self._attrs_cache is not None:
+            # Entry unchanged (e.g. full fan-out on a success flip): availability may differ.
+            self._async_write_ha_state_if_changed()
+            return
+        self._attrs_version = version
+        self._attrs_cache = None
+
         # Sync the raw device name from the coordinator and keep the entity display name in sync (no prefixes).
         try:
-            data = getattr(self.coordinator, "data", None) or []
             my_id = self._device["id"]
-            for dev in data:
-                if dev.get("id") == my_id:
-                    new_name = dev.get("name")
-                    # Ignore bootstrap placeholder names
-                    if not new_name or new_name == "Google Find My Device":
-                        break
-                    if new_name != self._device.get("name"):
-                        old = self._device.get("name")
-                        _LOGGER.debug(
-                            "Coordinator provided Google name for %s: '%s' -> '%s'",
-                            my_id,
-                            old,
-                            new_name,
-                        )
-                        self._device["name"] = new_name
-                        # Sync device registry (no-op if user renamed)
-                        _maybe_update_device_registry_name(self.hass, self.entity_id, new_name)
-                        # Update entity display name (has_entity_name=False).
-                        desired_display = self._display_name(new_name)
-                        if self._attr_name != desired_display:
-                            _LOGGER.debug(
-                                "Updating entity name for %s (%s): '%s' -> '%s'",
-                                self.entity_id,
-                                my_id,
-                                self._attr_name,
-                                desired_display,
-                            )
-                            self._attr_name = desired_display
-                    break
+            dev = self.coordinator.get_device_snapshot_entry(my_id)
+            new_name = dev.get("name") if dev else None
+            # Ignore bootstrap placeholder names
+            if (
+                new_name
+                and new_name != "Google Find My Device"
+                and new_name != self._device.get("name")
+            ):
+                old = self._device.get("name")
+                _LOGGER.debug(
+                    "Coordinator provided Google name for %s: '%s' -> '%s'",
+                    my_id,
+                    old,
+                    new_name,
+                )
+                self._device["name"] = new_name
+                # Sync device registry (no-op if user renamed)
+                _maybe_update_device_registry_name(
+                    self.hass,
+                    self.entity_id,
+                    new_name,
+                    registry_device_id=self.coordinator.get_registry_device_id(my_id),
+                )
+                # Update entity display name (has_entity_name=False).
+                desired_display = self._display_name(new_name)
+                if self._attr_name != desired_display:
+                    _LOGGER.debug(
+                        "Updating entity name for %s (%s): '%s' -> '%s'",
+                        self.entity_id,
+                        my_id,
+                        self._attr_name,
+                        desired_display,
+                    )
+                    self._attr_name = desired_display
         except (AttributeError, TypeError):
             # Non-critical update; ignore failures.
             pass
@@ -449,7 +532,7 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
 
         device_data = self._current_device_data
         if not device_data:
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return
 
         accuracy = device_data.get("accuracy")
@@ -484,4 +567,4 @@ class GoogleFindMyDeviceTracker(CoordinatorEntity, TrackerEntity, RestoreEntity)
                 min_accuracy_threshold,
             )
 
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
@@ -36,6 +36,12 @@ from .const import (
     OPT_GOOGLE_HOME_FILTER_KEYWORDS,
     OPT_ENABLE_STATS_ENTITIES,
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
+    OPT_PUSH_BATCH_WINDOW_MS,
+    OPT_POLL_SPACING_MIN_S,
+    OPT_POLL_SPACING_MAX_S,
+    OPT_POLL_CYCLE_BUDGET_S,
+    OPT_SNAPSHOT_CHUNK_SIZE,
+    OPT_ENABLE_LOOP_WATCHDOG,
     OPT_IGNORED_DEVICES,
     # secrets in entry.data (must never be exposed)
     CONF_OAUTH_TOKEN,
@@ -271,6 +277,52 @@ def _recent_errors_block(coordinator: Any) -> Optional[list[dict[str, Any]]]:
     return items or None
 
 
+def _entry_coordinator(hass: HomeAssistant, entry: ConfigEntry) -> Any:
+    """Return the coordinator of an entry (runtime_data, or hass.data for older setups)."""
+    coordinator = None
+    runtime = getattr(entry, "runtime_data", None)
+    if runtime:
+        # Allow either a direct coordinator or a holder object with attribute "coordinator"
+        coordinator = getattr(runtime, "coordinator", runtime)
+    if coordinator is None:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    return coordinator
+
+
+def _traces_block(traces: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Anonymize locate traces: device ids become per-download labels, times ISO-8601.
+
+    `device_ref` ("device-1", "device-2", ...) groups the traces of one device
+    within a download without exposing the identifier.
+    """
+    refs: dict[Any, str] = {}
+    items: list[dict[str, Any]] = []
+    for trace in traces:
+        item = dict(trace)
+        device_id = item.pop("device_id", None)
+        item["device_ref"] = refs.setdefault(device_id, f"device-{len(refs) + 1}")
+        item["started_at"] = _iso_utc(item.get("started_at"))
+        items.append(item)
+    return items
+
+
+def _freshness_block(coordinator: Any) -> dict[str, Any]:
+    """Summarize the freshness of the published fixes (counts and ages, no identifiers)."""
+    by_source: dict[str, int] = {}
+    ages: list[float] = []
+    for device_id in list(getattr(coordinator, "data", None) or {}):
+        freshness = coordinator.get_device_freshness(device_id)
+        source = freshness.get("source") or "none"
+        by_source[source] = by_source.get(source, 0) + 1
+        if freshness.get("age_s") is not None:
+            ages.append(float(freshness["age_s"]))
+    return {
+        "by_source": by_source,
+        "max_age_s": max(ages) if ages else None,
+        "revalidating": bool(getattr(coordinator, "is_revalidating", False)),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Diagnostics entrypoint
 # ---------------------------------------------------------------------------
@@ -305,13 +357,7 @@ async def async_get_config_entry_diagnostics(
         integration_meta = {}
 
     # --- Coordinator / runtime_data (preferred) or hass.data fallback ---
-    coordinator = None
-    runtime = getattr(entry, "runtime_data", None)
-    if runtime:
-        # Allow either a direct coordinator or a holder object with attribute "coordinator"
-        coordinator = getattr(runtime, "coordinator", runtime)
-    if coordinator is None:
-        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    coordinator = _entry_coordinator(hass, entry)
 
     # --- Build a compact, anonymized options snapshot (no raw strings that could contain PII) ---
     opt = entry.options
@@ -331,9 +377,15 @@ async def async_get_config_entry_diagnostics(
         "device_poll_delay": _coerce_pos_int(opt.get(OPT_DEVICE_POLL_DELAY, 5), 5),
         "min_accuracy_threshold": _coerce_pos_int(opt.get(OPT_MIN_ACCURACY_THRESHOLD, 100), 100),
         "movement_threshold": _coerce_pos_int(opt.get(OPT_MOVEMENT_THRESHOLD, 50), 50),
+        "push_batch_window_ms": _coerce_pos_int(opt.get(OPT_PUSH_BATCH_WINDOW_MS, 250), 250),
+        "poll_spacing_min_s": _coerce_pos_int(opt.get(OPT_POLL_SPACING_MIN_S, 1), 1),
+        "poll_spacing_max_s": _coerce_pos_int(opt.get(OPT_POLL_SPACING_MAX_S, 60), 60),
+        "poll_cycle_budget_s": _coerce_pos_int(opt.get(OPT_POLL_CYCLE_BUDGET_S, 600), 600),
+        "snapshot_chunk_size": _coerce_pos_int(opt.get(OPT_SNAPSHOT_CHUNK_SIZE, 250), 250),
         # Feature toggles
         "google_home_filter_enabled": bool(opt.get(OPT_GOOGLE_HOME_FILTER_ENABLED, False)),
         "enable_stats_entities": bool(opt.get(OPT_ENABLE_STATS_ENTITIES, True)),
+        "enable_loop_watchdog": bool(opt.get(OPT_ENABLE_LOOP_WATCHDOG, False)),
         # Token lifetime: store boolean value
         "map_view_token_expiration": bool(opt.get(OPT_MAP_VIEW_TOKEN_EXPIRATION, False)),
         # Counts only (never expose strings/IDs)
@@ -402,6 +454,8 @@ async def async_get_config_entry_diagnostics(
             "known_devices_count": known_devices_count,
             "cache_items_count": cache_items_count,
             "last_poll_wall_ts": last_poll_wall,  # seconds since epoch (UTC)
+            "poll_spacing_s": getattr(coordinator, "poll_spacing_s", None),  # adaptive (AIMD)
+            "poll_carryover_count": len(getattr(coordinator, "_poll_carryover", ()) or ()),
             "stats": stats,
         }
         if setup_perf:
@@ -409,6 +463,82 @@ async def async_get_config_entry_diagnostics(
         if recent_errors:
             coordinator_block["recent_errors"] = recent_errors
 
+        # Account request budgets / server-throttle pause (counters only)
+        try:
+            governor_state = coordinator.get_request_governor_state()
+        except (AttributeError, TypeError):
+            governor_state = None
+        if governor_state:
+            coordinator_block["request_governor"] = governor_state
+
+        # Per-endpoint circuit breakers (shared by all accounts)
+        try:
+            coordinator_block["circuit_breakers"] = coordinator.get_circuit_breaker_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Interactive vs background request lanes (counts and queue waits)
+        try:
+            coordinator_block["request_lanes"] = coordinator.get_request_lanes_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Adaptive device-list refresh (interval and fetch counters)
+        try:
+            coordinator_block["device_list_refresh"] = coordinator.get_device_list_refresh_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Age and source of the published fixes (stale-while-revalidate)
+        try:
+            coordinator_block["location_freshness"] = _freshness_block(coordinator)
+        except (AttributeError, TypeError):
+            pass
+
+        # Cooperative snapshot passes (event-loop blocking of the latest pass)
+        try:
+            coordinator_block["snapshot_passes"] = coordinator.get_snapshot_pass_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Warm start from the persisted cache (counts and timings only)
+        try:
+            coordinator_block["warm_start"] = coordinator.get_warm_start_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Adaptive locate timeouts (latency estimators; no identifiers)
+        try:
+            coordinator_block["locate_latency"] = coordinator.get_locate_latency_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Location pipeline: p50/p95/p99 per stage, poll and push paths (no identifiers)
+        try:
+            coordinator_block["stage_latency"] = coordinator.get_stage_latency_state()
+        except (AttributeError, TypeError):
+            pass
+
+        # Event-loop watchdog (optional): lag quantiles, stalls by code section
+        try:
+            watchdog_state = coordinator.get_loop_watchdog_state()
+        except (AttributeError, TypeError):
+            watchdog_state = None
+        if watchdog_state is not None:
+            coordinator_block["loop_watchdog"] = watchdog_state
+
+        # Per-device poll cadence: device counts per mode (no identifiers)
+        try:
+            coordinator_block["poll_cadence"] = coordinator.get_poll_cadence_summary()
+        except (AttributeError, TypeError):
+            pass
+
+        # Latest locate traces, newest first (device ids replaced by per-download labels)
+        try:
+            coordinator_block["recent_traces"] = _traces_block(coordinator.get_recent_traces())
+        except (AttributeError, TypeError):
+            pass
+
     # Concurrency & FCM receiver (global, not per-entry)
     concurrency = _concurrency_block(hass)
     fcm_state = _fcm_receiver_state(hass)
@@ -437,3 +567,32 @@ async def async_get_config_entry_diagnostics(
     # --- Final safety net: redact known secret-like keys anywhere in the payload ---
     # (We already avoided including secrets, but this keeps us safe against future extensions.)
     return async_redact_data(payload, TO_REDACT)
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: dr.DeviceEntry
+) -> dict[str, Any]:
+    """Return the freshness and latest locate traces of one device (timings and outcomes only)."""
+    coordinator = _entry_coordinator(hass, entry)
+    # Identifiers are "<entry_id>_<canonical id>" (older setups: the bare canonical id)
+    prefix = f"{entry.entry_id}_"
+    device_id: Optional[str] = None
+    for identifier in device.identifiers:
+        if isinstance(identifier, (tuple, list)) and len(identifier) == 2 and identifier[0] == DOMAIN:
+            ident = str(identifier[1])
+            device_id = ident[len(prefix):] if ident.startswith(prefix) else ident
+            break
+
+    traces: list[dict[str, Any]] = []
+    freshness: Optional[dict[str, Any]] = None
+    if coordinator is not None and device_id is not None:
+        try:
+            traces = _traces_block(coordinator.get_recent_traces(device_id))
+        except (AttributeError, TypeError):
+            traces = []
+        try:
+            freshness = coordinator.get_device_freshness(device_id)
+        except (AttributeError, TypeError):
+            freshness = None
+
+    return async_redact_data({"freshness": freshness, "recent_traces": traces}, TO_REDACT)
@@ -429,12 +429,15 @@ class GoogleFindMyEntity(CoordinatorEntity[GoogleFindMyCoordinator]):
             return
 
         try:
-            ent_reg = er.async_get(self.hass)
-            ent = ent_reg.async_get(self.entity_id)
-            if not ent or not ent.device_id:
-                return
+            # The entity's own registry entry avoids an Entity Registry lookup.
+            device_id = getattr(self.registry_entry, "device_id", None)
+            if not device_id:
+                ent = er.async_get(self.hass).async_get(self.entity_id)
+                if not ent or not ent.device_id:
+                    return
+                device_id = ent.device_id
             dev_reg = dr.async_get(self.hass)
-            dev = dev_reg.async_get(ent.device_id)
+            dev = dev_reg.async_get(device_id)
         except Exception as err:  # pragma: no cover - defensive best effort
             _LOGGER.debug(
                 "Device registry lookup failed for %s: %s", self.entity_id, err
@@ -445,12 +448,12 @@ class GoogleFindMyEntity(CoordinatorEntity[GoogleFindMyCoordinator]):
             return
 
         try:
-            dev_reg.async_update_device(device_id=ent.device_id, name=new_name)
+            dev_reg.async_update_device(device_id=device_id, name=new_name)
         except Exception as err:  # pragma: no cover - defensive best effort
             _LOGGER.debug(
                 "Device registry update failed for %s (%s): %s",
                 self.entity_id,
-                ent.device_id,
+                device_id,
                 err,
             )
 
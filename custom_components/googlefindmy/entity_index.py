@@ -0,0 +1,129 @@
+# custom_components/googlefindmy/entity_index.py
+"""Per-entry index: Find My device id <-> tracker entity id <-> HA device id.
+
+Snapshot fallbacks, the Google Home filter and the registry name sync used to
+resolve these mappings with Entity/Device Registry lookups on every pass (and
+the filter guessed with a legacy unique_id, which misses for multi-account
+entries). `TrackerEntityIndex` builds the mapping once from the entries of
+this config entry and keeps it current from `entity_registry_updated` event
+payloads; the coordinator owns one instance and exposes it via
+`get_tracker_entity_id()` / `get_registry_device_id()`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+__all__ = ["TrackerEntityIndex"]
+
+_TRACKER_PREFIX = "device_tracker."
+# Entity Registry fields whose change can move an entity into/out of the index
+_INDEX_FIELDS = frozenset({"config_entry_id", "device_id", "unique_id", "entity_id"})
+
+
+class TrackerEntityIndex:
+    """device_tracker entities of one config entry, keyed both ways."""
+
+    __slots__ = ("entry_id", "_prefix", "_by_device", "_by_entity", "built")
+
+    def __init__(self, entry_id: str) -> None:
+        self.entry_id = entry_id
+        self._prefix = f"{DOMAIN}_{entry_id}_"
+        # device id -> (entity id, HA device id); entity id -> device id
+        self._by_device: dict[str, tuple[str, str | None]] = {}
+        self._by_entity: dict[str, str] = {}
+        self.built = False
+
+    def __len__(self) -> int:
+        return len(self._by_device)
+
+    def device_id_from_unique_id(self, unique_id: str) -> str | None:
+        """Return the Find My device id encoded in a tracker unique_id."""
+        if unique_id.startswith(self._prefix):
+            return unique_id[len(self._prefix) :] or None
+        legacy = f"{DOMAIN}_"  # pre multi-account format
+        if unique_id.startswith(legacy):
+            return unique_id[len(legacy) :] or None
+        return None
+
+    def entity_id(self, device_id: str) -> str | None:
+        """Return the tracker entity id of a device (None if not registered)."""
+        hit = self._by_device.get(device_id)
+        return hit[0] if hit is not None else None
+
+    def registry_device_id(self, device_id: str) -> str | None:
+        """Return the HA Device Registry id linked to the device's tracker."""
+        hit = self._by_device.get(device_id)
+        return hit[1] if hit is not None else None
+
+    def device_id(self, entity_id: str) -> str | None:
+        """Return the Find My device id of a tracker entity."""
+        return self._by_entity.get(entity_id)
+
+    def rebuild(self, ent_reg: er.EntityRegistry) -> None:
+        """Index all tracker entities of the entry (uses the registry's entry index)."""
+        self._by_device.clear()
+        self._by_entity.clear()
+        for entry in er.async_entries_for_config_entry(ent_reg, self.entry_id):
+            self._add(entry)
+        self.built = True
+
+    def _add(self, entry: er.RegistryEntry) -> None:
+        if entry.platform != DOMAIN or not entry.entity_id.startswith(_TRACKER_PREFIX):
+            return
+        if entry.config_entry_id != self.entry_id:
+            return
+        device_id = self.device_id_from_unique_id(entry.unique_id or "")
+        if device_id is None:
+            return
+        previous = self._by_device.get(device_id)
+        if previous is not None and previous[0] != entry.entity_id:
+            # Prefer the current unique_id format over a leftover legacy entity.
+            if not (entry.unique_id or "").startswith(self._prefix):
+                return
+            self._by_entity.pop(previous[0], None)
+        self._by_device[device_id] = (entry.entity_id, entry.device_id)
+        self._by_entity[entry.entity_id] = device_id
+
+    def _discard(self, entity_id: str | None) -> None:
+        device_id = self._by_entity.pop(entity_id, None) if entity_id else None
+        if device_id is not None:
+            hit = self._by_device.get(device_id)
+            if hit is not None and hit[0] == entity_id:
+                del self._by_device[device_id]
+
+    @callback
+    def event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Return True if an Entity Registry event can change the index."""
+        entity_id = event_data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return False
+        if entity_id in self._by_entity or event_data.get("old_entity_id") in self._by_entity:
+            return True
+        if not entity_id.startswith(_TRACKER_PREFIX):
+            return False
+        action = event_data.get("action")
+        if action == "create":
+            return True
+        if action == "update":
+            return not _INDEX_FIELDS.isdisjoint(event_data.get("changes") or {})
+        return False
+
+    def apply_event(self, ent_reg: er.EntityRegistry, event_data: Mapping[str, Any]) -> None:
+        """Apply one create/update/remove payload (O(1))."""
+        entity_id = event_data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return
+        self._discard(event_data.get("old_entity_id"))
+        self._discard(entity_id)
+        if event_data.get("action") == "remove":
+            return
+        entry = ent_reg.async_get(entity_id)
+        if entry is not None:
+            self._add(entry)
@@ -15,7 +15,7 @@ Design goals
 
 Public API (stable)
 -------------------
-- `GoogleHomeFilter(hass, config_like)`
+- `GoogleHomeFilter(hass, config_like, entity_resolver=None)`
 - `apply_from_entry(entry)`
 - `update_config(config_or_entry)`
 - `is_google_home_device(location_name) -> bool`
@@ -76,8 +76,9 @@ class GoogleHomeFilter:
 
     Notes:
       * Debounce timing uses `time.monotonic()` (robust against system clock changes).
-      * Entity lookups use the registry shortcut `er.async_get_entity_id(...)`
-        for clarity and performance.
+      * Entity lookups go through `entity_resolver` (the coordinator's tracker
+        entity index) when given; the registry shortcut
+        `er.async_get_entity_id(...)` and state guesses remain the fallback.
     """
 
     __slots__ = (
@@ -89,16 +90,25 @@ class GoogleHomeFilter:
         "_home_zone_attrs",
         "_home_zone_passive",
         "_unsub_zone_listener",
+        "_entity_resolver",
     )
 
-    def __init__(self, hass: HomeAssistant, config_like: Mapping[str, Any] | ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_like: Mapping[str, Any] | ConfigEntry,
+        entity_resolver: Callable[[str], str | None] | None = None,
+    ) -> None:
         """Initialize the Google Home filter.
 
         Args:
             hass: Home Assistant instance.
             config_like: Either a `ConfigEntry` (preferred) or a Mapping (legacy).
+            entity_resolver: Optional device id -> tracker entity id lookup
+                (e.g. `GoogleFindMyCoordinator.get_tracker_entity_id`).
         """
         self.hass = hass
+        self._entity_resolver = entity_resolver
         self._enabled: bool = True
         self._keywords: list[str] = []
         # Debounce tracking: device_id -> last_seen_monotonic
@@ -293,8 +303,16 @@ class GoogleHomeFilter:
     def _find_tracker_entity_id(self, device_id: str) -> str | None:
         """Resolve the device_tracker entity_id for a given Find My device ID.
 
-        Uses the unique_id shape: f"{DOMAIN}_{device_id}" via registry shortcut.
+        Uses the entity resolver (an in-memory index) first; on a miss, the
+        unique_id shape f"{DOMAIN}_{device_id}" via registry shortcut.
         """
+        if self._entity_resolver is not None:
+            try:
+                entity_id = self._entity_resolver(device_id)
+                if entity_id:
+                    return entity_id
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Entity resolver failed for %s: %s", device_id, err)
         try:
             reg = er.async_get(self.hass)
             unique_id = f"{DOMAIN}_{device_id}"
@@ -0,0 +1,191 @@
+# custom_components/googlefindmy/latency.py
+"""Fixed-memory latency histograms for the stages of the location pipeline.
+
+A location passes through several stages before it reaches the entities. Poll
+path: Nova request round-trip, wait for the FCM callback, protobuf parse,
+identity-key retrieval, per-report decryption, best-record selection,
+significance gating and snapshot publish. The push path skips the Nova request,
+the FCM wait and the selection. `PipelineLatency` keeps one `LatencyHistogram`
+per stage for a config entry; the coordinator owns one instance and reports
+p50/p95/p99 in diagnostics and via diagnostic sensors.
+
+Histograms are log-linear (HDR-style): `SUB_BUCKETS` buckets per power of two
+between `MIN_S` and `MIN_S * 2**OCTAVES`, so memory is constant and quantiles
+are accurate to a few percent regardless of the number of samples.
+
+The recorder of the entry a request belongs to is carried in a context
+variable, so the Nova/decrypt layers need no extra parameters (like the request
+lane in `request_governor`). Stages observed without a bound recorder are
+ignored. The module has no Home Assistant imports.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# Pipeline stages (in pipeline order)
+STAGE_NOVA_REQUEST = "nova_request"
+STAGE_FCM_WAIT = "fcm_wait"
+STAGE_PARSE = "parse"
+STAGE_IDENTITY_KEY = "identity_key"
+STAGE_DECRYPT = "decrypt"
+STAGE_SELECT_BEST = "select_best"
+STAGE_GATING = "gating"
+STAGE_PUBLISH = "publish"
+PIPELINE_STAGES = (
+    STAGE_NOVA_REQUEST,
+    STAGE_FCM_WAIT,
+    STAGE_PARSE,
+    STAGE_IDENTITY_KEY,
+    STAGE_DECRYPT,
+    STAGE_SELECT_BEST,
+    STAGE_GATING,
+    STAGE_PUBLISH,
+)
+
+# Bucket layout: 1 µs .. ~1100 s, 8 buckets per octave (≤ 9 % relative bucket width)
+MIN_S = 1e-6
+OCTAVES = 30
+SUB_BUCKETS = 8
+_BUCKETS = OCTAVES * SUB_BUCKETS + 1  # bucket 0 holds everything <= MIN_S
+
+_current_pipeline: ContextVar[Optional["PipelineLatency"]] = ContextVar(
+    "googlefindmy_pipeline_latency", default=None
+)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with constant memory."""
+
+    __slots__ = ("_counts", "count", "total_s", "max_s")
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= MIN_S:
+            return 0
+        return min(_BUCKETS - 1, int(math.log2(seconds / MIN_S) * SUB_BUCKETS) + 1)
+
+    @staticmethod
+    def _upper_bound(bucket: int) -> float:
+        return MIN_S * 2.0 ** (bucket / SUB_BUCKETS)
+
+    def observe(self, seconds: float) -> None:
+        """Record one sample (negative values count as zero)."""
+        seconds = max(0.0, float(seconds))
+        self._counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-quantile in seconds (bucket upper bound; None without samples)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket, hits in enumerate(self._counts):
+            seen += hits
+            if seen >= rank:
+                return min(self._upper_bound(bucket), self.max_s)
+        return self.max_s
+
+    def cumulative(self, bounds: Sequence[float]) -> List[int]:
+        """Return the number of samples <= each bound (ascending bounds, in seconds).
+
+        Only buckets that end at or below a bound are counted, so a count may miss
+        samples from the one bucket straddling the bound (≤ 9 % of its value).
+        """
+        counts: List[int] = []
+        seen = 0
+        bucket = 0
+        for bound in bounds:
+            last = -1 if bound < MIN_S else min(
+                _BUCKETS - 1, int(math.log2(bound / MIN_S) * SUB_BUCKETS + 1e-9)
+            )
+            while bucket <= last:
+                seen += self._counts[bucket]
+                bucket += 1
+            counts.append(seen)
+        return counts
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return count, mean, p50/p95/p99 and max in milliseconds."""
+
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000.0, 3) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.total_s / self.count) if self.count else None,
+            "p50_ms": _ms(self.percentile(0.50)),
+            "p95_ms": _ms(self.percentile(0.95)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "max_ms": _ms(self.max_s) if self.count else None,
+        }
+
+
+class PipelineLatency:
+    """One `LatencyHistogram` per pipeline stage (unknown stages are ignored)."""
+
+    __slots__ = ("_stages",)
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in PIPELINE_STAGES
+        }
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record one sample for a stage."""
+        histogram = self._stages.get(stage)
+        if histogram is not None:
+            histogram.observe(seconds)
+
+    @contextlib.contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Record the duration of the enclosed block (also if it raises)."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, perf_counter() - started)
+
+    def stage(self, stage: str) -> Optional[LatencyHistogram]:
+        """Return the histogram of a stage."""
+        return self._stages.get(stage)
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the summary of every stage (diagnostics)."""
+        return {stage: histogram.as_dict() for stage, histogram in self._stages.items()}
+
+
+def current_pipeline_latency() -> Optional[PipelineLatency]:
+    """Return the recorder bound to this context (None outside a bound request)."""
+    return _current_pipeline.get()
+
+
+@contextlib.contextmanager
+def pipeline_latency(recorder: Optional[PipelineLatency]) -> Iterator[None]:
+    """Attribute the stages observed in the enclosed block to `recorder`."""
+    token = _current_pipeline.set(recorder)
+    try:
+        yield
+    finally:
+        _current_pipeline.reset(token)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record a stage sample on the recorder bound to this context (if any)."""
+    recorder = _current_pipeline.get()
+    if recorder is not None:
+        recorder.observe(stage, seconds)
@@ -0,0 +1,206 @@
+# custom_components/googlefindmy/loop_watchdog.py
+"""Event-loop lag watchdog with attribution to integration code sections.
+
+Several integration paths run synchronously on the Home Assistant loop: FCM
+notification handling (protobuf parse), map HTML rendering, Device Registry
+scans and snapshot builds. `LoopLagWatchdog` schedules a timer every
+`interval_s` and measures how late it fires (scheduling lag). A late firing of
+at least `threshold_s` is a stall.
+
+Those code paths are wrapped in `loop_section(name)` markers (or report a
+finished stretch via `record_section()`). While a watchdog runs, markers longer
+than `SECTION_MIN_S` are remembered in a small ring; a stall is attributed to
+the section that overlapped the stall window the most, or to `UNATTRIBUTED`
+when no integration code ran (another integration or HA itself blocked the
+loop). Markers cost two `perf_counter()` calls and are no-ops while no watchdog
+runs.
+
+There is one loop per process, so the section ring is module-global; one
+watchdog is shared by all config entries (see `__init__.py`). The module has
+no Home Assistant imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from .latency import LatencyHistogram
+
+DEFAULT_INTERVAL_S = 0.25
+DEFAULT_THRESHOLD_S = 0.1
+# Sections shorter than this cannot explain a stall and are not remembered
+SECTION_MIN_S = 0.001
+UNATTRIBUTED = "unattributed"
+
+_RECENT_SECTIONS = 64
+_RECENT_STALLS = 20
+
+# Recent synchronous sections (name, started, ended) in perf_counter() time
+_recent_sections: Deque[Tuple[str, float, float]] = deque(maxlen=_RECENT_SECTIONS)
+# Watchdogs currently probing; sections are only recorded while this is non-empty
+_running_watchdogs: Set["LoopLagWatchdog"] = set()
+
+
+def record_section(name: str, started: float, ended: float) -> None:
+    """Remember a finished synchronous stretch of integration code (perf_counter times)."""
+    if _running_watchdogs and ended - started >= SECTION_MIN_S:
+        _recent_sections.append((name, started, ended))
+
+
+class _LoopSection:
+    """Context manager behind `loop_section()`."""
+
+    __slots__ = ("name", "_started")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._started = 0.0
+
+    def __enter__(self) -> "_LoopSection":
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        record_section(self.name, self._started, perf_counter())
+
+
+def loop_section(name: str) -> _LoopSection:
+    """Mark a synchronous code path so loop stalls can be attributed to it."""
+    return _LoopSection(name)
+
+
+def _attribute(window_start: float, window_end: float) -> str:
+    """Return the section that overlapped the stall window most (or UNATTRIBUTED)."""
+    culprit, best = UNATTRIBUTED, 0.0
+    for name, started, ended in reversed(_recent_sections):
+        if ended <= window_start:
+            continue
+        overlap = min(ended, window_end) - max(started, window_start)
+        if overlap > best:
+            culprit, best = name, overlap
+    return culprit
+
+
+class _Offender:
+    """Stall totals of one section."""
+
+    __slots__ = ("count", "total_s", "max_s")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+
+class LoopLagWatchdog:
+    """Measure event-loop scheduling lag and record attributed stall events."""
+
+    __slots__ = (
+        "interval_s",
+        "threshold_s",
+        "samples",
+        "stalls",
+        "lag",
+        "_loop",
+        "_handle",
+        "_expected",
+        "_offenders",
+        "_recent_stalls",
+    )
+
+    def __init__(
+        self, interval_s: float = DEFAULT_INTERVAL_S, threshold_s: float = DEFAULT_THRESHOLD_S
+    ) -> None:
+        self.interval_s = float(interval_s)
+        self.threshold_s = float(threshold_s)
+        self.samples = 0
+        self.stalls = 0
+        self.lag = LatencyHistogram()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+        self._offenders: Dict[str, _Offender] = {}
+        self._recent_stalls: Deque[Dict[str, Any]] = deque(maxlen=_RECENT_STALLS)
+
+    @property
+    def running(self) -> bool:
+        """Return True while the probe timer is scheduled."""
+        return self._handle is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start probing `loop` (must be called on that loop)."""
+        if self._handle is not None:
+            return
+        _running_watchdogs.add(self)
+        self._loop = loop
+        self._schedule()
+
+    def stop(self) -> None:
+        """Stop probing (idempotent)."""
+        if self._handle is None:
+            return
+        self._handle.cancel()
+        self._handle = None
+        _running_watchdogs.discard(self)
+        if not _running_watchdogs:
+            _recent_sections.clear()
+
+    def _schedule(self) -> None:
+        assert self._loop is not None
+        self._expected = perf_counter() + self.interval_s
+        self._handle = self._loop.call_later(self.interval_s, self._tick)
+
+    def _tick(self) -> None:
+        now = perf_counter()
+        lag = max(0.0, now - self._expected)
+        self.samples += 1
+        self.lag.observe(lag)
+        if lag >= self.threshold_s:
+            self._record_stall(lag, now)
+        self._schedule()
+
+    def _record_stall(self, lag: float, now: float) -> None:
+        culprit = _attribute(self._expected, now)
+        offender = self._offenders.get(culprit)
+        if offender is None:
+            offender = self._offenders[culprit] = _Offender()
+        offender.count += 1
+        offender.total_s += lag
+        offender.max_s = max(offender.max_s, lag)
+        self.stalls += 1
+        self._recent_stalls.append(
+            {"at": round(time.time(), 3), "lag_ms": round(lag * 1000.0, 1), "section": culprit}
+        )
+
+    def worst_offenders(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return the sections with the most total stall time."""
+        ranked = sorted(self._offenders.items(), key=lambda item: item[1].total_s, reverse=True)
+        return [
+            {
+                "section": name,
+                "stalls": offender.count,
+                "total_ms": round(offender.total_s * 1000.0, 1),
+                "max_ms": round(offender.max_s * 1000.0, 1),
+            }
+            for name, offender in ranked[:limit]
+        ]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return settings, lag quantiles, stall counts and offenders (diagnostics)."""
+        lag = self.lag.as_dict()
+        return {
+            "running": self.running,
+            "interval_ms": round(self.interval_s * 1000.0),
+            "threshold_ms": round(self.threshold_s * 1000.0),
+            "samples": self.samples,
+            "stalls": self.stalls,
+            "lag_p50_ms": lag["p50_ms"],
+            "lag_p99_ms": lag["p99_ms"],
+            "lag_max_ms": lag["max_ms"],
+            "worst_offenders": self.worst_offenders(),
+            "recent_stalls": list(self._recent_stalls),
+        }
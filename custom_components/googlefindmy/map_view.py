@@ -2,8 +2,11 @@
 """Map view for Google Find My Device locations."""
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
 from aiohttp import web
@@ -19,10 +22,19 @@ from .const import (
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
     DEFAULT_MAP_VIEW_TOKEN_EXPIRATION,
 )
+from .loop_watchdog import loop_section
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# ------------------------------- Token Helpers ------------------------------
+
+@lru_cache(maxsize=8)
+def map_token_digest(secret: str) -> str:
+    """Return the map token for a secret (memoized; the secret only rotates weekly)."""
+    return hashlib.md5(secret.encode()).hexdigest()[:16]
+
+
 # ------------------------------- HTML Helpers -------------------------------
 
 def _html_response(title: str, body: str, status: int = 200) -> web.Response:
@@ -106,11 +118,17 @@ class GoogleFindMyMapView(HomeAssistantView):
             for entry_id_key, coordinator in coordinator_data.items():
                 if entry_id_key == "config_data":
                     continue
-                data_list = getattr(coordinator, "data", None) or []
-                for device in data_list:
-                    if device.get("id") == raw_device_id:
-                        device_name = device.get("name", device_name)
-                        break
+                data = getattr(coordinator, "data", None) or []
+                if isinstance(data, Mapping):
+                    # Keyed snapshot (device id -> entry)
+                    device = data.get(raw_device_id)
+                    if isinstance(device, dict):
+                        device_name = device.get("name") or device_name
+                else:
+                    for device in data:
+                        if isinstance(device, dict) and device.get("id") == raw_device_id:
+                            device_name = device.get("name", device_name)
+                            break
                 if device_name != "Unknown Device":
                     break
 
@@ -217,9 +235,10 @@ class GoogleFindMyMapView(HomeAssistantView):
                     )
 
             # ---- 7) Render HTML (no secrets) ----
-            html_content = self._generate_map_html(
-                device_name, locations, device_id, start_time, end_time, accuracy_filter
-            )
+            with loop_section("map_render"):
+                html_content = self._generate_map_html(
+                    device_name, locations, device_id, start_time, end_time, accuracy_filter
+                )
             return web.Response(text=html_content, content_type="text/html", charset="utf-8")
 
         except Exception as err:  # defensive: HTML error page instead of raw tracebacks
@@ -638,7 +657,6 @@ class GoogleFindMyMapView(HomeAssistantView):
         - Options-first harmony with other platforms (weekly/static).
         - No logging of the token value here or elsewhere.
         """
-        import hashlib
         import time
 
         config_entries = self.hass.config_entries.async_entries(DOMAIN)
@@ -655,8 +673,8 @@ class GoogleFindMyMapView(HomeAssistantView):
 
         if token_expiration_enabled:
             week = str(int(time.time() // 604800))  # 7-day bucket
-            return hashlib.md5(f"{ha_uuid}:{week}".encode()).hexdigest()[:16]
-        return hashlib.md5(f"{ha_uuid}:static".encode()).hexdigest()[:16]
+            return map_token_digest(f"{ha_uuid}:{week}")
+        return map_token_digest(f"{ha_uuid}:static")
 
 
 # ------------------------------ Redirect View -------------------------------
@@ -0,0 +1,387 @@
+# custom_components/googlefindmy/metrics_view.py
+"""OpenMetrics endpoint for the integration's performance counters.
+
+`GET /api/googlefindmy/metrics` serves the per-entry statistics counters, queue
+depths, request budgets and per-stage latency histograms, plus the shared
+circuit breakers, FCM receiver and loop watchdog, in OpenMetrics text format.
+A Prometheus-compatible scraper can poll it at short intervals with a
+long-lived access token of an admin user; nothing is written to the recorder.
+
+The payload is rendered from the same in-memory state as the diagnostics
+download and contains no device identifiers, names or locations. Config entries
+are labelled by `entry_id` only.
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .latency import PIPELINE_STAGES, LatencyHistogram
+from .request_governor import BREAKER_OPEN, circuit_breaker_states
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "googlefindmy"
+
+# Histogram bucket bounds (seconds) for the exported latency histograms
+LATENCY_BOUNDS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+# ----------------------------- Text rendering -------------------------------
+
+def _metric_name(name: str) -> str:
+    """Return a valid metric name component."""
+    return _INVALID_NAME_CHARS.sub("_", name)
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value (backslash, double quote, newline)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricFamilies:
+    """Collect samples grouped by metric family and render OpenMetrics text.
+
+    OpenMetrics requires all samples of a family to be contiguous, while the
+    collectors below iterate entry by entry; samples are therefore grouped first
+    and rendered once.
+    """
+
+    __slots__ = ("_families",)
+
+    def __init__(self) -> None:
+        # name -> (type, help, sample lines)
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def _lines(self, name: str, kind: str, help_text: str) -> List[str]:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (kind, help_text, [])
+        return family[2]
+
+    @staticmethod
+    def _sample(name: str, labels: Mapping[str, Any], value: float) -> str:
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            return f"{name}{{{rendered}}} {_format_value(value)}"
+        return f"{name} {_format_value(value)}"
+
+    def gauge(
+        self, name: str, help_text: str, value: Optional[float], labels: Mapping[str, Any]
+    ) -> None:
+        """Add a gauge sample (None values are skipped)."""
+        if value is None:
+            return
+        name = f"{PREFIX}_{name}"
+        self._lines(name, "gauge", help_text).append(self._sample(name, labels, value))
+
+    def counter(
+        self, name: str, help_text: str, value: Optional[float], labels: Mapping[str, Any]
+    ) -> None:
+        """Add a counter sample (the `_total` suffix is appended)."""
+        if value is None:
+            return
+        name = f"{PREFIX}_{name}"
+        self._lines(name, "counter", help_text).append(
+            self._sample(f"{name}_total", labels, value)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        histogram: LatencyHistogram,
+        labels: Mapping[str, Any],
+    ) -> None:
+        """Add a latency histogram (cumulative `le` buckets, count and sum in seconds)."""
+        name = f"{PREFIX}_{name}"
+        lines = self._lines(name, "histogram", help_text)
+        for bound, count in zip(LATENCY_BOUNDS, histogram.cumulative(LATENCY_BOUNDS)):
+            lines.append(self._sample(f"{name}_bucket", {**labels, "le": repr(bound)}, count))
+        lines.append(self._sample(f"{name}_bucket", {**labels, "le": "+Inf"}, histogram.count))
+        lines.append(self._sample(f"{name}_count", labels, histogram.count))
+        lines.append(self._sample(f"{name}_sum", labels, histogram.total_s))
+
+    def render(self) -> str:
+        """Return the exposition text (terminated by `# EOF`)."""
+        out: List[str] = []
+        for name, (kind, help_text, lines) in self._families.items():
+            out.append(f"# TYPE {name} {kind}")
+            out.append(f"# HELP {name} {help_text}")
+            out.extend(lines)
+        out.append("# EOF")
+        return "\n".join(out) + "\n"
+
+
+# ------------------------------- Collectors ---------------------------------
+
+def _collect_coordinator(families: MetricFamilies, entry_id: str, coordinator: Any) -> None:
+    """Add the metrics of one config entry."""
+    entry = {"entry_id": entry_id}
+
+    stats = getattr(coordinator, "stats", None) or {}
+    for key, value in stats.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            families.counter(
+                _metric_name(str(key)), f"Coordinator statistic {key}.", value, entry
+            )
+
+    data = getattr(coordinator, "data", None)
+    families.gauge("devices", "Devices in the published snapshot.", len(data or ()), entry)
+    families.gauge(
+        "polling",
+        "1 while a poll cycle runs.",
+        bool(getattr(coordinator, "_is_polling", False)),
+        entry,
+    )
+    families.gauge(
+        "poll_spacing_seconds",
+        "Adaptive delay between devices in a poll cycle.",
+        getattr(coordinator, "poll_spacing_s", None),
+        entry,
+    )
+    families.gauge(
+        "push_pending",
+        "Device updates waiting in the push batch.",
+        len(getattr(coordinator, "_push_pending_ids", ()) or ()),
+        entry,
+    )
+    families.gauge(
+        "poll_carryover",
+        "Devices carried over to the next poll cycle.",
+        len(getattr(coordinator, "_poll_carryover", ()) or ()),
+        entry,
+    )
+
+    for name, help_text, getter in (
+        (
+            "last_poll_duration_seconds",
+            "Duration of the latest poll cycle.",
+            "get_last_poll_duration_seconds",
+        ),
+        ("setup_duration_seconds", "Duration of the entry setup.", "get_setup_duration_seconds"),
+        (
+            "fcm_acquire_seconds",
+            "Time from setup start until FCM was acquired.",
+            "get_fcm_acquire_duration_seconds",
+        ),
+    ):
+        try:
+            families.gauge(name, help_text, getattr(coordinator, getter)(), entry)
+        except (AttributeError, TypeError):
+            pass
+
+    # Request lanes: queue depths and totals
+    try:
+        lanes = coordinator.get_request_lanes_state()
+    except (AttributeError, TypeError):
+        lanes = {}
+    for lane, state in lanes.items():
+        labels = {**entry, "lane": lane}
+        families.gauge(
+            "request_lane_queued", "Requests waiting for a slot.", state.get("queued"), labels
+        )
+        families.gauge(
+            "request_lane_active", "Requests holding a slot.", state.get("active"), labels
+        )
+        families.counter(
+            "request_lane_requests", "Requests admitted to the lane.", state.get("requests"), labels
+        )
+        families.gauge(
+            "request_lane_wait_max_seconds",
+            "Longest queue wait in the lane.",
+            state.get("wait_max_s"),
+            labels,
+        )
+
+    # Device list refresh (cache revalidation)
+    try:
+        refresh = coordinator.get_device_list_refresh_state()
+    except (AttributeError, TypeError):
+        refresh = {}
+    if refresh:
+        families.gauge(
+            "device_list_refresh_interval_seconds",
+            "Adaptive device-list refresh interval.",
+            refresh.get("interval_s"),
+            entry,
+        )
+        families.gauge(
+            "device_list_revalidating",
+            "1 while a background device-list revalidation runs.",
+            bool(refresh.get("revalidating")),
+            entry,
+        )
+
+    # Account request budget / server throttle
+    try:
+        governor = coordinator.get_request_governor_state()
+    except (AttributeError, TypeError):
+        governor = None
+    if governor:
+        families.gauge(
+            "request_budget_paused_seconds",
+            "Remaining server-throttle pause.",
+            governor.get("paused_for_s"),
+            entry,
+        )
+        families.counter(
+            "request_budget_throttle_events",
+            "Server throttle responses.",
+            governor.get("throttle_events"),
+            entry,
+        )
+        families.counter(
+            "request_budget_rejected",
+            "Requests rejected by the budget.",
+            governor.get("rejected"),
+            entry,
+        )
+        for kind, granted in (governor.get("granted") or {}).items():
+            families.counter(
+                "request_budget_granted",
+                "Requests granted by the budget.",
+                granted,
+                {**entry, "kind": kind},
+            )
+        for bucket, tokens in (governor.get("tokens") or {}).items():
+            families.gauge(
+                "request_budget_tokens",
+                "Tokens left in the budget bucket.",
+                tokens,
+                {**entry, "bucket": bucket},
+            )
+
+    # Location pipeline latency histograms
+    recorder = getattr(coordinator, "pipeline_latency", None)
+    if recorder is not None:
+        for stage in PIPELINE_STAGES:
+            histogram = recorder.stage(stage)
+            if histogram is not None:
+                families.histogram(
+                    "stage_latency_seconds",
+                    "Latency of the location pipeline stages.",
+                    histogram,
+                    {**entry, "stage": stage},
+                )
+
+
+def _collect_shared(families: MetricFamilies, bucket: Mapping[str, Any]) -> None:
+    """Add the metrics of process-wide components (breakers, FCM, loop watchdog)."""
+    for endpoint, state in circuit_breaker_states().items():
+        labels = {"endpoint": endpoint}
+        families.gauge(
+            "circuit_breaker_open",
+            "1 while the endpoint circuit is open.",
+            state.get("state") == BREAKER_OPEN,
+            labels,
+        )
+        families.counter(
+            "circuit_breaker_opened", "Times the circuit opened.", state.get("opened"), labels
+        )
+        families.counter(
+            "circuit_breaker_rejected",
+            "Calls rejected by the open circuit.",
+            state.get("rejected"),
+            labels,
+        )
+
+    receiver = bucket.get("fcm_receiver")
+    if receiver is not None:
+        families.gauge(
+            "fcm_listening",
+            "1 while the FCM receiver listens.",
+            bool(getattr(receiver, "_listening", False)),
+            {},
+        )
+        families.counter(
+            "fcm_receiver_starts",
+            "FCM receiver (re)starts.",
+            int(getattr(receiver, "start_count", 0) or 0),
+            {},
+        )
+        families.gauge(
+            "fcm_pending_payloads",
+            "Push payloads waiting to be applied.",
+            len(getattr(receiver, "_pending", ()) or ()),
+            {},
+        )
+    families.counter(
+        "fcm_lock_contention",
+        "FCM setup lock contention.",
+        int(bucket.get("fcm_lock_contention_count", 0) or 0),
+        {},
+    )
+
+    watchdog = bucket.get("loop_watchdog")
+    if watchdog is not None:
+        families.histogram("loop_lag_seconds", "Event-loop scheduling lag.", watchdog.lag, {})
+        for offender in watchdog.worst_offenders(limit=64):
+            families.counter(
+                "loop_stalls",
+                "Event-loop stalls by code section.",
+                offender["stalls"],
+                {"section": offender["section"]},
+            )
+
+
+def _coordinators(hass: HomeAssistant) -> Iterable[Tuple[str, Any]]:
+    """Yield (entry_id, coordinator) for the loaded config entries."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        runtime = getattr(entry, "runtime_data", None)
+        coordinator = getattr(runtime, "coordinator", runtime)
+        if coordinator is not None and hasattr(coordinator, "stats"):
+            yield entry.entry_id, coordinator
+
+
+def render_metrics(coordinators: Iterable[Tuple[str, Any]], bucket: Mapping[str, Any]) -> str:
+    """Render the OpenMetrics payload for the given entries and shared state."""
+    families = MetricFamilies()
+    for entry_id, coordinator in coordinators:
+        _collect_coordinator(families, entry_id, coordinator)
+    _collect_shared(families, bucket)
+    return families.render()
+
+
+# ------------------------------ Metrics View --------------------------------
+
+class GoogleFindMyMetricsView(HomeAssistantView):
+    """Serve performance counters in OpenMetrics text format (admin only)."""
+
+    url = "/api/googlefindmy/metrics"
+    name = "api:googlefindmy:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the metrics view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Render the metrics of all loaded entries."""
+        user = request.get("hass_user")
+        if user is None or not getattr(user, "is_admin", False):
+            raise web.HTTPUnauthorized()
+
+        bucket = self.hass.data.get(DOMAIN, {}) or {}
+        text = render_metrics(_coordinators(self.hass), bucket)
+        return web.Response(body=text.encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
@@ -0,0 +1,259 @@
+# custom_components/googlefindmy/profiling.py
+"""Time-boxed profiling captures for the integration's hot paths.
+
+Two capture modes back the `googlefindmy.profile` service:
+
+- `StackSampler` (default): a daemon thread takes a wall-clock sample of every
+  thread's Python stack every `interval_s` and keeps only the stacks that pass
+  through this integration's package. It covers the coroutines on the event
+  loop (poll cycle, FCM handling, map rendering) and the executor jobs
+  (protobuf parsing, decryption) at a fixed cost per sample, without changing
+  how that code runs.
+- `cProfile`: deterministic profiling of all Python code that runs during the
+  capture (on Python 3.12+ it sees every thread, not only the event loop).
+  Exact call counts, but every call is slowed down while it runs.
+
+Both modes produce a pstats-compatible statistics dict (`pstats.Stats`,
+snakeviz, gprof2dot can read the written file). Sampled times are sample
+counts multiplied by the interval, and "calls" are sample counts. The sampler
+also writes collapsed stacks (`frame;frame;frame count`) for flamegraph.pl or
+speedscope. The module has no Home Assistant imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_SAMPLE_INTERVAL_S = 0.01
+MAX_STACK_DEPTH = 128
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_OWN_FILE = os.path.abspath(__file__)  # frames of the capture itself are not "in scope"
+
+# pstats key: (filename, first line, function name)
+FuncKey = Tuple[str, int, str]
+# pstats value: (primitive calls, calls, own time, cumulative time, callers)
+StatsDict = Dict[FuncKey, Tuple[int, int, float, float, Dict[FuncKey, Tuple[int, int, float, float]]]]
+
+_capture_lock = threading.Lock()
+
+
+class ProfileBusyError(RuntimeError):
+    """Raised when a capture is requested while another one is running."""
+
+
+class StackSampler:
+    """Sample Python stacks of all threads and keep those through the integration."""
+
+    def __init__(
+        self, interval_s: float = DEFAULT_SAMPLE_INTERVAL_S, scope_dir: str = PACKAGE_DIR
+    ) -> None:
+        self.interval_s = float(interval_s)
+        self.scope_dir = scope_dir
+        self.samples = 0  # sampling rounds
+        self.stacks: Counter[Tuple[FuncKey, ...]] = Counter()  # root-first stacks
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="googlefindmy-profile-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            self.sample(skip_thread=own)
+
+    def sample(self, skip_thread: Optional[int] = None) -> None:
+        """Record the current stack of every thread that runs integration code."""
+        self.samples += 1
+        scope = self.scope_dir
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread:
+                continue
+            # Cheap scope check first: most threads run no integration code
+            probe, depth = frame, 0
+            while probe is not None and depth < MAX_STACK_DEPTH:
+                filename = probe.f_code.co_filename
+                if filename.startswith(scope) and filename != _OWN_FILE:
+                    break
+                probe, depth = probe.f_back, depth + 1
+            else:
+                continue
+            stack: List[FuncKey] = []
+            current = frame
+            while current is not None and len(stack) < MAX_STACK_DEPTH:
+                code = current.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                current = current.f_back
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+
+    def to_stats(self) -> StatsDict:
+        """Convert the samples to a pstats statistics dict (times in seconds)."""
+        weight = self.interval_s
+        own: Counter[FuncKey] = Counter()
+        total: Counter[FuncKey] = Counter()
+        edges: Dict[FuncKey, Counter[FuncKey]] = {}
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for func in set(stack):
+                total[func] += count
+            for caller, callee in set(zip(stack, stack[1:])):
+                edges.setdefault(callee, Counter())[caller] += count
+
+        stats: StatsDict = {}
+        for func, count in total.items():
+            callers = {
+                caller: (hits, hits, 0.0, hits * weight)
+                for caller, hits in edges.get(func, {}).items()
+            }
+            stats[func] = (count, count, own[func] * weight, count * weight, callers)
+        return stats
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks (flamegraph.pl / speedscope)."""
+        lines = [
+            ";".join(func_label(func) for func in stack) + f" {count}"
+            for stack, count in self.stacks.most_common()
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def func_label(func: FuncKey, scope_dir: str = PACKAGE_DIR) -> str:
+    """Return `path:line(function)` with paths shortened to the package or base name."""
+    filename, line, name = func
+    if filename.startswith(scope_dir):
+        filename = os.path.relpath(filename, os.path.dirname(os.path.dirname(scope_dir)))
+    elif os.sep in filename:
+        filename = os.path.basename(filename)
+    return f"{filename}:{line}({name})"
+
+
+def summarize(
+    stats: StatsDict, top: int = 15, scope_dir: str = PACKAGE_DIR
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the top functions by own time and the top integration functions by total time."""
+
+    def _row(func: FuncKey) -> Dict[str, Any]:
+        calls, _nc, own_s, total_s, _callers = stats[func]
+        return {
+            "function": func_label(func, scope_dir),
+            "calls": calls,
+            "self_ms": round(own_s * 1000.0, 1),
+            "total_ms": round(total_s * 1000.0, 1),
+        }
+
+    by_own = sorted(stats, key=lambda func: stats[func][2], reverse=True)
+    integration = [func for func in stats if func[0].startswith(scope_dir)]
+    by_total = sorted(integration, key=lambda func: stats[func][3], reverse=True)
+    return {
+        "top_self": [_row(func) for func in by_own[:top] if stats[func][2] > 0],
+        "top_integration": [_row(func) for func in by_total[:top]],
+    }
+
+
+def write_stats(path: str, stats: StatsDict) -> None:
+    """Write a statistics dict in the `pstats` file format."""
+    with open(path, "wb") as handle:
+        marshal.dump(stats, handle)
+
+
+def write_text(path: str, text: str) -> None:
+    """Write a text file (collapsed stacks)."""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+def _profile_stats(profile: cProfile.Profile) -> StatsDict:
+    profile.create_stats()
+    return dict(profile.stats)  # type: ignore[attr-defined]
+
+
+async def async_capture(
+    duration_s: float, *, sampling: bool = True, interval_s: float = DEFAULT_SAMPLE_INTERVAL_S
+) -> Tuple[StatsDict, Optional[StackSampler], float]:
+    """Run one capture on the running loop; return (stats, sampler or None, elapsed s).
+
+    Raises `ProfileBusyError` if a capture is already running, and `ValueError`
+    if another profiler (e.g. HA's own) holds the interpreter's profiling hook.
+    """
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfileBusyError("A profiling capture is already running")
+    try:
+        started = time.monotonic()
+        if sampling:
+            sampler = StackSampler(interval_s)
+            sampler.start()
+            try:
+                await asyncio.sleep(duration_s)
+            finally:
+                # Joining waits at most one interval
+                sampler.stop()
+            return sampler.to_stats(), sampler, time.monotonic() - started
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            await asyncio.sleep(duration_s)
+        finally:
+            profile.disable()
+        return _profile_stats(profile), None, time.monotonic() - started
+    finally:
+        _capture_lock.release()
+
+
+async def async_profile(
+    duration_s: float,
+    *,
+    sampling: bool,
+    top: int,
+    path_for: Callable[[str], str],
+    run_in_executor: Callable[..., Awaitable[Any]],
+) -> Dict[str, Any]:
+    """Run a capture, write the result files and return a summary (service response).
+
+    `path_for(name)` maps a file name into the output directory (HA: `hass.config.path`);
+    `run_in_executor(func, *args)` runs the blocking file writes. Files are named
+    `googlefindmy_profile_<timestamp>.pstats` and, for sampling, `.collapsed`.
+    """
+    stats, sampler, elapsed = await async_capture(duration_s, sampling=sampling)
+
+    files: Dict[str, str] = {}
+    base = path_for(f"googlefindmy_profile_{time.strftime('%Y%m%d_%H%M%S')}")
+    if stats:
+        files["pstats"] = f"{base}.pstats"
+        await run_in_executor(write_stats, files["pstats"], stats)
+    if sampler is not None and sampler.stacks:
+        files["collapsed"] = f"{base}.collapsed"
+        await run_in_executor(write_text, files["collapsed"], sampler.collapsed())
+
+    response: Dict[str, Any] = {
+        "mode": "sampling" if sampling else "cprofile",
+        "duration_s": round(elapsed, 1),
+        "files": files,
+    }
+    if sampler is not None:
+        response["sample_interval_ms"] = round(sampler.interval_s * 1000.0, 1)
+        response["sampling_rounds"] = sampler.samples
+        response["samples_in_scope"] = sum(sampler.stacks.values())
+    response.update(summarize(stats, top))
+    return response
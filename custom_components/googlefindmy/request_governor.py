@@ -0,0 +1,581 @@
+# custom_components/googlefindmy/request_governor.py
+"""Account-wide request budget governor for Nova/SPOT calls.
+
+Every outbound Nova/SPOT request acquires a token from the governor of the
+Google account it is made for. The governor keeps:
+
+- one token bucket per RPC class (`list`, `locate`, `action`), so a burst of
+  Play Sound presses cannot starve polling and vice versa;
+- one account-wide pause that is armed when the server signals throttling
+  (HTTP 429, RESOURCE_EXHAUSTED, or 503/UNAVAILABLE with a Retry-After).
+  Repeated throttling escalates the pause exponentially; the actual pause is
+  jittered so that multiple entries/devices do not resume in lockstep.
+
+Requests run in one of two lanes. The lane is carried in a context variable, so
+the transports need no extra parameters:
+
+- `interactive` (button presses/services) may use the last token of a bucket and
+  reserves it before sleeping;
+- `background` (poll cycles) always leaves `INTERACTIVE_RESERVE_TOKENS` in the
+  bucket and waits without reserving, so interactive requests can overtake it.
+
+`RequestDispatcher` adds the same priority to a coordinator's request slots:
+interactive requests are served before queued background ones and have
+reserved concurrency.
+
+`CircuitBreaker` guards one endpoint (Nova scope or SPOT method) across all
+accounts. After `BREAKER_FAILURE_THRESHOLD` consecutive outage-type failures
+(network errors, timeouts, 5xx) the breaker opens and requests fail fast; once
+the open period has elapsed a single probe request is let through (half-open)
+and its outcome closes the breaker or re-opens it for twice as long. Auth and
+throttling errors are neutral: they are handled by token refresh and the
+account pause respectively.
+
+The module is transport-agnostic (no Home Assistant imports) so the Nova and
+SPOT layers can use it directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# RPC classes
+RPC_LIST = "list"
+RPC_LOCATE = "locate"
+RPC_ACTION = "action"
+
+# Request lanes
+LANE_INTERACTIVE = "interactive"
+LANE_BACKGROUND = "background"
+LANES = (LANE_INTERACTIVE, LANE_BACKGROUND)
+
+_current_lane: ContextVar[str] = ContextVar("googlefindmy_request_lane", default=LANE_BACKGROUND)
+
+
+def current_lane() -> str:
+    """Return the lane of the request being issued in this context."""
+    return _current_lane.get()
+
+
+@contextlib.contextmanager
+def request_lane(lane: str) -> Iterator[None]:
+    """Run the enclosed requests in `lane`."""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    """Token-bucket parameters: sustained `rate` (tokens/s) and `burst` capacity."""
+
+    rate: float
+    burst: float
+
+
+# Defaults are deliberately generous for normal operation (a poll cycle with the
+# default inter-device delay never waits) while capping runaway loops.
+DEFAULT_BUDGETS: Dict[str, BucketConfig] = {
+    RPC_LIST: BucketConfig(rate=1 / 10, burst=3),
+    RPC_LOCATE: BucketConfig(rate=1 / 2, burst=5),
+    RPC_ACTION: BucketConfig(rate=1.0, burst=5),
+}
+
+# Account pause after throttling: base doubles per consecutive strike (capped).
+THROTTLE_PAUSE_BASE_S = 30.0
+THROTTLE_PAUSE_MAX_S = 900.0
+# A request never waits longer than this for budget/pause; it fails fast instead.
+MAX_ACQUIRE_WAIT_S = 30.0
+# Tokens per bucket that background requests leave for interactive ones.
+INTERACTIVE_RESERVE_TOKENS = 1.0
+
+# Circuit breaker: consecutive failures that open it, and the (doubling) open period.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_BASE_S = 30.0
+BREAKER_OPEN_MAX_S = 600.0
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Status codes that always signal throttling.
+GRPC_THROTTLE_CODES = frozenset({"8"})  # RESOURCE_EXHAUSTED
+HTTP_THROTTLE_CODES = frozenset({429})
+# Overload codes: throttling only with a Retry-After, otherwise an outage that
+# counts towards the endpoint's circuit breaker.
+GRPC_OVERLOAD_CODES = frozenset({"14"})  # UNAVAILABLE
+HTTP_OVERLOAD_CODES = frozenset({503})
+
+
+class RequestBudgetExceeded(Exception):
+    """Raised when a request would have to wait longer than allowed for budget."""
+
+    def __init__(self, rpc_class: str, wait_s: float, paused: bool) -> None:
+        reason = "account paused after throttling" if paused else "request budget exhausted"
+        super().__init__(f"{rpc_class}: {reason} (retry in {wait_s:.1f}s)")
+        self.rpc_class = rpc_class
+        self.wait_s = wait_s
+        self.paused = paused
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the endpoint's breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in_s: float) -> None:
+        super().__init__(f"{endpoint}: circuit open after repeated failures (retry in {retry_in_s:.0f}s)")
+        self.endpoint = endpoint
+        self.retry_in_s = retry_in_s
+
+
+def is_throttle_response(
+    status: Optional[int] = None,
+    grpc_status: Optional[str] = None,
+    body: Optional[str] = None,
+    retry_after: Optional[str] = None,
+) -> bool:
+    """Return True if a response asks the client to slow down.
+
+    429 and RESOURCE_EXHAUSTED always do. 503/UNAVAILABLE only do with a
+    Retry-After header; a bare 503 is an outage, not a throttle.
+    """
+    grpc = str(grpc_status) if grpc_status is not None else None
+    if status in HTTP_THROTTLE_CODES or grpc in GRPC_THROTTLE_CODES:
+        return True
+    if body and "RESOURCE_EXHAUSTED" in body:
+        return True
+    overloaded = status in HTTP_OVERLOAD_CODES or grpc in GRPC_OVERLOAD_CODES
+    return overloaded and bool(retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return a Retry-After header value in seconds (delta-seconds form only)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class _TokenBucket:
+    """Classic token bucket on the monotonic clock."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, cfg: BucketConfig, now: float) -> None:
+        self.rate = float(cfg.rate)
+        self.burst = float(cfg.burst)
+        self.tokens = float(cfg.burst)
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float, reserve: float = 0.0) -> float:
+        """Seconds until one token is available above `reserve` (0 if available now)."""
+        self._refill(now)
+        needed = 1.0 + max(0.0, min(reserve, self.burst - 1.0))
+        if self.tokens >= needed:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (needed - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1.0
+
+
+class RequestGovernor:
+    """Per-account request governor (token buckets + throttle pause)."""
+
+    def __init__(
+        self,
+        account: str,
+        budgets: Optional[Dict[str, BucketConfig]] = None,
+        *,
+        max_wait_s: float = MAX_ACQUIRE_WAIT_S,
+    ) -> None:
+        now = time.monotonic()
+        self.account = account
+        self.max_wait_s = float(max_wait_s)
+        self._buckets: Dict[str, _TokenBucket] = {
+            name: _TokenBucket(cfg, now) for name, cfg in (budgets or DEFAULT_BUDGETS).items()
+        }
+        self._paused_until: float = 0.0
+        self._strikes: int = 0
+        # Counters (exposed via diagnostics)
+        self.granted: Dict[str, int] = {name: 0 for name in self._buckets}
+        self.waited_s: float = 0.0
+        self.rejected: int = 0
+        self.throttle_events: int = 0
+
+    # ------------------------------ Pause state ------------------------------
+    def paused_for(self, now: Optional[float] = None) -> float:
+        """Return the remaining account pause in seconds (0 if not paused)."""
+        now = time.monotonic() if now is None else now
+        return max(0.0, self._paused_until - now)
+
+    def note_throttled(self, retry_after_s: Optional[float] = None) -> float:
+        """Record a throttling response and pause the whole account.
+
+        The pause is `max(Retry-After, base * 2**strikes)` (capped), with the
+        escalating part jittered into [50%, 100%] to de-synchronize recovery.
+
+        Returns:
+            The pause duration applied (seconds).
+        """
+        base = min(THROTTLE_PAUSE_MAX_S, THROTTLE_PAUSE_BASE_S * (2 ** self._strikes))
+        pause = random.uniform(base / 2, base)
+        if retry_after_s is not None:
+            pause = max(pause, min(float(retry_after_s), THROTTLE_PAUSE_MAX_S))
+        self._strikes += 1
+        self.throttle_events += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        _LOGGER.warning(
+            "Google API throttling detected; pausing requests for this account for %.0fs (strike %d)",
+            pause,
+            self._strikes,
+        )
+        return pause
+
+    def note_success(self) -> None:
+        """Record a successful request; clears the throttle escalation."""
+        self._strikes = 0
+
+    # ------------------------------- Acquire --------------------------------
+    async def acquire(self, rpc_class: str) -> None:
+        """Wait for budget of `rpc_class` (and for any account pause).
+
+        Interactive requests reserve the token before sleeping (the bucket may go
+        negative), so concurrent callers queue up behind each other instead of all
+        waking at once. Background requests keep `INTERACTIVE_RESERVE_TOKENS` free
+        and sleep without reserving, re-checking afterwards.
+
+        Raises:
+            RequestBudgetExceeded: if the total wait would exceed `max_wait_s`.
+        """
+        bucket = self._buckets.get(rpc_class) or self._buckets[RPC_ACTION]
+        interactive = current_lane() == LANE_INTERACTIVE
+        reserve = 0.0 if interactive else INTERACTIVE_RESERVE_TOKENS
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            pause = self.paused_for(now)
+            wait = max(pause, bucket.wait_time(now, reserve))
+            if (now - started) + wait > self.max_wait_s:
+                self.rejected += 1
+                raise RequestBudgetExceeded(rpc_class, wait, paused=pause > 0)
+            if interactive or wait <= 0:
+                bucket.take(now)
+                self.granted[rpc_class] = self.granted.get(rpc_class, 0) + 1
+                if wait > 0:
+                    _LOGGER.debug("Request governor: delaying %s request by %.2fs", rpc_class, wait)
+                    self.waited_s += wait
+                    await asyncio.sleep(wait)
+                return
+            _LOGGER.debug("Request governor: background %s request waits %.2fs", rpc_class, wait)
+            self.waited_s += wait
+            await asyncio.sleep(wait)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a diagnostics-friendly snapshot (no account identifiers)."""
+        now = time.monotonic()
+        return {
+            "paused_for_s": round(self.paused_for(now), 1),
+            "throttle_strikes": self._strikes,
+            "throttle_events": self.throttle_events,
+            "granted": dict(self.granted),
+            "rejected": self.rejected,
+            "waited_s": round(self.waited_s, 2),
+            "tokens": {name: round(b.tokens, 2) for name, b in self._buckets.items()},
+        }
+
+
+# ------------------------------ Dispatcher ----------------------------------
+class RequestDispatcher:
+    """Prioritised request slots for one coordinator (interactive before background).
+
+    At most `capacity` requests run at once; background requests may use at most
+    `capacity - reserved_interactive` of them and do not start while an interactive
+    request is queued. An optional `key` (device id) serialises requests that share
+    a per-device resource such as the FCM location callback.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 2,
+        reserved_interactive: int = 1,
+        *,
+        on_wait: Optional[Callable[[str, float], None]] = None,
+    ) -> None:
+        self.capacity = max(1, int(capacity))
+        self.reserved_interactive = min(max(0, int(reserved_interactive)), self.capacity - 1)
+        self._on_wait = on_wait
+        self._active: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._busy_keys: Set[str] = set()
+        self._waiters: Dict[str, Deque[Tuple[asyncio.Future, Optional[str]]]] = {
+            lane: deque() for lane in LANES
+        }
+        # Counters (exposed via diagnostics)
+        self.requests: Dict[str, int] = {lane: 0 for lane in LANES}
+        self.wait_total_s: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        self.wait_max_s: Dict[str, float] = {lane: 0.0 for lane in LANES}
+
+    def _can_start(self, lane: str, key: Optional[str]) -> bool:
+        if key is not None and key in self._busy_keys:
+            return False
+        if sum(self._active.values()) >= self.capacity:
+            return False
+        if lane == LANE_BACKGROUND:
+            if self._active[LANE_BACKGROUND] >= self.capacity - self.reserved_interactive:
+                return False
+            if self._waiters[LANE_INTERACTIVE]:
+                return False
+        return True
+
+    def _start(self, lane: str, key: Optional[str]) -> None:
+        self._active[lane] += 1
+        if key is not None:
+            self._busy_keys.add(key)
+
+    def _release(self, lane: str, key: Optional[str]) -> None:
+        self._active[lane] -= 1
+        if key is not None:
+            self._busy_keys.discard(key)
+        self._wake()
+
+    def _wake(self) -> None:
+        for lane in LANES:
+            queue = self._waiters[lane]
+            for entry in list(queue):
+                fut, key = entry
+                if fut.done():
+                    queue.remove(entry)
+                    continue
+                if self._can_start(lane, key):
+                    queue.remove(entry)
+                    self._start(lane, key)
+                    fut.set_result(None)
+
+    def _note_wait(self, lane: str, waited: float) -> None:
+        self.requests[lane] += 1
+        self.wait_total_s[lane] += waited
+        self.wait_max_s[lane] = max(self.wait_max_s[lane], waited)
+        if self._on_wait is not None:
+            self._on_wait(lane, waited)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane: str, key: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold a request slot in `lane` (and the governor lane) for the enclosed block."""
+        started = time.monotonic()
+        if not self._waiters[lane] and self._can_start(lane, key):
+            self._start(lane, key)
+        else:
+            fut: asyncio.Future = asyncio.get_running_loop().create_future()
+            entry = (fut, key)
+            self._waiters[lane].append(entry)
+            try:
+                await fut
+            except BaseException:
+                if entry in self._waiters[lane]:
+                    self._waiters[lane].remove(entry)
+                    self._wake()
+                elif fut.done() and not fut.cancelled():
+                    self._release(lane, key)
+                raise
+        self._note_wait(lane, time.monotonic() - started)
+        try:
+            with request_lane(lane):
+                yield
+        finally:
+            self._release(lane, key)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a diagnostics-friendly snapshot (no device identifiers)."""
+        return {
+            lane: {
+                "requests": self.requests[lane],
+                "active": self._active[lane],
+                "queued": len(self._waiters[lane]),
+                "wait_avg_s": round(self.wait_total_s[lane] / self.requests[lane], 3)
+                if self.requests[lane]
+                else 0.0,
+                "wait_max_s": round(self.wait_max_s[lane], 3),
+            }
+            for lane in LANES
+        }
+
+
+# ----------------------------- Circuit breaker ------------------------------
+class CircuitBreaker:
+    """Half-open circuit breaker for one endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        open_base_s: float = BREAKER_OPEN_BASE_S,
+        open_max_s: float = BREAKER_OPEN_MAX_S,
+    ) -> None:
+        self.endpoint = endpoint
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.open_base_s = float(open_base_s)
+        self.open_max_s = float(open_max_s)
+        self.state = BREAKER_CLOSED
+        self._failures = 0
+        self._open_s = self.open_base_s
+        self._open_until = 0.0
+        self._probe_inflight = False
+        # Counters (exposed via diagnostics/system health)
+        self.opened = 0
+        self.rejected = 0
+        self.last_error: Optional[str] = None
+
+    def retry_in(self, now: Optional[float] = None) -> float:
+        """Return seconds until a request may pass (0 if one would be allowed now)."""
+        if self.state != BREAKER_OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self._open_until - now)
+
+    def before_request(self) -> None:
+        """Admit a request or raise `CircuitOpenError`.
+
+        While open the request fails fast. Once the open period has elapsed the
+        breaker turns half-open and admits exactly one probe; others fail fast
+        until the probe has reported its outcome.
+        """
+        now = time.monotonic()
+        if self.state == BREAKER_OPEN:
+            if now < self._open_until:
+                self.rejected += 1
+                raise CircuitOpenError(self.endpoint, self._open_until - now)
+            self.state = BREAKER_HALF_OPEN
+            self._probe_inflight = False
+        if self.state == BREAKER_HALF_OPEN:
+            if self._probe_inflight:
+                self.rejected += 1
+                raise CircuitOpenError(self.endpoint, 0.0)
+            self._probe_inflight = True
+            _LOGGER.debug("Circuit %s half-open; sending probe request", self.endpoint)
+
+    def record_success(self) -> None:
+        """Close the breaker and reset its failure count."""
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Google API endpoint %s recovered; circuit closed", self.endpoint)
+        self.state = BREAKER_CLOSED
+        self._failures = 0
+        self._open_s = self.open_base_s
+        self._probe_inflight = False
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """Count an outage-type failure; open (or re-open) the breaker if needed."""
+        if error is not None:
+            self.last_error = type(error).__name__
+        if self.state == BREAKER_HALF_OPEN:
+            self._open_s = min(self.open_max_s, self._open_s * 2)
+            self._trip()
+            return
+        self._failures += 1
+        if self.state == BREAKER_CLOSED and self._failures >= self.failure_threshold:
+            self._trip()
+
+    def release(self) -> None:
+        """End a request without a verdict (cancelled, auth or throttling error)."""
+        self._probe_inflight = False
+
+    def _trip(self) -> None:
+        self.state = BREAKER_OPEN
+        self._probe_inflight = False
+        self._open_until = time.monotonic() + self._open_s
+        self.opened += 1
+        _LOGGER.warning(
+            "Google API endpoint %s keeps failing (%s); failing fast for %.0fs",
+            self.endpoint,
+            self.last_error or "error",
+            self._open_s,
+        )
+
+    @contextlib.contextmanager
+    def guard(self, is_failure: Callable[[Exception], bool] = lambda _err: True) -> Iterator[None]:
+        """Run one request under the breaker.
+
+        A normal exit counts as success; an exception counts as failure if
+        `is_failure(exc)` is true and is neutral otherwise.
+
+        Raises:
+            CircuitOpenError: if the breaker does not admit the request.
+        """
+        self.before_request()
+        try:
+            yield
+        except Exception as err:
+            if is_failure(err):
+                self.record_failure(err)
+            else:
+                self.release()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a diagnostics-friendly snapshot."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_in_s": round(self.retry_in(), 1),
+            "open_period_s": self._open_s,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
+
+
+# ------------------------------ Registry ------------------------------------
+_GOVERNORS: Dict[str, RequestGovernor] = {}
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def get_governor(account: Optional[str]) -> RequestGovernor:
+    """Return the governor for a Google account (created on first use)."""
+    key = (account or "").strip().lower() or "_default"
+    gov = _GOVERNORS.get(key)
+    if gov is None:
+        gov = _GOVERNORS[key] = RequestGovernor(key)
+    return gov
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Return the circuit breaker for an endpoint (created on first use)."""
+    breaker = _BREAKERS.get(endpoint)
+    if breaker is None:
+        breaker = _BREAKERS[endpoint] = CircuitBreaker(endpoint)
+    return breaker
+
+
+def circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Return the state of every breaker created so far, keyed by endpoint."""
+    return {endpoint: breaker.as_dict() for endpoint, breaker in sorted(_BREAKERS.items())}
+
+
+def rpc_class_for_nova_scope(api_scope: str) -> str:
+    """Map a Nova API scope to its default RPC class."""
+    return RPC_LIST if "list_devices" in api_scope else RPC_ACTION
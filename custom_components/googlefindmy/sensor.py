@@ -4,6 +4,8 @@
 Exposes:
 - Per-device `last_seen` timestamp sensors (restore-friendly).
 - Optional integration diagnostic counters (stats), toggled via options.
+- With the counters: p95 latency per stage of the location pipeline (p50/p99 as attributes).
+- With the loop watchdog option: event-loop stall count (worst offending code paths as attributes).
 
 Best practices:
 - Device names are synced from the coordinator once known; user-assigned names are never overwritten.
@@ -12,7 +14,6 @@ Best practices:
 """
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
 from datetime import datetime, timezone
@@ -26,6 +27,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
@@ -41,7 +43,9 @@ from .const import (
     DEFAULT_ENABLE_STATS_ENTITIES,
     OPT_MAP_VIEW_TOKEN_EXPIRATION,
 )
-from .coordinator import GoogleFindMyCoordinator
+from .coordinator import DeviceSnapshot, GoogleFindMyCoordinator
+from .latency import PIPELINE_STAGES
+from .map_view import map_token_digest
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +58,35 @@ LAST_SEEN_DESCRIPTION = SensorEntityDescription(
     device_class=SensorDeviceClass.TIMESTAMP,
 )
 
+# Current adaptive (AIMD) delay between devices within a poll cycle.
+POLL_SPACING_DESCRIPTION = SensorEntityDescription(
+    key="poll_spacing",
+    translation_key="poll_spacing",
+    icon="mdi:timer-sand",
+    device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.MEASUREMENT,
+)
+
+# Event-loop stalls seen by the (optional, shared) loop watchdog.
+LOOP_STALLS_DESCRIPTION = SensorEntityDescription(
+    key="loop_stalls",
+    translation_key="loop_stalls",
+    icon="mdi:speedometer-slow",
+    state_class=SensorStateClass.TOTAL_INCREASING,
+)
+
+# p95 latency per location pipeline stage (histograms owned by the coordinator).
+STAGE_LATENCY_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
+    stage: SensorEntityDescription(
+        key=f"latency_{stage}",
+        translation_key=f"latency_{stage}",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    for stage in PIPELINE_STAGES
+}
+
 # NOTE: HA Quality Scale (Platinum): entity descriptions define translation_key,
 # icon and state_class; keys must match coordinator.stats counters exactly.
 # `skipped_duplicates` was removed from the coordinator and is intentionally absent here.
@@ -80,23 +113,30 @@ STATS_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
 }
 
 
-def _maybe_update_device_registry_name(hass: HomeAssistant, entity_id: str, new_name: str) -> None:
+def _maybe_update_device_registry_name(
+    hass: HomeAssistant, entity_id: str, new_name: str, registry_device_id: str | None = None
+) -> None:
     """Write the real Google device label into the device registry once known.
 
     Never touch if the user renamed the device (name_by_user is set).
+
+    `registry_device_id` (from the coordinator's tracker entity index) skips the
+    Entity Registry lookup.
     """
     try:
-        ent_reg = er.async_get(hass)
-        ent = ent_reg.async_get(entity_id)
-        if not ent or not ent.device_id:
-            return
+        device_id = registry_device_id
+        if not device_id:
+            ent = er.async_get(hass).async_get(entity_id)
+            if not ent or not ent.device_id:
+                return
+            device_id = ent.device_id
         dev_reg = dr.async_get(hass)
-        dev = dev_reg.async_get(ent.device_id)
+        dev = dev_reg.async_get(device_id)
         # Respect user overrides
         if not dev or dev.name_by_user:
             return
         if new_name and dev.name != new_name:
-            dev_reg.async_update_device(device_id=ent.device_id, name=new_name)
+            dev_reg.async_update_device(device_id=device_id, name=new_name)
             _LOGGER.debug(
                 "Device registry name updated for %s: '%s' -> '%s'",
                 entity_id,
@@ -128,12 +168,20 @@ async def async_setup_entry(
         for stat_key, desc in STATS_DESCRIPTIONS.items():
             entities.append(GoogleFindMyStatsSensor(coordinator, stat_key, desc))
             created_stats.append(stat_key)
+        entities.append(GoogleFindMyPollSpacingSensor(coordinator, POLL_SPACING_DESCRIPTION))
+        created_stats.append(POLL_SPACING_DESCRIPTION.key)
+        for stage, desc in STAGE_LATENCY_DESCRIPTIONS.items():
+            entities.append(GoogleFindMyStageLatencySensor(coordinator, stage, desc))
+            created_stats.append(desc.key)
+        if getattr(coordinator, "loop_watchdog", None) is not None:
+            entities.append(GoogleFindMyLoopStallSensor(coordinator, LOOP_STALLS_DESCRIPTION))
+            created_stats.append(LOOP_STALLS_DESCRIPTION.key)
         # Helpful debug to verify which stats sensors are created at setup time.
         _LOGGER.debug("Stats sensors created: %s", ", ".join(created_stats))
 
     # Per-device last_seen sensors from current snapshot
     if coordinator.data:
-        for device in coordinator.data:
+        for device in coordinator.data.values():
             dev_id = device.get("id")
             dev_name = device.get("name")
             if dev_id and dev_name:
@@ -150,7 +198,12 @@ async def async_setup_entry(
     def _add_new_sensors_on_update() -> None:
         try:
             new_entities: list[SensorEntity] = []
-            for device in (getattr(coordinator, "data", None) or []):
+            data = getattr(coordinator, "data", None) or {}
+            # New devices are always among the changed ids of the published snapshot
+            devices = (
+                data.changed_entries() if isinstance(data, DeviceSnapshot) else data.values()
+            )
+            for device in devices:
                 dev_id = device.get("id")
                 dev_name = device.get("name")
                 if not dev_id or not dev_name or dev_id in known_ids:
@@ -203,6 +256,7 @@ class GoogleFindMyStatsSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{stat_key}"
         # Intentionally no `_attr_name` here; translations drive the visible name.
         self._attr_native_unit_of_measurement = "updates"
+        self._last_written_signature: tuple[Any, ...] | None = None
 
     @property
     def native_value(self) -> int | None:
@@ -212,6 +266,23 @@ class GoogleFindMyStatsSensor(CoordinatorEntity, SensorEntity):
             return None
         return stats.get(self._stat_key, 0)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the counter (or availability) actually changed.
+
+        Stats sensors listen to every snapshot publish; most publishes leave
+        a given counter untouched.
+        """
+        signature = self._state_signature()
+        if signature == self._last_written_signature:
+            return
+        self._last_written_signature = signature
+        self.async_write_ha_state()
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return what a state write would carry (skip writes when unchanged)."""
+        return (self.available, self.native_value)
+
     @property
     def device_info(self) -> DeviceInfo:
         """Expose a single integration device for diagnostic sensors."""
@@ -234,6 +305,86 @@ class GoogleFindMyStatsSensor(CoordinatorEntity, SensorEntity):
         )
 
 
+class GoogleFindMyPollSpacingSensor(GoogleFindMyStatsSensor):
+    """Diagnostic sensor exposing the current adaptive inter-device poll spacing."""
+
+    def __init__(
+        self, coordinator: GoogleFindMyCoordinator, description: SensorEntityDescription
+    ) -> None:
+        """Initialize the poll spacing sensor (integration device, like the counters)."""
+        super().__init__(coordinator, description.key, description)
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the current spacing in seconds."""
+        return getattr(self.coordinator, "poll_spacing_s", None)
+
+
+class GoogleFindMyStageLatencySensor(GoogleFindMyStatsSensor):
+    """Diagnostic sensor exposing the p95 latency of one location pipeline stage."""
+
+    def __init__(
+        self, coordinator: GoogleFindMyCoordinator, stage: str, description: SensorEntityDescription
+    ) -> None:
+        """Initialize the stage latency sensor (integration device, like the counters)."""
+        super().__init__(coordinator, description.key, description)
+        self._stage = stage
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def _summary(self) -> dict[str, Any]:
+        latency = getattr(self.coordinator, "pipeline_latency", None)
+        histogram = latency.stage(self._stage) if latency is not None else None
+        return histogram.as_dict() if histogram is not None else {}
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 latency in milliseconds (None until the stage ran)."""
+        return self._summary().get("p95_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return p50/p99, max and the sample count."""
+        summary = self._summary()
+        return {key: summary.get(key) for key in ("p50_ms", "p99_ms", "max_ms", "count")}
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Include the quantile attributes; a new sample count alone is not written."""
+        attrs = self.extra_state_attributes
+        return (self.available, self.native_value, attrs["p50_ms"], attrs["p99_ms"], attrs["max_ms"])
+
+
+class GoogleFindMyLoopStallSensor(GoogleFindMyStatsSensor):
+    """Diagnostic sensor exposing event-loop stalls and the code paths behind them."""
+
+    def __init__(
+        self, coordinator: GoogleFindMyCoordinator, description: SensorEntityDescription
+    ) -> None:
+        """Initialize the loop stall sensor (integration device, like the counters)."""
+        super().__init__(coordinator, description.key, description)
+        self._attr_native_unit_of_measurement = "stalls"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of stalls since the watchdog started."""
+        watchdog = getattr(self.coordinator, "loop_watchdog", None)
+        return watchdog.stalls if watchdog is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the p99 loop lag and the worst offending code sections."""
+        watchdog = getattr(self.coordinator, "loop_watchdog", None)
+        if watchdog is None:
+            return {}
+        return {
+            "lag_p99_ms": watchdog.lag.as_dict()["p99_ms"],
+            "worst_offenders": [
+                f"{item['section']}: {item['stalls']} ({item['max_ms']} ms max)"
+                for item in watchdog.worst_offenders(3)
+            ],
+        }
+
+
 # ----------------------------- Per-Device Last Seen ---------------------------
 
 
@@ -254,14 +405,19 @@ class GoogleFindMyLastSeenSensor(CoordinatorEntity, RestoreSensor):
 
     def __init__(self, coordinator: GoogleFindMyCoordinator, device: dict[str, Any]) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device = device
+        # Per-device listener: only woken when this device's snapshot entry changes.
+        super().__init__(coordinator, device.get("id"))
+        # Own copy: snapshot entries are shared between published snapshots (read-only).
+        self._device = dict(device)
         self._device_id: str | None = device.get("id")
         safe_id = self._device_id if self._device_id is not None else "unknown"
         # Include entry_id in unique_id for multi-account support
         entry_id = coordinator.config_entry.entry_id if coordinator.config_entry else "default"
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{safe_id}_last_seen"
         self._attr_native_value: datetime | None = None
+        # Recompute only for a new entry version; do not write identical states.
+        self._seen_version: int | None = None
+        self._last_written_signature: tuple[Any, ...] | None = None
 
     @property
     def available(self) -> bool:
@@ -277,16 +433,25 @@ class GoogleFindMyLastSeenSensor(CoordinatorEntity, RestoreSensor):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update native timestamp and keep the device label in sync."""
+        version = self.coordinator.get_device_snapshot_version(self._device_id or "")
+        if version == self._seen_version:
+            self._async_write_ha_state_if_changed()
+            return
+        self._seen_version = version
+
         # 1) Keep the raw device name synchronized with the coordinator snapshot.
         try:
             my_id = self._device_id or ""
-            for dev in (getattr(self.coordinator, "data", None) or []):
-                if dev.get("id") == my_id:
-                    new_name = dev.get("name")
-                    if new_name and new_name != self._device.get("name"):
-                        self._device["name"] = new_name
-                        _maybe_update_device_registry_name(self.hass, self.entity_id, new_name)
-                    break
+            dev = self.coordinator.get_device_snapshot_entry(my_id)
+            new_name = dev.get("name") if dev else None
+            if new_name and new_name != self._device.get("name"):
+                self._device["name"] = new_name
+                _maybe_update_device_registry_name(
+                    self.hass,
+                    self.entity_id,
+                    new_name,
+                    registry_device_id=self.coordinator.get_registry_device_id(my_id),
+                )
         except (AttributeError, TypeError) as e:  # noqa: BLE001
             _LOGGER.debug("Name refresh failed for %s: %s", self._device_id, e)
 
@@ -328,6 +493,15 @@ class GoogleFindMyLastSeenSensor(CoordinatorEntity, RestoreSensor):
                 self._device.get("name", self._device_id),
             )
 
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write state only if value/availability differ from the last write."""
+        signature = (self.available, self._attr_native_value)
+        if signature == self._last_written_signature:
+            return
+        self._last_written_signature = signature
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -449,4 +623,4 @@ class GoogleFindMyLastSeenSensor(CoordinatorEntity, RestoreSensor):
         else:
             token_src = f"{ha_uuid}:static"
 
-        return hashlib.md5(token_src.encode()).hexdigest()[:16]
+        return map_token_digest(token_src)
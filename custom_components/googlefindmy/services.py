@@ -214,6 +214,9 @@ async def async_rebuild_device_registry(hass: HomeAssistant, call: ServiceCall)
         data = getattr(candidate, "data", [])
         if isinstance(data, list):
             return data
+        if isinstance(data, Mapping):
+            # Keyed snapshot (device id -> entry)
+            return list(data.values())
         if isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
             try:
                 return list(data)
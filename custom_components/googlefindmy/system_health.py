@@ -14,6 +14,7 @@ from homeassistant.core import HomeAssistant, callback
 
 from .const import CONF_GOOGLE_EMAIL, DATA_SECRET_BUNDLE, DOMAIN, INTEGRATION_VERSION
 from .email import normalize_email
+from .request_governor import circuit_breaker_states
 
 
 class SystemHealthRegistration(Protocol):
@@ -294,6 +295,15 @@ async def async_get_system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "fcm": _get_fcm_info(domain_bucket.get("fcm_receiver")),
     }
 
+    breakers = circuit_breaker_states()
+    if breakers:
+        info["circuit_breakers"] = {
+            endpoint: state["state"]
+            if state["state"] == "closed"
+            else f"{state['state']} (retry in {state['retry_in_s']:.0f}s)"
+            for endpoint, state in breakers.items()
+        }
+
     contention = domain_bucket.get("fcm_lock_contention_count")
     if isinstance(contention, int):
         info["fcm_lock_contention_count"] = contention
@@ -0,0 +1,256 @@
+# custom_components/googlefindmy/tracing.py
+"""End-to-end traces of individual locates, kept in a fixed-size ring buffer.
+
+The stage histograms in `latency` answer "how slow is decryption at p99"; a
+trace answers "what happened to *this* locate". Every locate (background poll,
+manual locate, push-only update) gets a `LocateTrace` with a process-unique
+trace id and a list of timestamped spans, from the Nova request through the FCM
+callback, parse, identity-key retrieval, decryption and selection to gating,
+commit and the listener fan-out that published it.
+
+The trace travels with the request in a context variable, like the latency
+recorder and the request lane, so the Nova/FCM/decrypt layers need no extra
+parameters; the FCM callback captures it like the latency recorder. Spans
+recorded without a bound trace are ignored.
+
+Memory is bounded: the coordinator keeps the latest `DEFAULT_TRACE_CAPACITY`
+traces in a `TraceBuffer` (a `deque` with `maxlen`), spans are plain tuples and
+each trace keeps at most `MAX_SPANS` of them. Diagnostics export the buffer
+(filterable by device). The module has no Home Assistant imports.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import time
+from collections import deque
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .latency import STAGE_PUBLISH
+
+DEFAULT_TRACE_CAPACITY = 100
+MAX_SPANS = 32
+
+# Kinds of locate
+TRACE_POLL = "poll"
+TRACE_MANUAL = "manual"
+TRACE_PUSH = "push"
+
+# Outcomes (None while the locate is in flight)
+OUTCOME_PUBLISHED = "published"
+OUTCOME_COMMITTED = "committed"  # in the cache, waiting for the next publish
+OUTCOME_NO_LOCATION = "no_location"
+OUTCOME_FILTERED = "filtered"
+OUTCOME_INVALID = "invalid"
+OUTCOME_LOW_ACCURACY = "low_accuracy"
+OUTCOME_NOT_SIGNIFICANT = "not_significant"
+OUTCOME_STALE = "stale"
+OUTCOME_SUPERSEDED = "superseded"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+
+# Span names beyond the pipeline stages of `latency`
+SPAN_FCM_CALLBACK = "fcm_callback"
+SPAN_DEBOUNCE = "debounce"
+SPAN_COMMIT = "commit"
+
+# (name, start offset ms, duration ms, detail)
+Span = Tuple[str, float, float, Optional[str]]
+
+_trace_ids = itertools.count(1)
+_current_trace: ContextVar[Optional["LocateTrace"]] = ContextVar(
+    "googlefindmy_locate_trace", default=None
+)
+
+
+class LocateTrace:
+    """Timeline of one locate: spans relative to its start, and its outcome."""
+
+    __slots__ = (
+        "trace_id",
+        "device_id",
+        "kind",
+        "started_at",
+        "_t0",
+        "spans",
+        "dropped_spans",
+        "outcome",
+        "duration_ms",
+    )
+
+    def __init__(self, device_id: str, kind: str) -> None:
+        self.trace_id = next(_trace_ids)
+        self.device_id = device_id
+        self.kind = kind
+        self.started_at = time.time()  # wall clock for the reader
+        self._t0 = perf_counter()
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.outcome: Optional[str] = None
+        self.duration_ms: Optional[float] = None
+
+    def span(
+        self, name: str, started: float, ended: float, detail: Optional[str] = None
+    ) -> None:
+        """Record a span between two `perf_counter()` readings (thread-safe append)."""
+        if len(self.spans) >= MAX_SPANS:
+            self.dropped_spans += 1
+            return
+        self.spans.append(
+            (
+                name,
+                round((started - self._t0) * 1000.0, 3),
+                round(max(0.0, ended - started) * 1000.0, 3),
+                detail,
+            )
+        )
+
+    def event(self, name: str, detail: Optional[str] = None, at: Optional[float] = None) -> None:
+        """Record a zero-length span (now, or at the `perf_counter()` reading `at`)."""
+        moment = perf_counter() if at is None else at
+        self.span(name, moment, moment, detail)
+
+    def finish(self, outcome: str) -> None:
+        """Set the outcome and the end-to-end duration (a later call overrides both)."""
+        self.outcome = outcome
+        self.duration_ms = round((perf_counter() - self._t0) * 1000.0, 3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the trace as plain data (diagnostics)."""
+        spans = []
+        # Spans are appended when they end (and from worker threads): order by start
+        for name, start_ms, duration_ms, detail in sorted(self.spans, key=lambda span: span[1]):
+            row: Dict[str, Any] = {"name": name, "start_ms": start_ms, "duration_ms": duration_ms}
+            if detail is not None:
+                row["detail"] = detail
+            spans.append(row)
+        result: Dict[str, Any] = {
+            "trace_id": self.trace_id,
+            "device_id": self.device_id,
+            "kind": self.kind,
+            "started_at": self.started_at,
+            "outcome": self.outcome,
+            "duration_ms": self.duration_ms,
+            "spans": spans,
+        }
+        if self.dropped_spans:
+            result["dropped_spans"] = self.dropped_spans
+        return result
+
+
+class TraceBuffer:
+    """The latest `capacity` locate traces of a config entry (oldest are evicted).
+
+    Committed traces wait for the listener fan-out that publishes their device;
+    `published()` adds the publish span and completes them.
+    """
+
+    __slots__ = ("_traces", "_unpublished")
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY) -> None:
+        self._traces: Deque[LocateTrace] = deque(maxlen=max(1, int(capacity)))
+        self._unpublished: Dict[str, List[LocateTrace]] = {}
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of traces kept."""
+        return self._traces.maxlen or 0
+
+    def start(self, device_id: str, kind: str) -> LocateTrace:
+        """Start a trace and add it to the buffer."""
+        trace = LocateTrace(device_id, kind)
+        self._traces.append(trace)
+        return trace
+
+    def add(self, trace: LocateTrace) -> None:
+        """Add a trace started elsewhere (push path: the owning entry is known after decryption)."""
+        self._traces.append(trace)
+
+    def committed(self, trace: LocateTrace) -> None:
+        """Record the cache commit; the trace completes when its device is published."""
+        trace.event(SPAN_COMMIT)
+        trace.finish(OUTCOME_COMMITTED)
+        self._unpublished.setdefault(trace.device_id, []).append(trace)
+
+    def published(
+        self, device_ids: Optional[Iterable[str]], started: float, ended: float
+    ) -> None:
+        """Complete the committed traces of `device_ids` (None: every device)."""
+        if not self._unpublished:
+            return
+        if device_ids is None:
+            pending = list(self._unpublished.values())
+            self._unpublished.clear()
+        else:
+            pending = [self._unpublished.pop(dev_id, None) for dev_id in device_ids]
+        for traces in pending:
+            for trace in traces or ():
+                trace.span(STAGE_PUBLISH, started, ended)
+                trace.finish(OUTCOME_PUBLISHED)
+
+    def recent(
+        self, device_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the traces newest first, optionally of one device only."""
+        result: List[Dict[str, Any]] = []
+        for trace in reversed(self._traces):
+            if device_id is not None and trace.device_id != device_id:
+                continue
+            result.append(trace.as_dict())
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+
+def current_trace() -> Optional[LocateTrace]:
+    """Return the trace bound to this context (None outside a traced locate)."""
+    return _current_trace.get()
+
+
+@contextlib.contextmanager
+def bind_trace(trace: Optional[LocateTrace]) -> Iterator[None]:
+    """Attribute the spans recorded in the enclosed block to `trace`."""
+    token = _current_trace.set(trace)
+    try:
+        yield
+    finally:
+        _current_trace.reset(token)
+
+
+def trace_span(name: str, seconds: float, detail: Optional[str] = None) -> None:
+    """Record a span that ends now and lasted `seconds` on the bound trace (if any)."""
+    trace = _current_trace.get()
+    if trace is not None:
+        ended = perf_counter()
+        trace.span(name, ended - seconds, ended, detail)
+
+
+def trace_event(name: str, detail: Optional[str] = None) -> None:
+    """Record a zero-length span on the bound trace (if any)."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.event(name, detail)
+
+
+@contextlib.contextmanager
+def traced(name: str) -> Iterator[None]:
+    """Record the enclosed block as a span on the bound trace (detail: the exception type)."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = perf_counter()
+    detail: Optional[str] = None
+    try:
+        yield
+    except BaseException as err:
+        detail = type(err).__name__
+        raise
+    finally:
+        trace.span(name, started, perf_counter(), detail)
@@ -0,0 +1,210 @@
+"""Benchmark per-device coordinator state: parallel dicts vs. DeviceState records.
+
+The coordinator used to keep one dictionary per concern (names, locations,
+presence, cooldowns, cadence, ...). It now keeps one slotted ``DeviceState``
+per device in a ``DeviceStateRegistry``. For ``--devices`` synthetic devices
+(repeated for each size given) this helper prints:
+
+- the memory of the per-device bookkeeping structures (``tracemalloc``; the
+  payload objects such as names and location dicts are shared and excluded);
+- the time of the hot gates as they were and as they are now implemented:
+  presence (``is_device_present``), manual-locate gating
+  (``can_request_location``) and a purge of every device.
+
+Run it from the repository root::
+
+    python script/bench_device_state.py --devices 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.googlefindmy.device_state import (  # noqa: E402
+    DeviceState,
+    DeviceStateRegistry,
+)
+
+_PRESENCE_TTL_S = 120.0
+
+# Former coordinator attributes, in `purge_device` order
+_PARALLEL_DICTS = (
+    "location",
+    "name",
+    "caps",
+    "location_source",
+    "locate_cooldown_until",
+    "sound_request_uuid",
+    "poll_cooldown_until",
+    "next_poll_mono",
+    "last_moved_wall",
+    "stale_strikes",
+    "poll_failures",
+    "present_last_seen",
+)
+
+
+def _payloads(count: int) -> list[dict[str, Any]]:
+    """Return shared per-device values as a steady-state coordinator holds them."""
+
+    now = time.monotonic()
+    return [
+        {
+            "id": f"device-{idx:06d}",
+            "name": f"Tag {idx}",
+            "location": {"latitude": 48.0, "longitude": 11.0, "last_seen": 1.0e9},
+            "caps": {"can_ring": True},
+            "location_source": "poll",
+            "present_last_seen": now,
+            "next_poll_mono": now + 300.0,
+            "last_moved_wall": 1.0e9,
+            "stale_strikes": 0,
+            # Cooldowns, failures and sound UUIDs exist for a minority of devices
+            "locate_cooldown_until": now + 60.0 if idx % 10 == 0 else None,
+            "poll_cooldown_until": now + 60.0 if idx % 10 == 1 else None,
+            "poll_failures": 1 if idx % 20 == 0 else None,
+            "sound_request_uuid": "uuid" if idx % 50 == 0 else None,
+        }
+        for idx in range(count)
+    ]
+
+
+def _build_parallel(payloads: list[dict[str, Any]]) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    dicts: dict[str, dict[str, Any]] = {name: {} for name in _PARALLEL_DICTS}
+    for payload in payloads:
+        for name in _PARALLEL_DICTS:
+            if payload[name] is not None:
+                dicts[name][payload["id"]] = payload[name]
+    return dicts, set()
+
+
+def _build_registry(payloads: list[dict[str, Any]]) -> DeviceStateRegistry:
+    registry = DeviceStateRegistry()
+    for payload in payloads:
+        state = registry.ensure(payload["id"])
+        for name in _PARALLEL_DICTS:
+            if payload[name] is not None:
+                setattr(state, name, payload[name])
+    return registry
+
+
+def _measure_bytes(build: Callable[[], Any]) -> tuple[int, Any]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, built
+
+
+def _parallel_gates(dicts: dict[str, dict[str, Any]], inflight: set[str]) -> Callable[[str], bool]:
+    present = dicts["present_last_seen"]
+    manual = dicts["locate_cooldown_until"]
+    poll = dicts["poll_cooldown_until"]
+
+    def gate(device_id: str) -> bool:
+        now_mono = time.monotonic()
+        ts = present.get(device_id, 0.0)
+        if not ts or (now_mono - float(ts)) > _PRESENCE_TTL_S:
+            return False
+        if device_id in inflight:
+            return False
+        until_manual = manual.get(device_id, 0.0)
+        if until_manual and now_mono < until_manual:
+            return False
+        until_poll = poll.get(device_id, 0.0)
+        return not (until_poll and now_mono < until_poll)
+
+    return gate
+
+
+def _registry_gates(registry: DeviceStateRegistry) -> Callable[[str], bool]:
+    def gate(device_id: str) -> bool:
+        now_mono = time.monotonic()
+        state = registry.get(device_id)
+        if state is None or not state.present_last_seen:
+            return False
+        if (now_mono - state.present_last_seen) > _PRESENCE_TTL_S:
+            return False
+        if state.locate_inflight:
+            return False
+        if state.locate_cooldown_until and now_mono < state.locate_cooldown_until:
+            return False
+        return not (state.poll_cooldown_until and now_mono < state.poll_cooldown_until)
+
+    return gate
+
+
+def _bench(devices: int, repeat: int) -> None:
+    payloads = _payloads(devices)
+    ids = [payload["id"] for payload in payloads]
+
+    parallel_bytes, (dicts, inflight) = _measure_bytes(lambda: _build_parallel(payloads))
+    registry_bytes, registry = _measure_bytes(lambda: _build_registry(payloads))
+
+    def _run_gates(gate: Callable[[str], bool]) -> Callable[[], None]:
+        return lambda: [gate(dev_id) for dev_id in ids]
+
+    gate_parallel = min(timeit.repeat(_run_gates(_parallel_gates(dicts, inflight)), number=1, repeat=repeat))
+    gate_registry = min(timeit.repeat(_run_gates(_registry_gates(registry)), number=1, repeat=repeat))
+
+    def _purge_parallel() -> float:
+        dicts_copy = {name: dict(values) for name, values in dicts.items()}
+        started = time.perf_counter()
+        for dev_id in ids:
+            for values in dicts_copy.values():
+                values.pop(dev_id, None)
+            inflight.discard(dev_id)
+        return time.perf_counter() - started
+
+    def _purge_registry() -> float:
+        registry_copy = _build_registry(payloads)
+        started = time.perf_counter()
+        for dev_id in ids:
+            registry_copy.pop(dev_id)
+        return time.perf_counter() - started
+
+    purge_parallel = min(_purge_parallel() for _ in range(repeat))
+    purge_registry = min(_purge_registry() for _ in range(repeat))
+
+    print(f"\n{devices} devices (DeviceState slots: {len(DeviceState.__slots__)})")
+    print(f"{'variant':<16}{'bytes/dev':>12}{'gate ns/dev':>14}{'purge ns/dev':>15}")
+    for name, size, gate_s, purge_s in (
+        ("parallel dicts", parallel_bytes, gate_parallel, purge_parallel),
+        ("registry", registry_bytes, gate_registry, purge_registry),
+    ):
+        print(
+            f"{name:<16}{size / devices:>12.0f}{gate_s / devices * 1e9:>14.0f}"
+            f"{purge_s / devices * 1e9:>15.0f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-device parallel dicts with DeviceState records."
+    )
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=[1000, 10000], help="device counts to measure"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is shown)")
+    args = parser.parse_args()
+    for devices in args.devices:
+        _bench(devices, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
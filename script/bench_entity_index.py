@@ -0,0 +1,162 @@
+"""Benchmark tracker entity resolution: registry lookups vs. the entity index.
+
+Per snapshot pass the coordinator resolved each cold device's tracker with up
+to two ``async_get_entity_id`` calls (entry-scoped, then legacy unique_id), the
+Google Home filter tried the legacy unique_id (which misses for entry-scoped
+entities) and then two ``hass.states.get`` guesses, and the registry name sync
+looked up the entity before its device. All three now read the coordinator's
+``TrackerEntityIndex``. For each ``--devices`` size this helper registers that
+many trackers in a real Home Assistant Entity Registry and prints the cost of:
+
+- the index rebuild (once per entry setup; events keep it current after that);
+- resolving every device as the snapshot fallback / filter / name sync did it
+  and as they do it now.
+
+Run it from the repository root (requires Home Assistant)::
+
+    python script/bench_entity_index.py --devices 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.config_entries import ConfigEntries, ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from custom_components.googlefindmy.const import DOMAIN  # noqa: E402
+from custom_components.googlefindmy.entity_index import TrackerEntityIndex  # noqa: E402
+
+
+async def _populate(hass: HomeAssistant, devices: int) -> tuple[str, er.EntityRegistry]:
+    entry = ConfigEntry(
+        data={},
+        discovery_keys={},
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        title="bench",
+        unique_id=None,
+        version=1,
+        subentries_data=None,
+    )
+    # Registers the entry so entities can link to it (its setup fails harmlessly).
+    await hass.config_entries.async_add(entry)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    for idx in range(devices):
+        device = dev_reg.async_get_or_create(
+            config_entry_id=entry.entry_id, identifiers={(DOMAIN, f"dev-{idx}")}, name=f"Tag {idx}"
+        )
+        ent_reg.async_get_or_create(
+            "device_tracker",
+            DOMAIN,
+            f"{DOMAIN}_{entry.entry_id}_dev-{idx}",
+            config_entry=entry,
+            device_id=device.id,
+        )
+        # A few other entities per device, as the sensor/button platforms add them
+        for suffix in ("last_seen", "play_sound", "locate"):
+            ent_reg.async_get_or_create(
+                "sensor", DOMAIN, f"{DOMAIN}_{entry.entry_id}_dev-{idx}_{suffix}", config_entry=entry
+            )
+    return entry.entry_id, ent_reg
+
+
+def _bench_size(hass: HomeAssistant, entry_id: str, ent_reg: er.EntityRegistry, devices: int, repeat: int) -> None:
+    ids = [f"dev-{idx}" for idx in range(devices)]
+    states = hass.states
+    index = TrackerEntityIndex(entry_id)
+
+    rebuild = min(timeit.repeat(lambda: index.rebuild(ent_reg), number=1, repeat=repeat))
+
+    def _snapshot_old() -> None:
+        for dev_id in ids:
+            for uid in (f"{DOMAIN}_{entry_id}_{dev_id}", f"{DOMAIN}_{dev_id}"):
+                if ent_reg.async_get_entity_id("device_tracker", DOMAIN, uid):
+                    break
+
+    def _filter_old() -> None:
+        for dev_id in ids:
+            if ent_reg.async_get_entity_id("device_tracker", DOMAIN, f"{DOMAIN}_{dev_id}"):
+                continue
+            if states.get(f"device_tracker.{dev_id.lower().replace(' ', '_')}"):
+                continue
+            states.get(f"device_tracker.{DOMAIN}_{dev_id}")
+
+    def _name_sync_old() -> None:
+        for dev_id in ids:
+            entity_id = ent_reg.async_get_entity_id(
+                "device_tracker", DOMAIN, f"{DOMAIN}_{entry_id}_{dev_id}"
+            )
+            ent = ent_reg.async_get(entity_id)
+            _ = ent.device_id
+
+    def _resolve_new() -> None:
+        for dev_id in ids:
+            index.entity_id(dev_id)
+
+    def _name_sync_new() -> None:
+        for dev_id in ids:
+            index.registry_device_id(dev_id)
+
+    def _best(func: Callable[[], None]) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) / devices * 1e9
+
+    print(f"\n{devices} devices (index rebuild: {rebuild * 1e3:.2f} ms)")
+    print(f"{'path':<18}{'before ns/dev':>15}{'index ns/dev':>14}")
+    for name, old, new in (
+        ("snapshot fallback", _snapshot_old, _resolve_new),
+        ("home filter", _filter_old, _resolve_new),
+        ("name sync", _name_sync_old, _name_sync_new),
+    ):
+        print(f"{name:<18}{_best(old):>15.0f}{_best(new):>14.0f}")
+
+
+async def _run(sizes: list[int], repeat: int) -> None:
+    logging.basicConfig(level=logging.CRITICAL)
+    for devices in sizes:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            loader.async_setup(hass)
+            hass.config_entries = ConfigEntries(hass, {})
+            await hass.config_entries.async_initialize()
+            await dr.async_load(hass)
+            await er.async_load(hass)
+            try:
+                entry_id, ent_reg = await _populate(hass, devices)
+                _bench_size(hass, entry_id, ent_reg, devices, repeat)
+            finally:
+                await hass.async_stop(force=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-device registry lookups with the tracker entity index."
+    )
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=[10, 100, 1000], help="device counts to measure"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is shown)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.devices, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
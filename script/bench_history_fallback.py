@@ -0,0 +1,171 @@
+"""Benchmark the Recorder history fallback: per-device vs. batched lookups.
+
+This helper starts a minimal Home Assistant instance with the real Recorder on a
+synthetic SQLite database, records ``--history`` GPS states for each of
+``--devices`` device_tracker entities (the last state of ``--unavailable`` of
+them is ``unavailable`` without coordinates, as after a restart), and then
+resolves all of them the way the coordinator's cold-start snapshot does:
+
+- ``per-device``: one Recorder executor job and one ``get_last_state_changes``
+  query per entity (the previous implementation);
+- ``batched``: a single executor job running
+  ``_sync_get_last_gps_from_history_batch`` for all entities.
+
+For each variant it prints wall time, executor jobs, SQL statements and how
+many entities were resolved to a GPS fix. Run it from the repository root::
+
+    python script/bench_history_fallback.py --devices 100 --history 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from homeassistant import config_entries, loader  # noqa: E402
+from homeassistant.components.recorder import get_instance  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import recorder as recorder_helper  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from custom_components.googlefindmy.coordinator import (  # noqa: E402
+    _sync_get_last_gps_from_history,
+    _sync_get_last_gps_from_history_batch,
+)
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant core with the Recorder on a SQLite file."""
+
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    recorder_helper.async_initialize_recorder(hass)
+    db_url = f"sqlite:///{Path(config_dir) / 'home-assistant_v2.db'}"
+    if not await async_setup_component(
+        hass, "recorder", {"recorder": {"db_url": db_url, "commit_interval": 0}}
+    ):
+        raise RuntimeError("Recorder setup failed")
+    await hass.async_start()
+    await get_instance(hass).async_db_ready
+    return hass
+
+
+async def _async_populate(
+    hass: HomeAssistant, entity_ids: list[str], history: int, unavailable: int
+) -> None:
+    """Record `history` GPS states per entity; end `unavailable` of them without GPS."""
+
+    recorder = get_instance(hass)
+    for step in range(history):
+        for idx, entity_id in enumerate(entity_ids):
+            hass.states.async_set(
+                entity_id,
+                "not_home",
+                {
+                    "latitude": 48.0 + idx * 0.01 + step * 1e-4,
+                    "longitude": 11.0 + step * 1e-4,
+                    "gps_accuracy": 15,
+                },
+            )
+        await hass.async_block_till_done()
+        await recorder.async_block_till_done()
+    for entity_id in entity_ids[:unavailable]:
+        hass.states.async_set(entity_id, "unavailable", {})
+    await hass.async_block_till_done()
+    await recorder.async_block_till_done()
+
+
+async def _async_measure(
+    hass: HomeAssistant, run: Callable[[], Awaitable[tuple[int, dict[str, Any]]]]
+) -> tuple[float, int, int, int]:
+    """Return (seconds, executor jobs, SQL statements, resolved) for one variant."""
+
+    statements = 0
+
+    def _count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = get_instance(hass).engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        started = time.perf_counter()
+        jobs, found = await run()
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return elapsed, jobs, statements, len(found)
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_start_hass(config_dir)
+        try:
+            recorder = get_instance(hass)
+            entity_ids = [f"device_tracker.bench_tag_{i}" for i in range(args.devices)]
+            print(
+                f"Populating {args.devices} entities x {args.history} states "
+                f"({args.unavailable} ending unavailable)..."
+            )
+            await _async_populate(hass, entity_ids, args.history, args.unavailable)
+
+            async def _per_device() -> tuple[int, dict[str, Any]]:
+                found: dict[str, Any] = {}
+                for entity_id in entity_ids:
+                    fix = await recorder.async_add_executor_job(
+                        _sync_get_last_gps_from_history, hass, entity_id
+                    )
+                    if fix:
+                        found[entity_id] = fix
+                return len(entity_ids), found
+
+            async def _batched() -> tuple[int, dict[str, Any]]:
+                found = await recorder.async_add_executor_job(
+                    _sync_get_last_gps_from_history_batch, hass, entity_ids
+                )
+                return 1, found
+
+            print(f"{'variant':<12}{'best ms':>10}{'jobs':>8}{'SQL':>8}{'resolved':>10}")
+            for name, run in (("per-device", _per_device), ("batched", _batched)):
+                runs = [await _async_measure(hass, run) for _ in range(args.repeat)]
+                best = min(runs, key=lambda r: r[0])
+                print(f"{name:<12}{best[0] * 1000:>10.1f}{best[1]:>8}{best[2]:>8}{best[3]:>10}")
+        finally:
+            await hass.async_stop()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-device and batched Recorder history fallback lookups."
+    )
+    parser.add_argument("--devices", type=int, default=100, help="device_tracker entities")
+    parser.add_argument("--history", type=int, default=20, help="recorded GPS states per entity")
+    parser.add_argument(
+        "--unavailable",
+        type=int,
+        default=20,
+        help="entities whose latest state is 'unavailable' without coordinates",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per variant (best is shown)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    return asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Benchmark publishing a one-device update into the keyed device snapshot.
+
+A push or poll commit merges the entry of one device into the published
+``DeviceSnapshot``. The merge used to copy the entry, version and fingerprint
+maps of the whole fleet; it now publishes a layer holding the changed entry on
+top of the previous snapshot and compacts the layers every
+``_SNAPSHOT_MAX_LAYERS`` merges. For each ``--devices`` size this helper prints
+the mean time of:
+
+- a one-device merge as it was (copy of the three maps, then the update);
+- a one-device merge as it is now (amortized over the periodic compaction);
+- a lookup of an entry through the layers.
+
+Run it from the repository root (requires Home Assistant)::
+
+    python script/bench_snapshot_merge.py --devices 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.googlefindmy.coordinator import DeviceSnapshot  # noqa: E402
+
+
+def _entry(idx: int, latitude: float) -> dict[str, Any]:
+    return {"id": f"device-{idx:06d}", "name": f"Tag {idx}", "latitude": latitude}
+
+
+def _bench(devices: int, number: int) -> None:
+    base = DeviceSnapshot().merge([_entry(idx, 48.0) for idx in range(devices)], replace_all=True)
+    state = {"snapshot": base, "step": 0}
+
+    def _copying_merge() -> None:
+        # The previous implementation: copy the base maps, then apply the update
+        entries, versions, fps = dict(base._entries), dict(base._versions), dict(base._fingerprints)
+        entry = _entry(state["step"] % devices, float(state["step"]))
+        entries[entry["id"]] = entry
+        versions[entry["id"]] = versions.get(entry["id"], 0) + 1
+        fps.pop(entry["id"], None)
+        state["step"] += 1
+
+    def _layered_merge() -> None:
+        step = state["step"]
+        state["snapshot"] = state["snapshot"].merge([_entry(step % devices, float(step))])
+        state["step"] = step + 1
+
+    def _lookup() -> None:
+        state["snapshot"].get(f"device-{devices // 2:06d}")
+
+    copying = timeit.timeit(_copying_merge, number=number) / number
+    layered = timeit.timeit(_layered_merge, number=number) / number
+    lookup = timeit.timeit(_lookup, number=number) / number
+    print(
+        f"{devices:>7} devices: copying merge {copying * 1e6:9.1f} us | "
+        f"layered merge {layered * 1e6:7.1f} us | lookup {lookup * 1e6:5.2f} us"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare copying and layered one-device snapshot merges."
+    )
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=[1000, 10000], help="device counts to measure"
+    )
+    parser.add_argument("--number", type=int, default=2000, help="merges per measurement")
+    args = parser.parse_args()
+    for devices in args.devices:
+        _bench(devices, args.number)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""Benchmark event-loop stalls of snapshot passes: one synchronous stretch vs. chunks.
+
+A full snapshot pass builds one entry per device from the cache, fingerprints the
+entries and merges them into the published snapshot. It used to run as a single
+synchronous stretch on the event loop; it now yields to the loop every
+``snapshot_chunk_size`` devices. For each ``--devices`` size (synthetic fleet,
+every device with a cached fix) this helper runs both variants while a probe task
+measures how long the loop was unable to run anything else, and prints:
+
+- the longest loop stall seen by the probe (the user-visible latency spike);
+- the total pass duration (wall clock, including the yields);
+- the longest slice reported by the pass itself (``max_block_ms`` in diagnostics).
+
+Run it from the repository root (requires Home Assistant)::
+
+    python script/bench_snapshot_slicing.py --devices 1000 5000 --chunk-size 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.googlefindmy.const import DEFAULT_SNAPSHOT_CHUNK_SIZE  # noqa: E402
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator  # noqa: E402
+
+
+def _make_coordinator(devices: int, chunk_size: int) -> tuple[GoogleFindMyCoordinator, list[dict[str, Any]]]:
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.config_entry = None
+    coordinator.data = None
+    coordinator.location_poll_interval = 300
+    coordinator.snapshot_chunk_size = chunk_size
+    coordinator.stats = {"suppressed_updates": 0, "snapshot_block_ms": 0, "snapshot_yields": 0}
+    coordinator._presence_ttl_s = 600
+    coordinator._snapshot_passes = []
+    coordinator._snapshot_pass_info = {}
+    coordinator._api_push_ready = lambda: True
+    coordinator._schedule_stats_persist = lambda: None
+    now, now_mono = time.time(), time.monotonic()
+    listed = []
+    for idx in range(devices):
+        dev_id = f"device-{idx:06d}"
+        listed.append({"id": dev_id, "name": f"Tag {idx}", "can_ring": True})
+        coordinator._device_names[dev_id] = f"Tag {idx}"
+        coordinator._device_location_data[dev_id] = {
+            "latitude": 48.0 + idx * 1e-6,
+            "longitude": 11.0,
+            "accuracy": 10,
+            "last_seen": now,
+            "last_updated": now,
+        }
+        coordinator._present_last_seen[dev_id] = now_mono
+    return coordinator, listed
+
+
+async def _probe(stop: asyncio.Event, gaps: list[float]) -> None:
+    """Record the longest interval in which this task could not run."""
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def _measure(coordinator: GoogleFindMyCoordinator, devices: list[dict[str, Any]], chunked: bool) -> tuple[float, float, float]:
+    # Start from a published snapshot with changed content (worst case: every entry changes)
+    coordinator.data = None
+    stop = asyncio.Event()
+    gaps: list[float] = []
+    probe = asyncio.get_running_loop().create_task(_probe(stop, gaps))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    reported = 0.0
+    if chunked:
+        slicer = coordinator._begin_snapshot_pass()
+        try:
+            entries = await coordinator._async_build_snapshot_from_cache(devices, time.time(), slicer)
+            coordinator.data = await coordinator._async_merge_snapshot(entries, slicer, replace_all=True)
+        finally:
+            coordinator._end_snapshot_pass(slicer, "refresh", len(devices))
+        reported = coordinator.get_snapshot_pass_state()["max_block_ms"]
+    else:
+        entries = coordinator._build_snapshot_from_cache(devices, time.time())
+        coordinator.data = coordinator._merge_snapshot(entries, replace_all=True)
+    total = time.perf_counter() - started
+    stop.set()
+    await probe
+    return max(gaps) * 1e3, total * 1e3, reported
+
+
+async def _run(sizes: list[int], chunk_size: int, repeat: int) -> None:
+    print(f"chunk size {chunk_size}")
+    print(f"{'devices':>8}  {'variant':<12}{'max stall ms':>14}{'pass ms':>10}{'slice ms':>10}")
+    for count in sizes:
+        coordinator, devices = _make_coordinator(count, chunk_size)
+        for name, chunked in (("synchronous", False), ("chunked", True)):
+            runs = [await _measure(coordinator, devices, chunked) for _ in range(repeat)]
+            stall = min(run[0] for run in runs)
+            total = min(run[1] for run in runs)
+            sliced = min(run[2] for run in runs)
+            slice_txt = f"{sliced:>10.2f}" if chunked else f"{'-':>10}"
+            print(f"{count:>8}  {name:<12}{stall:>14.2f}{total:>10.2f}{slice_txt}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare loop stalls of synchronous and chunked snapshot passes."
+    )
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=[1000, 5000], help="fleet sizes to measure"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_SNAPSHOT_CHUNK_SIZE, help="devices per slice"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is shown)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.devices, args.chunk_size, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -305,6 +305,7 @@ def test_locate_button_available_when_push_unready() -> None:
     _ensure_button_dependencies()
     button_module = importlib.import_module("custom_components.googlefindmy.button")
     can_request_location_impl = _load_can_request_location_impl()
+    device_state = importlib.import_module("custom_components.googlefindmy.device_state")
 
     class _CoordinatorStub:
         def __init__(self) -> None:
@@ -313,9 +314,7 @@ def test_locate_button_available_when_push_unready() -> None:
             self.data = [{"id": "device-1", "name": "Tracker"}]
             self._listeners: list[Any] = []
             self._is_polling = False
-            self._locate_inflight: set[str] = set()
-            self._locate_cooldown_until: dict[str, float] = {}
-            self._device_poll_cooldown_until: dict[str, float] = {}
+            self._devices = device_state.DeviceStateRegistry()
             self.can_request_location = MethodType(
                 can_request_location_impl,
                 self,
@@ -0,0 +1,211 @@
+# tests/test_coordinator_device_list_refresh.py
+"""Tests for the adaptive, fingerprint-gated device-list refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+from custom_components.googlefindmy.diagnostics import _freshness_block
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return time.time()
+
+
+def _make_coordinator(devices: list[dict[str, Any]]) -> tuple[GoogleFindMyCoordinator, dict[str, int]]:
+    """Return a coordinator whose API serves `devices` and counts list fetches/rebuilds."""
+
+    calls = {"fetches": 0, "builds": 0, "refreshes": 0}
+
+    async def _device_list() -> list[dict[str, Any]]:
+        calls["fetches"] += 1
+        return [dict(dev) for dev in devices]
+
+    async def _refresh() -> None:
+        calls["refreshes"] += 1
+
+    async def _build(visible: list[dict[str, Any]], **_kwargs: Any) -> list[dict[str, Any]]:
+        calls["builds"] += 1
+        return coordinator._build_snapshot_from_cache(visible, time.time())
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace(
+        async_create_task=lambda coro, name=None: asyncio.get_running_loop().create_task(coro, name=name)
+    )
+    coordinator.api = SimpleNamespace(async_get_basic_device_list=_device_list)
+    coordinator.data = None
+    coordinator.stats = {
+        "device_list_fetches": 0,
+        "device_list_unchanged": 0,
+        "stale_while_revalidate": 0,
+        "revalidation_failures": 0,
+    }
+    coordinator._startup_complete = True
+    coordinator._empty_list_streak = 0
+    coordinator._last_device_list = []
+    coordinator._last_nonempty_wall = 0.0
+    coordinator._present_device_ids = set()
+    coordinator._presence_ttl_s = 120
+    coordinator._device_list_fetched_mono = 0.0
+    coordinator._device_list_interval_s = 60.0
+    coordinator._device_list_refresh_requested = False
+    coordinator._device_list_fp = None
+    coordinator._device_view_fp = None
+    coordinator._device_list_validated_mono = 0.0
+    coordinator._revalidate_task = None
+    coordinator._snapshot_passes = []
+    coordinator._snapshot_pass_info = {}
+    coordinator._revalidate_error = None
+    coordinator._revalidate_auth_failed = None
+    coordinator.async_request_refresh = _refresh  # type: ignore[method-assign]
+    coordinator.note_error = lambda *_args, **_kwargs: None  # type: ignore[method-assign]
+    coordinator._enabled_poll_device_ids = set()
+    coordinator._devices_with_entry = set()
+    coordinator._last_poll_mono = 0.0
+    coordinator._is_polling = True  # poll scheduling is out of scope here
+    coordinator.location_poll_interval = 300
+    coordinator.min_poll_interval = 60
+    coordinator._warm_store = None
+    coordinator._get_ignored_set = lambda: set()  # type: ignore[method-assign]
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    coordinator._async_build_device_snapshot_with_fallbacks = _build  # type: ignore[method-assign]
+    coordinator.increment_stat = lambda name: coordinator.stats.__setitem__(  # type: ignore[method-assign]
+        name, coordinator.stats[name] + 1
+    )
+    return coordinator, calls
+
+
+def _tick(coordinator: GoogleFindMyCoordinator, clock: _FakeClock, seconds: float = 60.0) -> Any:
+    """Run one refresh and let a background revalidation it started finish."""
+
+    async def _run() -> None:
+        coordinator.data = await coordinator._async_update_data()
+        if coordinator._revalidate_task is not None:
+            await coordinator._revalidate_task
+
+    clock.now += seconds
+    asyncio.run(_run())
+    return coordinator.data
+
+
+def test_stable_list_backs_off_and_skips_rebuilds(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Two idle hours of 60s ticks need a handful of list RPCs and one full rebuild."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, calls = _make_coordinator([{"id": "dev-1", "name": "Phone", "can_ring": True}])
+
+    for _ in range(120):
+        snapshot = _tick(coordinator, clock)
+
+    assert calls["builds"] == 1
+    assert calls["fetches"] <= 8  # 60s doubling to the 1h ceiling, vs. 120 before
+    assert coordinator._device_list_interval_s == 3600
+    assert list(snapshot) == ["dev-1"]
+    assert coordinator.is_device_present("dev-1")  # reused list keeps presence fresh
+    assert coordinator.stats["device_list_unchanged"] == calls["fetches"] - 1
+
+
+def test_hint_forces_fetch_and_change_resets_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A refresh request fetches on the next tick; a changed list rebuilds the snapshot."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    devices = [{"id": "dev-1", "name": "Phone"}]
+    coordinator, calls = _make_coordinator(devices)
+    for _ in range(10):
+        _tick(coordinator, clock)
+    fetches = calls["fetches"]
+
+    devices.append({"id": "dev-2", "name": "Keys"})
+    _tick(coordinator, clock)
+    assert calls["fetches"] == fetches  # not due yet: the old list is reused
+
+    coordinator.request_device_list_refresh()
+    snapshot = _tick(coordinator, clock)
+    assert calls["fetches"] == fetches + 1
+    assert list(snapshot) == ["dev-1"]  # cached view served while revalidating
+    assert calls["refreshes"] == 1
+
+    snapshot = _tick(coordinator, clock, 0.0)  # the requested refresh
+    assert calls["builds"] == 2
+    assert sorted(snapshot) == ["dev-1", "dev-2"]
+    assert coordinator._device_names["dev-2"] == "Keys"
+    assert coordinator._device_list_interval_s == 60.0
+
+
+def test_unchanged_list_still_ages_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skipping the rebuild must not freeze the cache-age status of published entries."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, calls = _make_coordinator([{"id": "dev-1", "name": "Phone"}])
+    coordinator._device_location_data["dev-1"] = {
+        "latitude": 1.0,
+        "longitude": 2.0,
+        "last_updated": time.time(),
+    }
+    assert _tick(coordinator, clock)["dev-1"]["status"] == "Location data current"
+
+    coordinator._device_location_data["dev-1"]["last_updated"] = time.time() - 400
+    snapshot = _tick(coordinator, clock)
+
+    assert calls["builds"] == 1
+    assert snapshot["dev-1"]["status"] == "Location data aging"
+    assert snapshot.changed_ids == frozenset({"dev-1"})
+
+
+def test_failed_revalidation_keeps_serving_the_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failing list RPC no longer fails the tick; auth failures surface on the next one."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, calls = _make_coordinator([{"id": "dev-1", "name": "Phone"}])
+    coordinator._device_location_data["dev-1"] = {
+        "latitude": 1.0,
+        "longitude": 2.0,
+        "last_updated": time.time(),
+    }
+    coordinator._device_location_source["dev-1"] = "push"
+    _tick(coordinator, clock)
+
+    async def _broken() -> list[dict[str, Any]]:
+        raise TimeoutError("list RPC too slow")
+
+    coordinator.api.async_get_basic_device_list = _broken
+    coordinator.request_device_list_refresh()
+    snapshot = _tick(coordinator, clock)
+
+    assert snapshot["dev-1"]["latitude"] == 1.0
+    assert snapshot["dev-1"]["location_source"] == "push"
+    assert coordinator.stats["revalidation_failures"] == 1
+    assert coordinator.get_device_list_refresh_state()["last_revalidation_error"] == "TimeoutError"
+    freshness = coordinator.get_device_freshness("dev-1")
+    assert freshness["source"] == "push" and freshness["revalidating"] is False
+    assert freshness["age_s"] is not None and freshness["age_s"] < 5
+    summary = _freshness_block(coordinator)
+    assert summary["by_source"] == {"push": 1} and summary["max_age_s"] < 5
+
+    async def _auth_failed() -> list[dict[str, Any]]:
+        raise coordinator_module.ConfigEntryAuthFailed("token revoked")
+
+    coordinator.api.async_get_basic_device_list = _auth_failed
+    coordinator.request_device_list_refresh()
+    _tick(coordinator, clock)
+    with pytest.raises(coordinator_module.ConfigEntryAuthFailed):
+        _tick(coordinator, clock, 0.0)
@@ -0,0 +1,92 @@
+# tests/test_coordinator_device_state.py
+"""Tests for the per-device state registry behind the coordinator's device maps."""
+
+from __future__ import annotations
+
+import time
+
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+from custom_components.googlefindmy.device_state import DeviceState, DeviceStateRegistry
+
+
+def _make_coordinator() -> GoogleFindMyCoordinator:
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._presence_ttl_s = 120
+    coordinator.config_entry = None
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    return coordinator
+
+
+def test_views_share_one_record_per_device() -> None:
+    """Every per-device map writes into the same slotted record."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_names["dev-1"] = "Phone"
+    coordinator._device_location_data["dev-1"] = {"latitude": 1.0}
+    coordinator._locate_inflight.add("dev-1")
+
+    registry = coordinator._devices
+    assert isinstance(registry, DeviceStateRegistry)
+    assert len(registry) == 1
+    state = registry.get("dev-1")
+    assert isinstance(state, DeviceState)
+    assert (state.name, state.location, state.locate_inflight) == ("Phone", {"latitude": 1.0}, True)
+    assert not hasattr(state, "__dict__")
+
+    coordinator._locate_inflight.discard("dev-1")
+    del coordinator._device_names["dev-1"]
+    assert "dev-1" not in coordinator._device_names
+    assert dict(coordinator._device_location_data) == {"dev-1": {"latitude": 1.0}}
+
+
+def test_assigning_a_dict_replaces_the_field_only() -> None:
+    """`coordinator._x = {...}` keeps the former dict semantics for one concern."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_names = {"dev-1": "Phone", "dev-2": "Keys"}
+    coordinator._device_poll_failures = {"dev-1": 2}
+
+    coordinator._device_poll_failures = {"dev-2": 1}
+
+    assert coordinator._device_poll_failures == {"dev-2": 1}
+    assert coordinator._device_names == {"dev-1": "Phone", "dev-2": "Keys"}
+    coordinator._locate_inflight = {"dev-2"}
+    assert coordinator._locate_inflight == {"dev-2"}
+
+
+def test_gates_read_a_single_record() -> None:
+    """Presence, locate gating and absent-device reporting use the record fields."""
+
+    coordinator = _make_coordinator()
+    now = time.monotonic()
+    coordinator._device_names = {"dev-1": "Phone", "dev-2": "Keys"}
+    coordinator._present_last_seen = {"dev-1": now, "dev-2": now - 600}
+    coordinator._locate_cooldown_until = {"dev-2": now + 60}
+
+    assert coordinator.is_device_present("dev-1")
+    assert not coordinator.is_device_present("dev-2")
+    assert not coordinator.is_device_present("dev-unknown")
+    assert coordinator.get_absent_device_ids() == ["dev-2"]
+    assert coordinator.can_request_location("dev-1")
+    assert not coordinator.can_request_location("dev-2")
+    assert coordinator.can_request_location("dev-unknown")
+    coordinator._locate_inflight.add("dev-1")
+    assert not coordinator.can_request_location("dev-1")
+
+
+def test_clearing_the_last_field_drops_the_record() -> None:
+    """Views do not leave empty records behind; cadence reads the record fields."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_poll_failures["dev-1"] = 1
+    coordinator._locate_inflight.add("dev-1")
+    del coordinator._device_poll_failures["dev-1"]
+    assert "dev-1" in coordinator._devices
+    coordinator._locate_inflight.discard("dev-1")
+    assert "dev-1" not in coordinator._devices
+
+    coordinator._device_names = {"dev-1": "Phone", "dev-2": "Keys"}
+    coordinator._device_stale_strikes = {"dev-2": 2}
+    coordinator._device_names = {}
+    coordinator._device_stale_strikes = {}
+    assert len(coordinator._devices) == 0
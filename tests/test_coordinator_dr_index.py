@@ -0,0 +1,115 @@
+# tests/test_coordinator_dr_index.py
+"""Tests for the incremental Device Registry poll-target index."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.const import DOMAIN
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+
+
+class _Devices(dict):
+    """Registry device map that counts full scans."""
+
+    scans = 0
+
+    def values(self):  # type: ignore[override]
+        type(self).scans += 1
+        return super().values()
+
+
+class _Registry:
+    def __init__(self) -> None:
+        self.devices = _Devices()
+
+    def async_get(self, device_id: str) -> Any:
+        return self.devices.get(device_id)
+
+    def add(self, reg_id: str, dev_id: str, entry_id: str = "entry-1", disabled_by: Any = None) -> None:
+        self.devices[reg_id] = SimpleNamespace(
+            id=reg_id,
+            config_entries={entry_id},
+            identifiers={(DOMAIN, dev_id)},
+            disabled_by=disabled_by,
+            name=dev_id,
+            name_by_user=None,
+        )
+
+
+def _make_coordinator(
+    monkeypatch: pytest.MonkeyPatch, registry: _Registry
+) -> tuple[GoogleFindMyCoordinator, list[None]]:
+    monkeypatch.setattr(coordinator_module.dr, "async_get", lambda _hass: registry)
+    refreshes: list[None] = []
+
+    async def _refresh() -> None:
+        refreshes.append(None)
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace()
+    coordinator.config_entry = SimpleNamespace(entry_id="entry-1", title="Account")
+    coordinator.async_request_refresh = _refresh  # type: ignore[method-assign]
+    coordinator._reindex_poll_targets_from_device_registry()
+    return coordinator, refreshes
+
+
+def _event(coordinator: GoogleFindMyCoordinator, **data: Any) -> bool:
+    """Deliver an event like the bus does: filter first, then the handler."""
+    if not coordinator._dr_event_filter(data):
+        return False
+    asyncio.run(coordinator._handle_dr_event(SimpleNamespace(data=data)))
+    return True
+
+
+def test_filter_drops_unrelated_events() -> None:
+    """Only events that can change this entry's targets reach the handler."""
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._dr_indexed_entry_id = "entry-1"
+    coordinator._dr_index = {"reg-1": "dev-1"}
+
+    check = coordinator._dr_event_filter
+    assert not check({"action": "update", "device_id": "reg-x", "changes": {"name": "old"}})
+    assert not check({"action": "remove", "device_id": "reg-x"})
+    assert not check({"action": "update", "device_id": "reg-1", "changes": {"name_by_user": None}})
+    assert check({"action": "update", "device_id": "reg-1", "changes": {"disabled_by": None}})
+    assert check({"action": "update", "device_id": "reg-x", "changes": {"config_entries": set()}})
+    assert check({"action": "remove", "device_id": "reg-1"})
+    assert check({"action": "create", "device_id": "reg-x"})
+
+
+def test_events_update_targets_without_full_scans(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Create/disable/remove are applied in place; refreshes only follow real changes."""
+
+    registry = _Registry()
+    registry.add("reg-1", "dev-1")
+    registry.add("reg-2", "dev-2", disabled_by="user")
+    registry.add("reg-9", "dev-9", entry_id="entry-other")
+    _Devices.scans = 0
+    coordinator, refreshes = _make_coordinator(monkeypatch, registry)
+    assert coordinator._devices_with_entry == {"dev-1", "dev-2"}
+    assert coordinator._enabled_poll_device_ids == {"dev-1"}
+
+    registry.add("reg-3", "dev-3")
+    _event(coordinator, action="create", device_id="reg-3")
+    assert coordinator._enabled_poll_device_ids == {"dev-1", "dev-3"}
+
+    registry.add("reg-4", "dev-4", entry_id="entry-other")
+    _event(coordinator, action="create", device_id="reg-4")  # another account's device
+
+    registry.devices["reg-1"].disabled_by = "user"
+    _event(coordinator, action="update", device_id="reg-1", changes={"disabled_by": None})
+    assert coordinator._enabled_poll_device_ids == {"dev-3"}
+
+    del registry.devices["reg-2"]
+    _event(coordinator, action="remove", device_id="reg-2")
+    assert coordinator._devices_with_entry == {"dev-1", "dev-3"}
+
+    assert len(refreshes) == 3
+    assert _Devices.scans == 1  # only the initial full index
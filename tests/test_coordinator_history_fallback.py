@@ -0,0 +1,126 @@
+# tests/test_coordinator_history_fallback.py
+"""Tests for the batched Recorder history fallback of cold snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.const import DOMAIN
+from custom_components.googlefindmy.coordinator import (
+    GoogleFindMyCoordinator,
+    _sync_get_last_gps_from_history_batch,
+)
+
+_SEEN = datetime(2024, 2, 6, tzinfo=UTC)
+
+
+def _state(lat: float | None) -> SimpleNamespace:
+    attrs = {} if lat is None else {"latitude": lat, "longitude": 11.0, "gps_accuracy": 20}
+    return SimpleNamespace(attributes=attrs, last_updated=_SEEN)
+
+
+class _EntityRegistry:
+    """Entity registry fake serving tracker entries of one config entry."""
+
+    def __init__(self, mapping: dict[str, str], entry_id: str = "entry-1") -> None:
+        entries = [
+            SimpleNamespace(
+                entity_id=entity_id,
+                platform=DOMAIN,
+                unique_id=unique_id,
+                config_entry_id=entry_id,
+                device_id=None,
+            )
+            for unique_id, entity_id in mapping.items()
+        ]
+        self.entities = SimpleNamespace(get_entries_for_config_entry_id=lambda _entry_id: entries)
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.jobs = 0
+
+    async def async_add_executor_job(self, func: Any, *args: Any) -> Any:
+        self.jobs += 1
+        return func(*args)
+
+
+def test_batch_helper_uses_latest_then_lookback_for_gps_less(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Latest states resolve most entities; only GPS-less ones are queried again."""
+
+    calls: list[list[str]] = []
+    latest = {"device_tracker.a": [_state(48.0)], "device_tracker.b": [_state(None)]}
+    window = {"device_tracker.b": [_state(47.0), _state(47.5), _state(None)]}
+
+    def _fake_significant_states(_hass, _start, _end, entity_ids, **kwargs):
+        calls.append(list(entity_ids))
+        return latest if kwargs["include_start_time_state"] else window
+
+    monkeypatch.setattr(
+        coordinator_module.recorder_history, "get_significant_states", _fake_significant_states
+    )
+
+    found = _sync_get_last_gps_from_history_batch(
+        SimpleNamespace(), ["device_tracker.a", "device_tracker.b", "device_tracker.c"]
+    )
+
+    assert calls == [
+        ["device_tracker.a", "device_tracker.b", "device_tracker.c"],
+        ["device_tracker.b", "device_tracker.c"],
+    ]
+    assert found["device_tracker.a"]["latitude"] == 48.0
+    assert found["device_tracker.b"]["latitude"] == 47.5  # newest GPS-bearing state
+    assert found["device_tracker.b"]["status"] == "Using historical data"
+    assert "device_tracker.c" not in found
+
+
+def test_snapshot_resolves_all_misses_in_one_executor_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache and live-state misses are batched; tracker unique_ids include the entry id."""
+
+    registry = _EntityRegistry(
+        {
+            f"{DOMAIN}_entry-1_dev-1": "device_tracker.dev_1",
+            f"{DOMAIN}_entry-1_dev-2": "device_tracker.dev_2",
+            f"{DOMAIN}_dev-3": "device_tracker.dev_3",  # legacy unique_id
+        }
+    )
+    recorder = _Recorder()
+    batches: list[list[str]] = []
+
+    def _fake_batch(_hass: Any, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+        batches.append(entity_ids)
+        return {"device_tracker.dev_1": {"latitude": 1.0, "longitude": 2.0, "status": "Using historical data"}}
+
+    monkeypatch.setattr(coordinator_module.er, "async_get", lambda _hass: registry)
+    monkeypatch.setattr(coordinator_module, "get_recorder", lambda _hass: recorder)
+    monkeypatch.setattr(coordinator_module, "_sync_get_last_gps_from_history_batch", _fake_batch)
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace(states=SimpleNamespace(get=lambda _eid: None))
+    coordinator.config_entry = SimpleNamespace(entry_id="entry-1")
+    coordinator.allow_history_fallback = True
+    coordinator.location_poll_interval = 300
+    coordinator._device_location_data = {}
+    coordinator.stats = {"history_fallback_used": 0}
+    coordinator.increment_stat = lambda name: coordinator.stats.__setitem__(  # type: ignore[method-assign]
+        name, coordinator.stats[name] + 1
+    )
+
+    snapshot = asyncio.run(
+        coordinator._async_build_device_snapshot_with_fallbacks(
+            [{"id": f"dev-{i}", "name": f"Tag {i}"} for i in range(1, 5)]
+        )
+    )
+
+    assert recorder.jobs == 1
+    assert batches == [["device_tracker.dev_1", "device_tracker.dev_2", "device_tracker.dev_3"]]
+    assert [entry["id"] for entry in snapshot] == ["dev-1", "dev-2", "dev-3", "dev-4"]
+    assert snapshot[0]["latitude"] == 1.0
+    assert snapshot[1]["status"] == "Waiting for location poll"
+    assert coordinator.stats["history_fallback_used"] == 1
@@ -0,0 +1,87 @@
+# tests/test_coordinator_keyed_snapshot.py
+"""Tests for the copy-on-write keyed device snapshot."""
+
+from __future__ import annotations
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.coordinator import DeviceSnapshot
+
+
+def _entry(dev_id: str, **extra: object) -> dict[str, object]:
+    return {"id": dev_id, "name": dev_id.upper(), **extra}
+
+
+def test_partial_merge_reuses_unchanged_entries() -> None:
+    """Partial merges replace only the given ids and keep other entry objects."""
+
+    base = DeviceSnapshot().merge([_entry("a"), _entry("b")], replace_all=True)
+    entry_b = base["b"]
+
+    merged = base.merge([_entry("a", latitude=1.0)])
+
+    assert set(merged) == {"a", "b"}
+    assert merged["b"] is entry_b
+    assert merged["a"]["latitude"] == 1.0
+    assert merged.changed_ids == frozenset({"a"})
+    assert merged.version("a") == base.version("a") + 1
+    assert merged.version("b") == base.version("b")
+    # The previous snapshot is never mutated.
+    assert "latitude" not in base["a"]
+
+
+def test_full_merge_drops_missing_devices() -> None:
+    """A full refresh removes devices absent from the new list and reports them."""
+
+    base = DeviceSnapshot().merge([_entry("a"), _entry("b")], replace_all=True)
+    merged = base.merge([_entry("a")], replace_all=True)
+
+    assert list(merged) == ["a"]
+    assert merged.changed_ids == frozenset({"a", "b"})
+    assert merged.version("b") == 0
+
+
+def test_removed_and_with_changed() -> None:
+    """Purges drop a device; with_changed flags ids without new entries."""
+
+    base = DeviceSnapshot().merge([_entry("a"), _entry("b")], replace_all=True)
+
+    purged = base.merge((), removed=("a",))
+    assert list(purged) == ["b"]
+    assert purged.changed_ids == frozenset({"a"})
+
+    flagged = purged.with_changed(("b",))
+    assert flagged["b"] is purged["b"]
+    assert flagged.version("b") == purged.version("b")
+    assert flagged.changed_ids == frozenset({"b"})
+
+
+def test_partial_merges_layer_on_the_base_and_compact() -> None:
+    """One-device updates store only that device; deep or wide merges are flattened."""
+
+    ids = [f"dev-{idx}" for idx in range(100)]
+    base = DeviceSnapshot().merge([_entry(dev_id) for dev_id in ids], replace_all=True)
+
+    snapshot = base
+    for step in range(coordinator_module._SNAPSHOT_MAX_LAYERS):
+        snapshot = snapshot.merge([_entry("dev-1", latitude=float(step))], removed=("dev-2",))
+        assert len(snapshot._entries) == 1  # the layer holds the changed entry only
+    snapshot = snapshot.merge([_entry("new", latitude=0.0)])
+    assert snapshot._parent is None  # compacted after the maximum number of layers
+
+    assert len(snapshot) == 100
+    assert list(snapshot) == [dev_id for dev_id in ids if dev_id != "dev-2"] + ["new"]
+    assert snapshot["dev-1"]["latitude"] == float(coordinator_module._SNAPSHOT_MAX_LAYERS - 1)
+    assert snapshot.version("dev-1") == base.version("dev-1") + coordinator_module._SNAPSHOT_MAX_LAYERS
+    assert "dev-2" not in snapshot
+    assert snapshot["dev-3"] is base["dev-3"]
+
+    wide = snapshot.merge([_entry(dev_id, latitude=1.0) for dev_id in ids[3:63]])
+    assert wide._parent is None
+    assert len(wide) == 100
+
+    layered = base.merge([_entry("dev-9", latitude=1.0)], removed=("dev-0",))
+    assert layered._parent is base
+    assert list(layered.changed_entries()) == [layered["dev-9"]]
+    assert dict(layered.items()) == {
+        dev_id: layered[dev_id] for dev_id in ids if dev_id != "dev-0"
+    }
@@ -0,0 +1,69 @@
+# tests/test_coordinator_listener_fanout.py
+"""Tests for per-device listener fan-out on the coordinator."""
+
+from __future__ import annotations
+
+from custom_components.googlefindmy.coordinator import (
+    DeviceSnapshot,
+    GoogleFindMyCoordinator,
+)
+from custom_components.googlefindmy.latency import PipelineLatency
+from custom_components.googlefindmy.tracing import TraceBuffer
+
+
+def _make_coordinator() -> tuple[GoogleFindMyCoordinator, list[str]]:
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    calls: list[str] = []
+    coordinator._listeners = {
+        1: (lambda: calls.append("platform"), None),
+        2: (lambda: calls.append("dev-a"), "dev-a"),
+        3: (lambda: calls.append("dev-b"), "dev-b"),
+    }
+    coordinator.last_update_success = True
+    coordinator._fanout_last_success = True
+    coordinator._pipeline_latency = PipelineLatency()
+    coordinator._locate_traces = TraceBuffer()
+    coordinator.data = DeviceSnapshot().merge(
+        [{"id": "dev-a"}, {"id": "dev-b"}], replace_all=True
+    )
+    return coordinator, calls
+
+
+def test_only_changed_device_listeners_are_called() -> None:
+    """A partial publish wakes context-free listeners and the changed device only."""
+
+    coordinator, calls = _make_coordinator()
+    coordinator.data = coordinator.data.merge([{"id": "dev-b", "latitude": 1.0}])
+
+    coordinator.async_update_listeners()
+
+    assert calls == ["platform", "dev-b"]
+
+
+def test_update_failure_and_recovery_notify_everyone() -> None:
+    """Availability flips (last_update_success) must reach all entities."""
+
+    coordinator, calls = _make_coordinator()
+    coordinator.data = coordinator.data.with_changed(())
+
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert calls == ["platform", "dev-a", "dev-b"]
+
+    calls.clear()
+    coordinator.last_update_success = True
+    coordinator.async_update_listeners()
+    assert calls == ["platform", "dev-a", "dev-b"]
+
+    calls.clear()
+    coordinator.async_update_listeners()
+    assert calls == ["platform"]
+
+
+def test_snapshot_entry_lookup() -> None:
+    """Entities resolve their own entry by id without scanning the snapshot."""
+
+    coordinator, _ = _make_coordinator()
+
+    assert coordinator.get_device_snapshot_entry("dev-a") == {"id": "dev-a"}
+    assert coordinator.get_device_snapshot_entry("missing") is None
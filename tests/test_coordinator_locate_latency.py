@@ -0,0 +1,58 @@
+# tests/test_coordinator_locate_latency.py
+"""Tests for adaptive locate timeouts derived from observed latencies."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.googlefindmy.coordinator import LocateLatencyTracker
+
+
+def test_unknown_device_without_samples_uses_max_timeout() -> None:
+    """No evidence yet: keep the legacy worst-case timeout."""
+
+    tracker = LocateLatencyTracker(min_s=10.0, max_s=30.0)
+    assert tracker.timeout_for("dev-1") == pytest.approx(30.0)
+
+
+def test_fast_device_gets_short_timeout_bounded_by_min() -> None:
+    """Consistently fast answers shrink the timeout down to the lower bound."""
+
+    tracker = LocateLatencyTracker(min_s=10.0, max_s=30.0)
+    for _ in range(5):
+        tracker.observe("dev-1", 2.0)
+    assert tracker.timeout_for("dev-1") == pytest.approx(10.0)
+
+    tracker.observe("dev-2", 5.0)  # first sample: 5 + 4 * 2.5 = 15
+    assert tracker.timeout_for("dev-2") == pytest.approx(15.0)
+
+
+def test_global_percentile_covers_devices_without_history() -> None:
+    """With enough samples, unknown devices use p95 * margin instead of the maximum."""
+
+    tracker = LocateLatencyTracker(min_s=5.0, max_s=60.0)
+    for latency in (4.0, 5.0, 6.0, 8.0, 12.0):
+        tracker.observe("dev-1", latency)
+    assert tracker.percentile(0.95) == pytest.approx(12.0)
+    assert tracker.timeout_for("dev-new") == pytest.approx(18.0)
+
+
+def test_repeated_timeouts_enable_fast_fail_with_periodic_full_probe() -> None:
+    """Unlikely devices get the short timeout, with every Nth attempt at full length."""
+
+    tracker = LocateLatencyTracker(min_s=10.0, max_s=30.0)
+    for _ in range(3):
+        tracker.observe_timeout("dev-1")
+    assert tracker.is_unlikely("dev-1")
+
+    timeouts = []
+    for _ in range(4):
+        timeouts.append(tracker.timeout_for("dev-1"))
+        tracker.observe_timeout("dev-1")
+    assert timeouts == [10.0, 10.0, 10.0, 30.0]
+
+    tracker.observe("dev-1", 3.0)
+    assert not tracker.is_unlikely("dev-1")
+    state = tracker.as_dict()
+    assert state["devices_fast_fail"] == 0
+    assert state["samples"] == 1
@@ -0,0 +1,134 @@
+# tests/test_coordinator_poll_cadence.py
+"""Tests for the movement- and zone-aware per-device poll cadence."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.googlefindmy.const import OPT_DEVICE_POLL_OVERRIDES
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+
+_HOME = {"latitude": 52.52, "longitude": 13.405, "radius": 100.0}
+
+
+class _HomeFilter:
+    def get_home_zone_attributes(self) -> dict[str, float]:
+        return dict(_HOME)
+
+
+def _make_coordinator(overrides: dict[str, int] | None = None) -> GoogleFindMyCoordinator:
+    """Return a lightweight coordinator with only the cadence state initialised."""
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.location_poll_interval = 300
+    coordinator.min_poll_interval = 60
+    coordinator._movement_threshold = 50
+    coordinator._device_names = {"dev-1": "Phone"}
+    coordinator._device_location_data = {}
+    coordinator._device_next_poll_mono = {}
+    coordinator._device_last_moved_wall = {}
+    coordinator._device_stale_strikes = {}
+    coordinator.google_home_filter = _HomeFilter()
+    coordinator.config_entry = SimpleNamespace(
+        options={OPT_DEVICE_POLL_OVERRIDES: overrides or {}}
+    )
+    coordinator.update_settings(device_poll_overrides=overrides or {})
+    return coordinator
+
+
+def _fix(lat: float, lon: float, *, age_s: float = 0.0) -> dict[str, float]:
+    return {"latitude": lat, "longitude": lon, "accuracy": 10.0, "last_seen": time.time() - age_s}
+
+
+def test_unknown_device_uses_base_interval() -> None:
+    """Without history a device is polled at the configured interval."""
+
+    coordinator = _make_coordinator()
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(300.0)
+
+
+def test_stationary_at_home_is_polled_rarely() -> None:
+    """A fix inside zone.home slows the cadence down."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_location_data["dev-1"] = _fix(52.5201, 13.4051)
+    assert coordinator._device_cadence_mode("dev-1") == "home"
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(1200.0)
+
+
+def test_movement_speeds_up_cadence_but_not_below_min() -> None:
+    """A fix beyond the movement threshold marks the device as moving."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_location_data["dev-1"] = _fix(52.5201, 13.4051)
+    new_fix = _fix(52.53, 13.42)
+    coordinator._note_device_fix("dev-1", new_fix)
+    coordinator._device_location_data["dev-1"] = new_fix
+
+    assert coordinator._device_cadence_mode("dev-1") == "moving"
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(150.0)
+
+    coordinator.location_poll_interval = 100
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(60.0)
+
+
+def test_stale_device_backs_off_and_recovers_on_fresh_fix() -> None:
+    """Polls without newer data for an old report double the interval each time."""
+
+    coordinator = _make_coordinator()
+    coordinator._device_location_data["dev-1"] = _fix(48.0, 11.0, age_s=24 * 3600)
+
+    coordinator._schedule_next_device_poll("dev-1", fresh=False)
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(600.0)
+    coordinator._schedule_next_device_poll("dev-1", fresh=False)
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(1200.0)
+    assert coordinator._device_next_poll_mono["dev-1"] > time.monotonic() + 1000
+
+    for _ in range(20):
+        coordinator._schedule_next_device_poll("dev-1", fresh=False)
+    assert coordinator._device_poll_interval("dev-1") <= 6 * 3600
+
+    coordinator._note_device_fix("dev-1", _fix(48.0, 11.0))
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(300.0)
+
+
+def test_override_wins_and_is_counted_separately() -> None:
+    """A user override replaces the cadence model (still bounded by min_poll_interval)."""
+
+    coordinator = _make_coordinator({"dev-1": 30})
+    coordinator._device_location_data["dev-1"] = _fix(52.5201, 13.4051)
+
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(60.0)
+    assert coordinator.get_poll_cadence_summary() == {
+        "moving": 0,
+        "home": 0,
+        "stale": 0,
+        "normal": 0,
+        "override": 1,
+    }
+
+
+def test_overrides_are_parsed_once_and_refreshed_when_set() -> None:
+    """Options are not re-read per device; setting an override refreshes the cache."""
+
+    coordinator = _make_coordinator({"dev-1": "600", "dev-2": "x", "dev-3": 0})
+    assert coordinator._get_poll_overrides() == {"dev-1": 600}
+
+    updates: list[dict[str, object]] = []
+
+    def _update_entry(entry: SimpleNamespace, *, options: dict[str, object]) -> None:
+        updates.append(options)
+        entry.options = options
+
+    coordinator.hass = SimpleNamespace(config_entries=SimpleNamespace(async_update_entry=_update_entry))
+    coordinator.config_entry.options = {}  # ignored until the next setting change
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(600.0)
+
+    coordinator.set_device_poll_override("dev-1", None)
+    coordinator.set_device_poll_override("dev-2", 120)
+    assert coordinator._get_poll_overrides() == {"dev-2": 120}
+    assert updates[-1][OPT_DEVICE_POLL_OVERRIDES] == {"dev-2": 120}
+    assert coordinator._device_poll_interval("dev-1") == pytest.approx(300.0)
@@ -0,0 +1,171 @@
+# tests/test_coordinator_poll_cycle_resume.py
+"""Tests for staleness-ordered, budgeted and resumable poll cycles."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.const import OPT_DEVICE_POLL_OVERRIDES
+from custom_components.googlefindmy.coordinator import (
+    GoogleFindMyCoordinator,
+    LocateLatencyTracker,
+    PollSpacingController,
+)
+from custom_components.googlefindmy.NovaApi.nova_request import NovaRateLimitError
+from custom_components.googlefindmy.latency import PipelineLatency
+from custom_components.googlefindmy.request_governor import RequestDispatcher
+from custom_components.googlefindmy.tracing import TraceBuffer
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when a locate is performed."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return time.time()
+
+
+def _make_coordinator(clock: _FakeClock, budget_s: int) -> tuple[GoogleFindMyCoordinator, list[str]]:
+    """Return a coordinator whose API records the poll order and costs 60s per locate."""
+
+    polled: list[str] = []
+
+    async def _locate(dev_id: str, _name: str, **_kwargs: Any) -> dict[str, Any]:
+        polled.append(dev_id)
+        clock.now += 60.0
+        return {}
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace()
+    coordinator.api = SimpleNamespace(async_get_device_location=_locate)
+    coordinator.poll_cycle_budget_s = budget_s
+    coordinator.location_poll_interval = 300
+    coordinator.min_poll_interval = 60
+    coordinator.config_entry = SimpleNamespace(options={OPT_DEVICE_POLL_OVERRIDES: {}})
+    coordinator._poll_overrides = {}
+    coordinator._poll_lock = asyncio.Lock()
+    coordinator._is_polling = False
+    coordinator._poll_spacing = PollSpacingController(0, 0, 0)
+    coordinator._locate_latency = LocateLatencyTracker()
+    coordinator._dispatcher = RequestDispatcher()
+    coordinator._pipeline_latency = PipelineLatency()
+    coordinator._locate_traces = TraceBuffer()
+    coordinator._locate_inflight = set()
+    coordinator._poll_carryover = []
+    coordinator._device_poll_failures = {}
+    coordinator._device_names = {f"dev-{i}": f"Tag {i}" for i in range(1, 5)}
+    coordinator._device_location_data = {}
+    coordinator._device_next_poll_mono = {}
+    coordinator._device_last_moved_wall = {}
+    coordinator._device_stale_strikes = {}
+    coordinator.stats = {"poll_budget_exhausted": 0}
+    coordinator.performance_metrics = {}
+    coordinator._is_fcm_ready_soft = lambda: True  # type: ignore[method-assign]
+    coordinator._fcm_defer_started_mono = 0.0
+
+    async def _no_governor() -> None:
+        return None
+
+    coordinator._async_get_request_governor = _no_governor  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    coordinator.note_error = lambda *_args, **_kwargs: None  # type: ignore[method-assign]
+    coordinator._build_snapshot_from_cache = lambda devices, wall_now: []  # type: ignore[method-assign]
+    coordinator._merge_snapshot = lambda entries, **_kwargs: entries  # type: ignore[method-assign]
+    coordinator._snapshot_passes = []
+    coordinator._snapshot_pass_info = {}
+    coordinator.async_set_updated_data = lambda _data: None  # type: ignore[method-assign]
+    coordinator.increment_stat = lambda name: coordinator.stats.__setitem__(  # type: ignore[method-assign]
+        name, coordinator.stats.get(name, 0) + 1
+    )
+    return coordinator, polled
+
+
+def _devices(*ids: str) -> list[dict[str, str]]:
+    return [{"id": dev_id, "name": dev_id} for dev_id in ids]
+
+
+def test_targets_are_ordered_by_staleness_failures_and_overrides() -> None:
+    """Oldest fixes go first; failures demote, user overrides promote."""
+
+    coordinator, _ = _make_coordinator(_FakeClock(), 0)
+    now = time.time()
+    coordinator._device_location_data = {
+        "dev-1": {"last_seen": now - 100},
+        "dev-2": {"last_seen": now - 1000},
+        "dev-3": {"last_seen": now - 3000},
+        "dev-4": {"last_seen": now - 400},
+    }
+    coordinator._device_poll_failures = {"dev-3": 2}  # 3000s / 4 = 750s
+    coordinator.update_settings(device_poll_overrides={"dev-4": 600})  # 400s * 2 = 800s
+
+    ordered = coordinator._order_poll_targets(_devices("dev-1", "dev-2", "dev-3", "dev-4"))
+    assert [d["id"] for d in ordered] == ["dev-2", "dev-4", "dev-3", "dev-1"]
+
+
+def test_budget_stops_cycle_and_next_cycle_resumes_tail(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The unpolled tail is carried over and polled first by the next cycle."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, polled = _make_coordinator(clock, budget_s=100)
+    devices = _devices("dev-1", "dev-2", "dev-3", "dev-4")
+
+    asyncio.run(coordinator._async_start_poll_cycle(devices))
+    assert polled == ["dev-1", "dev-2"]
+    assert coordinator._poll_carryover == ["dev-3", "dev-4"]
+    assert coordinator.stats["poll_budget_exhausted"] == 1
+
+    polled.clear()
+    asyncio.run(coordinator._async_start_poll_cycle(devices))
+    assert polled[:2] == ["dev-3", "dev-4"]
+
+
+def test_cancelled_cycle_keeps_remaining_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cancellation mid-cycle (e.g. unload) carries the current and later devices over."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, polled = _make_coordinator(clock, budget_s=0)
+
+    async def _locate(dev_id: str, _name: str, **_kwargs: Any) -> dict[str, Any]:
+        polled.append(dev_id)
+        if dev_id == "dev-2":
+            raise asyncio.CancelledError
+        return {}
+
+    coordinator.api = SimpleNamespace(async_get_device_location=_locate)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(coordinator._async_start_poll_cycle(_devices("dev-1", "dev-2", "dev-3")))
+    assert coordinator._poll_carryover == ["dev-2", "dev-3"]
+
+
+def test_throttled_locate_widens_spacing_and_counts_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A throttle from the API reaches the poll loop instead of reading as "no location"."""
+
+    clock = _FakeClock()
+    monkeypatch.setattr(coordinator_module, "time", clock)
+    coordinator, polled = _make_coordinator(clock, budget_s=0)
+    coordinator._poll_spacing = PollSpacingController(2.0, 1.0, 60.0)
+
+    async def _locate(dev_id: str, _name: str, **_kwargs: Any) -> dict[str, Any]:
+        polled.append(dev_id)
+        raise NovaRateLimitError("RESOURCE_EXHAUSTED")
+
+    coordinator.api = SimpleNamespace(async_get_device_location=_locate)
+
+    asyncio.run(coordinator._async_start_poll_cycle(_devices("dev-1")))
+    assert polled == ["dev-1"]
+    assert coordinator._poll_spacing.spacing_s == pytest.approx(4.0)
+    assert coordinator._device_poll_failures == {"dev-1": 1}
@@ -0,0 +1,38 @@
+# tests/test_coordinator_poll_spacing.py
+"""Tests for the AIMD inter-device poll spacing controller."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.googlefindmy.coordinator import PollSpacingController
+
+
+def test_fast_successes_shrink_additively_to_min() -> None:
+    """Each fast locate removes a fixed step until the lower bound."""
+
+    ctrl = PollSpacingController(2.0, 1.0, 60.0)
+    assert ctrl.on_success(1.0) == pytest.approx(1.5)
+    assert ctrl.on_success(1.0) == pytest.approx(1.0)
+    assert ctrl.on_success(1.0) == pytest.approx(1.0)
+
+
+def test_slow_success_holds_and_failure_backs_off_multiplicatively() -> None:
+    """Slow answers keep the spacing; failures double it up to the upper bound."""
+
+    ctrl = PollSpacingController(5.0, 1.0, 12.0)
+    assert ctrl.on_success(25.0) == pytest.approx(5.0)
+    assert ctrl.on_failure() == pytest.approx(10.0)
+    assert ctrl.on_failure() == pytest.approx(12.0)
+
+
+def test_zero_spacing_can_recover_and_bounds_are_applied() -> None:
+    """A zero spacing still grows on failure; reconfigure clamps into new bounds."""
+
+    ctrl = PollSpacingController(0.0, 0.0, 60.0)
+    assert ctrl.on_failure() > 0.0
+
+    ctrl.reconfigure(3.0, 4.0, initial_s=10.0)
+    assert ctrl.spacing_s == pytest.approx(4.0)
+    ctrl.reconfigure(5.0, 2.0)
+    assert (ctrl.min_s, ctrl.max_s, ctrl.spacing_s) == (5.0, 5.0, 5.0)
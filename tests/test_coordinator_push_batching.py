@@ -0,0 +1,123 @@
+# tests/test_coordinator_push_batching.py
+"""Tests for micro-batched snapshot publishing on the coordinator push path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy.coordinator import (
+    DeviceSnapshot,
+    GoogleFindMyCoordinator,
+)
+
+
+def _make_coordinator(window_s: float) -> tuple[GoogleFindMyCoordinator, list[DeviceSnapshot]]:
+    """Return a lightweight coordinator that records every published snapshot."""
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace()
+    coordinator.push_batch_window_s = window_s
+    coordinator._push_pending_ids = set()
+    coordinator._push_flush_cancel = None
+    coordinator._device_names = {"dev-1": "Phone", "dev-2": "Keys", "dev-3": "Wallet"}
+    coordinator._device_location_data = {}
+    coordinator._present_last_seen = {}
+    coordinator._last_poll_mono = 0.0
+    coordinator._presence_ttl_s = 120
+    coordinator._device_caps = {}
+    coordinator._locate_inflight = set()
+    coordinator._locate_cooldown_until = {}
+    coordinator._device_poll_cooldown_until = {}
+    coordinator._device_next_poll_mono = {}
+    coordinator._poll_overrides = {}
+    coordinator._device_last_moved_wall = {}
+    coordinator._device_stale_strikes = {}
+    coordinator.location_poll_interval = 300
+    coordinator.min_poll_interval = 60
+    coordinator.stats = {"push_updates_coalesced": 0, "suppressed_updates": 0}
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    coordinator._is_on_hass_loop = lambda: True  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    coordinator._get_ignored_set = lambda: set()  # type: ignore[method-assign]
+
+    published: list[DeviceSnapshot] = []
+
+    def _publish(snapshot: DeviceSnapshot) -> None:
+        coordinator.data = snapshot
+        published.append(snapshot)
+
+    coordinator.async_set_updated_data = _publish  # type: ignore[method-assign]
+    return coordinator, published
+
+
+def _capture_call_later(
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[tuple[float, Callable[[Any], None]]]:
+    scheduled: list[tuple[float, Callable[[Any], None]]] = []
+
+    def _fake_call_later(hass: Any, delay: float, action: Callable[[Any], None]) -> Callable[[], None]:
+        scheduled.append((delay, action))
+        return lambda: None
+
+    monkeypatch.setattr(
+        "custom_components.googlefindmy.coordinator.async_call_later", _fake_call_later
+    )
+    return scheduled
+
+
+def test_burst_of_pushes_publishes_one_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pushes inside one window must result in a single publish covering all ids."""
+
+    scheduled = _capture_call_later(monkeypatch)
+    coordinator, published = _make_coordinator(0.25)
+
+    coordinator.push_updated(["dev-1"])
+    coordinator.push_updated(["dev-2"])
+    coordinator.push_updated(["dev-1", "dev-3"])
+
+    assert published == []
+    assert len(scheduled) == 1
+    assert scheduled[0][0] == pytest.approx(0.25)
+    assert coordinator.stats["push_updates_coalesced"] == 2
+
+    scheduled[0][1](None)
+
+    assert len(published) == 1
+    assert set(published[0]) == {"dev-1", "dev-2", "dev-3"}
+    assert coordinator._push_pending_ids == set()
+    assert coordinator._push_flush_cancel is None
+
+
+def test_full_push_absorbs_pending_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A full push publishes immediately and cancels the pending batch."""
+
+    scheduled = _capture_call_later(monkeypatch)
+    coordinator, published = _make_coordinator(0.25)
+
+    coordinator.push_updated(["dev-1"])
+    coordinator.push_updated()
+
+    assert len(published) == 1
+    assert set(published[0]) == {"dev-1", "dev-2", "dev-3"}
+    assert coordinator._push_pending_ids == set()
+
+    # A late timer callback must not publish an empty snapshot.
+    scheduled[0][1](None)
+    assert len(published) == 1
+
+
+def test_zero_window_publishes_immediately(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batching disabled keeps the legacy one-publish-per-push behaviour."""
+
+    scheduled = _capture_call_later(monkeypatch)
+    coordinator, published = _make_coordinator(0.0)
+
+    coordinator.push_updated(["dev-1"])
+    coordinator.push_updated(["dev-2"])
+
+    assert scheduled == []
+    assert [set(snap.changed_ids) for snap in published] == [{"dev-1"}, {"dev-2"}]
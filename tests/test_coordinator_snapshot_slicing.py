@@ -0,0 +1,89 @@
+# tests/test_coordinator_snapshot_slicing.py
+"""Tests for cooperative (chunked) snapshot passes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from custom_components.googlefindmy.coordinator import DeviceSnapshot, GoogleFindMyCoordinator
+
+
+def _make_coordinator(devices: int, chunk_size: int) -> GoogleFindMyCoordinator:
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.config_entry = None
+    coordinator.data = None
+    coordinator.location_poll_interval = 300
+    coordinator.snapshot_chunk_size = chunk_size
+    coordinator.stats = {"suppressed_updates": 0, "snapshot_block_ms": 0, "snapshot_yields": 0}
+    coordinator._presence_ttl_s = 120
+    coordinator._snapshot_passes = []
+    coordinator._snapshot_pass_info = {}
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    now = time.time()
+    for idx in range(devices):
+        coordinator._device_location_data[f"dev-{idx}"] = {
+            "latitude": 1.0,
+            "longitude": float(idx),
+            "last_seen": now,
+            "last_updated": now,
+        }
+    return coordinator
+
+
+def test_pass_yields_every_chunk_and_records_blocking() -> None:
+    """A 100-device pass with chunk size 10 yields between chunks and reports its slices."""
+
+    coordinator = _make_coordinator(100, chunk_size=10)
+    devices = [{"id": f"dev-{idx}", "name": f"Tag {idx}"} for idx in range(100)]
+
+    async def _run() -> DeviceSnapshot:
+        slicer = coordinator._begin_snapshot_pass()
+        try:
+            entries = await coordinator._async_build_snapshot_from_cache(devices, time.time(), slicer)
+            return await coordinator._async_merge_snapshot(entries, slicer, replace_all=True)
+        finally:
+            coordinator._end_snapshot_pass(slicer, "refresh", len(devices))
+
+    snapshot = asyncio.run(_run())
+
+    assert len(snapshot) == 100
+    state = coordinator.get_snapshot_pass_state()
+    assert state["yields"] == 20  # 10 build chunks + 10 fingerprint chunks
+    assert coordinator.stats["snapshot_yields"] == 20
+    assert 0.0 <= state["max_block_ms"] <= state["block_ms"]
+    assert coordinator._snapshot_passes == []
+
+
+def test_publish_during_a_yield_is_not_overwritten() -> None:
+    """A device committed by another path mid-pass keeps its newer entry."""
+
+    coordinator = _make_coordinator(30, chunk_size=10)
+    devices = [{"id": f"dev-{idx}", "name": f"Tag {idx}"} for idx in range(30)]
+
+    async def _push_dev_0() -> None:
+        await asyncio.sleep(0)  # runs while the pass yields after its first chunk
+        coordinator._device_location_data["dev-0"] = {
+            "latitude": 9.0,
+            "longitude": 9.0,
+            "last_seen": time.time(),
+            "last_updated": time.time(),
+        }
+        entries = coordinator._build_snapshot_from_cache(devices[:1], time.time())
+        coordinator.data = coordinator._merge_snapshot(entries)
+
+    async def _run() -> DeviceSnapshot:
+        slicer = coordinator._begin_snapshot_pass()
+        push = asyncio.get_running_loop().create_task(_push_dev_0())
+        try:
+            entries = await coordinator._async_build_snapshot_from_cache(devices, time.time(), slicer)
+            await push
+            return await coordinator._async_merge_snapshot(entries, slicer, replace_all=True)
+        finally:
+            coordinator._end_snapshot_pass(slicer, "refresh", len(devices))
+
+    snapshot = asyncio.run(_run())
+
+    assert snapshot["dev-0"]["latitude"] == 9.0
+    assert len(snapshot) == 30
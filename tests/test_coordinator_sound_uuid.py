@@ -7,6 +7,7 @@ from types import SimpleNamespace
 import pytest
 
 from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+from custom_components.googlefindmy.request_governor import RequestDispatcher
 
 
 @pytest.mark.asyncio
@@ -14,6 +15,7 @@ async def test_async_play_sound_stores_uuid() -> None:
     """Play sound should cache the returned request UUID per device."""
 
     coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._dispatcher = RequestDispatcher()  # type: ignore[attr-defined]
     coordinator._sound_request_uuids = {}  # type: ignore[attr-defined]
     coordinator.can_play_sound = lambda _device_id: True  # type: ignore[assignment]
     coordinator._note_push_transport_problem = lambda: None  # type: ignore[attr-defined]
@@ -39,6 +41,7 @@ async def test_async_stop_sound_uses_cached_uuid() -> None:
     """Stop sound should look up a cached UUID when none is provided."""
 
     coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._dispatcher = RequestDispatcher()  # type: ignore[attr-defined]
     coordinator._sound_request_uuids = {"device-1": "uuid-1"}  # type: ignore[attr-defined]
     coordinator._note_push_transport_problem = lambda: None  # type: ignore[attr-defined]
     coordinator._set_auth_state = lambda **kwargs: None  # type: ignore[attr-defined]
@@ -64,6 +67,7 @@ async def test_async_stop_sound_warns_when_uuid_missing(caplog: pytest.LogCaptur
     """Stop sound should warn when no cached UUID is available."""
 
     coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._dispatcher = RequestDispatcher()  # type: ignore[attr-defined]
     coordinator._sound_request_uuids = {}  # type: ignore[attr-defined]
     coordinator._note_push_transport_problem = lambda: None  # type: ignore[attr-defined]
     coordinator._set_auth_state = lambda **kwargs: None  # type: ignore[attr-defined]
@@ -0,0 +1,81 @@
+# tests/test_coordinator_update_suppression.py
+"""Tests for fingerprint-based suppression of no-op device updates."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.googlefindmy.coordinator import (
+    DeviceSnapshot,
+    GoogleFindMyCoordinator,
+)
+
+
+def _make_coordinator() -> GoogleFindMyCoordinator:
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace()
+    coordinator.data = DeviceSnapshot()
+    coordinator._present_last_seen = {}
+    coordinator._presence_ttl_s = 120
+    coordinator._device_caps = {}
+    coordinator._locate_inflight = set()
+    coordinator._locate_cooldown_until = {}
+    coordinator._device_poll_cooldown_until = {}
+    coordinator.stats = {"suppressed_updates": 0}
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    return coordinator
+
+
+def _entry(dev_id: str, lat: float, last_updated: float) -> dict:
+    return {
+        "id": dev_id,
+        "name": dev_id,
+        "latitude": lat,
+        "longitude": 2.0,
+        "last_seen": 1000.0,
+        "last_updated": last_updated,
+    }
+
+
+def test_identical_refresh_is_suppressed() -> None:
+    """Re-fetching the same fix keeps entry, version and listeners untouched."""
+
+    coordinator = _make_coordinator()
+    coordinator.data = coordinator._merge_snapshot(
+        [_entry("dev-1", 1.0, 10.0), _entry("dev-2", 1.0, 10.0)], replace_all=True
+    )
+    first_entry = coordinator.data["dev-1"]
+
+    merged = coordinator._merge_snapshot(
+        [_entry("dev-1", 1.0, 20.0), _entry("dev-2", 1.5, 20.0)], replace_all=True
+    )
+
+    assert merged.changed_ids == frozenset({"dev-2"})
+    assert merged["dev-1"] is first_entry
+    assert merged.version("dev-1") == coordinator.data.version("dev-1")
+    assert merged.version("dev-2") == coordinator.data.version("dev-2") + 1
+    assert coordinator.stats["suppressed_updates"] == 1
+
+
+def test_gating_change_is_not_suppressed() -> None:
+    """Availability inputs are part of the fingerprint."""
+
+    coordinator = _make_coordinator()
+    coordinator.data = coordinator._merge_snapshot([_entry("dev-1", 1.0, 10.0)])
+
+    coordinator._locate_inflight.add("dev-1")
+    merged = coordinator._merge_snapshot([_entry("dev-1", 1.0, 10.0)])
+
+    assert merged.changed_ids == frozenset({"dev-1"})
+    assert coordinator.stats["suppressed_updates"] == 0
+
+
+def test_merge_without_fingerprints_always_replaces() -> None:
+    """Plain merges (no fingerprints) keep the previous always-changed semantics."""
+
+    snap = DeviceSnapshot().merge([_entry("dev-1", 1.0, 10.0)])
+    merged = snap.merge([_entry("dev-1", 1.0, 10.0)])
+
+    assert merged.changed_ids == frozenset({"dev-1"})
+    assert merged.version("dev-1") == snap.version("dev-1") + 1
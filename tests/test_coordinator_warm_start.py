@@ -0,0 +1,133 @@
+# tests/test_coordinator_warm_start.py
+"""Tests for the persisted warm-start cache of device list and locations."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import coordinator as coordinator_module
+from custom_components.googlefindmy.const import OPT_IGNORED_DEVICES
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+
+
+class _FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    saved: dict[str, Any] = {}
+
+    def __init__(self, _hass: Any, _version: int, key: str, **_kwargs: Any) -> None:
+        self.key = key
+
+    async def async_load(self) -> Any:
+        return self.saved.get(self.key)
+
+    def async_delay_save(self, data_func: Any, _delay: float = 0) -> None:
+        self.saved[self.key] = data_func()
+
+    async def async_save(self, data: Any) -> None:
+        self.saved[self.key] = data
+
+
+def _make_coordinator(options: dict[str, Any] | None = None) -> GoogleFindMyCoordinator:
+    """Return a lightweight coordinator with only the warm-start state initialised."""
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator.hass = SimpleNamespace()
+    coordinator.config_entry = SimpleNamespace(entry_id="entry-1", options=options or {})
+    coordinator.data = None
+    coordinator.location_poll_interval = 300
+    coordinator.stats = {}
+    coordinator._warm_store = None
+    coordinator._warm_start_info = {}
+    coordinator._last_device_list = []
+    coordinator._device_names = {}
+    coordinator._device_caps = {}
+    coordinator._device_location_data = {}
+    coordinator._device_location_source = {}
+    coordinator._revalidate_task = None
+    coordinator._present_last_seen = {}
+    coordinator._presence_ttl_s = 120
+    coordinator._locate_inflight = set()
+    coordinator._locate_cooldown_until = {}
+    coordinator._device_poll_cooldown_until = {}
+    coordinator._api_push_ready = lambda: True  # type: ignore[method-assign]
+    coordinator._schedule_stats_persist = lambda: None  # type: ignore[method-assign]
+    return coordinator
+
+
+def test_payload_keeps_list_locations_and_provenance_only() -> None:
+    """Internal and non-scalar fields are not persisted; provenance is."""
+
+    coordinator = _make_coordinator()
+    coordinator._last_device_list = [{"id": "dev-1", "name": "Phone", "can_ring": True, "raw": object()}]
+    coordinator._device_location_data = {
+        "dev-1": {"latitude": 1.0, "longitude": 2.0, "last_seen": 100.0, "_report_hint": "x"},
+        "dev-2": {"latitude": 1.0},  # primed only, never seen: not worth restoring
+    }
+    coordinator._device_location_source = {"dev-1": "push"}
+
+    payload = coordinator._warm_start_payload()
+
+    assert payload["devices"] == [{"id": "dev-1", "name": "Phone", "can_ring": True}]
+    assert payload["locations"] == {
+        "dev-1": {"data": {"latitude": 1.0, "longitude": 2.0, "last_seen": 100.0}, "source": "push"}
+    }
+
+
+def test_restore_publishes_snapshot_before_first_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A new coordinator publishes the persisted view at setup, ignore filter applied."""
+
+    monkeypatch.setattr(coordinator_module, "Store", _FakeStore)
+    _FakeStore.saved = {}
+    now = time.time()
+
+    source = _make_coordinator()
+    source._warm_store = _FakeStore(None, 1, "googlefindmy_warm_start_entry-1")
+    source._last_device_list = [
+        {"id": "dev-1", "name": "Phone", "can_ring": True},
+        {"id": "dev-2", "name": "Keys"},
+    ]
+    source._device_location_data = {
+        "dev-1": {"latitude": 1.0, "longitude": 2.0, "last_seen": now - 60, "last_updated": now - 60}
+    }
+    source._device_location_source = {"dev-1": "poll"}
+    source._schedule_warm_start_save()
+
+    restored = _make_coordinator({OPT_IGNORED_DEVICES: {"dev-2": {"name": "Keys"}}})
+    asyncio.run(restored._async_restore_warm_start())
+
+    assert list(restored.data) == ["dev-1"]
+    assert restored.data["dev-1"]["latitude"] == 1.0
+    assert restored.data["dev-1"]["status"] == "Location data current"
+    assert restored.is_device_present("dev-1")
+    assert restored._device_caps["dev-1"] == {"can_ring": True}
+    assert restored._last_device_list[1]["id"] == "dev-2"  # empty-list quorum still protected
+    state = restored.get_warm_start_state()
+    assert state["restored_devices"] == 1
+    assert state["restored_locations"] == 1
+    assert state["location_sources"] == {"restored": 1}
+    assert state["restored_from"] == {"poll": 1}
+    freshness = restored.get_device_freshness("dev-1")
+    assert freshness["source"] == "restored"
+    assert 59 <= freshness["age_s"] < 120
+
+
+def test_restore_without_cache_leaves_coordinator_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    """First install: nothing is published and later saves still go to the Store."""
+
+    monkeypatch.setattr(coordinator_module, "Store", _FakeStore)
+    _FakeStore.saved = {}
+
+    coordinator = _make_coordinator()
+    asyncio.run(coordinator._async_restore_warm_start())
+
+    assert coordinator.data is None
+    assert coordinator._warm_store is not None
+    coordinator._last_device_list = [{"id": "dev-1", "name": "Phone"}]
+    coordinator._schedule_warm_start_save()
+    assert _FakeStore.saved["googlefindmy_warm_start_entry-1"]["devices"] == [{"id": "dev-1", "name": "Phone"}]
@@ -0,0 +1,129 @@
+# tests/test_entity_index.py
+"""Tests for the per-entry tracker entity index."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.googlefindmy.const import DOMAIN
+from custom_components.googlefindmy.entity_index import TrackerEntityIndex
+from custom_components.googlefindmy.google_home_filter import GoogleHomeFilter
+
+
+class _EntityRegistry:
+    """Entity registry fake keyed by entity id."""
+
+    def __init__(self) -> None:
+        self.by_entity_id: dict[str, Any] = {}
+        self.entities = SimpleNamespace(
+            get_entries_for_config_entry_id=lambda entry_id: [
+                ent for ent in self.by_entity_id.values() if ent.config_entry_id == entry_id
+            ]
+        )
+
+    def async_get(self, entity_id: str) -> Any:
+        return self.by_entity_id.get(entity_id)
+
+    def add(
+        self,
+        entity_id: str,
+        unique_id: str,
+        device_id: str | None = None,
+        entry_id: str = "entry-1",
+        platform: str = DOMAIN,
+    ) -> None:
+        self.by_entity_id[entity_id] = SimpleNamespace(
+            entity_id=entity_id,
+            unique_id=unique_id,
+            device_id=device_id,
+            config_entry_id=entry_id,
+            platform=platform,
+        )
+
+
+def _apply(index: TrackerEntityIndex, registry: _EntityRegistry, **data: Any) -> bool:
+    """Deliver an event like the bus does: filter first, then the handler."""
+    if not index.event_filter(data):
+        return False
+    index.apply_event(registry, data)
+    return True
+
+
+def test_rebuild_indexes_trackers_of_the_entry() -> None:
+    """Current and legacy unique_ids resolve; other entries, platforms and domains do not."""
+
+    registry = _EntityRegistry()
+    registry.add("device_tracker.phone", f"{DOMAIN}_entry-1_dev-1", device_id="reg-1")
+    registry.add("device_tracker.keys", f"{DOMAIN}_dev-2")  # legacy unique_id
+    registry.add("device_tracker.keys_2", f"{DOMAIN}_entry-1_dev-2", device_id="reg-2")
+    registry.add("sensor.phone_last_seen", f"{DOMAIN}_entry-1_dev-1_last_seen")
+    registry.add("device_tracker.other", f"{DOMAIN}_entry-2_dev-3", entry_id="entry-2")
+    registry.add("device_tracker.foreign", f"{DOMAIN}_entry-1_dev-4", platform="mobile_app")
+
+    index = TrackerEntityIndex("entry-1")
+    index.rebuild(registry)
+
+    assert len(index) == 2
+    assert index.entity_id("dev-1") == "device_tracker.phone"
+    assert index.registry_device_id("dev-1") == "reg-1"
+    assert index.entity_id("dev-2") == "device_tracker.keys_2"  # current format wins
+    assert index.device_id("device_tracker.phone") == "dev-1"
+    assert index.device_id("device_tracker.keys") is None
+    assert index.entity_id("dev-3") is None
+
+
+def test_events_keep_the_index_current() -> None:
+    """Create, rename, device re-link and remove are applied from event payloads."""
+
+    registry = _EntityRegistry()
+    registry.add("device_tracker.phone", f"{DOMAIN}_entry-1_dev-1", device_id="reg-1")
+    index = TrackerEntityIndex("entry-1")
+    index.rebuild(registry)
+
+    assert not _apply(index, registry, action="create", entity_id="sensor.foo")
+    assert not _apply(
+        index, registry, action="update", entity_id="device_tracker.x", changes={"name": None}
+    )
+
+    registry.add("device_tracker.keys", f"{DOMAIN}_entry-1_dev-2", device_id="reg-2")
+    assert _apply(index, registry, action="create", entity_id="device_tracker.keys")
+    assert index.entity_id("dev-2") == "device_tracker.keys"
+
+    registry.by_entity_id["device_tracker.my_phone"] = registry.by_entity_id.pop("device_tracker.phone")
+    registry.by_entity_id["device_tracker.my_phone"].entity_id = "device_tracker.my_phone"
+    registry.by_entity_id["device_tracker.my_phone"].device_id = "reg-9"
+    assert _apply(
+        index,
+        registry,
+        action="update",
+        entity_id="device_tracker.my_phone",
+        old_entity_id="device_tracker.phone",
+        changes={"entity_id": "device_tracker.phone", "device_id": "reg-1"},
+    )
+    assert index.entity_id("dev-1") == "device_tracker.my_phone"
+    assert index.registry_device_id("dev-1") == "reg-9"
+    assert index.device_id("device_tracker.phone") is None
+
+    del registry.by_entity_id["device_tracker.keys"]
+    assert _apply(index, registry, action="remove", entity_id="device_tracker.keys")
+    assert index.entity_id("dev-2") is None
+    assert len(index) == 1
+
+
+def test_google_home_filter_prefers_the_resolver() -> None:
+    """The filter resolves trackers via the index and only guesses on a miss."""
+
+    lookups: list[str] = []
+    states = {"device_tracker.phone": SimpleNamespace(state="home")}
+
+    def _get_state(entity_id: str) -> Any:
+        lookups.append(entity_id)
+        return states.get(entity_id)
+
+    home_filter = GoogleHomeFilter.__new__(GoogleHomeFilter)
+    home_filter.hass = SimpleNamespace(states=SimpleNamespace(get=_get_state))
+    home_filter._entity_resolver = {"dev-1": "device_tracker.phone"}.get
+
+    assert home_filter.is_device_at_home("dev-1")
+    assert lookups == ["device_tracker.phone"]
@@ -0,0 +1,120 @@
+# tests/test_entity_state_write_gating.py
+"""Tests for version-cached derived state and identical-write suppression."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.googlefindmy.button import GoogleFindMyLocateButton
+from custom_components.googlefindmy.device_tracker import GoogleFindMyDeviceTracker
+
+
+class _FakeCoordinator:
+    """Minimal coordinator surface used by the entities under test."""
+
+    def __init__(self) -> None:
+        self.config_entry = None
+        self.version = 1
+        self.location: dict[str, Any] = {
+            "latitude": 1.0,
+            "longitude": 2.0,
+            "accuracy": 5,
+            "last_seen": 1_700_000_000.0,
+        }
+        self.present = True
+        self.locate_allowed = True
+        self.freshness: dict[str, Any] = {"age_s": 12.5, "source": "poll", "revalidating": False}
+
+    def get_device_snapshot_entry(self, device_id: str) -> dict[str, Any]:
+        return {"id": device_id, "name": "Phone"}
+
+    def get_device_snapshot_version(self, device_id: str) -> int:
+        return self.version
+
+    def get_device_location_data(self, device_id: str) -> dict[str, Any]:
+        return self.location
+
+    def get_device_freshness(self, device_id: str) -> dict[str, Any]:
+        return dict(self.freshness)
+
+    def is_device_present(self, device_id: str) -> bool:
+        return self.present
+
+    def can_request_location(self, device_id: str) -> bool:
+        return self.locate_allowed
+
+
+def _count_writes(entity: Any) -> list[None]:
+    writes: list[None] = []
+    entity.async_write_ha_state = lambda: writes.append(None)
+    return writes
+
+
+def test_tracker_skips_identical_writes_and_caches_attributes() -> None:
+    """Same entry version -> no recompute; identical state -> no write."""
+
+    coordinator = _FakeCoordinator()
+    tracker = GoogleFindMyDeviceTracker(coordinator, {"id": "dev-1", "name": "Phone"})
+    tracker.hass = SimpleNamespace()
+    writes = _count_writes(tracker)
+
+    tracker._handle_coordinator_update()
+    attrs = tracker._cached_attributes()
+    assert attrs["last_seen"].startswith("2023-11-14")
+    assert len(writes) == 1
+
+    # Same version: attributes are served from cache and nothing is rewritten.
+    tracker._handle_coordinator_update()
+    assert tracker._cached_attributes() is attrs
+    assert len(writes) == 1
+
+    # New version with identical content: recomputed, still no write.
+    coordinator.version = 2
+    tracker._handle_coordinator_update()
+    assert len(writes) == 1
+
+    # Availability change at the same version is still written.
+    coordinator.present = False
+    tracker._handle_coordinator_update()
+    assert len(writes) == 2
+
+
+def test_tracker_exposes_freshness_without_forcing_writes() -> None:
+    """Freshness is read on access; a changing age alone does not trigger a write."""
+
+    coordinator = _FakeCoordinator()
+    tracker = GoogleFindMyDeviceTracker(coordinator, {"id": "dev-1", "name": "Phone"})
+    tracker.hass = SimpleNamespace()
+    writes = _count_writes(tracker)
+
+    tracker._handle_coordinator_update()
+    attrs = tracker.extra_state_attributes
+    assert attrs["location_age_s"] == 12.5
+    assert attrs["location_source"] == "poll"
+    assert attrs["revalidating"] is False
+
+    coordinator.freshness = {"age_s": 90.0, "source": "poll", "revalidating": True}
+    tracker._handle_coordinator_update()
+    assert len(writes) == 1
+    assert tracker.extra_state_attributes["location_age_s"] == 90.0
+    assert tracker.extra_state_attributes["revalidating"] is True
+
+
+def test_button_writes_only_on_availability_change() -> None:
+    """Buttons evaluate gating once per update and skip unchanged writes."""
+
+    coordinator = _FakeCoordinator()
+    button = GoogleFindMyLocateButton(coordinator, {"id": "dev-1", "name": "Phone"})
+    button.hass = SimpleNamespace()
+    writes = _count_writes(button)
+
+    button._handle_coordinator_update()
+    button._handle_coordinator_update()
+    assert len(writes) == 1
+    assert button.available is True
+
+    coordinator.locate_allowed = False
+    button._handle_coordinator_update()
+    assert len(writes) == 2
+    assert button.available is False
@@ -0,0 +1,72 @@
+# tests/test_latency.py
+"""Tests for the location pipeline latency histograms."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.googlefindmy.coordinator import GoogleFindMyCoordinator
+from custom_components.googlefindmy.latency import (
+    STAGE_DECRYPT,
+    STAGE_GATING,
+    LatencyHistogram,
+    PipelineLatency,
+    current_pipeline_latency,
+    observe_stage,
+    pipeline_latency,
+)
+from custom_components.googlefindmy.tracing import TraceBuffer
+
+
+def test_quantiles_stay_within_bucket_error() -> None:
+    """Quantiles match the exact values within one bucket (~9 %) in constant memory."""
+
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-3.0, 1.2) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.observe(value)
+
+    ordered = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered)) - 1]
+        estimate = histogram.percentile(q)
+        assert estimate is not None
+        assert exact <= estimate * 1.001
+        assert estimate <= exact * 1.1
+
+    summary = histogram.as_dict()
+    assert summary["count"] == 20000
+    assert summary["max_ms"] == round(max(samples) * 1000.0, 3)
+    assert LatencyHistogram().as_dict()["p95_ms"] is None
+
+
+def test_stages_are_recorded_on_the_bound_recorder_only() -> None:
+    """Without a bound recorder samples are dropped; binding nests and restores."""
+
+    outer, inner = PipelineLatency(), PipelineLatency()
+    observe_stage(STAGE_DECRYPT, 0.01)  # unbound: ignored
+
+    with pipeline_latency(outer):
+        observe_stage(STAGE_DECRYPT, 0.01)
+        with pipeline_latency(inner):
+            observe_stage(STAGE_DECRYPT, 0.02)
+            observe_stage("unknown_stage", 0.02)
+        assert current_pipeline_latency() is outer
+    assert current_pipeline_latency() is None
+
+    assert outer.as_dict()[STAGE_DECRYPT]["count"] == 1
+    assert inner.as_dict()[STAGE_DECRYPT]["count"] == 1
+    assert inner.as_dict()[STAGE_DECRYPT]["p50_ms"] == 20.0
+
+
+def test_significance_gate_is_timed() -> None:
+    """The coordinator records the gating stage for every significance check."""
+
+    coordinator = GoogleFindMyCoordinator.__new__(GoogleFindMyCoordinator)
+    coordinator._pipeline_latency = PipelineLatency()
+    coordinator._locate_traces = TraceBuffer()
+    coordinator._device_location_data = {}
+
+    assert coordinator._passes_significance_gate("dev-1", {"latitude": 1.0, "longitude": 2.0})
+    assert coordinator.get_stage_latency_state()[STAGE_GATING]["count"] == 1
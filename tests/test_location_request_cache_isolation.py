@@ -15,6 +15,7 @@ from custom_components.googlefindmy.exceptions import (
 from custom_components.googlefindmy.NovaApi.ExecuteAction.LocateTracker import (
     location_request,
 )
+from custom_components.googlefindmy.NovaApi.nova_request import NovaRateLimitError
 from custom_components.googlefindmy.NovaApi.ExecuteAction.PlaySound import (
     start_sound_request,
     stop_sound_request,
@@ -125,6 +126,32 @@ def test_locate_request_prefers_entry_scoped_cache(
     asyncio.run(_run())
 
 
+def test_locate_request_propagates_throttling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A throttled locate raises to the caller instead of reading as "no location"."""
+
+    receiver = DummyFcmReceiver()
+
+    async def fake_async_nova_request(*_args: Any, **_kwargs: Any) -> str:
+        raise NovaRateLimitError("RESOURCE_EXHAUSTED")
+
+    monkeypatch.setattr(location_request, "_FCM_ReceiverGetter", lambda: receiver)
+    monkeypatch.setattr(location_request, "async_nova_request", fake_async_nova_request)
+    monkeypatch.setattr(
+        location_request, "create_location_request", lambda *args, **kwargs: "payload"
+    )
+
+    async def _run() -> None:
+        with pytest.raises(NovaRateLimitError):
+            await location_request.get_location_data_for_device(
+                canonic_device_id="device-123",
+                name="Tracker",
+                cache=FakeTokenCache("entry-one"),
+            )
+        assert receiver.registered == {}
+
+    asyncio.run(_run())
+
+
 def test_start_sound_request_requires_cache() -> None:
     """Start sound submitter must raise when cache is missing."""
 
@@ -0,0 +1,64 @@
+# tests/test_loop_watchdog.py
+"""Tests for the event-loop lag watchdog and its stall attribution."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from custom_components.googlefindmy import loop_watchdog
+from custom_components.googlefindmy.loop_watchdog import (
+    UNATTRIBUTED,
+    LoopLagWatchdog,
+    loop_section,
+    record_section,
+)
+
+
+def test_stalls_are_attributed_to_the_blocking_section() -> None:
+    """A marked blocking stretch is named; an unmarked one is unattributed."""
+
+    async def _run() -> LoopLagWatchdog:
+        watchdog = LoopLagWatchdog(interval_s=0.01, threshold_s=0.05)
+        watchdog.start(asyncio.get_running_loop())
+        try:
+            await asyncio.sleep(0.05)
+            with loop_section("map_render"):
+                time.sleep(0.15)  # blocks the loop
+            await asyncio.sleep(0.05)
+            time.sleep(0.15)  # blocks the loop outside integration markers
+            await asyncio.sleep(0.05)
+        finally:
+            watchdog.stop()
+        return watchdog
+
+    watchdog = asyncio.run(_run())
+
+    assert watchdog.stalls == 2
+    sections = [stall["section"] for stall in watchdog.as_dict()["recent_stalls"]]
+    assert sections == ["map_render", UNATTRIBUTED]
+    worst = watchdog.worst_offenders()
+    assert {item["section"] for item in worst} == {"map_render", UNATTRIBUTED}
+    assert all(item["max_ms"] >= 100 for item in worst)
+    assert watchdog.samples > 10
+    assert not watchdog.running
+
+
+def test_sections_are_only_kept_while_a_watchdog_runs() -> None:
+    """Markers are no-ops without a watchdog; stopping the last one clears the ring."""
+
+    record_section("fcm_notification", 0.0, 1.0)
+    assert not loop_watchdog._recent_sections
+
+    async def _run() -> None:
+        watchdog = LoopLagWatchdog()
+        watchdog.start(asyncio.get_running_loop())
+        record_section("fcm_notification", 0.0, 1.0)
+        record_section("too_short", 0.0, 0.0001)
+        assert [name for name, *_ in loop_watchdog._recent_sections] == ["fcm_notification"]
+        watchdog.stop()
+        watchdog.stop()  # idempotent
+
+    asyncio.run(_run())
+    assert not loop_watchdog._recent_sections
+    assert not loop_watchdog._running_watchdogs
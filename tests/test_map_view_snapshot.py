@@ -0,0 +1,65 @@
+# tests/test_map_view_snapshot.py
+"""Regression test: the map view resolves device names from a keyed snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import map_view
+from custom_components.googlefindmy.const import DOMAIN
+from custom_components.googlefindmy.coordinator import DeviceSnapshot
+
+
+def test_map_view_reads_the_device_name_from_a_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """`coordinator.data` is a DeviceSnapshot keyed by id, not a list of dicts."""
+
+    device_id = "dev-1"
+    coordinator = SimpleNamespace(
+        data=DeviceSnapshot(
+            {
+                "dev-0": {"id": "dev-0", "name": "Wallet"},
+                device_id: {"id": device_id, "name": "Keys"},
+            }
+        )
+    )
+
+    async def _executor(func: Any, *args: Any) -> Any:
+        return func(*args)
+
+    hass = SimpleNamespace(
+        data={DOMAIN: {"entry-1": coordinator}}, async_add_executor_job=_executor
+    )
+    device = SimpleNamespace(identifiers={(DOMAIN, f"entry-1_{device_id}")})
+    monkeypatch.setattr(
+        map_view.dr, "async_get", lambda _hass: SimpleNamespace(devices={"d": device})
+    )
+    monkeypatch.setattr(
+        map_view, "async_get_entity_registry", lambda _hass: SimpleNamespace(entities={})
+    )
+    history = ModuleType("homeassistant.components.recorder.history")
+    history.get_significant_states = lambda *_args: {}
+    monkeypatch.setitem(sys.modules, "homeassistant.components.recorder.history", history)
+
+    rendered: list[str] = []
+
+    def _render(_self: Any, device_name: str, *_args: Any) -> str:
+        rendered.append(device_name)
+        return "ok"
+
+    monkeypatch.setattr(map_view.GoogleFindMyMapView, "_generate_map_html", _render)
+    monkeypatch.setattr(map_view.GoogleFindMyMapView, "_get_simple_token", lambda _self: "t")
+
+    view = map_view.GoogleFindMyMapView(hass)
+    response = asyncio.run(
+        view.get(SimpleNamespace(query={"token": "t"}), f"entry-1_{device_id}")
+    )
+
+    assert response.status == 200
+    assert rendered == ["Keys"]
@@ -0,0 +1,86 @@
+# tests/test_metrics_view.py
+"""Tests for the OpenMetrics rendering of the performance counters."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.googlefindmy.latency import (
+    STAGE_DECRYPT,
+    LatencyHistogram,
+    PipelineLatency,
+)
+from custom_components.googlefindmy.loop_watchdog import LoopLagWatchdog
+from custom_components.googlefindmy.metrics_view import LATENCY_BOUNDS, render_metrics
+
+
+def _coordinator() -> SimpleNamespace:
+    recorder = PipelineLatency()
+    for seconds in (0.002, 0.004, 0.2):
+        recorder.observe(STAGE_DECRYPT, seconds)
+    return SimpleNamespace(
+        stats={"polled_updates": 3, "snapshot_block_ms": 12, "not_a_number": "x"},
+        data={"dev-1": {}, "dev-2": {}},
+        _is_polling=True,
+        poll_spacing_s=1.5,
+        pipeline_latency=recorder,
+        get_request_lanes_state=lambda: {
+            "interactive": {"requests": 2, "active": 1, "queued": 0, "wait_max_s": 0.0},
+            "background": {"requests": 9, "active": 1, "queued": 4, "wait_max_s": 2.5},
+        },
+    )
+
+
+def test_families_are_contiguous_and_labelled_per_entry() -> None:
+    """Counters, gauges and histograms of all entries render as valid families."""
+
+    watchdog = LoopLagWatchdog()
+    watchdog.lag.observe(0.3)
+    text = render_metrics(
+        [("entry-a", _coordinator()), ("entry-b", _coordinator())],
+        {"loop_watchdog": watchdog, "fcm_lock_contention_count": 1},
+    )
+    lines = text.splitlines()
+
+    assert lines[-1] == "# EOF"
+    # Every family is declared once, before all of its samples
+    declared = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert len(declared) == len(set(declared))
+    seen_family = None
+    for line in lines:
+        if line.startswith("# TYPE"):
+            seen_family = line.split()[2]
+        elif not line.startswith("#"):
+            assert line.startswith(seen_family)
+
+    assert "# TYPE googlefindmy_polled_updates counter" in lines
+    assert 'googlefindmy_polled_updates_total{entry_id="entry-a"} 3' in lines
+    assert 'googlefindmy_polled_updates_total{entry_id="entry-b"} 3' in lines
+    assert not any("not_a_number" in line for line in lines)
+    assert 'googlefindmy_devices{entry_id="entry-a"} 2' in lines
+    assert 'googlefindmy_polling{entry_id="entry-a"} 1' in lines
+    assert 'googlefindmy_request_lane_queued{entry_id="entry-a",lane="background"} 4' in lines
+
+    prefix = 'googlefindmy_stage_latency_seconds_bucket{entry_id="entry-a",stage="decrypt",'
+    assert prefix + 'le="0.005"} 2' in lines
+    assert prefix + 'le="0.25"} 3' in lines
+    assert prefix + 'le="+Inf"} 3' in lines
+    assert 'googlefindmy_stage_latency_seconds_count{entry_id="entry-a",stage="decrypt"} 3' in lines
+    assert 'googlefindmy_loop_lag_seconds_bucket{le="0.5"} 1' in lines
+    assert "googlefindmy_fcm_lock_contention_total 1" in lines
+
+
+def test_cumulative_counts_match_exact_counts_at_the_bounds() -> None:
+    """Bucketed cumulative counts never exceed the exact counts and stay monotonic."""
+
+    samples = [0.0004 * (1.07**i) for i in range(160)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.observe(value)
+
+    counts = histogram.cumulative(LATENCY_BOUNDS)
+    assert counts == sorted(counts)
+    for bound, count in zip(LATENCY_BOUNDS, counts):
+        exact = sum(1 for value in samples if value <= bound)
+        assert count <= exact
+        assert exact - count <= 2  # only the bucket straddling the bound is missed
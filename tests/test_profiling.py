@@ -0,0 +1,92 @@
+# tests/test_profiling.py
+"""Tests for the time-boxed profiling captures and the profile service."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from custom_components.googlefindmy import profiling
+from custom_components.googlefindmy.latency import LatencyHistogram
+
+
+def _busy(seconds: float) -> None:
+    histogram = LatencyHistogram()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        histogram.observe(0.01)
+        histogram.percentile(0.99)
+
+
+def test_sampler_keeps_integration_stacks_and_writes_pstats(tmp_path: Path) -> None:
+    """Stacks through the package become pstats entries and collapsed stacks."""
+
+    sampler = profiling.StackSampler(interval_s=0.001)
+    sampler.start()
+    try:
+        _busy(0.3)
+    finally:
+        sampler.stop()
+
+    assert sampler.samples > 0
+    assert sampler.stacks
+    assert all(
+        any(func[0].startswith(profiling.PACKAGE_DIR) for func in stack)
+        for stack in sampler.stacks
+    )
+
+    stats = sampler.to_stats()
+    path = tmp_path / "capture.pstats"
+    profiling.write_stats(str(path), stats)
+    loaded = pstats.Stats(str(path))
+    busy = next(func for func in loaded.stats if func[2] == "_busy")
+    # Every in-scope sample of this thread passes through _busy
+    assert loaded.stats[busy][3] == pytest.approx(
+        sum(sampler.stacks.values()) * sampler.interval_s
+    )
+
+    summary = profiling.summarize(stats, top=5)
+    assert summary["top_integration"][0]["function"].startswith("googlefindmy/latency.py:")
+    assert "googlefindmy/latency.py:" in sampler.collapsed()
+
+
+def test_capture_writes_files_into_the_output_dir_and_is_exclusive(tmp_path: Path) -> None:
+    """A capture writes pstats and collapsed stacks; a concurrent capture is refused."""
+
+    async def _executor(func: Any, *args: Any) -> Any:
+        return func(*args)
+
+    async def _run() -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(None, _busy, 0.6)
+        capture = asyncio.ensure_future(
+            profiling.async_profile(
+                0.5,
+                sampling=True,
+                top=3,
+                path_for=lambda name: os.path.join(tmp_path, name),
+                run_in_executor=_executor,
+            )
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(profiling.ProfileBusyError):
+            await profiling.async_capture(0.1)
+        try:
+            return await capture
+        finally:
+            await work
+
+    response = asyncio.run(_run())
+
+    assert response["mode"] == "sampling"
+    assert response["samples_in_scope"] > 0
+    assert 0 < len(response["top_integration"]) <= 3
+    assert Path(response["files"]["pstats"]).parent == tmp_path
+    assert Path(response["files"]["collapsed"]).is_file()
+    pstats.Stats(response["files"]["pstats"])
@@ -0,0 +1,304 @@
+# tests/test_request_governor.py
+"""Tests for the account-wide request budget governor."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.googlefindmy import request_governor as rg
+from custom_components.googlefindmy.NovaApi import nova_request
+
+
+def test_bucket_delays_then_rejects(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Burst is served immediately; further requests wait or fail fast."""
+
+    clock = [1000.0]
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(rg.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rg.asyncio, "sleep", _fake_sleep)
+
+    gov = rg.RequestGovernor(
+        "user@example.com",
+        {rg.RPC_LOCATE: rg.BucketConfig(rate=1.0, burst=2), rg.RPC_ACTION: rg.BucketConfig(1.0, 1)},
+        max_wait_s=1.5,
+    )
+
+    async def _run() -> None:
+        with rg.request_lane(rg.LANE_INTERACTIVE):
+            await gov.acquire(rg.RPC_LOCATE)
+            await gov.acquire(rg.RPC_LOCATE)
+            assert sleeps == []
+            await gov.acquire(rg.RPC_LOCATE)  # reserves the next token -> waits 1 s
+            assert sleeps == [pytest.approx(1.0)]
+            with pytest.raises(rg.RequestBudgetExceeded):
+                await gov.acquire(rg.RPC_LOCATE)  # would wait 2 s > max_wait
+            # Other classes have their own budget.
+            await gov.acquire(rg.RPC_ACTION)
+
+    asyncio.run(_run())
+    assert gov.granted[rg.RPC_LOCATE] == 3
+    assert gov.rejected == 1
+
+
+def test_background_lane_leaves_reserve_for_interactive(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Background requests never take the last token; interactive ones may."""
+
+    clock = [1000.0]
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(rg.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rg.asyncio, "sleep", _fake_sleep)
+
+    gov = rg.RequestGovernor("user@example.com", {rg.RPC_LOCATE: rg.BucketConfig(rate=0.5, burst=2)})
+
+    async def _run() -> None:
+        await gov.acquire(rg.RPC_LOCATE)  # background: 2 -> 1 token
+        with rg.request_lane(rg.LANE_INTERACTIVE):
+            await gov.acquire(rg.RPC_LOCATE)  # interactive takes the reserved token at once
+        assert sleeps == []
+        await gov.acquire(rg.RPC_LOCATE)  # background waits until 2 tokens are back
+        assert sum(sleeps) == pytest.approx(4.0)
+
+    asyncio.run(_run())
+    assert rg.current_lane() == rg.LANE_BACKGROUND
+
+
+def test_dispatcher_serves_interactive_before_queued_background() -> None:
+    """Queued interactive requests start first and get reserved concurrency."""
+
+    waits: list[tuple[str, float]] = []
+    dispatcher = rg.RequestDispatcher(capacity=2, reserved_interactive=1, on_wait=lambda lane, w: waits.append((lane, w)))
+    order: list[str] = []
+
+    async def _request(lane: str, name: str, key: str | None, hold: asyncio.Event) -> None:
+        async with dispatcher.slot(lane, key):
+            order.append(name)
+            assert rg.current_lane() == lane
+            await hold.wait()
+
+    async def _run() -> None:
+        release_bg = asyncio.Event()
+        release_all = asyncio.Event()
+        bg1 = asyncio.create_task(_request(rg.LANE_BACKGROUND, "bg1", "dev-1", release_bg))
+        await asyncio.sleep(0)
+        bg2 = asyncio.create_task(_request(rg.LANE_BACKGROUND, "bg2", "dev-2", release_all))
+        await asyncio.sleep(0)
+        # Background is capped at one slot; the reserved slot serves interactive at once.
+        it1 = asyncio.create_task(_request(rg.LANE_INTERACTIVE, "it1", None, release_all))
+        await asyncio.sleep(0)
+        assert order == ["bg1", "it1"]
+        # Same-device interactive request waits for the running background one and
+        # then starts before the queued background request.
+        it2 = asyncio.create_task(_request(rg.LANE_INTERACTIVE, "it2", "dev-1", release_all))
+        await asyncio.sleep(0)
+        release_bg.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert order == ["bg1", "it1", "it2"]
+        assert dispatcher.as_dict()[rg.LANE_BACKGROUND]["queued"] == 1
+        release_all.set()
+        await asyncio.gather(bg1, bg2, it1, it2)
+
+    asyncio.run(_run())
+    assert order == ["bg1", "it1", "it2", "bg2"]
+    assert [lane for lane, _ in waits].count(rg.LANE_INTERACTIVE) == 2
+    state = dispatcher.as_dict()
+    assert state[rg.LANE_BACKGROUND]["requests"] == 2
+    assert state[rg.LANE_INTERACTIVE]["active"] == 0
+
+
+def test_throttle_pauses_account_with_escalating_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Throttling pauses all classes; strikes escalate until a success resets them."""
+
+    monkeypatch.setattr(rg.random, "uniform", lambda lo, hi: hi)
+    gov = rg.RequestGovernor("user@example.com")
+
+    first = gov.note_throttled()
+    second = gov.note_throttled()
+    assert first == pytest.approx(rg.THROTTLE_PAUSE_BASE_S)
+    assert second == pytest.approx(rg.THROTTLE_PAUSE_BASE_S * 2)
+    assert gov.paused_for() > 0
+
+    with pytest.raises(rg.RequestBudgetExceeded) as err:
+        asyncio.run(gov.acquire(rg.RPC_LIST))
+    assert err.value.paused is True
+
+    gov.note_success()
+    assert gov.note_throttled(retry_after_s=5000) == pytest.approx(rg.THROTTLE_PAUSE_MAX_S)
+
+
+def test_throttle_detection_and_registry() -> None:
+    """Status codes, gRPC codes and body markers are recognised; accounts are shared."""
+
+    assert rg.is_throttle_response(429)
+    assert rg.is_throttle_response(200, grpc_status="8")
+    assert rg.is_throttle_response(400, body="... RESOURCE_EXHAUSTED ...")
+    assert not rg.is_throttle_response(500)
+    # Overload is a throttle only when the server names a retry time
+    assert not rg.is_throttle_response(503)
+    assert not rg.is_throttle_response(200, grpc_status="14")
+    assert rg.is_throttle_response(503, retry_after="30")
+    assert rg.parse_retry_after("12") == 12.0
+    assert rg.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+    assert rg.get_governor("User@Example.com") is rg.get_governor("user@example.com")
+    assert rg.rpc_class_for_nova_scope("nbe_list_devices") == rg.RPC_LIST
+
+
+def test_circuit_breaker_opens_probes_and_recovers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Consecutive failures open the breaker; one half-open probe decides recovery."""
+
+    clock = [1000.0]
+    monkeypatch.setattr(rg.time, "monotonic", lambda: clock[0])
+    breaker = rg.CircuitBreaker("nbe_execute_action", failure_threshold=2, open_base_s=30.0)
+
+    def _fail() -> None:
+        with pytest.raises(TimeoutError):
+            with breaker.guard():
+                raise TimeoutError
+
+    # Neutral errors (auth, throttling) never count.
+    with pytest.raises(PermissionError):
+        with breaker.guard(lambda err: not isinstance(err, PermissionError)):
+            raise PermissionError
+    _fail()
+    assert breaker.state == rg.BREAKER_CLOSED
+    _fail()
+    assert breaker.state == rg.BREAKER_OPEN
+    with pytest.raises(rg.CircuitOpenError):
+        breaker.before_request()
+
+    # Half-open: only one probe at a time; a failed probe doubles the open period.
+    clock[0] += 30.0
+    breaker.before_request()
+    assert breaker.state == rg.BREAKER_HALF_OPEN
+    with pytest.raises(rg.CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure(TimeoutError())
+    assert breaker.retry_in() == pytest.approx(60.0)
+
+    clock[0] += 60.0
+    with breaker.guard():
+        pass
+    state = breaker.as_dict()
+    assert state["state"] == rg.BREAKER_CLOSED
+    assert state["opened"] == 2
+    assert state["rejected"] == 2
+    assert state["last_error"] == "TimeoutError"
+
+
+def test_cancelled_probe_releases_half_open_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A probe that ends without a verdict lets the next request probe instead."""
+
+    clock = [1000.0]
+    monkeypatch.setattr(rg.time, "monotonic", lambda: clock[0])
+    breaker = rg.CircuitBreaker("GetEidInfoForE2eeDevices", failure_threshold=1)
+    breaker.record_failure()
+    clock[0] += breaker.open_base_s
+
+    with pytest.raises(asyncio.CancelledError):
+        with breaker.guard():
+            raise asyncio.CancelledError
+    assert breaker.state == rg.BREAKER_HALF_OPEN
+    breaker.before_request()  # does not raise: the earlier probe was released
+
+
+class _Response:
+    """aiohttp response stub (async context manager)."""
+
+    def __init__(self, status: int, headers: dict[str, str]) -> None:
+        self.status = status
+        self.headers = headers
+
+    async def read(self) -> bytes:
+        return b"Service Unavailable"
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+
+class _Session:
+    """aiohttp session stub answering every request with one status."""
+
+    def __init__(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.status = status
+        self.headers = headers or {}
+        self.posts = 0
+
+    def post(self, *_args: object, **_kwargs: object) -> _Response:
+        self.posts += 1
+        return _Response(self.status, self.headers)
+
+
+class _Policy:
+    def __init__(self, **_kwargs: object) -> None:
+        pass
+
+    async def pre_request(self) -> None:
+        return None
+
+
+def _patch_nova_transport(monkeypatch: pytest.MonkeyPatch) -> dict[str, rg.RequestGovernor]:
+    """Stub token/retry plumbing; accounts get an unlimited budget and never wait out a pause."""
+
+    async def _token(*_args: object, **_kwargs: object) -> str:
+        return "token"
+
+    unlimited = {rpc: rg.BucketConfig(rate=100.0, burst=100) for rpc in rg.DEFAULT_BUDGETS}
+    governors: dict[str, rg.RequestGovernor] = {}
+
+    def _governor(account: str) -> rg.RequestGovernor:
+        return governors.setdefault(account, rg.RequestGovernor(account, unlimited, max_wait_s=1.0))
+
+    monkeypatch.setattr(nova_request, "_get_initial_token_async", _token)
+    monkeypatch.setattr(nova_request, "AsyncTTLPolicy", _Policy)
+    monkeypatch.setattr(nova_request, "_compute_delay", lambda *_args: 0.0)
+    monkeypatch.setattr(nova_request, "get_governor", _governor)
+    return governors
+
+
+def test_bare_503s_trip_the_breaker_but_announced_overload_throttles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """503 without Retry-After is an outage; with Retry-After it pauses the account."""
+
+    governors = _patch_nova_transport(monkeypatch)
+    scope = "test_scope_503"
+    breaker = rg.get_circuit_breaker(scope)
+    down = _Session(503)
+
+    async def _run() -> None:
+        for _ in range(breaker.failure_threshold):
+            with pytest.raises(nova_request.NovaHTTPError):
+                await nova_request.async_nova_request(scope, "00", username="outage@example.com", session=down)
+        assert breaker.state == rg.BREAKER_OPEN
+        posts = down.posts
+        with pytest.raises(nova_request.NovaCircuitOpenError):
+            await nova_request.async_nova_request(scope, "00", username="outage@example.com", session=down)
+        assert down.posts == posts
+        assert governors["outage@example.com"].throttle_events == 0
+
+    asyncio.run(_run())
+
+    announced = rg.get_circuit_breaker("test_scope_503_retry_after")
+    throttled = _Session(503, {"Retry-After": "0"})
+    with pytest.raises(nova_request.NovaRateLimitError):
+        asyncio.run(
+            nova_request.async_nova_request(
+                "test_scope_503_retry_after", "00", username="busy@example.com", session=throttled
+            )
+        )
+    assert announced.state == rg.BREAKER_CLOSED
+    assert governors["busy@example.com"].throttle_events == 1
@@ -0,0 +1,90 @@
+# tests/test_tracing.py
+"""Tests for the locate trace ring buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+import pytest
+
+from custom_components.googlefindmy.diagnostics import _traces_block
+from custom_components.googlefindmy.latency import STAGE_DECRYPT, STAGE_NOVA_REQUEST
+from custom_components.googlefindmy.tracing import (
+    OUTCOME_COMMITTED,
+    OUTCOME_PUBLISHED,
+    TRACE_POLL,
+    TRACE_PUSH,
+    TraceBuffer,
+    bind_trace,
+    current_trace,
+    trace_span,
+    traced,
+)
+
+
+def test_buffer_keeps_the_latest_traces_and_completes_them_on_publish() -> None:
+    """Old traces are evicted; committed traces complete when their device is published."""
+
+    buffer = TraceBuffer(capacity=3)
+    first = buffer.start("dev-a", TRACE_POLL)
+    for device_id in ("dev-b", "dev-a", "dev-b"):
+        buffer.start(device_id, TRACE_PUSH)
+
+    assert len(buffer) == 3
+    assert first.trace_id not in [trace["trace_id"] for trace in buffer.recent()]
+    ids = [trace["trace_id"] for trace in buffer.recent()]
+    assert ids == sorted(ids, reverse=True)
+    assert [trace["device_id"] for trace in buffer.recent("dev-b")] == ["dev-b", "dev-b"]
+    assert len(buffer.recent(limit=1)) == 1
+
+    latest = buffer._traces[-1]
+    buffer.committed(latest)
+    assert latest.outcome == OUTCOME_COMMITTED
+    buffer.published(["dev-a"], perf_counter(), perf_counter())
+    assert latest.outcome == OUTCOME_COMMITTED
+    buffer.published(["dev-b"], perf_counter(), perf_counter())
+    assert latest.outcome == OUTCOME_PUBLISHED
+    assert [span["name"] for span in latest.as_dict()["spans"]] == ["commit", "publish"]
+
+
+def test_spans_follow_the_bound_trace_across_tasks() -> None:
+    """The bound trace reaches awaited layers; failures are recorded with their type."""
+
+    buffer = TraceBuffer()
+    trace = buffer.start("dev-a", TRACE_POLL)
+
+    async def _layer() -> None:
+        with pytest.raises(TimeoutError):
+            with traced(STAGE_NOVA_REQUEST):
+                raise TimeoutError
+        await asyncio.sleep(0.01)
+        trace_span(STAGE_DECRYPT, 0.002, "own")
+
+    async def _run() -> None:
+        with bind_trace(trace):
+            await asyncio.create_task(_layer())
+        assert current_trace() is None
+        trace_span(STAGE_DECRYPT, 0.001)  # unbound: ignored
+
+    asyncio.run(_run())
+
+    spans = trace.as_dict()["spans"]
+    assert [span["name"] for span in spans] == [STAGE_NOVA_REQUEST, STAGE_DECRYPT]
+    assert spans[0]["detail"] == "TimeoutError"
+    assert spans[1]["detail"] == "own"
+    assert spans[1]["duration_ms"] == pytest.approx(2.0)
+
+
+def test_diagnostics_replace_device_ids_with_labels() -> None:
+    """Exported traces group devices by label and carry no identifiers."""
+
+    buffer = TraceBuffer()
+    for device_id in ("secret-a", "secret-b", "secret-a"):
+        buffer.start(device_id, TRACE_PUSH)
+
+    exported = _traces_block(buffer.recent())
+
+    assert [trace["device_ref"] for trace in exported] == ["device-1", "device-2", "device-1"]
+    assert "secret" not in repr(exported)
+    assert exported[0]["started_at"].endswith("+00:00")